@@ -36,6 +36,7 @@
     GrapheneAssetCheckExecution,
 )
 from .fetch_asset_checks import asset_checks_iter
+from .loader import AssetRecordLoader, LatestAssetCheckExecutionLoader
 
 
 class AssetChecksLoader:
@@ -122,7 +123,7 @@ def _fetch_checks(
             for external_check in external_checks
         ]
         execution_loader = AssetChecksExecutionForLatestMaterializationLoader(
-            self._context.instance, check_keys=all_check_keys
+            self._context, check_keys=all_check_keys
         )
 
         asset_graph = ExternalAssetGraph.from_workspace(self._context)
@@ -241,8 +242,14 @@ def _execution_targets_latest_materialization(
 
 
 class AssetChecksExecutionForLatestMaterializationLoader:
-    def __init__(self, instance: DagsterInstance, check_keys: List[AssetCheckKey]):
-        self._instance = instance
+    """Loads the latest executions of asset checks that target the latest materializations of
+    their assets. The executions and asset records are fetched through the request scoped loaders,
+    so that they're fetched at most once per request.
+    """
+
+    def __init__(self, context: WorkspaceRequestContext, check_keys: List[AssetCheckKey]):
+        self._context = context
+        self._instance = context.instance
         self._check_keys = check_keys
         self._executions: Optional[
             Mapping[AssetCheckKey, Optional[GrapheneAssetCheckExecution]]
@@ -251,20 +258,19 @@ def __init__(self, instance: DagsterInstance, check_keys: List[AssetCheckKey]):
     def _fetch_executions(self) -> Mapping[AssetCheckKey, Optional[GrapheneAssetCheckExecution]]:
         from .fetch_asset_checks import get_asset_check_execution_statuses_by_id
 
-        latest_executions_by_check_key = (
-            self._instance.event_log_storage.get_latest_asset_check_execution_by_key(
-                self._check_keys
-            )
-        )
+        latest_executions_by_check_key = {
+            check_key: execution
+            for check_key, execution in LatestAssetCheckExecutionLoader.for_context(self._context)
+            .load_many(self._check_keys)
+            .items()
+            if execution
+        }
         statuses_by_execution_id = get_asset_check_execution_statuses_by_id(
             self._instance, list(latest_executions_by_check_key.values())
         )
-        asset_records_by_asset_key = {
-            record.asset_entry.asset_key: record
-            for record in self._instance.get_asset_records(
-                list({ck.asset_key for ck in self._check_keys})
-            )
-        }
+        asset_records_by_asset_key = AssetRecordLoader.for_context(self._context).load_many(
+            {check_key.asset_key for check_key in self._check_keys}
+        )
 
         self._executions = {}
         for check_key in self._check_keys:
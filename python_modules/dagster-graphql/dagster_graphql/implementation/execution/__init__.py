@@ -1,12 +1,14 @@
 import asyncio
 import os
 import sys
-from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional, Sequence, Tuple, Union
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Mapping, Optional, Sequence, Union
 
 # re-exports
 import dagster._check as check
 from dagster._annotations import deprecated
 from dagster._core.definitions.events import AssetKey
+from dagster._core.event_api import EventLogCursor
 from dagster._core.events import (
     AssetMaterialization,
     AssetObservation,
@@ -224,7 +226,131 @@ def get_chunk_size() -> int:
     )
 
 
-async def gen_events_for_run(
+def get_live_event_batch_window_seconds() -> float:
+    return float(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_WINDOW_MS", "100")) / 1000
+
+
+def get_live_event_batch_size() -> int:
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_SIZE", "1000"))
+
+
+def get_live_event_queue_size() -> int:
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_QUEUE_SIZE", "10000"))
+
+
+class RunLogSubscriptionMetrics:
+    """Process-wide counters describing how well the subscribers to live run logs keep up with the
+    events of their runs.
+
+    A subscriber lags once more events are queued for it than the live event queue size allows.
+    The events it is then sent are dropped from its queue, and read back from storage once it has
+    worked through its queue.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._num_lagging_subscribers = 0
+        self._num_lags = 0
+        self._num_dropped_events = 0
+
+    @property
+    def num_lagging_subscribers(self) -> int:
+        """The number of subscribers that are currently lagging."""
+        return self._num_lagging_subscribers
+
+    @property
+    def num_lags(self) -> int:
+        """The number of times that a subscriber started lagging."""
+        return self._num_lags
+
+    @property
+    def num_dropped_events(self) -> int:
+        """The number of events dropped from the queues of lagging subscribers."""
+        return self._num_dropped_events
+
+    def on_lag_started(self) -> None:
+        with self._lock:
+            self._num_lagging_subscribers += 1
+            self._num_lags += 1
+
+    def on_lag_ended(self) -> None:
+        with self._lock:
+            self._num_lagging_subscribers -= 1
+
+    def on_event_dropped(self) -> None:
+        with self._lock:
+            self._num_dropped_events += 1
+
+
+RUN_LOG_SUBSCRIPTION_METRICS = RunLogSubscriptionMetrics()
+
+
+def get_cursor_storage_id(cursor: Optional[str]) -> Optional[int]:
+    if cursor is None:
+        return None
+    event_log_cursor = EventLogCursor.parse(cursor)
+    return event_log_cursor.storage_id() if event_log_cursor.is_id_cursor() else None
+
+
+class LiveEventQueue:
+    """Queues the live events of a run for a subscriber to its logs, up to the live event queue
+    size. Once the queue is full, the subscriber lags, and the events put in the queue are dropped
+    until the subscriber has worked through the queue and ends the lag, after reading the events it
+    missed from elsewhere.
+
+    Events are put in the queue from the event loop that the subscriber runs on.
+    """
+
+    def __init__(self, max_size: int):
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._max_size = max_size
+        self._is_lagging = False
+        self._is_closed = False
+
+    @property
+    def is_lagging(self) -> bool:
+        return self._is_lagging
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def put(self, item: Any) -> None:
+        if self._is_closed:
+            # the subscription ended while the event was being handed over to the loop
+            return
+        if not self._is_lagging and self._queue.qsize() >= self._max_size:
+            self._is_lagging = True
+            RUN_LOG_SUBSCRIPTION_METRICS.on_lag_started()
+        if self._is_lagging:
+            RUN_LOG_SUBSCRIPTION_METRICS.on_event_dropped()
+        else:
+            self._queue.put_nowait(item)
+
+    async def get_batch(self, max_batch_size: int, batch_window_seconds: float) -> List[Any]:
+        """Waits for an item to be queued, then for the batch window to let more items queue up,
+        and returns the queued items, up to the max batch size.
+        """
+        batch = [await self._queue.get()]
+        if batch_window_seconds > 0 and self._queue.qsize() < max_batch_size - 1:
+            await asyncio.sleep(batch_window_seconds)
+        while len(batch) < max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    def end_lag(self) -> None:
+        """Queues the events put in the queue from now on again. Must be called before reading the
+        events missed while lagging, so that no event is missed.
+        """
+        if self._is_lagging:
+            self._is_lagging = False
+            RUN_LOG_SUBSCRIPTION_METRICS.on_lag_ended()
+
+    def close(self) -> None:
+        self.end_lag()
+        self._is_closed = True
+
+
+def gen_events_for_run(
     graphene_info: "ResolveInfo",
     run_id: str,
     after_cursor: Optional[str] = None,
@@ -233,6 +359,30 @@ async def gen_events_for_run(
         "GraphenePipelineRunLogsSubscriptionFailure",
         "GraphenePipelineRunLogsSubscriptionSuccess",
     ]
+]:
+    from .run_log_subscription_hub import get_run_log_subscription_hub
+
+    check.str_param(run_id, "run_id")
+    after_cursor = check.opt_str_param(after_cursor, "after_cursor")
+    instance = graphene_info.context.instance
+
+    # subscriptions that skip the past events of the run don't benefit from the cached messages of
+    # the hub
+    hub = get_run_log_subscription_hub(instance)
+    if hub is not None and after_cursor != "HEAD":
+        return hub.gen_events_for_run(run_id, after_cursor)
+    return _gen_events_for_run(instance, run_id, after_cursor)
+
+
+async def _gen_events_for_run(
+    instance: DagsterInstance,
+    run_id: str,
+    after_cursor: Optional[str],
+) -> AsyncIterator[
+    Union[
+        "GraphenePipelineRunLogsSubscriptionFailure",
+        "GraphenePipelineRunLogsSubscriptionSuccess",
+    ]
 ]:
     from ...schema.pipelines.pipeline import GrapheneRun
     from ...schema.pipelines.subscription import (
@@ -241,9 +391,6 @@ async def gen_events_for_run(
     )
     from ..events import from_event_record
 
-    check.str_param(run_id, "run_id")
-    after_cursor = check.opt_str_param(after_cursor, "after_cursor")
-    instance = graphene_info.context.instance
     record = instance.get_run_record_by_id(run_id)
 
     if not record:
@@ -285,25 +432,67 @@ async def gen_events_for_run(
         has_more = connection.has_more
         after_cursor = connection.cursor
 
+    batch_window_seconds = get_live_event_batch_window_seconds()
+    max_batch_size = get_live_event_batch_size()
+
     loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
+    queue = LiveEventQueue(get_live_event_queue_size())
 
     def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
+        loop.call_soon_threadsafe(queue.put, (event, cursor))
 
     # watch for live events
     instance.watch_event_logs(run_id, after_cursor, _enqueue)
     try:
         while True:
-            event, cursor = await queue.get()
+            if queue.is_lagging and queue.empty():
+                # events that are sent from now on are queued again, and deduplicated below against
+                # the ones read from storage
+                queue.end_lag()
+                has_more = True
+                while has_more:
+                    connection = await run_in_threadpool(
+                        instance.get_records_for_run,
+                        run_id=run_id,
+                        cursor=after_cursor,
+                        limit=chunk_size,
+                    )
+                    if connection.records:
+                        yield GraphenePipelineRunLogsSubscriptionSuccess(
+                            run=GrapheneRun(record),
+                            messages=[
+                                from_event_record(record.event_log_entry, run.job_name)
+                                for record in connection.records
+                            ],
+                            hasMorePastEvents=False,
+                            cursor=connection.cursor,
+                        )
+                    has_more = connection.has_more
+                    after_cursor = connection.cursor
+                continue
+
+            # coalesce the events sent in quick succession into a single message
+            batch = await queue.get_batch(max_batch_size, batch_window_seconds)
+            after_storage_id = get_cursor_storage_id(after_cursor)
+            if after_storage_id is not None:
+                batch = [
+                    (event, cursor)
+                    for event, cursor in batch
+                    if (get_cursor_storage_id(cursor) or 0) > after_storage_id
+                ]
+            if not batch:
+                continue
+
+            after_cursor = batch[-1][1]
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                messages=[from_event_record(event, run.job_name) for event, _cursor in batch],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=after_cursor,
             )
     finally:
         instance.end_watch_event_logs(run_id, _enqueue)
+        queue.close()
 
 
 async def gen_compute_logs(
@@ -0,0 +1,382 @@
+import asyncio
+import os
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun
+from starlette.concurrency import run_in_threadpool
+
+from . import (
+    LiveEventQueue,
+    get_chunk_size,
+    get_cursor_storage_id,
+    get_live_event_batch_size,
+    get_live_event_batch_window_seconds,
+    get_live_event_queue_size,
+)
+
+if TYPE_CHECKING:
+    from dagster_graphql.schema.pipelines.subscription import (
+        GraphenePipelineRunLogsSubscriptionFailure,
+        GraphenePipelineRunLogsSubscriptionSuccess,
+    )
+
+# a log message of a run, with the storage id and cursor of its event
+CachedMessage = Tuple[int, str, Any]
+
+# the hubs are owned by the servers that register them, and each hub keeps its instance alive, so
+# the instance ids of the registered hubs aren't reused
+_hubs_by_instance_id: "weakref.WeakValueDictionary[int, RunLogSubscriptionHub]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_run_log_cache_size() -> int:
+    return int(os.getenv("DAGSTER_UI_RUN_LOG_CACHE_SIZE", "10000"))
+
+
+def register_run_log_subscription_hub(hub: "RunLogSubscriptionHub") -> None:
+    """Serves the run log subscriptions made against the instance of the hub through the hub, for
+    as long as the hub is referenced elsewhere.
+    """
+    _hubs_by_instance_id[id(hub.instance)] = hub
+
+
+def get_run_log_subscription_hub(instance: DagsterInstance) -> Optional["RunLogSubscriptionHub"]:
+    return _hubs_by_instance_id.get(id(instance))
+
+
+class _RunLogFeed:
+    """Watches the event log of a run on behalf of all of the subscribers to its logs, and caches
+    its most recent log messages.
+
+    The subscribers may run on different event loops, so the messages of each event are handed
+    over to each subscriber on the loop it subscribed from.
+    """
+
+    def __init__(
+        self, instance: DagsterInstance, run_id: str, job_name: str, max_cached_messages: int
+    ):
+        self._instance = instance
+        self._run_id = run_id
+        self._job_name = job_name
+        # guards the cache and the subscribers, which are updated from the thread of the watch
+        self._lock = threading.RLock()
+        self._cached_messages: Deque[CachedMessage] = deque(maxlen=max_cached_messages)
+        # the storage id of the oldest cached message, if older messages of the run aren't cached
+        self._uncached_before_storage_id: Optional[int] = None
+        self._subscriber_loops: Dict[LiveEventQueue, asyncio.AbstractEventLoop] = {}
+        self._is_watching = False
+        self._is_closed = False
+        # not bound to the event loop of any subscriber, so that each of them can wait on it
+        self._started: "Future[None]" = Future()
+        threading.Thread(target=self._start, name=f"run-log-feed-{run_id}", daemon=True).start()
+
+    async def wait_started(self) -> None:
+        # the feed is shared, so it isn't cancelled along with the subscription that waits on it
+        await asyncio.shield(asyncio.wrap_future(self._started))
+
+    @property
+    def cached_messages(self) -> List[CachedMessage]:
+        with self._lock:
+            return list(self._cached_messages)
+
+    @property
+    def uncached_before_storage_id(self) -> Optional[int]:
+        with self._lock:
+            return self._uncached_before_storage_id
+
+    @property
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscriber_loops)
+
+    def _start(self) -> None:
+        from ..events import from_event_record
+
+        try:
+            # only the most recent events of the run are read, as older ones wouldn't be cached
+            connection = self._instance.get_records_for_run(
+                run_id=self._run_id,
+                limit=self._cached_messages.maxlen,
+                ascending=False,
+            )
+            records = list(reversed(connection.records))
+            messages = [
+                (
+                    record.storage_id,
+                    str(EventLogCursor.from_storage_id(record.storage_id)),
+                    from_event_record(record.event_log_entry, self._job_name),
+                )
+                for record in records
+            ]
+            with self._lock:
+                if not self._is_closed:
+                    for message in messages:
+                        self._cache_message(*message)
+                    if connection.has_more and records:
+                        self._uncached_before_storage_id = records[0].storage_id
+
+                    cursor = messages[-1][1] if messages else None
+                    self._instance.watch_event_logs(self._run_id, cursor, self._on_event)
+                    self._is_watching = True
+        except Exception as error:
+            self._started.set_exception(error)
+        else:
+            self._started.set_result(None)
+
+    def _cache_message(self, storage_id: int, cursor: str, message: Any) -> None:
+        is_full = len(self._cached_messages) == self._cached_messages.maxlen
+        self._cached_messages.append((storage_id, cursor, message))
+        if is_full:
+            # the oldest message was evicted
+            self._uncached_before_storage_id = self._cached_messages[0][0]
+
+    def _on_event(self, event: EventLogEntry, cursor: str) -> None:
+        from ..events import from_event_record
+
+        storage_id = check.not_none(get_cursor_storage_id(cursor))
+        with self._lock:
+            if self._is_closed:
+                return
+            if self._cached_messages and storage_id <= self._cached_messages[-1][0]:
+                return
+
+            # the event is converted once, no matter the number of subscribers
+            cached_message = (storage_id, cursor, from_event_record(event, self._job_name))
+            self._cache_message(*cached_message)
+            subscriber_loops = list(self._subscriber_loops.items())
+
+        for queue, loop in subscriber_loops:
+            try:
+                loop.call_soon_threadsafe(queue.put, cached_message)
+            except RuntimeError:
+                # the loop of the subscriber was closed while the event was being fanned out
+                pass
+
+    def add_subscriber(self) -> LiveEventQueue:
+        queue = LiveEventQueue(get_live_event_queue_size())
+        with self._lock:
+            self._subscriber_loops[queue] = asyncio.get_running_loop()
+        return queue
+
+    def remove_subscriber(self, queue: LiveEventQueue) -> None:
+        with self._lock:
+            self._subscriber_loops.pop(queue, None)
+        queue.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._is_closed = True
+            is_watching = self._is_watching
+        # outside of the lock, which the watch may be waiting on to hand over an event
+        if is_watching:
+            self._instance.end_watch_event_logs(self._run_id, self._on_event)
+
+
+class RunLogSubscriptionHub:
+    """Serves the subscriptions to the logs of runs made in a process, e.g. in the webserver, so
+    that the cost of watching a run doesn't grow with the number of its subscribers.
+
+    Each run with subscribers is watched once, and the most recent log messages of each run are
+    cached. Every event of the run is converted to a log message once, and fanned out from the cache
+    to each subscriber, which keeps track of the last message it was sent. Subscribers only read the
+    events of a run from storage if they need older events than the ones cached, or if they fell too
+    far behind.
+
+    Args:
+        instance (DagsterInstance): The instance to watch the runs of.
+        max_cached_messages (Optional[int]): The number of log messages to cache for each run.
+            Defaults to the DAGSTER_UI_RUN_LOG_CACHE_SIZE env var, or 10000.
+    """
+
+    def __init__(self, instance: DagsterInstance, max_cached_messages: Optional[int] = None):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._max_cached_messages = check.opt_int_param(
+            max_cached_messages, "max_cached_messages", get_run_log_cache_size()
+        )
+        check.invariant(self._max_cached_messages > 0, "max_cached_messages must be positive")
+        # guards the feeds, whose subscribers may run on different event loops
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, _RunLogFeed] = {}
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._instance
+
+    @property
+    def watched_run_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._feeds.keys())
+
+    async def _gen_message_chunks_since(
+        self, feed: _RunLogFeed, run: DagsterRun, cursor: Optional[str], chunk_size: int
+    ) -> AsyncIterator[List[CachedMessage]]:
+        """Yields the log messages of the run after the given cursor in chunks, reading the ones
+        that aren't cached from storage.
+        """
+        from ..events import from_event_record
+
+        while True:
+            storage_id = get_cursor_storage_id(cursor)
+            uncached_before_storage_id = feed.uncached_before_storage_id
+            if uncached_before_storage_id is None or (
+                storage_id is not None and storage_id >= uncached_before_storage_id
+            ):
+                break
+
+            connection = await run_in_threadpool(
+                self._instance.get_records_for_run,
+                run_id=run.run_id,
+                cursor=cursor,
+                limit=chunk_size,
+            )
+            # more messages may have been evicted from the cache in the meantime
+            records = [
+                record
+                for record in connection.records
+                if record.storage_id < check.not_none(feed.uncached_before_storage_id)
+            ]
+            if not records:
+                break
+
+            chunk = [
+                (
+                    record.storage_id,
+                    str(EventLogCursor.from_storage_id(record.storage_id)),
+                    from_event_record(record.event_log_entry, run.job_name),
+                )
+                for record in records
+            ]
+            cursor = chunk[-1][1]
+            yield chunk
+
+        storage_id = get_cursor_storage_id(cursor)
+        cached_messages = [
+            cached_message
+            for cached_message in feed.cached_messages
+            if storage_id is None or cached_message[0] > storage_id
+        ]
+        for i in range(0, len(cached_messages), chunk_size):
+            yield cached_messages[i : i + chunk_size]
+
+    async def gen_events_for_run(
+        self, run_id: str, after_cursor: Optional[str]
+    ) -> AsyncIterator[
+        Union[
+            "GraphenePipelineRunLogsSubscriptionFailure",
+            "GraphenePipelineRunLogsSubscriptionSuccess",
+        ]
+    ]:
+        """Yields the log messages of the run after the given cursor, then its live log messages."""
+        from ...schema.pipelines.pipeline import GrapheneRun
+        from ...schema.pipelines.subscription import (
+            GraphenePipelineRunLogsSubscriptionFailure,
+            GraphenePipelineRunLogsSubscriptionSuccess,
+        )
+
+        record = self._instance.get_run_record_by_id(run_id)
+        if not record:
+            yield GraphenePipelineRunLogsSubscriptionFailure(
+                missingRunId=run_id,
+                message=f"Could not load run with id {run_id}",
+            )
+            return
+
+        run = record.dagster_run
+        with self._lock:
+            feed = self._feeds.get(run.run_id)
+            if feed is None:
+                feed = _RunLogFeed(
+                    self._instance, run.run_id, run.job_name, self._max_cached_messages
+                )
+                self._feeds[run.run_id] = feed
+
+            # live messages are queued from the start, and deduplicated below against past ones
+            queue = feed.add_subscriber()
+        try:
+            await feed.wait_started()
+
+            chunk_size = get_chunk_size()
+            batch_window_seconds = get_live_event_batch_window_seconds()
+            max_batch_size = get_live_event_batch_size()
+
+            # send the past messages, holding back each chunk until it's known whether it's the last
+            past_chunk = None
+            async for chunk in self._gen_message_chunks_since(feed, run, after_cursor, chunk_size):
+                if past_chunk is not None:
+                    after_cursor = past_chunk[-1][1]
+                    yield GraphenePipelineRunLogsSubscriptionSuccess(
+                        run=GrapheneRun(record),
+                        messages=[message for _, _, message in past_chunk],
+                        hasMorePastEvents=True,
+                        cursor=after_cursor,
+                    )
+                past_chunk = chunk
+            if past_chunk:
+                after_cursor = past_chunk[-1][1]
+            yield GraphenePipelineRunLogsSubscriptionSuccess(
+                run=GrapheneRun(record),
+                messages=[message for _, _, message in past_chunk or []],
+                hasMorePastEvents=False,
+                cursor=after_cursor,
+            )
+
+            while True:
+                if queue.is_lagging and queue.empty():
+                    queue.end_lag()
+                    async for chunk in self._gen_message_chunks_since(
+                        feed, run, after_cursor, chunk_size
+                    ):
+                        after_cursor = chunk[-1][1]
+                        yield GraphenePipelineRunLogsSubscriptionSuccess(
+                            run=GrapheneRun(record),
+                            messages=[message for _, _, message in chunk],
+                            hasMorePastEvents=False,
+                            cursor=after_cursor,
+                        )
+                    continue
+
+                # coalesce the messages fanned out in quick succession into a single message
+                batch = await queue.get_batch(max_batch_size, batch_window_seconds)
+                after_storage_id = get_cursor_storage_id(after_cursor)
+                if after_storage_id is not None:
+                    batch = [
+                        cached_message
+                        for cached_message in batch
+                        if cached_message[0] > after_storage_id
+                    ]
+                if not batch:
+                    continue
+
+                after_cursor = batch[-1][1]
+                yield GraphenePipelineRunLogsSubscriptionSuccess(
+                    run=GrapheneRun(record),
+                    messages=[message for _, _, message in batch],
+                    hasMorePastEvents=False,
+                    cursor=after_cursor,
+                )
+        finally:
+            with self._lock:
+                feed.remove_subscriber(queue)
+                if not feed.has_subscribers and self._feeds.get(run.run_id) is feed:
+                    feed.close()
+                    del self._feeds[run.run_id]
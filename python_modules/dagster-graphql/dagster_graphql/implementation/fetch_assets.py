@@ -1,8 +1,12 @@
 import datetime
-from collections import defaultdict
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
     Iterator,
     List,
@@ -25,6 +29,7 @@
 )
 from dagster._core.definitions.data_time import CachingDataTimeResolver
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
     PartitionsDefinition,
@@ -34,7 +39,6 @@
     BaseTimeWindowPartitionsSubset,
     PartitionRangeStatus,
     TimeWindowPartitionsDefinition,
-    TimeWindowPartitionsSubset,
     fetch_flattened_time_window_ranges,
 )
 from dagster._core.events import ASSET_EVENTS
@@ -43,7 +47,9 @@
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.external_data import ExternalAssetNode
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.partition_status_cache import (
+    AssetStatusCacheValue,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
     get_materialized_multipartitions,
@@ -353,9 +359,11 @@ def get_partition_subsets(
     asset_key: AssetKey,
     dynamic_partitions_loader: DynamicPartitionsStore,
     partitions_def: Optional[PartitionsDefinition] = None,
+    asset_record: Optional[AssetRecord] = None,
 ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
     """Returns a tuple of PartitionSubset objects: the first is the materialized partitions,
-    the second is the failed partitions, and the third are in progress.
+    the second is the failed partitions, and the third are in progress. The cached partition
+    status is read from the given asset record, if any, rather than fetched from storage.
     """
     if not partitions_def:
         return None, None, None
@@ -364,25 +372,9 @@ def get_partition_subsets(
         # When the "cached_status_data" column exists in storage, update the column to contain
         # the latest partition status values
         updated_cache_value = get_and_update_asset_status_cache_value(
-            instance, asset_key, partitions_def, dynamic_partitions_loader
-        )
-        materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
+            instance, asset_key, partitions_def, dynamic_partitions_loader, asset_record
         )
-
-        return materialized_subset, failed_subset, in_progress_subset
+        return _deserialize_partition_subsets(updated_cache_value, partitions_def)
 
     else:
         # If the partition status can't be cached, fetch partition status from storage
@@ -410,6 +402,130 @@ def get_partition_subsets(
         return materialized_subset, failed_subset, in_progress_subset
 
 
+def _deserialize_partition_subsets(
+    cache_value: Optional[AssetStatusCacheValue], partitions_def: PartitionsDefinition
+) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+    if not cache_value:
+        return (
+            partitions_def.empty_subset(),
+            partitions_def.empty_subset(),
+            partitions_def.empty_subset(),
+        )
+
+    return (
+        cache_value.deserialize_materialized_partition_subsets(partitions_def),
+        cache_value.deserialize_failed_partition_subsets(partitions_def),
+        cache_value.deserialize_in_progress_partition_subsets(partitions_def),
+    )
+
+
+def get_partition_statuses_cache_size() -> int:
+    return int(os.getenv("DAGSTER_UI_PARTITION_STATUSES_CACHE_SIZE", "1000"))
+
+
+class _PartitionStatusesCache:
+    """Caches the partition statuses built for each asset from the cached partition status of the
+    asset, so that they're only built again once the cached status is updated, e.g. when new
+    events are stored for the asset, or once the partition keys of the asset change, e.g. when code
+    is reloaded or dynamic partitions are added. Only the statuses of the least recently used assets
+    are evicted when the cache is full.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[AssetKey, Tuple[str, AssetStatusCacheValue, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, asset_key: AssetKey, partitions_def_id: str, cache_value: AssetStatusCacheValue
+    ) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(asset_key)
+            if entry is None or entry[0] != partitions_def_id or entry[1] != cache_value:
+                return None
+            self._entries.move_to_end(asset_key)
+            return entry[2]
+
+    def set(
+        self,
+        asset_key: AssetKey,
+        partitions_def_id: str,
+        cache_value: AssetStatusCacheValue,
+        statuses: Any,
+    ) -> None:
+        with self._lock:
+            self._entries[asset_key] = (partitions_def_id, cache_value, statuses)
+            self._entries.move_to_end(asset_key)
+            while len(self._entries) > get_partition_statuses_cache_size():
+                self._entries.popitem(last=False)
+
+
+_partition_statuses_cache = _PartitionStatusesCache()
+
+
+def get_partition_statuses(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    dynamic_partitions_loader: DynamicPartitionsStore,
+    partitions_def: Optional[PartitionsDefinition] = None,
+    asset_record: Optional[AssetRecord] = None,
+) -> Union[
+    "GrapheneTimePartitionStatuses",
+    "GrapheneDefaultPartitionStatuses",
+    "GrapheneMultiPartitionStatuses",
+]:
+    """Returns the statuses of the partitions of an asset. When the partition status of the asset
+    is cached in storage, the statuses are reused across requests until the cached status changes.
+    The cached partition status is read from the given asset record, if any, so that the records
+    of many assets can be fetched at once.
+    """
+    if (
+        partitions_def
+        and instance.can_cache_asset_status_data()
+        and is_cacheable_partition_type(partitions_def)
+    ):
+        updated_cache_value = get_and_update_asset_status_cache_value(
+            instance, asset_key, partitions_def, dynamic_partitions_loader, asset_record
+        )
+        if updated_cache_value:
+            # the failed and in progress subsets of the cached value can change without new events
+            # for the asset, e.g. when a run fails, so the statuses are keyed by the whole value
+            # rather than by its latest storage id. The statuses also depend on the partition keys
+            # of the asset, which the identifier of its partitions definition covers, including
+            # the current keys of dynamic partitions.
+            partitions_def_id = partitions_def.get_serializable_unique_identifier(
+                dynamic_partitions_store=dynamic_partitions_loader
+            )
+            statuses = _partition_statuses_cache.get(
+                asset_key, partitions_def_id, updated_cache_value
+            )
+            if statuses is None:
+                statuses = build_partition_statuses(
+                    dynamic_partitions_loader,
+                    *_deserialize_partition_subsets(updated_cache_value, partitions_def),
+                    partitions_def,
+                )
+                _partition_statuses_cache.set(
+                    asset_key, partitions_def_id, updated_cache_value, statuses
+                )
+            return statuses
+
+        return build_partition_statuses(
+            dynamic_partitions_loader,
+            *_deserialize_partition_subsets(None, partitions_def),
+            partitions_def,
+        )
+
+    return build_partition_statuses(
+        dynamic_partitions_loader,
+        *get_partition_subsets(
+            instance, asset_key, dynamic_partitions_loader, partitions_def, asset_record
+        ),
+        partitions_def,
+    )
+
+
 def build_partition_statuses(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: Optional[PartitionsSubset],
@@ -442,12 +558,14 @@ def build_partition_statuses(
     materialized_partitions_subset = check.not_none(materialized_partitions_subset)
     failed_partitions_subset = check.not_none(failed_partitions_subset)
     in_progress_partitions_subset = check.not_none(in_progress_partitions_subset)
+    # the subsets of a time window partitions definition can be of different subset classes, as
+    # they're all flattened into time windows below
     check.invariant(
-        type(materialized_partitions_subset)
-        == type(failed_partitions_subset)
-        == type(in_progress_partitions_subset),
+        isinstance(materialized_partitions_subset, BaseTimeWindowPartitionsSubset)
+        == isinstance(failed_partitions_subset, BaseTimeWindowPartitionsSubset)
+        == isinstance(in_progress_partitions_subset, BaseTimeWindowPartitionsSubset),
         "Expected materialized_partitions_subset, failed_partitions_subset, and"
-        " in_progress_partitions_subset to be of the same type",
+        " in_progress_partitions_subset to either all be time window partitions subsets, or none",
     )
 
     if isinstance(materialized_partitions_subset, BaseTimeWindowPartitionsSubset):
@@ -455,10 +573,10 @@ def build_partition_statuses(
             {
                 PartitionRangeStatus.MATERIALIZED: materialized_partitions_subset,
                 PartitionRangeStatus.FAILED: cast(
-                    TimeWindowPartitionsSubset, failed_partitions_subset
+                    BaseTimeWindowPartitionsSubset, failed_partitions_subset
                 ),
                 PartitionRangeStatus.MATERIALIZING: cast(
-                    TimeWindowPartitionsSubset, in_progress_partitions_subset
+                    BaseTimeWindowPartitionsSubset, in_progress_partitions_subset
                 ),
             },
         )
@@ -504,6 +622,18 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def _get_secondary_subsets_by_primary_key(
+    partitions_subset: PartitionsSubset, partitions_def: MultiPartitionsDefinition
+) -> Mapping[str, PartitionsSubset]:
+    # multi-partitions subsets already store a subset of the secondary dimension for each primary
+    # key, so their rows are used as they are instead of being rebuilt from each multi-partition key
+    if not isinstance(partitions_subset, MultiPartitionsSubset):
+        partitions_subset = cast(
+            MultiPartitionsSubset, partitions_def.empty_subset()
+        ).with_partition_keys(partitions_subset.get_partition_keys())
+    return partitions_subset.secondary_subsets_by_primary_key
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -524,47 +654,9 @@ def get_2d_run_length_encoded_partitions(
     primary_dim = partitions_def.primary_dimension
     secondary_dim = partitions_def.secondary_dimension
 
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in materialized_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in failed_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in in_progress_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    materialized_2d_ranges = []
-
     dim1_keys = primary_dim.partitions_def.get_partition_keys(
         dynamic_partitions_store=dynamic_partitions_store
     )
-    unevaluated_idx = 0
-    range_start_idx = 0  # pointer to first dim1 partition with same dim2 materialization status
-
     if (
         len(dim1_keys) == 0
         or len(
@@ -576,55 +668,72 @@ def get_2d_run_length_encoded_partitions(
     ):
         return GrapheneMultiPartitionStatuses(ranges=[], primaryDimensionName=primary_dim.name)
 
-    while unevaluated_idx <= len(dim1_keys):
-        if (
-            unevaluated_idx == len(dim1_keys)
-            or dim2_materialized_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_failed_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_in_progress_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-        ):
-            # Add new multipartition range if we've reached the end of the dim1 keys or if the
-            # second dimension subsets are different than for the previous dim1 key
-            if (
-                len(dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-            ):
-                # Do not add to materialized_2d_ranges if the dim2 partition subset is empty
-                start_key = dim1_keys[range_start_idx]
-                end_key = dim1_keys[unevaluated_idx - 1]
-
-                primary_partitions_def = primary_dim.partitions_def
-                if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
-                    time_windows = cast(
-                        TimeWindowPartitionsDefinition, primary_partitions_def
-                    ).time_windows_for_partition_keys(frozenset([start_key, end_key]))
-                    start_time = time_windows[0].start.timestamp()
-                    end_time = time_windows[-1].end.timestamp()
-                else:
-                    start_time = None
-                    end_time = None
-
-                materialized_2d_ranges.append(
-                    GrapheneMultiPartitionRangeStatuses(
-                        primaryDimStartKey=start_key,
-                        primaryDimEndKey=end_key,
-                        primaryDimStartTime=start_time,
-                        primaryDimEndTime=end_time,
-                        secondaryDim=build_partition_statuses(
-                            dynamic_partitions_store,
-                            dim2_materialized_partition_subset_by_dim1[start_key],
-                            dim2_failed_partition_subset_by_dim1[start_key],
-                            dim2_in_progress_partition_subset_by_dim1[start_key],
-                            secondary_dim.partitions_def,
-                        ),
-                    )
-                )
-            range_start_idx = unevaluated_idx
-        unevaluated_idx += 1
+    dim2_materialized_partition_subset_by_dim1 = _get_secondary_subsets_by_primary_key(
+        materialized_partitions_subset, partitions_def
+    )
+    dim2_failed_partition_subset_by_dim1 = _get_secondary_subsets_by_primary_key(
+        failed_partitions_subset, partitions_def
+    )
+    dim2_in_progress_partition_subset_by_dim1 = _get_secondary_subsets_by_primary_key(
+        in_progress_partitions_subset, partitions_def
+    )
+
+    def _get_dim2_partition_subsets(
+        dim1_key: str,
+    ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
+        return (
+            dim2_materialized_partition_subset_by_dim1.get(dim1_key),
+            dim2_failed_partition_subset_by_dim1.get(dim1_key),
+            dim2_in_progress_partition_subset_by_dim1.get(dim1_key),
+        )
+
+    materialized_2d_ranges = []
+
+    # Consecutive dim1 keys with the same dim2 subsets are grouped into a single range. The dim2
+    # subsets deserialized from the asset status cache are shared between the dim1 keys they're
+    # stored for, so comparing them is mostly a matter of comparing their identity.
+    primary_partitions_def = primary_dim.partitions_def
+    secondary_partitions_def = secondary_dim.partitions_def
+    for dim2_partition_subsets, range_dim1_keys in groupby(
+        dim1_keys, key=_get_dim2_partition_subsets
+    ):
+        if all(subset is None for subset in dim2_partition_subsets):
+            # Do not add to materialized_2d_ranges if the dim2 partition subsets are empty
+            continue
+
+        range_dim1_keys = list(range_dim1_keys)
+        start_key = range_dim1_keys[0]
+        end_key = range_dim1_keys[-1]
+
+        if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+            time_windows = primary_partitions_def.time_windows_for_partition_keys(
+                frozenset([start_key, end_key])
+            )
+            start_time = time_windows[0].start.timestamp()
+            end_time = time_windows[-1].end.timestamp()
+        else:
+            start_time = None
+            end_time = None
+
+        materialized_subset, failed_subset, in_progress_subset = (
+            subset if subset is not None else secondary_partitions_def.empty_subset()
+            for subset in dim2_partition_subsets
+        )
+        materialized_2d_ranges.append(
+            GrapheneMultiPartitionRangeStatuses(
+                primaryDimStartKey=start_key,
+                primaryDimEndKey=end_key,
+                primaryDimStartTime=start_time,
+                primaryDimEndTime=end_time,
+                secondaryDim=build_partition_statuses(
+                    dynamic_partitions_store,
+                    materialized_subset,
+                    failed_subset,
+                    in_progress_subset,
+                    secondary_partitions_def,
+                ),
+            )
+        )
 
     return GrapheneMultiPartitionStatuses(
         ranges=materialized_2d_ranges, primaryDimensionName=primary_dim.name
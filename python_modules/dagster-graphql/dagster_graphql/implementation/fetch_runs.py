@@ -25,6 +25,7 @@
 from dagster._core.storage.tags import TagType, get_tag_type
 
 from .external import ensure_valid_config, get_external_job_or_raise
+from .loader import RunStatsLoader, RunStepStatsLoader
 
 if TYPE_CHECKING:
     from ..schema.asset_graph import GrapheneAssetLatestInfo, GrapheneAssetNode
@@ -122,11 +123,16 @@ def get_runs(
     check.opt_int_param(limit, "limit")
 
     instance = graphene_info.context.instance
+    records = instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    # the stats of all of the runs are fetched at once, if any are requested
+    run_ids = [record.dagster_run.run_id for record in records]
+    RunStatsLoader.for_context(graphene_info.context).prime(run_ids)
+    RunStepStatsLoader.for_context(graphene_info.context).prime(
+        (run_id, None) for run_id in run_ids
+    )
+
+    return [GrapheneRun(record) for record in records]
 
 
 def get_run_ids(
@@ -273,12 +279,26 @@ def _get_in_progress_runs_for_assets(
     in_progress_run_ids_by_asset = defaultdict(set)
     unstarted_run_ids_by_asset = defaultdict(set)
 
+    run_step_keys_by_run_id = {
+        record.dagster_run.run_id: frozenset(
+            graphene_info.context.instance.get_execution_plan_snapshot(
+                check.not_none(record.dagster_run.execution_plan_snapshot_id)
+            ).step_keys_to_execute
+        )
+        for record in in_progress_records
+    }
+
+    step_stats_loader = RunStepStatsLoader.for_context(graphene_info.context)
+    step_stats_loader.prime(
+        (record.dagster_run.run_id, run_step_keys_by_run_id[record.dagster_run.run_id])
+        for record in in_progress_records
+        if record.dagster_run.status in IN_PROGRESS_STATUSES
+    )
+
     for record in in_progress_records:
         run = record.dagster_run
         asset_selection = run.asset_selection
-        run_step_keys = graphene_info.context.instance.get_execution_plan_snapshot(
-            check.not_none(run.execution_plan_snapshot_id)
-        ).step_keys_to_execute
+        run_step_keys = run_step_keys_by_run_id[run.run_id]
 
         selected_assets = (
             set.union(*[asset_key_by_step_key[run_step_key] for run_step_key in run_step_keys])
@@ -287,9 +307,7 @@ def _get_in_progress_runs_for_assets(
         )  # only display in progress/unstarted indicators for selected assets
 
         if run.status in IN_PROGRESS_STATUSES:
-            step_stats = graphene_info.context.instance.get_run_step_stats(
-                run.run_id, run_step_keys
-            )
+            step_stats = check.not_none(step_stats_loader.load((run.run_id, run_step_keys)))
             # Build mapping of asset to all the step stats that generate the asset
             step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
             for step_stat in step_stats:
@@ -360,8 +378,7 @@ def get_execution_plan(
 def get_stats(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunStatsSnapshot":
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
-    stats.id = "stats-{run_id}"  # type: ignore  # (unused code path)
+    stats = check.not_none(RunStatsLoader.for_context(graphene_info.context).load(run_id))
     return GrapheneRunStatsSnapshot(stats)
 
 
@@ -370,7 +387,11 @@ def get_step_stats(
 ) -> Sequence["GrapheneRunStepStats"]:
     from ..schema.logs.events import GrapheneRunStepStats
 
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    step_stats = check.not_none(
+        RunStepStatsLoader.for_context(graphene_info.context).load(
+            (run_id, frozenset(step_keys) if step_keys else None)
+        )
+    )
     return [GrapheneRunStepStats(stats) for stats in step_stats]
 
 
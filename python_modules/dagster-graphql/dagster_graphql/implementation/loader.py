@@ -1,15 +1,30 @@
+from abc import ABC, abstractmethod
 from collections import defaultdict
 from enum import Enum
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from dagster import (
     DagsterInstance,
     _check as check,
 )
+from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
 from dagster._core.definitions.events import AssetKey
 from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot
 from dagster._core.host_representation import ExternalRepository
 from dagster._core.host_representation.external_data import (
     ExternalAssetDependedBy,
@@ -17,8 +32,14 @@
     ExternalAssetNode,
 )
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorType
-from dagster._core.storage.dagster_run import RunRecord, RunsFilter
-from dagster._core.workspace.context import WorkspaceRequestContext
+from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
+from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot, RunRecord, RunsFilter
+from dagster._core.storage.event_log.base import AssetRecord
+from dagster._core.workspace.context import BaseWorkspaceRequestContext, WorkspaceRequestContext
+from typing_extensions import Self
+
+TKey = TypeVar("TKey")
+TValue = TypeVar("TValue")
 
 
 class RepositoryDataType(Enum):
@@ -153,63 +174,144 @@ def get_schedule_ticks(self, origin_id: str, selector_id: str, limit: int) -> Se
         return self._get(RepositoryDataType.SCHEDULE_TICKS, origin_id, limit)
 
 
-class BatchRunLoader:
-    """A batch loader that fetches a set of runs by run_id. This loader is expected to be instantiated
-    once with a set of run_ids. For example, for a particular asset, we can fetch a list of asset
-    materializations, all of which may have been materialized from a different run.
+class RequestScopedBatchLoader(ABC, Generic[TKey, TValue]):
+    """A loader that batches and caches the storage queries for values of a given kind made while
+    serving a request. A single instance of each loader type is shared by all of the resolvers of
+    the request, and is accessed with `for_context`.
+
+    Resolvers that know which keys their child objects will load, e.g. the resolver of a list of
+    runs, prime the loader with those keys. The first key loaded then fetches all of the primed
+    keys at once, rather than each child object issuing its own query.
     """
 
-    def __init__(self, instance: DagsterInstance, run_ids: Iterable[str]):
-        self._instance = instance
-        self._run_ids: Set[str] = set(run_ids)
-        self._records: Dict[str, RunRecord] = {}
+    def __init__(self, context: BaseWorkspaceRequestContext):
+        self._context = context
+        self._values: Dict[TKey, Optional[TValue]] = {}
+        # an ordered set of the keys to fetch with the next batch
+        self._pending_keys: Dict[TKey, None] = {}
+
+    @classmethod
+    def for_context(cls, context: BaseWorkspaceRequestContext) -> Self:
+        loader = context.loaders.get(cls)
+        if loader is None:
+            loader = cls(context)
+            context.loaders[cls] = loader
+        return loader
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._context.instance
+
+    @abstractmethod
+    def fetch(self, keys: Sequence[TKey]) -> Mapping[TKey, TValue]:
+        """Fetches the values for a batch of keys. Keys without a value may be omitted."""
+
+    def prime(self, keys: Iterable[TKey]) -> None:
+        for key in keys:
+            if key not in self._values:
+                self._pending_keys[key] = None
+
+    def load(self, key: TKey) -> Optional[TValue]:
+        return self.load_many([key])[key]
+
+    def load_many(self, keys: Iterable[TKey]) -> Mapping[TKey, Optional[TValue]]:
+        keys = list(keys)
+        self.prime(keys)
+        if self._pending_keys:
+            pending_keys = list(self._pending_keys)
+            self._pending_keys.clear()
+            values = self.fetch(pending_keys)
+            for key in pending_keys:
+                self._values[key] = values.get(key)
+        return {key: self._values[key] for key in keys}
+
+
+class RunRecordLoader(RequestScopedBatchLoader[str, RunRecord]):
+    """Loads run records by run id."""
+
+    def fetch(self, keys: Sequence[str]) -> Mapping[str, RunRecord]:
+        return {
+            record.dagster_run.run_id: record
+            for record in self.instance.get_run_records(RunsFilter(run_ids=list(keys)))
+        }
 
-    def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
-        if run_id not in self._run_ids:
-            check.failed(
-                f"Run id {run_id} not recognized for this loader.  Expected one of: {self._run_ids}"
-            )
-        if self._records.get(run_id) is None:
-            self._fetch()
-        return self._records.get(run_id)
 
-    def _fetch(self) -> None:
-        records = self._instance.get_run_records(RunsFilter(run_ids=list(self._run_ids)))
-        for record in records:
-            self._records[record.dagster_run.run_id] = record
+class RunStatsLoader(RequestScopedBatchLoader[str, DagsterRunStatsSnapshot]):
+    """Loads the stats of runs by run id."""
+
+    def fetch(self, keys: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        return self.instance.get_run_stats_for_runs(keys)
+
 
+# a run id, and the step keys to load the stats of, or None to load the stats of all of its steps
+RunStepStatsKey = Tuple[str, Optional[FrozenSet[str]]]
 
-class BatchMaterializationLoader:
-    """A batch loader that fetches materializations for asset keys.  This loader is expected to be
-    instantiated with a set of asset keys.
+
+class RunStepStatsLoader(
+    RequestScopedBatchLoader[RunStepStatsKey, Sequence[RunStepKeyStatsSnapshot]]
+):
+    """Loads the stats of the steps of runs by run id and step keys. The stats of the keys that
+    select steps are fetched with a single query for the union of their step keys.
     """
 
-    def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
-        self._instance = instance
-        self._asset_keys: List[AssetKey] = list(asset_keys)
-        self._fetched = False
-        self._materializations: Mapping[AssetKey, Optional[EventLogEntry]] = {}
-
-    def get_latest_materialization_for_asset_key(
-        self, asset_key: AssetKey
-    ) -> Optional[EventLogEntry]:
-        if asset_key not in self._asset_keys:
-            check.failed(
-                f"Asset key {asset_key} not recognized for this loader.  Expected one of:"
-                f" {self._asset_keys}"
+    def fetch(
+        self, keys: Sequence[RunStepStatsKey]
+    ) -> Mapping[RunStepStatsKey, Sequence[RunStepKeyStatsSnapshot]]:
+        unfiltered_run_ids = list({run_id: None for run_id, step_keys in keys if step_keys is None})
+        filtered_keys = [(run_id, step_keys) for run_id, step_keys in keys if step_keys is not None]
+
+        step_stats_by_run_id = (
+            self.instance.get_run_step_stats_for_runs(unfiltered_run_ids)
+            if unfiltered_run_ids
+            else {}
+        )
+        filtered_step_stats_by_run_id = (
+            self.instance.get_run_step_stats_for_runs(
+                list({run_id: None for run_id, _ in filtered_keys}),
+                step_keys=sorted(set().union(*(step_keys for _, step_keys in filtered_keys))),
             )
+            if filtered_keys
+            else {}
+        )
+
+        values: Dict[RunStepStatsKey, Sequence[RunStepKeyStatsSnapshot]] = {}
+        for run_id, step_keys in keys:
+            if step_keys is None:
+                values[(run_id, step_keys)] = step_stats_by_run_id.get(run_id, [])
+            else:
+                values[(run_id, step_keys)] = [
+                    step_stats
+                    for step_stats in filtered_step_stats_by_run_id.get(run_id, [])
+                    if step_stats.step_key in step_keys
+                ]
+        return values
 
-        if not self._fetched:
-            self._fetch()
-        return self._materializations.get(asset_key)
 
-    def _fetch(self) -> None:
-        self._fetched = True
-        self._materializations = {
-            record.asset_entry.asset_key: record.asset_entry.last_materialization
-            for record in self._instance.get_asset_records(self._asset_keys)
+class AssetRecordLoader(RequestScopedBatchLoader[AssetKey, AssetRecord]):
+    """Loads asset records by asset key, e.g. for the latest materialization of an asset or its
+    cached partition status.
+    """
+
+    def fetch(self, keys: Sequence[AssetKey]) -> Mapping[AssetKey, AssetRecord]:
+        return {
+            record.asset_entry.asset_key: record for record in self.instance.get_asset_records(keys)
         }
 
+    def load_latest_materialization(self, key: AssetKey) -> Optional[EventLogEntry]:
+        asset_record = self.load(key)
+        return asset_record.asset_entry.last_materialization if asset_record else None
+
+
+class LatestAssetCheckExecutionLoader(
+    RequestScopedBatchLoader[AssetCheckKey, AssetCheckExecutionRecord]
+):
+    """Loads the latest execution of asset checks by asset check key."""
+
+    def fetch(
+        self, keys: Sequence[AssetCheckKey]
+    ) -> Mapping[AssetCheckKey, AssetCheckExecutionRecord]:
+        return self.instance.event_log_storage.get_latest_asset_check_execution_by_key(keys)
+
 
 class CrossRepoAssetDependedByLoader:
     """A batch loader that computes cross-repository asset dependencies. Locates source assets
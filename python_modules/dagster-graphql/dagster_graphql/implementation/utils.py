@@ -132,6 +132,23 @@ def _fn(*args: P.args, **kwargs: P.kwargs) -> T:
     return _fn
 
 
+_NON_BLOCKING_RESOLVER_ATTR = "__dagster_non_blocking_resolver__"
+
+
+def non_blocking_resolver(fn: T_Callable) -> T_Callable:
+    """Marks a sync resolver as pure: it only computes its value from its parent object and never
+    blocks on storage or a code location, so that servers that execute queries on an event loop
+    may run it on the loop rather than in a thread. Sync resolvers are assumed to block unless
+    they are marked. Must be the outermost decorator of the resolver.
+    """
+    setattr(fn, _NON_BLOCKING_RESOLVER_ATTR, True)
+    return fn
+
+
+def is_non_blocking_resolver(fn: Callable) -> bool:
+    return getattr(fn, _NON_BLOCKING_RESOLVER_ATTR, False)
+
+
 class UserFacingGraphQLError(Exception):
     # The `error` arg here should be a Graphene type implementing the interface `GrapheneError`, but
     # this is not trackable by the Python type system.
@@ -53,12 +53,12 @@
 )
 
 from ..implementation.fetch_assets import (
-    build_partition_statuses,
     get_freshness_info,
+    get_partition_statuses,
     get_partition_subsets,
 )
 from ..implementation.loader import (
-    BatchMaterializationLoader,
+    AssetRecordLoader,
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
@@ -128,7 +128,6 @@ def __init__(
         input_name: Optional[str],
         asset_key: AssetKey,
         asset_checks_loader: AssetChecksLoader,
-        materialization_loader: Optional[BatchMaterializationLoader] = None,
         depended_by_loader: Optional[CrossRepoAssetDependedByLoader] = None,
         partition_mapping: Optional[PartitionMapping] = None,
     ):
@@ -142,9 +141,6 @@ def __init__(
         self._asset_checks_loader = check.inst_param(
             asset_checks_loader, "asset_checks_loader", AssetChecksLoader
         )
-        self._latest_materialization_loader = check.opt_inst_param(
-            materialization_loader, "materialization_loader", BatchMaterializationLoader
-        )
         self._depended_by_loader = check.opt_inst_param(
             depended_by_loader, "depended_by_loader", CrossRepoAssetDependedByLoader
         )
@@ -164,7 +160,6 @@ def resolve_asset(self, _graphene_info: ResolveInfo):
             self._external_repository,
             asset_node,
             asset_checks_loader=self._asset_checks_loader,
-            materialization_loader=self._latest_materialization_loader,
         )
 
     def resolve_partitionMapping(
@@ -210,7 +205,6 @@ class GrapheneAssetNode(graphene.ObjectType):
     _node_definition_snap: Optional[Union[GraphDefSnap, OpDefSnap]]
     _external_job: Optional[ExternalJob]
     _external_repository: ExternalRepository
-    _latest_materialization_loader: Optional[BatchMaterializationLoader]
     _stale_status_loader: Optional[StaleStatusLoader]
     _asset_checks_loader: AssetChecksLoader
 
@@ -311,7 +305,6 @@ def __init__(
         external_repository: ExternalRepository,
         external_asset_node: ExternalAssetNode,
         asset_checks_loader: AssetChecksLoader,
-        materialization_loader: Optional[BatchMaterializationLoader] = None,
         depended_by_loader: Optional[CrossRepoAssetDependedByLoader] = None,
         stale_status_loader: Optional[StaleStatusLoader] = None,
         dynamic_partitions_loader: Optional[CachingDynamicPartitionsLoader] = None,
@@ -329,9 +322,6 @@ def __init__(
         self._external_asset_node = check.inst_param(
             external_asset_node, "external_asset_node", ExternalAssetNode
         )
-        self._latest_materialization_loader = check.opt_inst_param(
-            materialization_loader, "materialization_loader", BatchMaterializationLoader
-        )
         self._depended_by_loader = check.opt_inst_param(
             depended_by_loader, "depended_by_loader", CrossRepoAssetDependedByLoader
         )
@@ -565,17 +555,10 @@ def resolve_assetMaterializations(
         except ValueError:
             before_timestamp = None
 
-        if (
-            self._latest_materialization_loader
-            and limit == 1
-            and not partitions
-            and not before_timestamp
-        ):
-            latest_materialization_event = (
-                self._latest_materialization_loader.get_latest_materialization_for_asset_key(
-                    self._external_asset_node.asset_key
-                )
-            )
+        if limit == 1 and not partitions and not before_timestamp:
+            latest_materialization_event = AssetRecordLoader.for_context(
+                graphene_info.context
+            ).load_latest_materialization(self._external_asset_node.asset_key)
 
             if not latest_materialization_event:
                 return []
@@ -743,9 +726,8 @@ def resolve_dependedBy(self, graphene_info: ResolveInfo) -> List[GrapheneAssetDe
         if not depended_by_asset_nodes:
             return []
 
-        materialization_loader = BatchMaterializationLoader(
-            instance=graphene_info.context.instance,
-            asset_keys=[dep.downstream_asset_key for dep in depended_by_asset_nodes],
+        AssetRecordLoader.for_context(graphene_info.context).prime(
+            [dep.downstream_asset_key for dep in depended_by_asset_nodes]
         )
         asset_checks_loader = AssetChecksLoader(
             context=graphene_info.context,
@@ -759,7 +741,6 @@ def resolve_dependedBy(self, graphene_info: ResolveInfo) -> List[GrapheneAssetDe
                 input_name=dep.input_name,
                 asset_key=dep.downstream_asset_key,
                 asset_checks_loader=asset_checks_loader,
-                materialization_loader=materialization_loader,
                 depended_by_loader=_depended_by_loader,
             )
             for dep in depended_by_asset_nodes
@@ -797,9 +778,8 @@ def resolve_dependencies(self, graphene_info: ResolveInfo) -> Sequence[GrapheneA
         if not self._external_asset_node.dependencies:
             return []
 
-        materialization_loader = BatchMaterializationLoader(
-            instance=graphene_info.context.instance,
-            asset_keys=[dep.upstream_asset_key for dep in self._external_asset_node.dependencies],
+        AssetRecordLoader.for_context(graphene_info.context).prime(
+            [dep.upstream_asset_key for dep in self._external_asset_node.dependencies]
         )
         asset_checks_loader = AssetChecksLoader(
             context=graphene_info.context,
@@ -811,7 +791,6 @@ def resolve_dependencies(self, graphene_info: ResolveInfo) -> Sequence[GrapheneA
                 external_repository=self._external_repository,
                 input_name=dep.input_name,
                 asset_key=dep.upstream_asset_key,
-                materialization_loader=materialization_loader,
                 asset_checks_loader=asset_checks_loader,
                 partition_mapping=dep.partition_mapping,
             )
@@ -959,23 +938,12 @@ def resolve_assetPartitionStatuses(
             else None
         )
 
-        (
-            materialized_partition_subset,
-            failed_partition_subset,
-            in_progress_subset,
-        ) = get_partition_subsets(
+        return get_partition_statuses(
             graphene_info.context.instance,
             asset_key,
             self._dynamic_partitions_loader,
             partitions_def,
-        )
-
-        return build_partition_statuses(
-            self._dynamic_partitions_loader,
-            materialized_partition_subset,
-            failed_partition_subset,
-            in_progress_subset,
-            partitions_def,
+            AssetRecordLoader.for_context(graphene_info.context).load(asset_key),
         )
 
     def resolve_partitionStats(
@@ -1001,6 +969,7 @@ def resolve_partitionStats(
                     if self._external_asset_node.partitions_def_data
                     else None
                 ),
+                AssetRecordLoader.for_context(graphene_info.context).load(asset_key),
             )
 
             if (
@@ -31,6 +31,7 @@
 from dagster_graphql.implementation.asset_checks_loader import AssetChecksLoader
 from dagster_graphql.implementation.fetch_solids import get_solid, get_solids
 from dagster_graphql.implementation.loader import (
+    AssetRecordLoader,
     RepositoryScopedBatchLoader,
     StaleStatusLoader,
 )
@@ -347,6 +348,9 @@ def resolve_assetNodes(self, graphene_info: ResolveInfo):
             context=graphene_info.context,
             asset_keys=[node.asset_key for node in external_asset_nodes],
         )
+        AssetRecordLoader.for_context(graphene_info.context).prime(
+            node.asset_key for node in external_asset_nodes
+        )
         return [
             GrapheneAssetNode(
                 self._repository_location,
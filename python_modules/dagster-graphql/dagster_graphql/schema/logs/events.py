@@ -10,8 +10,8 @@
 from dagster_graphql.schema.tags import GrapheneEventTag
 
 from ...implementation.events import construct_basic_params
-from ...implementation.fetch_runs import get_run_by_id, get_step_stats
-from ...implementation.loader import BatchRunLoader
+from ...implementation.fetch_runs import get_step_stats
+from ...implementation.loader import RunRecordLoader
 from ..asset_checks import GrapheneAssetCheckEvaluation
 from ..asset_key import GrapheneAssetKey, GrapheneAssetLineageInfo
 from ..errors import GraphenePythonError, GrapheneRunNotFoundError
@@ -308,6 +308,19 @@ class Meta:
     logKey = graphene.NonNull(graphene.String)
 
 
+def _load_run_or_error(
+    graphene_info: ResolveInfo, run_id: str
+) -> Union["GrapheneRun", GrapheneRunNotFoundError]:
+    from ..pipelines.pipeline import GrapheneRun
+
+    # the runs of a list of events are loaded at once
+    record = RunRecordLoader.for_context(graphene_info.context).load(run_id)
+    if not record:
+        return GrapheneRunNotFoundError(run_id)
+
+    return GrapheneRun(record)
+
+
 def _construct_asset_event_metadata_params(event, metadata):
     metadata_params = {"label": metadata.label, "description": metadata.description}
     metadata_params.update(construct_basic_params(event))
@@ -337,7 +350,7 @@ def resolve_runOrError(
         self,
         graphene_info,
     ) -> Union["GrapheneRun", GrapheneRunNotFoundError]:
-        return get_run_by_id(graphene_info, self._event.run_id)
+        return _load_run_or_error(graphene_info, self._event.run_id)
 
     def resolve_stepStats(self, graphene_info) -> "GrapheneRunStepStats":
         run_id = self.runId  # type: ignore  # (value obj access)
@@ -369,9 +382,8 @@ class Meta:
 
     assetLineage = non_null_list(GrapheneAssetLineageInfo)
 
-    def __init__(self, event: EventLogEntry, assetLineage=None, loader=None):
+    def __init__(self, event: EventLogEntry, assetLineage=None):
         self._asset_lineage = check.opt_list_param(assetLineage, "assetLineage", AssetLineageInfo)
-        self._batch_run_loader = check.opt_inst_param(loader, "loader", BatchRunLoader)
 
         dagster_event = check.not_none(event.dagster_event)
         materialization = dagster_event.step_materialization_data.materialization
@@ -382,18 +394,6 @@ def __init__(self, event: EventLogEntry, assetLineage=None, loader=None):
             metadata=materialization,
         )
 
-    def resolve_runOrError(self, graphene_info: ResolveInfo):
-        from ..pipelines.pipeline import GrapheneRun
-
-        if self._batch_run_loader:
-            record = self._batch_run_loader.get_run_record_by_run_id(self._event.run_id)
-            if not record:
-                return GrapheneRunNotFoundError(self._event.run_id)
-
-            return GrapheneRun(record)
-
-        return super().resolve_runOrError(graphene_info)
-
     def resolve_assetLineage(self, _graphene_info: ResolveInfo):
         return [
             GrapheneAssetLineageInfo(
@@ -435,7 +435,7 @@ def resolve_assetKey(self, _graphene_info: ResolveInfo):
         return self._event.dagster_event.asset_materialization_planned_data.asset_key
 
     def resolve_runOrError(self, graphene_info: ResolveInfo):
-        return get_run_by_id(graphene_info, self._event.run_id)
+        return _load_run_or_error(graphene_info, self._event.run_id)
 
 
 class GrapheneHandledOutputEvent(graphene.ObjectType):
@@ -27,8 +27,12 @@
 from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import BatchRunLoader
-from ...implementation.utils import UserFacingGraphQLError, capture_error
+from ...implementation.loader import RunRecordLoader, RunStatsLoader
+from ...implementation.utils import (
+    UserFacingGraphQLError,
+    capture_error,
+    non_blocking_resolver,
+)
 from ..asset_checks import GrapheneAssetCheckHandle
 from ..asset_key import GrapheneAssetKey
 from ..dagster_types import (
@@ -239,9 +243,8 @@ def resolve_assetMaterializations(
             tags={tag["name"]: tag["value"] for tag in tags} if tags else None,
             limit=limit,
         )
-        run_ids = [event.run_id for event in events]
-        loader = BatchRunLoader(graphene_info.context.instance, run_ids) if run_ids else None
-        return [GrapheneMaterializationEvent(event=event, loader=loader) for event in events]
+        RunRecordLoader.for_context(graphene_info.context).prime(event.run_id for event in events)
+        return [GrapheneMaterializationEvent(event=event) for event in events]
 
     def resolve_assetObservations(
         self,
@@ -418,9 +421,11 @@ def resolve_hasTerminatePermission(self, graphene_info: ResolveInfo):
     def resolve_hasDeletePermission(self, graphene_info: ResolveInfo):
         return self._get_permission_value(Permissions.DELETE_PIPELINE_RUN, graphene_info)
 
+    @non_blocking_resolver
     def resolve_id(self, _graphene_info: ResolveInfo):
         return self.dagster_run.run_id
 
+    @non_blocking_resolver
     def resolve_repositoryOrigin(self, _graphene_info: ResolveInfo):
         return (
             GrapheneRepositoryOrigin(
@@ -433,18 +438,23 @@ def resolve_repositoryOrigin(self, _graphene_info: ResolveInfo):
     def resolve_pipeline(self, graphene_info: ResolveInfo):
         return get_job_reference_or_raise(graphene_info, self.dagster_run)
 
+    @non_blocking_resolver
     def resolve_pipelineName(self, _graphene_info: ResolveInfo):
         return self.dagster_run.job_name
 
+    @non_blocking_resolver
     def resolve_jobName(self, _graphene_info: ResolveInfo):
         return self.dagster_run.job_name
 
+    @non_blocking_resolver
     def resolve_solidSelection(self, _graphene_info: ResolveInfo):
         return self.dagster_run.op_selection
 
+    @non_blocking_resolver
     def resolve_assetSelection(self, _graphene_info: ResolveInfo):
         return self.dagster_run.asset_selection
 
+    @non_blocking_resolver
     def resolve_assetCheckSelection(self, _graphene_info: ResolveInfo):
         return (
             [GrapheneAssetCheckHandle(handle) for handle in self.dagster_run.asset_check_selection]
@@ -452,9 +462,11 @@ def resolve_assetCheckSelection(self, _graphene_info: ResolveInfo):
             else None
         )
 
+    @non_blocking_resolver
     def resolve_resolvedOpSelection(self, _graphene_info: ResolveInfo):
         return self.dagster_run.resolved_op_selection
 
+    @non_blocking_resolver
     def resolve_pipelineSnapshotId(self, _graphene_info: ResolveInfo):
         return self.dagster_run.job_snapshot_id
 
@@ -475,6 +487,7 @@ def resolve_stats(self, graphene_info: ResolveInfo):
     def resolve_stepStats(self, graphene_info: ResolveInfo):
         return get_step_stats(graphene_info, self.run_id)
 
+    @non_blocking_resolver
     def resolve_computeLogs(self, _graphene_info: ResolveInfo, stepKey):
         return GrapheneComputeLogs(runId=self.run_id, stepKey=stepKey)
 
@@ -501,15 +514,19 @@ def resolve_executionPlan(self, graphene_info: ResolveInfo):
             else None
         )
 
+    @non_blocking_resolver
     def resolve_stepKeysToExecute(self, _graphene_info: ResolveInfo):
         return self.dagster_run.step_keys_to_execute
 
+    @non_blocking_resolver
     def resolve_runConfigYaml(self, _graphene_info: ResolveInfo):
         return dump_run_config_yaml(self.dagster_run.run_config)
 
+    @non_blocking_resolver
     def resolve_runConfig(self, _graphene_info: ResolveInfo):
         return self.dagster_run.run_config
 
+    @non_blocking_resolver
     def resolve_tags(self, _graphene_info: ResolveInfo):
         return [
             GraphenePipelineTag(key=key, value=value)
@@ -517,9 +534,11 @@ def resolve_tags(self, _graphene_info: ResolveInfo):
             if get_tag_type(key) != TagType.HIDDEN
         ]
 
+    @non_blocking_resolver
     def resolve_rootRunId(self, _graphene_info: ResolveInfo):
         return self.dagster_run.root_run_id
 
+    @non_blocking_resolver
     def resolve_parentRunId(self, _graphene_info: ResolveInfo):
         return self.dagster_run.parent_run_id
 
@@ -527,6 +546,7 @@ def resolve_parentRunId(self, _graphene_info: ResolveInfo):
     def run_id(self):
         return self.runId
 
+    @non_blocking_resolver
     def resolve_canTerminate(self, _graphene_info: ResolveInfo):
         # short circuit if the pipeline run is in a terminal state
         if self.dagster_run.is_finished:
@@ -573,7 +593,9 @@ def resolve_startTime(self, graphene_info: ResolveInfo):
                 return run_record.end_time
 
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = check.not_none(
+                    RunStatsLoader.for_context(graphene_info.context).load(self.runId)
+                )
 
             if self._run_stats.start_time is None and self._run_stats.end_time:
                 return self._run_stats.end_time
@@ -585,7 +607,9 @@ def resolve_endTime(self, graphene_info: ResolveInfo):
         run_record = self._get_run_record(graphene_info.context.instance)
         if run_record.end_time is None and self.dagster_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = check.not_none(
+                    RunStatsLoader.for_context(graphene_info.context).load(self.runId)
+                )
             return self._run_stats.end_time
         return run_record.end_time
 
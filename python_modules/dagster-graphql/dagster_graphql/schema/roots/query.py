@@ -82,7 +82,7 @@
 from ...implementation.fetch_solids import get_graph_or_error
 from ...implementation.fetch_ticks import get_instigation_ticks
 from ...implementation.loader import (
-    BatchMaterializationLoader,
+    AssetRecordLoader,
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
@@ -919,9 +919,8 @@ def resolve_assetNodes(
         if not results:
             return []
 
-        materialization_loader = BatchMaterializationLoader(
-            instance=graphene_info.context.instance,
-            asset_keys=[node.assetKey for node in results],
+        AssetRecordLoader.for_context(graphene_info.context).prime(
+            node.assetKey for node in results
         )
         asset_checks_loader = AssetChecksLoader(
             context=graphene_info.context,
@@ -947,7 +946,6 @@ def load_asset_graph() -> ExternalAssetGraph:
                 node.external_repository,
                 node.external_asset_node,
                 asset_checks_loader=asset_checks_loader,
-                materialization_loader=materialization_loader,
                 depended_by_loader=depended_by_loader,
                 stale_status_loader=stale_status_loader,
                 dynamic_partitions_loader=dynamic_partitions_loader,
@@ -13,6 +13,7 @@
 
 from dagster_graphql.implementation.asset_checks_loader import AssetChecksLoader
 from dagster_graphql.implementation.events import iterate_metadata_entries
+from dagster_graphql.implementation.loader import RunStepStatsLoader
 from dagster_graphql.schema.logs.events import GrapheneRunStepStats
 from dagster_graphql.schema.metadata import GrapheneMetadataEntry
 
@@ -612,9 +613,13 @@ def resolve_stepStats(self, _graphene_info: ResolveInfo, limit: Optional[int]):
         instance = _graphene_info.context.instance
         runs_filter = RunsFilter(job_name=self._solid.get_pipeline_name())
         runs = instance.get_runs(runs_filter, limit=limit)
+        step_keys = frozenset([str(self.handleID)])
+        step_stats_by_key = RunStepStatsLoader.for_context(_graphene_info.context).load_many(
+            (run.run_id, step_keys) for run in runs
+        )
         nodes = []
         for run in runs:
-            stats = instance.get_run_step_stats(run.run_id, [str(self.handleID)])
+            stats = check.not_none(step_stats_by_key[(run.run_id, step_keys)])
             if len(stats):
                 nodes.append(GrapheneRunStepStats(stats[0]))
         return GrapheneSolidStepStatsConnection(nodes=nodes)
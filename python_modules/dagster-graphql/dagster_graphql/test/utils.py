@@ -56,6 +56,9 @@ def main_repo_name() -> str:
 def execute_dagster_graphql(
     context: WorkspaceRequestContext, query: str, variables: Optional[GqlVariables] = None
 ) -> GqlResult:
+    # tests reuse a request context across queries, so the storage queries batched and cached by
+    # its loaders are cleared to serve each query as a new request would
+    context.loaders.clear()
     result = SCHEMA.execute(
         query,
         context_value=context,
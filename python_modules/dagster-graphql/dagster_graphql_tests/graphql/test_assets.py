@@ -2,6 +2,7 @@
 import os
 import time
 from typing import Dict, List, Optional, Sequence
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -10,6 +11,7 @@
     AssetSelection,
     DagsterEventType,
     DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
     MultiPartitionsDefinition,
     Output,
     StaticPartitionsDefinition,
@@ -18,6 +20,7 @@
     repository,
 )
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
+from dagster._core.definitions.partition import CachingDynamicPartitionsLoader
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.event_log.base import EventRecordsFilter
@@ -28,6 +31,10 @@
     LAUNCH_PIPELINE_EXECUTION_MUTATION,
     LAUNCH_PIPELINE_REEXECUTION_MUTATION,
 )
+from dagster_graphql.implementation.fetch_assets import (
+    build_partition_statuses,
+    get_partition_statuses,
+)
 from dagster_graphql.test.utils import (
     GqlAssetKey,
     GqlTag,
@@ -2081,6 +2088,57 @@ def _get_date_float(dt_str):
         # multipartitions_2 should have no materialized partitions
         assert result.data["assetNodes"][1]["assetPartitionStatuses"]["ranges"] == []
 
+    def test_multipartitions_statuses_reused(self, graphql_context: WorkspaceRequestContext):
+        if not graphql_context.instance.can_cache_asset_status_data():
+            pytest.skip("Partition statuses are only reused for cached asset statuses")
+
+        selector = infer_job_selector(graphql_context, "multipartitions_job")
+        _create_partitioned_run(
+            graphql_context,
+            "multipartitions_job",
+            MultiPartitionKey({"date": "2022-01-01", "ab": "a"}),
+            asset_selection=[AssetKey("multipartitions_1")],
+        )
+
+        def _get_ranges():
+            result = execute_dagster_graphql(
+                graphql_context,
+                GET_2D_ASSET_PARTITIONS,
+                variables={"pipelineSelector": selector},
+            )
+            assert result.data
+            return result.data["assetNodes"][0]["assetPartitionStatuses"]["ranges"]
+
+        ranges = _get_ranges()
+        assert len(ranges) == 1
+        assert ranges[0]["secondaryDim"]["materializedPartitions"] == ["a"]
+
+        # the statuses aren't built again until the cached status of the asset changes
+        with mock.patch(
+            "dagster_graphql.implementation.fetch_assets.build_partition_statuses",
+            wraps=build_partition_statuses,
+        ) as build_partition_statuses_mock:
+            assert _get_ranges() == ranges
+            # only the statuses of multipartitions_2, which has no cached status, are built
+            assert all(
+                len(call.args[1]) == 0 for call in build_partition_statuses_mock.call_args_list
+            )
+
+            _create_partitioned_run(
+                graphql_context,
+                "multipartitions_job",
+                MultiPartitionKey({"date": "2022-01-02", "ab": "a"}),
+                asset_selection=[AssetKey("multipartitions_1")],
+            )
+            ranges = _get_ranges()
+            assert any(
+                len(call.args[1]) > 0 for call in build_partition_statuses_mock.call_args_list
+            )
+
+        assert len(ranges) == 1
+        assert ranges[0]["primaryDimStartKey"] == "2022-01-01"
+        assert ranges[0]["primaryDimEndKey"] == "2022-01-02"
+
     def test_multipartitions_get_failed_status(self, graphql_context: WorkspaceRequestContext):
         def _get_date_float(dt_str):
             return (
@@ -2877,3 +2935,40 @@ def test_2d_subset_backcompat():
             assert len(ranges[1]["secondaryDim"]["materializedPartitions"]) == 2
             assert set(ranges[1]["secondaryDim"]["materializedPartitions"]) == {"a", "c"}
             assert set(ranges[1]["secondaryDim"]["unmaterializedPartitions"]) == {"b", "d"}
+
+
+def test_partition_statuses_rebuilt_when_partition_keys_change():
+    with instance_for_test(overrides={"asset_status_cache": {"eager_updates": True}}) as instance:
+        if not instance.can_cache_asset_status_data():
+            pytest.skip("Partition statuses are only reused for cached asset statuses")
+
+        def _get_statuses(asset_key, partitions_def):
+            return get_partition_statuses(
+                instance, asset_key, CachingDynamicPartitionsLoader(instance), partitions_def
+            )
+
+        # dynamic partitions are added without any new events for the asset
+        dynamic_asset_key = AssetKey("statuses_dynamic_asset")
+        dynamic_partitions_def = DynamicPartitionsDefinition(name="statuses_fruits")
+        instance.add_dynamic_partitions("statuses_fruits", ["apple", "banana"])
+        instance.report_runless_asset_event(
+            AssetMaterialization(dynamic_asset_key, partition="apple")
+        )
+        statuses = _get_statuses(dynamic_asset_key, dynamic_partitions_def)
+        assert set(statuses.materializedPartitions) == {"apple"}
+        assert set(statuses.unmaterializedPartitions) == {"banana"}
+        assert _get_statuses(dynamic_asset_key, dynamic_partitions_def) is statuses
+
+        instance.add_dynamic_partitions("statuses_fruits", ["cherry"])
+        statuses = _get_statuses(dynamic_asset_key, dynamic_partitions_def)
+        assert set(statuses.materializedPartitions) == {"apple"}
+        assert set(statuses.unmaterializedPartitions) == {"banana", "cherry"}
+
+        # the static partition keys of an asset change when its code is reloaded
+        static_asset_key = AssetKey("statuses_static_asset")
+        instance.report_runless_asset_event(AssetMaterialization(static_asset_key, partition="a"))
+        statuses = _get_statuses(static_asset_key, StaticPartitionsDefinition(["a", "b"]))
+        assert set(statuses.unmaterializedPartitions) == {"b"}
+        statuses = _get_statuses(static_asset_key, StaticPartitionsDefinition(["a", "b", "c"]))
+        assert set(statuses.materializedPartitions) == {"a"}
+        assert set(statuses.unmaterializedPartitions) == {"b", "c"}
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+from dagster._core.event_api import EventLogCursor
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
+from dagster_graphql.implementation.execution import (
+    RUN_LOG_SUBSCRIPTION_METRICS,
+    gen_events_for_run,
+)
+from dagster_graphql.implementation.execution.run_log_subscription_hub import (
+    RunLogSubscriptionHub,
+)
+
+
+def _gen_live_messages(instance, run, num_events):
+    """Subscribes to the logs of the run, then stores engine events for it that are all handed to
+    the subscription at once, and returns the messages of the subscription for them.
+    """
+    watch_callbacks = []
+    graphene_info = SimpleNamespace(context=SimpleNamespace(instance=instance))
+
+    async def _gen():
+        subscription = gen_events_for_run(graphene_info, run.run_id)
+        past_events_message = await subscription.__anext__()
+        assert not past_events_message.hasMorePastEvents
+
+        # the subscription starts watching for live events once it is resumed
+        next_message = asyncio.ensure_future(subscription.__anext__())
+        while not watch_callbacks:
+            await asyncio.sleep(0)
+        (watch_callback,) = watch_callbacks
+
+        for i in range(num_events):
+            instance.report_engine_event(f"event {i}", run)
+        for event_record in instance.get_records_for_run(
+            run.run_id, cursor=past_events_message.cursor
+        ).records:
+            watch_callback(
+                event_record.event_log_entry,
+                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+            )
+
+        messages = [await next_message]
+        while len(_get_log_messages(messages)) < num_events:
+            messages.append(await subscription.__anext__())
+        await subscription.aclose()
+        return messages
+
+    with mock.patch.object(
+        instance,
+        "watch_event_logs",
+        side_effect=lambda _run_id, _cursor, cb: watch_callbacks.append(cb),
+    ), mock.patch.object(instance, "end_watch_event_logs"):
+        return asyncio.run(_gen())
+
+
+def _get_log_messages(subscription_messages):
+    return [message.message for batch in subscription_messages for message in batch.messages]
+
+
+def test_live_events_are_coalesced():
+    with instance_for_test() as instance, environ(
+        {"DAGSTER_UI_LIVE_EVENT_BATCH_WINDOW_MS": "10"}
+    ):
+        run = create_run_for_test(instance)
+        messages = _gen_live_messages(instance, run, 5)
+
+    assert len(messages) == 1
+    assert _get_log_messages(messages) == [f"event {i}" for i in range(5)]
+
+
+def test_lagging_subscriber_catches_up_from_storage():
+    num_lags = RUN_LOG_SUBSCRIPTION_METRICS.num_lags
+    num_dropped_events = RUN_LOG_SUBSCRIPTION_METRICS.num_dropped_events
+    with instance_for_test() as instance, environ(
+        {"DAGSTER_UI_LIVE_EVENT_QUEUE_SIZE": "2", "DAGSTER_UI_LIVE_EVENT_BATCH_SIZE": "2"}
+    ):
+        run = create_run_for_test(instance)
+        messages = _gen_live_messages(instance, run, 5)
+
+    # the events that didn't fit in the queue are read back from storage, in order
+    assert len(messages) == 2
+    assert _get_log_messages(messages) == [f"event {i}" for i in range(5)]
+    assert RUN_LOG_SUBSCRIPTION_METRICS.num_lags == num_lags + 1
+    assert RUN_LOG_SUBSCRIPTION_METRICS.num_dropped_events == num_dropped_events + 3
+    assert RUN_LOG_SUBSCRIPTION_METRICS.num_lagging_subscribers == 0
+
+
+def test_hub_subscribers_on_different_loops():
+    watch_callbacks = []
+    num_subscribers = 2
+    subscribed = threading.Barrier(num_subscribers + 1, timeout=30)
+
+    with instance_for_test() as instance, mock.patch.object(
+        instance,
+        "watch_event_logs",
+        side_effect=lambda _run_id, _cursor, cb: watch_callbacks.append(cb),
+    ), mock.patch.object(instance, "end_watch_event_logs"):
+        run = create_run_for_test(instance)
+        hub = RunLogSubscriptionHub(instance)
+
+        async def _subscribe():
+            subscription = hub.gen_events_for_run(run.run_id, None)
+            await subscription.__anext__()
+            next_message = asyncio.ensure_future(subscription.__anext__())
+            subscribed.wait()
+            message = await asyncio.wait_for(next_message, timeout=30)
+            await subscription.aclose()
+            return message
+
+        # each subscriber runs on an event loop of its own
+        with ThreadPoolExecutor(max_workers=num_subscribers) as executor:
+            futures = [
+                executor.submit(asyncio.run, _subscribe()) for _ in range(num_subscribers)
+            ]
+            subscribed.wait()
+            (watch_callback,) = watch_callbacks
+            instance.report_engine_event("live event", run)
+            record = instance.get_records_for_run(run.run_id, ascending=False, limit=1).records[0]
+            watch_callback(
+                record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
+            )
+            messages = [future.result() for future in futures]
+
+        assert [_get_log_messages([message]) for message in messages] == [
+            ["live event"],
+            ["live event"],
+        ]
+        assert hub.watched_run_ids == []
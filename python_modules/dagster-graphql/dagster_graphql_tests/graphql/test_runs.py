@@ -240,6 +240,27 @@
 }
 """
 
+RUNS_STATS_QUERY = """
+{
+  pipelineRunsOrError {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on RunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+        stepStats {
+          stepKey
+          status
+        }
+      }
+    }
+  }
+}
+"""
+
 RUN_CONCURRENCY_QUERY = """
 {
   pipelineRunsOrError {
@@ -861,6 +882,28 @@ def test_asset_batching():
             assert counts.get("DagsterInstance.get_run_records") == 1
 
 
+def test_runs_stats_batch_loading():
+    with instance_for_test() as instance:
+        repo = get_asset_repo()
+        foo_job = repo.get_job("foo_job")
+        for _ in range(3):
+            foo_job.execute_in_process(instance=instance)
+        with define_out_of_process_context(__file__, "asset_repo", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(context, RUNS_STATS_QUERY)
+            runs = result.data["pipelineRunsOrError"]["results"]
+            assert len(runs) == 3
+            for run in runs:
+                assert run["stats"] == {"stepsSucceeded": 1}
+                assert run["stepStats"] == [{"stepKey": "foo", "status": "SUCCESS"}]
+
+            counts = traced_counter.get().counts()
+            assert counts.get("DagsterInstance.get_run_stats_for_runs") == 1
+            assert counts.get("DagsterInstance.get_run_step_stats_for_runs") == 1
+            assert not counts.get("DagsterInstance.get_run_stats")
+            assert not counts.get("DagsterInstance.get_run_step_stats")
+
+
 def test_run_has_concurrency_slots():
     with tempfile.TemporaryDirectory() as temp_dir:
         with instance_for_test(
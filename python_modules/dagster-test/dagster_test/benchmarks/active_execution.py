@@ -0,0 +1,160 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from typing import Callable, Mapping, Sequence
+
+from dagster import DynamicOut, DynamicOutput, GraphDefinition, JobDefinition, job, op
+from dagster._core.definitions.dependency import DependencyDefinition, NodeInvocation
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+
+DESC = """
+Analyze execution time when driving an ActiveExecution through large execution plans. Every vended
+step is reported as successful, so the timings measure the scheduling overhead of ActiveExecution
+only. Two plan shapes are benchmarked:
+
+    layered:         layers of 100 steps, each step depending on the step in the same position of
+                     the previous layer
+    dynamic fan-out: a dynamic output mapped to N steps and collected by a single step
+
+The plan sizes are configurable via the `--num-steps` arg. Execution time is logged for each plan.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    nargs="+",
+    default=[1_000, 10_000, 50_000],
+    help="Set the number of steps in each benchmarked plan.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op
+def root():
+    return 1
+
+
+@op
+def passthrough(_x):
+    return 1
+
+
+def build_layered_job(num_steps: int, width: int = 100) -> JobDefinition:
+    """A plan of layers of `width` steps, each depending on the step in the same position of the
+    previous layer.
+    """
+    dependencies = {}
+    for i in range(num_steps):
+        layer, position = divmod(i, width)
+        if layer == 0:
+            dependencies[NodeInvocation("root", alias=f"step_{i}")] = {}
+        else:
+            upstream = (layer - 1) * width + position
+            dependencies[NodeInvocation("passthrough", alias=f"step_{i}")] = {
+                "_x": DependencyDefinition(f"step_{upstream}")
+            }
+
+    return GraphDefinition(
+        name="layered", node_defs=[root, passthrough], dependencies=dependencies
+    ).to_job()
+
+
+def build_fan_out_job(num_steps: int) -> JobDefinition:
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(num_steps):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def collect(_xs):
+        pass
+
+    @job
+    def fan_out():
+        collect(emit().map(passthrough).collect())
+
+    return fan_out
+
+
+def drive(plan: ExecutionPlan, fan_out: int = 0, max_concurrent: int = 16) -> int:
+    """Reports every vended step as successful, emitting `fan_out` mapping keys from each dynamic
+    output. Returns the number of steps that were executed.
+    """
+    executed = 0
+    with plan.start(RetryMode.DISABLED, max_concurrent=max_concurrent) as active_execution:
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute():
+                for step_output in step.step_outputs:
+                    mapping_keys = (
+                        [str(i) for i in range(fan_out)] if step_output.is_dynamic else [None]
+                    )
+                    for mapping_key in mapping_keys:
+                        active_execution.handle_event(
+                            DagsterEvent(
+                                DagsterEventType.STEP_OUTPUT.value,
+                                job_name="benchmark",
+                                step_key=step.key,
+                                event_specific_data=StepOutputData(
+                                    StepOutputHandle(step.key, step_output.name, mapping_key)
+                                ),
+                            )
+                        )
+                active_execution.handle_event(
+                    DagsterEvent(
+                        DagsterEventType.STEP_SUCCESS.value,
+                        job_name="benchmark",
+                        step_key=step.key,
+                        event_specific_data=StepSuccessData(duration_ms=1.0),
+                    )
+                )
+                executed += 1
+
+            # as the executors do with plan_events_iterator, process the completed steps so that
+            # newly resolved dynamic steps are pending before checking for completion
+            assert not active_execution.get_steps_to_skip()
+            assert not active_execution.get_steps_to_abandon()
+    return executed
+
+
+def _benchmarks(num_steps: int) -> Mapping[str, Callable[[], int]]:
+    layered_plan = create_execution_plan(build_layered_job(num_steps))
+    return {
+        "layered": lambda: drive(layered_plan),
+        # each run resolves the dynamic steps on a fresh plan
+        "dynamic fan-out": lambda: drive(
+            create_execution_plan(build_fan_out_job(num_steps)), fan_out=num_steps
+        ),
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps_list: Sequence[int]) -> None:
+    for num_steps in num_steps_list:
+        print(f"active execution benchmarks ({num_steps} steps)")
+        for name, fn in _benchmarks(num_steps).items():
+            start = time.perf_counter()
+            executed = fn()
+            print(f"  {name:<16} {time.perf_counter() - start:9.2f} s ({executed} steps)")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps)
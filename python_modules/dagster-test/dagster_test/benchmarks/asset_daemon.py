@@ -0,0 +1,179 @@
+# ruff: noqa: T201
+
+import argparse
+import logging
+import time
+from typing import Optional, Sequence
+
+import dagster._check as check
+from dagster import AssetMaterialization, AssetSpec, AutoMaterializePolicy, multi_asset
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.utils import InheritContextThreadPoolExecutor
+
+DESC = """
+Analyze execution time of a single asset daemon tick over a large asset graph, evaluating the
+assets of each topological level serially and on a threadpool. The graph has `--num-levels` levels
+of `--width` assets. Each asset depends on two assets of the previous level, a third of the
+policies are lazy, and every other pair of assets in a level is a non-subsettable multi-asset.
+
+Before the ticks are evaluated, every `--materialized-every`th root asset is materialized so that
+the tick has work to do. Every tick starts from an empty cursor on the same instance, so each mode
+does the same work. Each mode is timed `--repeat` times and the best time is logged, along with
+the number of requested runs, which must match across modes.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_daemon",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-levels",
+    type=int,
+    default=10,
+    help="Set the number of topological levels in the asset graph.",
+)
+
+parser.add_argument(
+    "--width",
+    type=int,
+    default=200,
+    help="Set the number of assets in each level. Must be even.",
+)
+
+parser.add_argument(
+    "--materialized-every",
+    type=int,
+    default=3,
+    help="Materialize every Nth root asset before evaluating the ticks.",
+)
+
+parser.add_argument(
+    "--num-workers",
+    type=int,
+    nargs="+",
+    default=[2, 4, 8],
+    help="Set the threadpool sizes to benchmark against serial evaluation.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Set the number of times each tick is timed.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_assets(num_levels: int, width: int) -> Sequence[AssetsDefinition]:
+    assets = []
+    for level in range(num_levels):
+        for i in range(0, width, 2):
+            specs = [
+                AssetSpec(
+                    f"asset_{level}_{j}",
+                    deps=[f"asset_{level - 1}_{k}" for k in {j, (j + 1) % width}] if level else [],
+                    auto_materialize_policy=(
+                        AutoMaterializePolicy.lazy()
+                        if i % 3 == 2
+                        else AutoMaterializePolicy.eager()
+                    ),
+                )
+                for j in [i, i + 1]
+            ]
+            # every other pair is a non-subsettable multi-asset, the others are single assets
+            for group in [specs] if i % 4 == 0 else [[spec] for spec in specs]:
+
+                @multi_asset(name=f"multi_asset_{group[0].key.to_python_identifier()}", specs=group)
+                def _assets():
+                    ...
+
+                assets.append(_assets)
+    return assets
+
+
+def evaluate_tick(
+    instance: DagsterInstance,
+    asset_graph: AssetGraph,
+    threadpool_executor: Optional[InheritContextThreadPoolExecutor],
+) -> int:
+    run_requests, _, _ = AssetDaemonContext(
+        evaluation_id=1,
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=AssetDaemonCursor.empty(),
+        materialize_run_tags={},
+        observe_run_tags={},
+        auto_observe=False,
+        target_asset_keys=None,
+        respect_materialization_data_versions=False,
+        logger=logging.getLogger("dagster.asset_daemon_benchmark"),
+        threadpool_executor=threadpool_executor,
+    ).evaluate()
+    return len(run_requests)
+
+
+def time_tick(
+    name: str,
+    instance: DagsterInstance,
+    asset_graph: AssetGraph,
+    threadpool_executor: Optional[InheritContextThreadPoolExecutor],
+    repeat: int,
+) -> int:
+    best = None
+    num_run_requests = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        num_run_requests = evaluate_tick(instance, asset_graph, threadpool_executor)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {name:<12} {best:9.2f} s ({num_run_requests} run requests)")
+    return num_run_requests
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_levels: int,
+    width: int,
+    materialized_every: int,
+    num_workers: Sequence[int],
+    repeat: int,
+) -> None:
+    asset_graph = AssetGraph.from_assets(build_assets(num_levels, width))
+    print(
+        f"asset daemon tick benchmarks ({num_levels * width} assets in {num_levels} levels, best"
+        f" of {repeat})"
+    )
+    with instance_for_test() as instance:
+        for i in range(0, width, materialized_every):
+            instance.report_runless_asset_event(AssetMaterialization(f"asset_0_{i}"))
+
+        serial_run_requests = time_tick("serial", instance, asset_graph, None, repeat)
+        for max_workers in num_workers:
+            with InheritContextThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="asset_daemon_worker"
+            ) as threadpool_executor:
+                threaded_run_requests = time_tick(
+                    f"{max_workers} workers", instance, asset_graph, threadpool_executor, repeat
+                )
+            check.invariant(
+                threaded_run_requests == serial_run_requests,
+                "Threaded evaluation requested a different number of runs than serial evaluation",
+            )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_levels, args.width, args.materialized_every, args.num_workers, args.repeat)
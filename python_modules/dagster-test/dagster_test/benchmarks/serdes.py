@@ -0,0 +1,141 @@
+# ruff: noqa: T201
+
+import argparse
+import timeit
+from enum import Enum
+from typing import AbstractSet, Any, Callable, Mapping, NamedTuple, Optional, Sequence
+
+from dagster._serdes.serdes import (
+    SerdesFormat,
+    SetToSequenceFieldSerializer,
+    WhitelistMap,
+    _whitelist_for_serdes,
+    deserialize_value,
+    pack_value,
+    serialize_value,
+    unpack_value,
+)
+
+DESC = """
+Analyze execution time when packing, unpacking, serializing and deserializing a batch of
+whitelisted NamedTuples. Each record in the batch uses a renamed storage field, a field that is
+skipped when empty, a custom field serializer, an enum and nested metadata, so that every branch
+of NamedTupleSerializer is exercised.
+
+The batch size is configurable via the `--num-records` arg. Each operation is timed
+`--repeat` times and the best time is logged.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-records",
+    type=int,
+    default=5000,
+    help="Set the number of records in the serialized batch.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=5,
+    help="Set the number of times each operation is timed.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+BENCH_WHITELIST_MAP = WhitelistMap.create()
+
+
+@_whitelist_for_serdes(BENCH_WHITELIST_MAP)
+class BenchStatus(Enum):
+    SUCCESS = "SUCCESS"
+    FAILURE = "FAILURE"
+
+
+@_whitelist_for_serdes(BENCH_WHITELIST_MAP)
+class BenchKey(NamedTuple):
+    path: Sequence[str]
+
+
+@_whitelist_for_serdes(
+    BENCH_WHITELIST_MAP,
+    storage_field_names={"key": "asset_key"},
+    skip_when_empty_fields={"description"},
+    field_serializers={"tags": SetToSequenceFieldSerializer},
+)
+class BenchRecord(NamedTuple):
+    key: BenchKey
+    status: BenchStatus
+    tags: AbstractSet[str]
+    metadata: Mapping[str, Any]
+    description: Optional[str] = None
+
+
+@_whitelist_for_serdes(BENCH_WHITELIST_MAP)
+class BenchBatch(NamedTuple):
+    run_id: str
+    records: Sequence[BenchRecord]
+
+
+def build_batch(num_records: int) -> BenchBatch:
+    return BenchBatch(
+        run_id="bench_run",
+        records=[
+            BenchRecord(
+                key=BenchKey(["prefix", f"asset_{i}"]),
+                status=BenchStatus.SUCCESS if i % 3 else BenchStatus.FAILURE,
+                tags={"a", f"tag_{i % 10}"},
+                metadata={"rows": i, "path": f"/data/{i}.parquet", "nested": {"ok": True}},
+                description=None if i % 2 else f"record {i}",
+            )
+            for i in range(num_records)
+        ],
+    )
+
+
+def get_benchmarks(batch: BenchBatch) -> Mapping[str, Callable[[], Any]]:
+    packed = pack_value(batch, whitelist_map=BENCH_WHITELIST_MAP)
+    json_str = serialize_value(batch, whitelist_map=BENCH_WHITELIST_MAP)
+    compact_str = serialize_value(
+        batch, whitelist_map=BENCH_WHITELIST_MAP, serdes_format=SerdesFormat.COMPACT_JSON
+    )
+    return {
+        "pack_value": lambda: pack_value(batch, whitelist_map=BENCH_WHITELIST_MAP),
+        "unpack_value": lambda: unpack_value(packed, whitelist_map=BENCH_WHITELIST_MAP),
+        "serialize_value (json)": lambda: serialize_value(
+            batch, whitelist_map=BENCH_WHITELIST_MAP
+        ),
+        "deserialize_value (json)": lambda: deserialize_value(
+            json_str, BenchBatch, whitelist_map=BENCH_WHITELIST_MAP
+        ),
+        "serialize_value (compact_json)": lambda: serialize_value(
+            batch, whitelist_map=BENCH_WHITELIST_MAP, serdes_format=SerdesFormat.COMPACT_JSON
+        ),
+        "deserialize_value (compact_json)": lambda: deserialize_value(
+            compact_str, BenchBatch, whitelist_map=BENCH_WHITELIST_MAP
+        ),
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_records: int, repeat: int) -> None:
+    batch = build_batch(num_records)
+    print(f"serdes benchmarks ({num_records} records, best of {repeat})")
+    for name, fn in get_benchmarks(batch).items():
+        best = min(timeit.repeat(fn, number=1, repeat=repeat))
+        print(f"  {name:<34} {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_records, args.repeat)
@@ -15,12 +15,14 @@ def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: Optional[int] = None,
+    max_resolver_workers: Optional[int] = None,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
     )
     check.str_param(path_prefix, "path_prefix")
+    check.opt_int_param(max_resolver_workers, "max_resolver_workers")
 
     instance = workspace_process_context.instance
 
@@ -38,4 +40,5 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        max_resolver_workers=max_resolver_workers,
     ).create_asgi_app(**kwargs)
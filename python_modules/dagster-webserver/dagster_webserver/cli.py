@@ -172,6 +172,17 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--max-resolver-workers",
+    help=(
+        "Execute GraphQL queries on the event loop of the server, running the sync resolvers that"
+        " aren't marked as non-blocking on a pool of this many threads, instead of executing each"
+        " query on a thread of its own."
+    ),
+    type=click.INT,
+    required=False,
+    default=None,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -186,6 +197,7 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    max_resolver_workers: Optional[int],
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -222,6 +234,7 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                max_resolver_workers,
             )
 
 
@@ -244,6 +257,7 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    max_resolver_workers: Optional[int] = None,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -252,11 +266,16 @@ def host_dagster_ui_with_workspace_process_context(
     check.opt_int_param(port, "port")
     check.str_param(path_prefix, "path_prefix")
     check.opt_int_param(live_data_poll_rate, "live_data_poll_rate")
+    check.opt_int_param(max_resolver_workers, "max_resolver_workers")
 
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        max_resolver_workers,
+        lifespan=_lifespan,
     )
 
     if not port:
@@ -1,10 +1,15 @@
+import inspect
 from abc import ABC, abstractmethod
-from asyncio import Task, get_event_loop, run
+from asyncio import Future, Task, get_event_loop, get_running_loop, run
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from enum import Enum
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
     List,
     Optional,
@@ -18,9 +23,9 @@
 from dagster._serdes import pack_value
 from dagster._seven import json
 from dagster._utils.error import serializable_error_info_from_exc_info
-from dagster_graphql.implementation.utils import ErrorCapture
+from dagster_graphql.implementation.utils import ErrorCapture, is_non_blocking_resolver
 from graphene import Schema
-from graphql import GraphQLError, GraphQLFormattedError
+from graphql import GraphQLError, GraphQLFormattedError, GraphQLResolveInfo
 from graphql.execution import ExecutionResult
 from starlette import status
 from starlette.applications import Starlette
@@ -53,12 +58,124 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+class BlockingResolverExecutor:
+    """Runs the sync resolvers of GraphQL fields in a bounded pool of threads, so that queries can
+    execute on the event loop of the server.
+
+    Every sync resolver is assumed to block on storage or a code location and is run in the pool,
+    unless it is marked with non_blocking_resolver, which declares that it only computes its value
+    from its parent object. Marked resolvers run on the event loop, so that large lists of objects
+    don't take a thread hop per field of each object.
+    """
+
+    def __init__(self, max_workers: int):
+        check.invariant(max_workers > 0, "max_workers must be positive")
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dagster-webserver-resolver"
+        )
+        self._is_blocking_by_field: Dict[Tuple[str, str], bool] = {}
+
+    def is_blocking(self, info: GraphQLResolveInfo) -> bool:
+        key = (info.parent_type.name, info.field_name)
+        if key not in self._is_blocking_by_field:
+            field = info.parent_type.fields.get(info.field_name)
+            resolve = field.resolve if field else None
+            # fields without a resolver method read an attribute of their parent object, and
+            # introspection fields, async resolvers and resolvers marked as pure don't block
+            self._is_blocking_by_field[key] = (
+                resolve is not None
+                and not isinstance(resolve, partial)
+                and not inspect.iscoroutinefunction(resolve)
+                and not is_non_blocking_resolver(resolve)
+            )
+        return self._is_blocking_by_field[key]
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # context vars, e.g. the traced counter of the request, are carried over to the thread
+        context = copy_context()
+        return await get_running_loop().run_in_executor(
+            self._thread_pool, partial(context.run, fn, *args, **kwargs)
+        )
+
+
+class BlockingResolverMiddleware:
+    """GraphQL middleware that runs the blocking resolvers of a single request in an executor, one
+    at a time, as they would run on a thread of their own.
+
+    Blocking resolvers are queued, and the queue is drained on a single thread hop, so that the
+    resolvers of the objects of a list, which are resolved concurrently, share a thread hop.
+    """
+
+    def __init__(self, executor: BlockingResolverExecutor):
+        self._executor = executor
+        self._pending: List[Tuple[Callable[[], Any], "Future[Any]"]] = []
+        self._drain_task: Optional[Task] = None
+
+    def resolve(self, next_: Callable[..., Any], root: Any, info: GraphQLResolveInfo, **args: Any):
+        if not self._executor.is_blocking(info):
+            return next_(root, info, **args)
+        return self._resolve_in_executor(next_, root, info, args)
+
+    async def _resolve_in_executor(
+        self,
+        next_: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        args: Dict[str, Any],
+    ) -> Any:
+        loop = get_running_loop()
+        future = loop.create_future()
+        self._pending.append((partial(next_, root, info, **args), future))
+        if self._drain_task is None:
+            self._drain_task = loop.create_task(self._drain())
+        result = await future
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                outcomes = await self._executor.run(_run_resolvers, [fn for fn, _ in batch])
+                for (_, future), (error, result) in zip(batch, outcomes):
+                    if future.done():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+        finally:
+            self._drain_task = None
+            # fail the resolvers that were queued if the drain itself failed or was cancelled
+            for _, future in self._pending:
+                if not future.done():
+                    future.cancel()
+            self._pending = []
+
+
+def _run_resolvers(
+    resolvers: Sequence[Callable[[], Any]]
+) -> Sequence[Tuple[Optional[BaseException], Any]]:
+    outcomes: List[Tuple[Optional[BaseException], Any]] = []
+    for resolver in resolvers:
+        try:
+            outcomes.append((None, resolver()))
+        except Exception as error:
+            outcomes.append((error, None))
+    return outcomes
+
+
 class GraphQLServer(ABC):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(self, app_path_prefix: str = "", max_resolver_workers: Optional[int] = None):
         self._app_path_prefix = app_path_prefix
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
+        # by default, each query executes on a thread of its own
+        self._resolver_executor = (
+            BlockingResolverExecutor(max_resolver_workers) if max_resolver_workers else None
+        )
 
     @abstractmethod
     def build_graphql_schema(self) -> Schema:
@@ -236,11 +353,24 @@ async def execute_graphql_request(
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
     ) -> ExecutionResult:
+        request_context = self.make_request_context(request)
+
+        if self._resolver_executor:
+            # execute the query on the event loop, only running its blocking resolvers in threads
+            return await self._graphql_schema.execute_async(
+                query,
+                variables=variables,
+                operation_name=operation_name,
+                context=request_context,
+                middleware=[
+                    *self._graphql_middleware,
+                    BlockingResolverMiddleware(self._resolver_executor),
+                ],
+            )
+
         # run each query in a separate thread, as much of the schema is sync/blocking
         # use execute_async to allow async resolvers to facilitate dataloader pattern
 
-        request_context = self.make_request_context(request)
-
         def _graphql_request():
             return run(
                 self._graphql_schema.execute_async(
@@ -15,6 +15,10 @@
 from dagster._seven import json
 from dagster._utils import Counter, traced_counter
 from dagster_graphql import __version__ as dagster_graphql_version
+from dagster_graphql.implementation.execution.run_log_subscription_hub import (
+    RunLogSubscriptionHub,
+    register_run_log_subscription_hub,
+)
 from dagster_graphql.schema import create_schema
 from graphene import Schema
 from starlette.datastructures import MutableHeaders
@@ -53,11 +57,15 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        max_resolver_workers: Optional[int] = None,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        # the viewers of a run share a single watch of its event log
+        self._run_log_subscription_hub = RunLogSubscriptionHub(process_context.instance)
+        register_run_log_subscription_hub(self._run_log_subscription_hub)
+        super().__init__(app_path_prefix, max_resolver_workers)
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
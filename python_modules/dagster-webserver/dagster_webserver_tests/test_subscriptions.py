@@ -121,6 +121,24 @@ def test_event_log_subscription_chunked():
         assert len(objgraph.by_type("async_generator")) == 0
 
 
+def test_event_log_subscriptions_share_watch():
+    with instance_for_test() as instance:
+        run = example_job.execute_in_process(instance=instance)
+        assert run.success
+
+        with mock.patch.object(
+            instance, "watch_event_logs", wraps=instance.watch_event_logs
+        ) as watch_event_logs, create_asgi_client(instance) as client:
+            with client.websocket_connect(
+                "/graphql", GraphQLWS.PROTOCOL
+            ) as ws1, client.websocket_connect("/graphql", GraphQLWS.PROTOCOL) as ws2:
+                start_subscription(ws1, EVENT_LOG_SUBSCRIPTION, {"runId": run.run_id})
+                start_subscription(ws2, EVENT_LOG_SUBSCRIPTION, {"runId": run.run_id})
+                assert watch_event_logs.call_count == 1
+                end_subscription(ws1)
+                end_subscription(ws2)
+
+
 @mock.patch(
     "dagster._core.storage.local_compute_log_manager.LocalComputeLogManager.is_watch_completed"
 )
@@ -20,3 +20,15 @@ def test_client(instance):
     )
     app = DagsterWebserver(process_context).create_asgi_app(debug=True)
     return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def async_execution_test_client(instance):
+    process_context = get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=__version__,
+        read_only=False,
+        kwargs={"empty_workspace": True},
+    )
+    app = DagsterWebserver(process_context, max_resolver_workers=2).create_asgi_app(debug=True)
+    return TestClient(app)
@@ -1,5 +1,9 @@
+import asyncio
 import gc
+import threading
+from unittest import mock
 
+import graphene
 import objgraph
 import pytest
 from dagster import (
@@ -11,8 +15,14 @@
 from dagster._serdes import unpack_value
 from dagster._seven import json
 from dagster._utils.error import SerializableErrorInfo
+from dagster_graphql.implementation.utils import is_non_blocking_resolver, non_blocking_resolver
+from dagster_graphql.schema.pipelines.pipeline import GrapheneRun
 from dagster_graphql.version import __version__ as dagster_graphql_version
-from dagster_webserver.graphql import GraphQLWS
+from dagster_webserver.graphql import (
+    BlockingResolverExecutor,
+    BlockingResolverMiddleware,
+    GraphQLWS,
+)
 from dagster_webserver.version import __version__ as dagster_webserver_version
 from starlette.testclient import TestClient
 
@@ -24,6 +34,25 @@
 }
 """
 
+RUNS_QUERY = """
+query RunsQuery {
+    runsOrError {
+        ... on Runs {
+            results {
+                id
+                tags {
+                    key
+                    value
+                }
+                startTime
+                endTime
+                updateTime
+            }
+        }
+    }
+}
+"""
+
 RUN_QUERY = """
 query RunQuery($runId: ID!) {
     pipelineRunOrError(runId: $runId) {
@@ -291,6 +320,106 @@ def test_async(test_client: TestClient):
     assert result["data"]["test"]["two"] == "slept concurrently", result
 
 
+def test_async_execution(instance, async_execution_test_client: TestClient):
+    run_id = _add_run(instance)
+    response = async_execution_test_client.post(
+        "/graphql",
+        json={"query": RUN_QUERY, "variables": {"runId": run_id}},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"pipelineRunOrError": {"__typename": "Run", "id": run_id}}}
+
+    # async resolvers still run concurrently on the event loop
+    response = async_execution_test_client.post(
+        "/graphql",
+        params={"query": "{test{one: asyncString, two: asyncString}}"},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["data"]["test"] == {"one": "slept", "two": "slept concurrently"}, result
+
+    # errors raised by resolvers run in threads are still reported
+    response = async_execution_test_client.post(
+        "/graphql",
+        params={"query": "{test{alwaysException}}"},
+    )
+    assert response.status_code == 500, response.text
+
+
+def test_async_execution_batches_blocking_resolvers(
+    instance, async_execution_test_client: TestClient
+):
+    for _ in range(10):
+        _add_run(instance)
+
+    with mock.patch.object(
+        BlockingResolverExecutor, "run", autospec=True, side_effect=BlockingResolverExecutor.run
+    ) as run_mock:
+        response = async_execution_test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    results = response.json()["data"]["runsOrError"]["results"]
+    assert len(results) >= 10
+    assert all(result["startTime"] and result["endTime"] for result in results)
+    # the times of the runs are resolved on a few shared thread hops, not one per field of each run
+    assert run_mock.call_count <= 3
+
+
+def test_blocking_resolvers():
+    # resolvers marked as pure stay on the event loop
+    assert is_non_blocking_resolver(GrapheneRun.resolve_id)
+    assert is_non_blocking_resolver(GrapheneRun.resolve_tags)
+    # any other sync resolver may block on storage
+    assert not is_non_blocking_resolver(GrapheneRun.resolve_stats)
+    assert not is_non_blocking_resolver(GrapheneRun.resolve_startTime)
+
+
+_RESOLVER_THREADS = {}
+
+
+class GrapheneHelperFields(graphene.ObjectType):
+    blockingString = graphene.String()
+    pureString = graphene.String()
+
+    def _load_string(self):
+        # stands in for a helper method that reads from storage
+        _RESOLVER_THREADS["blockingString"] = threading.get_ident()
+        return "loaded"
+
+    def resolve_blockingString(self, _):
+        return self._load_string()
+
+    @non_blocking_resolver
+    def resolve_pureString(self, _):
+        _RESOLVER_THREADS["pureString"] = threading.get_ident()
+        return "pure"
+
+
+class GrapheneHelperQuery(graphene.ObjectType):
+    helper = graphene.Field(GrapheneHelperFields)
+
+    def resolve_helper(self, _):
+        return GrapheneHelperFields()
+
+
+def test_blocking_resolver_runs_off_event_loop():
+    schema = graphene.Schema(query=GrapheneHelperQuery)
+    executor = BlockingResolverExecutor(max_workers=1)
+
+    async def _execute():
+        result = await schema.execute_async(
+            "{helper{blockingString pureString}}",
+            middleware=[BlockingResolverMiddleware(executor)],
+        )
+        return threading.get_ident(), result
+
+    loop_thread, result = asyncio.run(_execute())
+    assert not result.errors, result.errors
+    assert result.data == {"helper": {"blockingString": "loaded", "pureString": "pure"}}
+    # the resolver only blocks through a helper method, which doesn't mark it as pure
+    assert _RESOLVER_THREADS["blockingString"] != loop_thread
+    assert _RESOLVER_THREADS["pureString"] == loop_thread
+
+
 def test_download_captured_logs_not_found(test_client: TestClient):
     response = test_client.get("/logs/does-not-exist/stdout")
     assert response.status_code == 404
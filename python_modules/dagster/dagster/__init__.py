@@ -195,11 +195,13 @@
 from dagster._core.definitions.executor_definition import (
     ExecutorDefinition as ExecutorDefinition,
     ExecutorRequirement as ExecutorRequirement,
+    asyncio_executor as asyncio_executor,
     executor as executor,
     in_process_executor as in_process_executor,
     multi_or_in_process_executor as multi_or_in_process_executor,
     multiple_process_executor_requirements as multiple_process_executor_requirements,
     multiprocess_executor as multiprocess_executor,
+    multithread_executor as multithread_executor,
 )
 from dagster._core.definitions.external_asset import (
     external_asset_from_spec as external_asset_from_spec,
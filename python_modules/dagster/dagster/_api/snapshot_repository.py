@@ -27,7 +27,10 @@ def sync_get_streaming_external_repositories_data_grpc(
                 external_repository_origin=ExternalRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                # deserialize_value reads the compact format, and servers that predate it ignore
+                # the flag and send JSON
+                compact_serialization=True,
             )
         )
 
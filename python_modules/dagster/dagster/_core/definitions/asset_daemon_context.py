@@ -1,9 +1,10 @@
 import datetime
-import itertools
+import functools
 import logging
 import os
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -51,7 +52,10 @@
 
 if TYPE_CHECKING:
     from dagster._core.instance import DagsterInstance
-    from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
+    from dagster._utils.caching_instance_queryer import (  # expensive import
+        CachingInstanceQueryer,
+        InstanceQueryerCache,
+    )
 
 
 def get_implicit_auto_materialize_policy(
@@ -98,12 +102,18 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        query_cache: Optional["InstanceQueryerCache"] = None,
+        threadpool_executor: Optional[ThreadPoolExecutor] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
         self._evaluation_id = evaluation_id
         self._instance_queryer = CachingInstanceQueryer(
-            instance, asset_graph, evaluation_time=evaluation_time, logger=logger
+            instance,
+            asset_graph,
+            evaluation_time=evaluation_time,
+            logger=logger,
+            query_cache=query_cache,
         )
         self._data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
         self._cursor = cursor
@@ -117,6 +127,7 @@ def __init__(
         self._auto_observe = auto_observe
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        self._threadpool_executor = threadpool_executor
 
         self._verbose_log_fn = (
             self._logger.info if os.getenv("ASSET_DAEMON_VERBOSE_LOGS") else self._logger.debug
@@ -274,44 +285,32 @@ def evaluate_asset(
 
         return auto_materialize_policy_evaluator.evaluate(context, report_num_skipped=True)
 
-    def get_auto_materialize_asset_evaluations(
+    def _evaluate_assets_in_group(
         self,
-    ) -> Tuple[
-        Mapping[AssetKey, AutoMaterializeAssetEvaluation],
-        Sequence[AssetDaemonAssetCursor],
-        AbstractSet[AssetKeyPartitionKey],
+        asset_keys_and_indexes: Sequence[Tuple[AssetKey, int]],
+        will_materialize_mapping: Mapping[AssetKey, AbstractSet[AssetKeyPartitionKey]],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> Mapping[
+        AssetKey,
+        Tuple[
+            AutoMaterializeAssetEvaluation,
+            AssetDaemonAssetCursor,
+            AbstractSet[AssetKeyPartitionKey],
+            Optional[datetime.datetime],
+        ],
     ]:
-        """Returns a mapping from asset key to the AutoMaterializeAssetEvaluation for that key, a
-        sequence of new per-asset cursors, and the set of all asset partitions that should be
-        materialized or discarded this tick.
+        """Evaluates a group of assets of the same topological level that are part of the same
+        non-subsettable multi-asset, in order. Once an asset of the group will be materialized, the
+        remaining assets of the group are not evaluated, as its evaluation is copied over to them.
         """
-        evaluations_by_key: Dict[AssetKey, AutoMaterializeAssetEvaluation] = {}
-        asset_cursors: List[AssetDaemonAssetCursor] = []
-        will_materialize_mapping: Dict[AssetKey, AbstractSet[AssetKeyPartitionKey]] = defaultdict(
-            set
-        )
-        expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]] = defaultdict()
-        visited_multi_asset_keys = set()
-
-        num_checked_assets = 0
-        num_target_asset_keys = len(self.target_asset_keys)
-
-        for asset_key in itertools.chain(*self.asset_graph.toposort_asset_keys()):
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.target_asset_keys:
-                continue
-
-            num_checked_assets = num_checked_assets + 1
+        results = {}
+        for asset_key, asset_index in asset_keys_and_indexes:
             start_time = time.time()
             self._verbose_log_fn(
                 "Evaluating asset"
-                f" {asset_key.to_user_string()} ({num_checked_assets}/{num_target_asset_keys})"
+                f" {asset_key.to_user_string()} ({asset_index}/{len(self.target_asset_keys)})"
             )
 
-            if asset_key in visited_multi_asset_keys:
-                self._verbose_log_fn(f"Asset {asset_key.to_user_string()} already visited")
-                continue
-
             (
                 evaluation,
                 asset_cursor_for_asset,
@@ -337,10 +336,8 @@ def get_auto_materialize_asset_evaluations(
                 f" skipped, {evaluation.num_discarded} discarded ({format(time.time()-start_time, '.3f')} seconds)"
             )
 
-            evaluations_by_key[asset_key] = evaluation
-            asset_cursors.append(asset_cursor_for_asset)
-            will_materialize_mapping[asset_key] = to_materialize_for_asset
-
+            # only the expected data times of the parents of the asset are read, so this doesn't
+            # depend on the other assets of the level
             expected_data_time = get_expected_data_time_for_asset_key(
                 self.asset_graph,
                 asset_key,
@@ -350,30 +347,121 @@ def get_auto_materialize_asset_evaluations(
                 current_time=self.instance_queryer.evaluation_time,
                 will_materialize=bool(to_materialize_for_asset),
             )
-            expected_data_time_mapping[asset_key] = expected_data_time
-            # if we need to materialize any partitions of a non-subsettable multi-asset, just copy
-            # over evaluation to any required neighbor key
+            results[asset_key] = (
+                evaluation,
+                asset_cursor_for_asset,
+                to_materialize_for_asset,
+                expected_data_time,
+            )
             if to_materialize_for_asset:
+                break
+
+        return results
+
+    def get_auto_materialize_asset_evaluations(
+        self,
+    ) -> Tuple[
+        Mapping[AssetKey, AutoMaterializeAssetEvaluation],
+        Sequence[AssetDaemonAssetCursor],
+        AbstractSet[AssetKeyPartitionKey],
+    ]:
+        """Returns a mapping from asset key to the AutoMaterializeAssetEvaluation for that key, a
+        sequence of new per-asset cursors, and the set of all asset partitions that should be
+        materialized or discarded this tick.
+
+        The assets of a topological level only depend on the evaluations of the assets of earlier
+        levels, so if a threadpool executor was provided, the assets of each level are evaluated
+        concurrently on it.
+        """
+        evaluations_by_key: Dict[AssetKey, AutoMaterializeAssetEvaluation] = {}
+        asset_cursors: List[AssetDaemonAssetCursor] = []
+        will_materialize_mapping: Dict[AssetKey, AbstractSet[AssetKeyPartitionKey]] = defaultdict(
+            set
+        )
+        expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]] = defaultdict()
+        visited_multi_asset_keys = set()
+
+        num_checked_assets = 0
+
+        for level in self.asset_graph.toposort_asset_keys():
+            level_asset_keys: List[AssetKey] = []
+            # assets of the same non-subsettable multi-asset are evaluated in the same group, so
+            # that the evaluation of the first asset of the group that will be materialized can be
+            # copied over to the other ones without evaluating them
+            groups: Dict[AssetKey, List[Tuple[AssetKey, int]]] = {}
+            group_keys_by_asset_key: Dict[AssetKey, AssetKey] = {}
+            for asset_key in level:
+                # an asset may have already been visited if it was part of a non-subsettable
+                # multi-asset
+                if asset_key not in self.target_asset_keys:
+                    continue
+
+                num_checked_assets = num_checked_assets + 1
+                if asset_key in visited_multi_asset_keys:
+                    self._verbose_log_fn(f"Asset {asset_key.to_user_string()} already visited")
+                    continue
+
+                level_asset_keys.append(asset_key)
+                group_key = group_keys_by_asset_key.get(asset_key, asset_key)
+                groups.setdefault(group_key, []).append((asset_key, num_checked_assets))
                 for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
-                    auto_materialize_policy = self.asset_graph.auto_materialize_policies_by_key.get(
-                        neighbor_key
-                    )
+                    group_keys_by_asset_key.setdefault(neighbor_key, group_key)
+
+            evaluate_group = functools.partial(
+                self._evaluate_assets_in_group,
+                will_materialize_mapping=will_materialize_mapping,
+                expected_data_time_mapping=expected_data_time_mapping,
+            )
+            if self._threadpool_executor is not None and len(groups) > 1:
+                group_results = list(self._threadpool_executor.map(evaluate_group, groups.values()))
+            else:
+                group_results = [evaluate_group(group) for group in groups.values()]
+            results_by_key = {
+                asset_key: result
+                for results in group_results
+                for asset_key, result in results.items()
+            }
 
-                    if auto_materialize_policy is None:
-                        check.failed(f"Expected auto materialize policy on asset {asset_key}")
+            for asset_key in level_asset_keys:
+                if asset_key in visited_multi_asset_keys:
+                    self._verbose_log_fn(f"Asset {asset_key.to_user_string()} already visited")
+                    continue
+
+                (
+                    evaluation,
+                    asset_cursor_for_asset,
+                    to_materialize_for_asset,
+                    expected_data_time,
+                ) = results_by_key[asset_key]
+
+                evaluations_by_key[asset_key] = evaluation
+                asset_cursors.append(asset_cursor_for_asset)
+                will_materialize_mapping[asset_key] = to_materialize_for_asset
+                expected_data_time_mapping[asset_key] = expected_data_time
+
+                # if we need to materialize any partitions of a non-subsettable multi-asset, just
+                # copy over evaluation to any required neighbor key
+                if to_materialize_for_asset:
+                    for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
+                        auto_materialize_policy = (
+                            self.asset_graph.auto_materialize_policies_by_key.get(neighbor_key)
+                        )
 
-                    to_materialize_for_neighbor = {
-                        ap._replace(asset_key=neighbor_key) for ap in to_materialize_for_asset
-                    }
+                        if auto_materialize_policy is None:
+                            check.failed(f"Expected auto materialize policy on asset {asset_key}")
 
-                    evaluations_by_key[neighbor_key] = evaluation._replace(
-                        asset_key=neighbor_key,
-                        rule_snapshots=auto_materialize_policy.rule_snapshots,  # Neighbors can have different rule snapshots
-                    )
-                    will_materialize_mapping[neighbor_key] = to_materialize_for_neighbor
+                        to_materialize_for_neighbor = {
+                            ap._replace(asset_key=neighbor_key) for ap in to_materialize_for_asset
+                        }
+
+                        evaluations_by_key[neighbor_key] = evaluation._replace(
+                            asset_key=neighbor_key,
+                            rule_snapshots=auto_materialize_policy.rule_snapshots,  # Neighbors can have different rule snapshots
+                        )
+                        will_materialize_mapping[neighbor_key] = to_materialize_for_neighbor
 
-                    expected_data_time_mapping[neighbor_key] = expected_data_time
-                    visited_multi_asset_keys.add(neighbor_key)
+                        expected_data_time_mapping[neighbor_key] = expected_data_time
+                        visited_multi_asset_keys.add(neighbor_key)
 
         to_materialize = set().union(*will_materialize_mapping.values())
         return (evaluations_by_key, asset_cursors, to_materialize)
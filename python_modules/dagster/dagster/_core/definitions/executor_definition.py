@@ -28,6 +28,7 @@
     from dagster._core.executor.in_process import InProcessExecutor
     from dagster._core.executor.init import InitExecutorContext
     from dagster._core.executor.multiprocess import MultiprocessExecutor
+    from dagster._core.executor.multithread import AsyncioExecutor, MultithreadExecutor
     from dagster._core.instance import DagsterInstance
 
 
@@ -333,6 +334,7 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     start_selector = check.opt_dict_elem(config, "start_method")
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
 
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
@@ -340,6 +342,8 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg.get("enabled", False),
+        max_tasks_per_worker=check.opt_int_elem(worker_pool_cfg, "max_tasks_per_worker"),
     )
 
 
@@ -392,6 +396,29 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "enabled": Field(
+                    bool,
+                    default_value=False,
+                    description=(
+                        "Execute steps in a pool of up to `max_concurrent` persistent worker"
+                        " processes, instead of starting a new process for each step. Code"
+                        " loaded by a worker is reused by the following steps it executes,"
+                        " which reduces the overhead of jobs with many small steps."
+                    ),
+                ),
+                "max_tasks_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process executes before being replaced by"
+                        " a new one. By default, workers are reused for the whole run."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -421,6 +448,19 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a new process. Jobs with many small steps can instead
+    reuse a pool of up to ``max_concurrent`` persistent worker processes, each replaced after
+    executing ``max_tasks_per_worker`` steps, if set:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                enabled: true
+                max_tasks_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -428,6 +468,112 @@ def multiprocess_executor(init_context):
     return _core_multiprocess_executor_creation(init_context.executor_config)
 
 
+def _core_multithread_executor_creation(config: ExecutorConfig) -> "MultithreadExecutor":
+    from dagster._core.executor.multithread import MultithreadExecutor
+
+    return MultithreadExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+    )
+
+
+MULTITHREAD_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of steps that may run concurrently. By default, this is"
+                " `min(32, os.cpu_count() + 4)`."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently in a pool of threads in a single process.",
+)
+
+
+@executor(
+    name="multithread",
+    config_schema=MULTITHREAD_CONFIG,
+)
+def multithread_executor(init_context):
+    """The multithread executor executes steps concurrently on a pool of threads in a single
+    process.
+
+    It is suited to jobs whose ops spend most of their time waiting on I/O. Since all steps run in
+    the same process, resources are initialized once for the run and shared between the threads,
+    so they must be thread-safe.
+
+    To configure the multithread executor, include a fragment such as the following in your run
+    config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 8
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. Steps are also subject to ``tag_concurrency_limits`` and to the op concurrency
+    limits configured on the instance.
+    """
+    return _core_multithread_executor_creation(init_context.executor_config)
+
+
+def _core_asyncio_executor_creation(config: ExecutorConfig) -> "AsyncioExecutor":
+    from dagster._core.executor.multithread import AsyncioExecutor
+
+    return AsyncioExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+    )
+
+
+ASYNCIO_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description="The number of steps that may run concurrently. By default, this is 64.",
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently, running async ops on a shared event loop.",
+)
+
+
+@executor(
+    name="asyncio",
+    config_schema=ASYNCIO_CONFIG,
+)
+def asyncio_executor(init_context):
+    """The asyncio executor executes steps concurrently in a single process, running the compute
+    functions of async ops on a single event loop shared by the whole run.
+
+    Each in-flight step occupies a thread while it waits on the event loop, so synchronous ops can
+    be mixed with async ones without blocking it. As with the multithread executor, resources are
+    shared between steps and must be thread-safe.
+
+    To configure the asyncio executor, include a fragment such as the following in your run config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 100
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may be in
+    flight at once. Steps are also subject to ``tag_concurrency_limits`` and to the op concurrency
+    limits configured on the instance.
+    """
+    return _core_asyncio_executor_creation(init_context.executor_config)
+
+
 def check_cross_process_constraints(init_context: "InitExecutorContext") -> None:
     from dagster._core.executor.init import InitExecutorContext
 
@@ -1,9 +1,15 @@
 import hashlib
 import itertools
+import operator
+from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache, reduce
 from typing import (
+    AbstractSet,
     Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -32,13 +38,20 @@
 )
 
 from .partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
-from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
+from .partition_key_range import PartitionKeyRange
+from .time_window_partitions import (
+    TimeWindow,
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
 
@@ -215,7 +228,7 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+        return MultiPartitionsSubset
 
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
@@ -319,8 +332,10 @@ def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
         partition_keys_by_dimension = {
-            dim.name: dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+            dim.name: set(
+                dim.partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store
+                )
             )
             for dim in self.partitions_defs
         }
@@ -335,7 +350,7 @@ def filter_valid_partition_keys(
             )
 
             if all(
-                key in partition_keys_by_dimension.get(dim, [])
+                key in partition_keys_by_dimension.get(dim, set())
                 for dim, key in multipartition_key.keys_by_dimension.items()
             ):
                 validated_partitions.add(partition_key)
@@ -508,6 +523,374 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+def _get_secondary_subset_grouping_key(secondary_subset: PartitionsSubset) -> Hashable:
+    """A key that is cheap to compute and hash, under which rows of a MultiPartitionsSubset with
+    identical secondary subsets are grouped.
+    """
+    if isinstance(secondary_subset, BitmapPartitionsSubset):
+        return (secondary_subset.bitmap, secondary_subset.unindexed_partition_keys)
+    if isinstance(secondary_subset, TimeWindowPartitionsSubset):
+        return tuple(secondary_subset.included_time_windows)
+    if isinstance(secondary_subset, DefaultPartitionsSubset):
+        return frozenset(secondary_subset.subset)
+    # subsets of other types are shared between the rows they were added to together
+    return id(secondary_subset)
+
+
+class MultiPartitionsSubset(PartitionsSubset[MultiPartitionKey]):
+    """A PartitionsSubset for a MultiPartitionsDefinition, which internally represents the included
+    partitions as a subset of the secondary dimension for each partition key of the primary
+    dimension, e.g. a bitmap over the static partitions for every day of a daily-by-static
+    multi-partitions definition.
+
+    This allows operating on whole rows of the grid of partitions, rather than on each of the
+    multi-partition keys in the cross product of the dimensions.
+    """
+
+    # Subsets are serialized in the format of DefaultPartitionsSubset, as multi-partition keys, so
+    # that they stay valid when the partition keys of a dimension change, and can be read by
+    # versions that predate storing subsets by primary partition key.
+    SERIALIZATION_VERSION = DefaultPartitionsSubset.SERIALIZATION_VERSION
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        secondary_subsets_by_primary_key: Optional[Mapping[str, PartitionsSubset]] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        self._primary_dimension, self._secondary_dimension = (
+            partitions_def._get_primary_and_secondary_dimension()  # noqa: SLF001
+        )
+        self._secondary_subsets_by_primary_key = {
+            primary_key: secondary_subset
+            for primary_key, secondary_subset in check.opt_mapping_param(
+                secondary_subsets_by_primary_key,
+                "secondary_subsets_by_primary_key",
+                key_type=str,
+                value_type=PartitionsSubset,
+            ).items()
+            if len(secondary_subset) > 0
+        }
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def secondary_subsets_by_primary_key(self) -> Mapping[str, PartitionsSubset]:
+        """For each partition key of the primary dimension with included partitions, the subset
+        of the secondary dimension that is included for that key.
+        """
+        return self._secondary_subsets_by_primary_key
+
+    def _empty_secondary_subset(self) -> PartitionsSubset:
+        return self._secondary_dimension.partitions_def.empty_subset()
+
+    def _split_partition_key(self, partition_key: str) -> Tuple[str, str]:
+        """Returns the partition keys of the primary and secondary dimension for the given
+        multi-partition key.
+        """
+        # multi-partition keys order the keys of their dimensions by dimension name, which is
+        # also the order of the dimensions of the partitions definition
+        dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        check.invariant(
+            len(dimension_keys) == len(self._partitions_def.partitions_defs),
+            f"Expected {len(self._partitions_def.partitions_defs)} partition keys in partition key"
+            f" string {partition_key}, but got {len(dimension_keys)}",
+        )
+        keys_by_dimension = dict(
+            zip(self._partitions_def.partition_dimension_names, dimension_keys)
+        )
+        return (
+            keys_by_dimension[self._primary_dimension.name],
+            keys_by_dimension[self._secondary_dimension.name],
+        )
+
+    def _to_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._primary_dimension.name: primary_key,
+                self._secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _with_secondary_subsets(
+        self, secondary_subsets_by_primary_key: Mapping[str, PartitionsSubset]
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self._partitions_def, secondary_subsets_by_primary_key)
+
+    def _has_same_partitions_def(self, other: object) -> bool:
+        return isinstance(other, MultiPartitionsSubset) and (
+            other.partitions_def is self._partitions_def
+            or other.partitions_def == self._partitions_def
+        )
+
+    def _to_multi_partitions_subset(self, other: PartitionsSubset) -> "MultiPartitionsSubset":
+        if self._has_same_partitions_def(other):
+            return cast(MultiPartitionsSubset, other)
+        return self.empty_subset(self._partitions_def).with_partition_keys(
+            other.get_partition_keys()
+        )
+
+    def get_dimension_partition_keys(self, dimension_name: str) -> AbstractSet[str]:
+        """Returns the partition keys of the given dimension that are part of at least one of the
+        partitions in the subset.
+        """
+        if dimension_name == self._primary_dimension.name:
+            return set(self._secondary_subsets_by_primary_key.keys())
+
+        check.invariant(
+            dimension_name == self._secondary_dimension.name,
+            f"Invalid dimension name {dimension_name}",
+        )
+        if not self._secondary_subsets_by_primary_key:
+            return set()
+        secondary_subsets = self._secondary_subsets_by_primary_key.values()
+        return set(reduce(operator.or_, secondary_subsets).get_partition_keys())
+
+    def get_partition_key_products(self) -> Sequence[Mapping[str, AbstractSet[str]]]:
+        """Returns the partitions in the subset as a union of cross products of the partition keys
+        of each dimension, where the primary partition keys with identical secondary subsets share
+        a cross product.
+        """
+        # rows are grouped by a cheap key first, so that the partition keys of each distinct
+        # secondary subset are only materialized once, rather than once per primary partition key
+        primary_keys_by_grouping_key: Dict[Hashable, List[str]] = defaultdict(list)
+        secondary_subsets_by_grouping_key: Dict[Hashable, PartitionsSubset] = {}
+        for primary_key, secondary_subset in self._secondary_subsets_by_primary_key.items():
+            grouping_key = _get_secondary_subset_grouping_key(secondary_subset)
+            primary_keys_by_grouping_key[grouping_key].append(primary_key)
+            secondary_subsets_by_grouping_key[grouping_key] = secondary_subset
+
+        # subsets that are equal but were grouped apart, e.g. distinct objects of a subset type
+        # that is grouped by identity, share a cross product
+        primary_keys_by_secondary_keys: Dict[FrozenSet[str], List[str]] = defaultdict(list)
+        for grouping_key, primary_keys in primary_keys_by_grouping_key.items():
+            secondary_keys = frozenset(
+                secondary_subsets_by_grouping_key[grouping_key].get_partition_keys()
+            )
+            primary_keys_by_secondary_keys[secondary_keys].extend(primary_keys)
+
+        return [
+            {
+                self._primary_dimension.name: set(primary_keys),
+                self._secondary_dimension.name: set(secondary_keys),
+            }
+            for secondary_keys, primary_keys in primary_keys_by_secondary_keys.items()
+        ]
+
+    def with_partition_key_product(
+        self, partition_keys_by_dimension: Mapping[str, Iterable[str]]
+    ) -> "MultiPartitionsSubset":
+        """Returns a subset that additionally contains the cross product of the given partition
+        keys of each dimension.
+        """
+        secondary_subset = self._empty_secondary_subset().with_partition_keys(
+            partition_keys_by_dimension[self._secondary_dimension.name]
+        )
+        if len(secondary_subset) == 0:
+            return self
+
+        secondary_subsets_by_primary_key = dict(self._secondary_subsets_by_primary_key)
+        for primary_key in partition_keys_by_dimension[self._primary_dimension.name]:
+            existing_subset = secondary_subsets_by_primary_key.get(primary_key)
+            secondary_subsets_by_primary_key[primary_key] = (
+                existing_subset | secondary_subset if existing_subset else secondary_subset
+            )
+        return self._with_secondary_subsets(secondary_subsets_by_primary_key)
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        if partitions_def != self._partitions_def:
+            return set(
+                partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+            ) - set(self.get_partition_keys())
+
+        primary_partitions_def = self._primary_dimension.partitions_def
+        secondary_partitions_def = self._secondary_dimension.partitions_def
+        all_secondary_keys = secondary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+
+        partition_keys = set()
+        for primary_key in primary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ):
+            secondary_subset = self._secondary_subsets_by_primary_key.get(primary_key)
+            secondary_keys = (
+                secondary_subset.get_partition_keys_not_in_subset(
+                    secondary_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+                if secondary_subset is not None
+                else all_secondary_keys
+            )
+            partition_keys.update(
+                self._to_partition_key(primary_key, secondary_key)
+                for secondary_key in secondary_keys
+            )
+        return partition_keys
+
+    @public
+    def get_partition_keys(self) -> Iterable[MultiPartitionKey]:
+        return {
+            self._to_partition_key(primary_key, secondary_key)
+            for primary_key, secondary_subset in self._secondary_subsets_by_primary_key.items()
+            for secondary_key in secondary_subset.get_partition_keys()
+        }
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+            partitions_def, current_time, dynamic_partitions_store
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        secondary_keys_by_primary_key: Dict[str, List[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            primary_key, secondary_key = self._split_partition_key(partition_key)
+            secondary_keys_by_primary_key[primary_key].append(secondary_key)
+
+        secondary_subsets_by_primary_key = dict(self._secondary_subsets_by_primary_key)
+        for primary_key, secondary_keys in secondary_keys_by_primary_key.items():
+            secondary_subsets_by_primary_key[primary_key] = (
+                secondary_subsets_by_primary_key.get(primary_key) or self._empty_secondary_subset()
+            ).with_partition_keys(secondary_keys)
+        return self._with_secondary_subsets(secondary_subsets_by_primary_key)
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return super().__or__(other)
+
+        secondary_subsets_by_primary_key = dict(self._secondary_subsets_by_primary_key)
+        for primary_key, secondary_subset in self._to_multi_partitions_subset(
+            other
+        ).secondary_subsets_by_primary_key.items():
+            existing_subset = secondary_subsets_by_primary_key.get(primary_key)
+            secondary_subsets_by_primary_key[primary_key] = (
+                existing_subset | secondary_subset if existing_subset else secondary_subset
+            )
+        return self._with_secondary_subsets(secondary_subsets_by_primary_key)
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return super().__and__(other)
+
+        other_secondary_subsets_by_primary_key = self._to_multi_partitions_subset(
+            other
+        ).secondary_subsets_by_primary_key
+        return self._with_secondary_subsets(
+            {
+                primary_key: secondary_subset & other_secondary_subsets_by_primary_key[primary_key]
+                for primary_key, secondary_subset in self._secondary_subsets_by_primary_key.items()
+                if primary_key in other_secondary_subsets_by_primary_key
+            }
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset[MultiPartitionKey]":
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return super().__sub__(other)
+
+        other_secondary_subsets_by_primary_key = self._to_multi_partitions_subset(
+            other
+        ).secondary_subsets_by_primary_key
+        return self._with_secondary_subsets(
+            {
+                primary_key: (
+                    secondary_subset - other_secondary_subsets_by_primary_key[primary_key]
+                    if primary_key in other_secondary_subsets_by_primary_key
+                    else secondary_subset
+                )
+                for primary_key, secondary_subset in self._secondary_subsets_by_primary_key.items()
+            }
+        )
+
+    def serialize(self) -> str:
+        return self.to_serializable_subset().serialize()
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        default_subset = DefaultPartitionsSubset.from_serialized(partitions_def, serialized)
+        return cls.empty_subset(partitions_def).with_partition_keys(
+            default_subset.get_partition_keys()
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if self._has_same_partitions_def(other):
+            return (
+                self._secondary_subsets_by_primary_key
+                == cast(MultiPartitionsSubset, other).secondary_subsets_by_primary_key
+            )
+        return isinstance(other, DefaultPartitionsSubset) and set(
+            self.get_partition_keys()
+        ) == set(other.subset)
+
+    def __len__(self) -> int:
+        return sum(
+            len(secondary_subset)
+            for secondary_subset in self._secondary_subsets_by_primary_key.values()
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str) or value.count(MULTIPARTITION_KEY_DELIMITER) != 1:
+            return False
+        primary_key, secondary_key = self._split_partition_key(value)
+        secondary_subset = self._secondary_subsets_by_primary_key.get(primary_key)
+        return secondary_subset is not None and secondary_key in secondary_subset
+
+    def __repr__(self) -> str:
+        return (
+            "MultiPartitionsSubset(secondary_subsets_by_primary_key="
+            f"{self._secondary_subsets_by_primary_key})"
+        )
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            check.failed("Partitions definition must be a MultiPartitionsDefinition")
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # subsets are stored in the partition keys format, which doesn't depend on the partitions
+        # definition
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
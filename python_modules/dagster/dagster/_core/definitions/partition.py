@@ -18,6 +18,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -35,6 +36,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import JsonSerializableValue, NamedTupleSerializer, WhitelistMap
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import (
@@ -349,6 +351,14 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return BitmapPartitionsSubset
+
+    @cached_method
+    def _get_partition_key_indexes(self) -> Mapping[str, int]:
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -1181,6 +1191,10 @@ def partitions_def(self) -> Optional[PartitionsDefinition[T_str]]:
         return None
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, PartitionsSubset) and not isinstance(other, DefaultPartitionsSubset):
+            # other subset types, e.g. BitmapPartitionsSubset, compare themselves to subsets of
+            # partition keys
+            return NotImplemented
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1199,6 +1213,262 @@ def empty_subset(
         return cls()
 
 
+class BitmapPartitionsSubsetSerializer(NamedTupleSerializer):
+    # BitmapPartitionsSubsets are stored in the format of DefaultPartitionsSubsets, which doesn't
+    # depend on the partitions definition, so that they can be deserialized without it
+    def pack(
+        self,
+        value: "BitmapPartitionsSubset",
+        whitelist_map: WhitelistMap,
+        descent_path: str,
+    ) -> Dict[str, JsonSerializableValue]:
+        return whitelist_map.get_tuple_serializer(DefaultPartitionsSubset.__name__).pack(
+            DefaultPartitionsSubset(set(value.get_partition_keys())), whitelist_map, descent_path
+        )
+
+
+@whitelist_for_serdes(serializer=BitmapPartitionsSubsetSerializer)
+class BitmapPartitionsSubset(
+    PartitionsSubset[str],
+    NamedTuple(
+        "_BitmapPartitionsSubset",
+        [
+            ("partitions_def", "StaticPartitionsDefinition"),
+            ("bitmap", int),
+            ("unindexed_partition_keys", AbstractSet[str]),
+        ],
+    ),
+):
+    """A PartitionsSubset for a StaticPartitionsDefinition, which internally represents the
+    included partitions as a bitmap over the indexes of the partition keys in the partitions
+    definition, so that set operations between subsets don't need to materialize sets of strings.
+
+    Partition keys that are not part of the partitions definition, e.g. keys of partitions that
+    have since been removed, are kept alongside the bitmap as strings.
+    """
+
+    # Subsets are serialized in the format of DefaultPartitionsSubset, as partition keys rather
+    # than indexes, so that they stay valid when the partition keys of the partitions definition
+    # change, and can be read by versions that predate the bitmap.
+    SERIALIZATION_VERSION = DefaultPartitionsSubset.SERIALIZATION_VERSION
+
+    def __new__(
+        cls,
+        partitions_def: "StaticPartitionsDefinition",
+        bitmap: int = 0,
+        unindexed_partition_keys: AbstractSet[str] = frozenset(),
+    ):
+        return super(BitmapPartitionsSubset, cls).__new__(
+            cls,
+            partitions_def=check.inst_param(
+                partitions_def, "partitions_def", StaticPartitionsDefinition
+            ),
+            bitmap=check.int_param(bitmap, "bitmap"),
+            unindexed_partition_keys=frozenset(
+                check.set_param(unindexed_partition_keys, "unindexed_partition_keys", of_type=str)
+            ),
+        )
+
+    @property
+    def partitions_def(self) -> "StaticPartitionsDefinition":
+        return self._asdict()["partitions_def"]
+
+    def _get_partition_key_indexes(self) -> Mapping[str, int]:
+        return self.partitions_def._get_partition_key_indexes()  # noqa: SLF001
+
+    def _get_full_bitmap(self) -> int:
+        return (1 << len(self.partitions_def.get_partition_keys())) - 1
+
+    def _iterate_indexes(self) -> Iterable[int]:
+        # the bits of the bitmap, least significant first
+        for index, bit in enumerate(reversed(bin(self.bitmap)[2:])):
+            if bit == "1":
+                yield index
+
+    def _iterate_ranges(self) -> Iterable[Tuple[int, int]]:
+        """The runs of consecutive indexes in the bitmap, as (first index, last index) tuples."""
+        range_start = None
+        prev_index = None
+        for index in self._iterate_indexes():
+            if prev_index is None or index != prev_index + 1:
+                if range_start is not None:
+                    yield (range_start, cast(int, prev_index))
+                range_start = index
+            prev_index = index
+        if range_start is not None:
+            yield (range_start, cast(int, prev_index))
+
+    def _with_bitmap(
+        self, bitmap: int, unindexed_partition_keys: AbstractSet[str]
+    ) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self.partitions_def, bitmap, unindexed_partition_keys)
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        return isinstance(other, BitmapPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        if partitions_def is self.partitions_def or partitions_def == self.partitions_def:
+            return self._with_bitmap(
+                self._get_full_bitmap() & ~self.bitmap, frozenset()
+            ).get_partition_keys()
+
+        return set(
+            partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+        ) - set(self.get_partition_keys())
+
+    @public
+    def get_partition_keys(self) -> Iterable[str]:
+        # a set, like the partition keys of a DefaultPartitionsSubset
+        partition_keys = self.partitions_def.get_partition_keys()
+        return {
+            partition_keys[index] for index in self._iterate_indexes()
+        } | self.unindexed_partition_keys
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        if partitions_def is not self.partitions_def and partitions_def != self.partitions_def:
+            return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+                partitions_def, current_time, dynamic_partitions_store
+            )
+
+        partition_keys = self.partitions_def.get_partition_keys()
+        return [
+            PartitionKeyRange(partition_keys[range_start], partition_keys[range_end])
+            for range_start, range_end in self._iterate_ranges()
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        partition_key_indexes = self._get_partition_key_indexes()
+        bitmap = self.bitmap
+        unindexed_partition_keys = set(self.unindexed_partition_keys)
+        for partition_key in partition_keys:
+            index = partition_key_indexes.get(partition_key)
+            if index is None:
+                unindexed_partition_keys.add(partition_key)
+            else:
+                bitmap |= 1 << index
+        return self._with_bitmap(bitmap, unindexed_partition_keys)
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset) and other.partitions_def == self.partitions_def:
+            return self._with_bitmap(self._get_full_bitmap(), self.unindexed_partition_keys)
+        if self._is_compatible(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                self.bitmap | other.bitmap,
+                self.unindexed_partition_keys | other.unindexed_partition_keys,
+            )
+        return super().__or__(other)
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset) and other.partitions_def == self.partitions_def:
+            return self._with_bitmap(self.bitmap, frozenset())
+        if self._is_compatible(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                self.bitmap & other.bitmap,
+                self.unindexed_partition_keys & other.unindexed_partition_keys,
+            )
+        return super().__and__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset[str]":
+        if self is other:
+            return self.empty_subset(self.partitions_def)
+        if isinstance(other, AllPartitionsSubset) and other.partitions_def == self.partitions_def:
+            return self._with_bitmap(0, self.unindexed_partition_keys)
+        if self._is_compatible(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return self._with_bitmap(
+                self.bitmap & ~other.bitmap,
+                self.unindexed_partition_keys - other.unindexed_partition_keys,
+            )
+        return super().__sub__(other)
+
+    def serialize(self) -> str:
+        return DefaultPartitionsSubset(set(self.get_partition_keys())).serialize()
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        default_subset = DefaultPartitionsSubset.from_serialized(partitions_def, serialized)
+        return cls.empty_subset(partitions_def).with_partition_keys(
+            default_subset.get_partition_keys()
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PartitionsSubset) and self._is_compatible(other):
+            other = cast(BitmapPartitionsSubset, other)
+            return (
+                self.bitmap == other.bitmap
+                and self.unindexed_partition_keys == other.unindexed_partition_keys
+            )
+        return isinstance(other, DefaultPartitionsSubset) and set(
+            self.get_partition_keys()
+        ) == set(other.subset)
+
+    def __ne__(self, other: object) -> bool:
+        # otherwise tuple.__ne__ would compare the fields with those of subsets of other types
+        return not self == other
+
+    def __hash__(self) -> int:
+        # hashing the partitions definition would hash every partition key
+        return hash((self.bitmap, self.unindexed_partition_keys))
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1") + len(self.unindexed_partition_keys)
+
+    def __contains__(self, value) -> bool:
+        index = self._get_partition_key_indexes().get(value)
+        if index is None:
+            return value in self.unindexed_partition_keys
+        return bool(self.bitmap >> index & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={self.get_partition_keys()})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        if not isinstance(partitions_def, StaticPartitionsDefinition):
+            check.failed("Partitions definition must be a StaticPartitionsDefinition")
+        return cls(partitions_def)
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -1,16 +1,18 @@
 import collections.abc
-import itertools
 from abc import ABC, abstractmethod, abstractproperty
 from collections import defaultdict
 from datetime import datetime
 from typing import (
+    AbstractSet,
     Collection,
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -20,8 +22,8 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr, experimental, public
 from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
     PartitionsDefinition,
@@ -356,15 +358,25 @@ def _get_dependency_partitions_subset(
         partition keys in the partitions definition b_partitions_def that are
         dependencies of the partition keys in a_partition_keys.
         """
-        a_partition_keys_by_dimension = defaultdict(set)
+        # The partitions in a_partitions_subset, as a union of cross products of the partition keys
+        # of each dimension. This allows mapping whole rows and columns of a multi-partitions
+        # subset at once, rather than each of its multi-partition keys.
+        a_partition_key_products: Sequence[Mapping[Optional[str], AbstractSet[str]]]
         if isinstance(a_partitions_def, MultiPartitionsDefinition):
-            for partition_key in a_partitions_subset.get_partition_keys():
-                key = a_partitions_def.get_partition_key_from_str(partition_key)
-                for dimension_name, key in key.keys_by_dimension.items():
-                    a_partition_keys_by_dimension[dimension_name].add(key)
+            if not isinstance(a_partitions_subset, MultiPartitionsSubset):
+                a_partitions_subset = a_partitions_def.empty_subset().with_partition_keys(
+                    a_partitions_subset.get_partition_keys()
+                )
+            a_partition_key_products = cast(
+                MultiPartitionsSubset, a_partitions_subset
+            ).get_partition_key_products()
         else:
-            for partition_key in a_partitions_subset.get_partition_keys():
-                a_partition_keys_by_dimension[None].add(partition_key)
+            a_partition_key_products = [{None: set(a_partitions_subset.get_partition_keys())}]
+
+        a_partition_keys_by_dimension: Dict[Optional[str], Set[str]] = defaultdict(set)
+        for partition_key_product in a_partition_key_products:
+            for dimension_name, keys in partition_key_product.items():
+                a_partition_keys_by_dimension[dimension_name].update(keys)
 
         # Maps the dimension name and key of a partition in a_partitions_def to the list of
         # partition keys in b_partitions_def that are dependencies of that partition
@@ -468,49 +480,40 @@ def _get_dependency_partitions_subset(
                             set(mapped_partitions_result.required_but_nonexistent_partition_keys)
                         )
 
-        b_partition_keys = set()
-
         mapped_a_dim_names = a_dim_to_dependency_b_dim.keys()
         mapped_b_dim_names = [mapping[0] for mapping in a_dim_to_dependency_b_dim.values()]
         unmapped_b_dim_names = list(
             set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
         )
+        unmapped_b_partition_keys_by_dimension = {
+            dim_name: b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
+                dynamic_partitions_store=dynamic_partitions_store, current_time=current_time
+            )
+            for dim_name in unmapped_b_dim_names
+        }
 
-        for key in a_partitions_subset.get_partition_keys():
-            for b_key_values in itertools.product(
-                *(
-                    [
-                        dep_b_keys_by_a_dim_and_key[dim_name][
-                            (
-                                cast(MultiPartitionsDefinition, a_partitions_def)
-                                .get_partition_key_from_str(key)
-                                .keys_by_dimension[dim_name]
-                                if dim_name
-                                else key
-                            )
-                        ]
-                        for dim_name in mapped_a_dim_names
-                    ]
-                ),
-                *[
-                    b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
-                        dynamic_partitions_store=dynamic_partitions_store, current_time=current_time
-                    )
-                    for dim_name in unmapped_b_dim_names
-                ],
-            ):
-                b_partition_keys.add(
-                    MultiPartitionKey(
-                        {
-                            cast(str, (mapped_b_dim_names + unmapped_b_dim_names)[i]): key
-                            for i, key in enumerate(b_key_values)
-                        }
-                    )
-                    if len(b_key_values) > 1
-                    else b_key_values[0]
+        mapped_subset = b_partitions_def.empty_subset()
+        for partition_key_product in a_partition_key_products:
+            # the cross product of the dependencies of each dimension of the a partitions
+            b_partition_keys_by_dimension: Dict[Optional[str], Iterable[str]] = {
+                b_dim_name: {
+                    b_key
+                    for a_key in partition_key_product[a_dim_name]
+                    for b_key in dep_b_keys_by_a_dim_and_key[a_dim_name][a_key]
+                }
+                for a_dim_name, b_dim_name in zip(mapped_a_dim_names, mapped_b_dim_names)
+            }
+            b_partition_keys_by_dimension.update(unmapped_b_partition_keys_by_dimension)
+
+            if isinstance(mapped_subset, MultiPartitionsSubset):
+                mapped_subset = mapped_subset.with_partition_key_product(
+                    cast(Mapping[str, Iterable[str]], b_partition_keys_by_dimension)
+                )
+            else:
+                mapped_subset = mapped_subset.with_partition_keys(
+                    b_partition_keys_by_dimension[None]
                 )
 
-        mapped_subset = b_partitions_def.empty_subset().with_partition_keys(b_partition_keys)
         if a_upstream_of_b:
             return mapped_subset
         else:
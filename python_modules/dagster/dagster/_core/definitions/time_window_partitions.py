@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from abc import abstractmethod, abstractproperty
 from datetime import datetime, timedelta
@@ -49,6 +50,7 @@
 )
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -69,6 +71,8 @@
 )
 from .partition_key_range import PartitionKeyRange
 
+SECONDS_PER_HOUR = 60 * 60
+
 
 def is_second_ambiguous_time(dt: datetime, tz: str):
     """Returns if a datetime is the second instance of an ambiguous time in the given timezone due
@@ -356,6 +360,111 @@ def get_current_timestamp(self, current_time: Optional[datetime] = None) -> floa
             else pendulum.now(self.timezone)
         ).timestamp()
 
+    @functools.lru_cache(maxsize=256)
+    def _get_fixed_interval_schedule_type(self) -> Optional[ScheduleType]:
+        """The schedule type of this partitions definition, if the partition boundaries can be
+        computed arithmetically from their index rather than by stepping through the cron schedule
+        one partition at a time.
+
+        Hourly partitions are a fixed number of seconds apart, and daily, weekly and monthly
+        partitions start exactly once on a fixed number of days or months in the timezone of the
+        partitions definition, with DST transitions only shifting the time of day at which they start.
+        """
+        schedule_type = self.schedule_type
+        if schedule_type == ScheduleType.HOURLY:
+            # the cron iterator advances hourly schedules by whole hours from the first boundary
+            # after the start. Partitions are only a fixed number of seconds apart from the first
+            # partition if that boundary is also aligned to the hour in UTC.
+            first_start_timestamp = self._get_first_partition_start().timestamp()
+            if first_start_timestamp % SECONDS_PER_HOUR != self.minute_offset * 60:
+                return None
+        elif (
+            schedule_type == ScheduleType.MONTHLY
+            and self.day_offset > MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+        ):
+            return None
+
+        return schedule_type
+
+    @functools.lru_cache(maxsize=256)
+    def _get_first_partition_start(self) -> datetime:
+        return next(iter(self._iterate_time_windows(self.start))).start
+
+    def _get_partition_index(self, partition_start: datetime) -> int:
+        """The index of the partition with the given start, counted from the first partition after
+        the start of the partitions definition. Only valid for fixed interval schedules.
+        """
+        first_start = self._get_first_partition_start()
+        schedule_type = self._get_fixed_interval_schedule_type()
+        if schedule_type == ScheduleType.HOURLY:
+            return round(
+                (partition_start.timestamp() - first_start.timestamp()) / SECONDS_PER_HOUR
+            )
+
+        partition_start = to_timezone(partition_start, self.timezone)
+        if schedule_type == ScheduleType.MONTHLY:
+            return (partition_start.year - first_start.year) * 12 + (
+                partition_start.month - first_start.month
+            )
+
+        days = (partition_start.date() - first_start.date()).days
+        return days // 7 if schedule_type == ScheduleType.WEEKLY else days
+
+    def _get_partition_start_for_index(self, index: int) -> datetime:
+        """The start of the partition at the given index. Only valid for fixed interval schedules."""
+        first_start = self._get_first_partition_start()
+        schedule_type = self._get_fixed_interval_schedule_type()
+        if schedule_type == ScheduleType.HOURLY:
+            return pendulum.from_timestamp(
+                first_start.timestamp() + index * SECONDS_PER_HOUR, tz=self.timezone
+            )
+
+        # find the day or month that the partition starts in, and then the first partition boundary
+        # on that day or in that month, which is at a DST-dependent time of day
+        if schedule_type == ScheduleType.MONTHLY:
+            year, month = divmod(first_start.year * 12 + first_start.month - 1 + index, 12)
+            period_start = create_pendulum_time(year, month + 1, 1, tz=self.timezone)
+        else:
+            days = index * 7 if schedule_type == ScheduleType.WEEKLY else index
+            period_date = first_start.date() + timedelta(days=days)
+            period_start = create_pendulum_time(
+                period_date.year, period_date.month, period_date.day, tz=self.timezone
+            )
+
+        return next(
+            cron_string_iterator(period_start.timestamp(), self.cron_schedule, self.timezone)
+        )
+
+    def _get_num_partition_starts_before(self, timestamp: float) -> int:
+        """The number of partitions that start at or before the given timestamp, counting those
+        that end after the partitions definition or the current time. Only valid for fixed interval
+        schedules.
+        """
+        if self._get_fixed_interval_schedule_type() == ScheduleType.HOURLY:
+            first_start_timestamp = self._get_first_partition_start().timestamp()
+            return max(
+                0, math.floor((timestamp - first_start_timestamp) / SECONDS_PER_HOUR) + 1
+            )
+
+        last_start = next(reverse_cron_string_iterator(timestamp, self.cron_schedule, self.timezone))
+        return max(0, self._get_partition_index(last_start) + 1)
+
+    def _get_num_partitions_from_index(self, current_timestamp: float) -> int:
+        # the partitions that end at or before the current time, i.e. those for which the next
+        # partition starts before then
+        num_partitions = max(0, self._get_num_partition_starts_before(current_timestamp) - 1)
+        if self.end_offset > 0:
+            num_partitions += self.end_offset
+        if self.end:
+            num_partitions = min(
+                num_partitions,
+                max(0, self._get_num_partition_starts_before(self.end.timestamp()) - 1),
+            )
+        if self.end_offset < 0:
+            num_partitions += self.end_offset
+
+        return num_partitions
+
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
@@ -366,6 +475,9 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._get_fixed_interval_schedule_type():
+            return self._get_num_partitions_from_index(current_timestamp)
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -397,6 +509,16 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._get_fixed_interval_schedule_type():
+            start_idx = max(0, start_idx)
+            end_idx = min(end_idx, self._get_num_partitions_from_index(current_timestamp))
+            if start_idx >= end_idx:
+                return []
+
+            return self._format_partition_keys_from(
+                self._get_partition_start_for_index(start_idx), end_idx - start_idx
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -435,6 +557,13 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self._get_fixed_interval_schedule_type():
+            num_partitions = self._get_num_partitions_from_index(current_timestamp)
+            if num_partitions <= 0:
+                return []
+
+            return self._format_partition_keys_from(self.start, num_partitions)
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -460,6 +589,16 @@ def get_partition_keys(
 
         return partition_keys
 
+    def _format_partition_keys_from(self, start: datetime, num_partitions: int) -> List[str]:
+        partition_keys = []
+        for time_window in self._iterate_time_windows(start):
+            if len(partition_keys) >= num_partitions:
+                break
+            partition_keys.append(
+                dst_safe_strftime(time_window.start, self.timezone, self.fmt, self.cron_schedule)
+            )
+        return partition_keys
+
     def __str__(self) -> str:
         schedule_str = (
             self.schedule_type.value.capitalize() if self.schedule_type else self.cron_schedule
@@ -667,6 +806,18 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+        elif self._get_fixed_interval_schedule_type():
+            num_partitions = self._get_num_partitions_from_index(current_time.timestamp())
+            if num_partitions <= 0:
+                return None
+
+            return next(
+                iter(
+                    self._iterate_time_windows(
+                        self._get_partition_start_for_index(num_partitions - 1)
+                    )
+                )
+            )
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -1,7 +1,16 @@
 import base64
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Literal, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import (
+    Callable,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import TypeAlias
 
@@ -9,7 +18,7 @@
 from dagster._annotations import PublicAttr
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
 from dagster._core.errors import DagsterInvalidInvocationError
-from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
+from dagster._core.events import ASSET_EVENTS, EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._serdes import whitelist_for_serdes
 from dagster._seven import json
@@ -135,6 +144,129 @@ def asset_observation(self) -> Optional[AssetObservation]:
         return self.event_log_entry.asset_observation
 
 
+class LazyEventLogRecord:
+    """An event record whose indexed fields (event type, step key, asset key, partition and
+    timestamp) are read from the columns of the event log, and whose event log entry is only
+    loaded and deserialized on first access. Returned by `EventLogStorage.get_lazy_records_for_run`.
+
+    Users should not instantiate this class directly.
+    """
+
+    __slots__ = (
+        "_storage_id",
+        "_run_id",
+        "_event_type",
+        "_step_key",
+        "_timestamp",
+        "_asset_key",
+        "_partition_key",
+        "_load_event_log_entry",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        run_id: str,
+        event_type: Optional[DagsterEventType],
+        step_key: Optional[str],
+        timestamp: float,
+        asset_key: Optional[AssetKey] = None,
+        partition_key: Optional[str] = None,
+        load_event_log_entry: Optional[Callable[[int], EventLogEntry]] = None,
+        event_log_entry: Optional[EventLogEntry] = None,
+    ):
+        check.invariant(
+            (load_event_log_entry is None) != (event_log_entry is None),
+            "Exactly one of load_event_log_entry or event_log_entry must be provided",
+        )
+        self._storage_id = storage_id
+        self._run_id = run_id
+        self._event_type = event_type
+        self._step_key = step_key
+        self._timestamp = timestamp
+        self._asset_key = asset_key
+        self._partition_key = partition_key
+        self._load_event_log_entry = load_event_log_entry
+        self._event_log_entry = event_log_entry
+
+    @staticmethod
+    def from_event_log_record(record: EventLogRecord) -> "LazyEventLogRecord":
+        entry = record.event_log_entry
+        return LazyEventLogRecord(
+            storage_id=record.storage_id,
+            run_id=entry.run_id,
+            event_type=entry.dagster_event_type,
+            step_key=entry.step_key,
+            timestamp=entry.timestamp,
+            asset_key=record.asset_key,
+            partition_key=record.partition_key,
+            event_log_entry=entry,
+        )
+
+    @property
+    def storage_id(self) -> int:
+        return self._storage_id
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def event_type(self) -> Optional[DagsterEventType]:
+        return self._event_type
+
+    @property
+    def step_key(self) -> Optional[str]:
+        return self._step_key
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        if self._has_unindexed_asset_columns():
+            return check.not_none(self.event_log_entry.dagster_event).asset_key
+        return self._asset_key
+
+    @property
+    def partition_key(self) -> Optional[str]:
+        if self._has_unindexed_asset_columns():
+            return check.not_none(self.event_log_entry.dagster_event).partition
+        return self._partition_key
+
+    def _has_unindexed_asset_columns(self) -> bool:
+        # asset events always have an asset key, so a missing one means that the row was written
+        # before the asset key and partition columns were populated, and they must be read from
+        # the event itself
+        return self._asset_key is None and self._event_type in ASSET_EVENTS
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the event log entry has been loaded."""
+        return self._event_log_entry is not None
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            load_event_log_entry = check.not_none(self._load_event_log_entry)
+            self._event_log_entry = load_event_log_entry(self._storage_id)
+            self._load_event_log_entry = None
+        return self._event_log_entry
+
+    @property
+    def asset_materialization(self) -> Optional[AssetMaterialization]:
+        return self.event_log_entry.asset_materialization
+
+    @property
+    def asset_observation(self) -> Optional[AssetObservation]:
+        return self.event_log_entry.asset_observation
+
+    def to_event_log_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self._storage_id, event_log_entry=self.event_log_entry)
+
+
 class EventRecordsResult(NamedTuple):
     """Return value for a query fetching event records from the instance.  Contains a list of event
     records, a cursor string, and a boolean indicating whether there are more records to fetch.
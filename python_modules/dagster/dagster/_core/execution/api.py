@@ -49,6 +49,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.execution.plan.outputs import StepOutputHandle
+    from dagster._core.storage.partition_status_cache import AssetStatusCacheUpdater
 
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new DagsterRun  |
@@ -742,6 +743,34 @@ def create_execution_plan(
     )
 
 
+def _get_asset_status_cache_updater(
+    job_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+) -> Optional["AssetStatusCacheUpdater"]:
+    from dagster._core.storage.partition_status_cache import (
+        AssetStatusCacheUpdater,
+        is_cacheable_partition_type,
+    )
+
+    if not job_context.instance.asset_status_cache_eager_updates_enabled:
+        return None
+
+    asset_layer = job_context.job.get_definition().asset_layer
+    partitions_defs_by_asset_key = {}
+    for step_key in execution_plan.step_keys_to_execute:
+        for step_output in execution_plan.get_step_by_key(step_key).step_outputs:
+            asset_key = step_output.properties.asset_key
+            if not asset_key or not step_output.properties.is_asset_partitioned:
+                continue
+            partitions_def = asset_layer.partitions_def_for_asset(asset_key)
+            if partitions_def and is_cacheable_partition_type(partitions_def):
+                partitions_defs_by_asset_key[asset_key] = partitions_def
+
+    if not partitions_defs_by_asset_key:
+        return None
+
+    return AssetStatusCacheUpdater(job_context.instance, partitions_defs_by_asset_key)
+
+
 def job_execution_iterator(
     job_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
 ) -> Iterator[DagsterEvent]:
@@ -756,6 +785,10 @@ def job_execution_iterator(
     if not job_context.resume_from_failure:
         yield DagsterEvent.job_start(job_context)
 
+    asset_status_cache_updater = _get_asset_status_cache_updater(job_context, execution_plan)
+    if asset_status_cache_updater:
+        asset_status_cache_updater.update_all()
+
     job_exception_info = None
     job_canceled_info = None
     failed_steps = []
@@ -770,6 +803,9 @@ def job_execution_iterator(
             # Telemetry
             log_dagster_event(event, job_context)
 
+            if asset_status_cache_updater:
+                asset_status_cache_updater.handle_event(event)
+
             yield event
     except GeneratorExit:
         # Shouldn't happen, but avoid runtime-exception in case this generator gets GC-ed
@@ -833,6 +869,8 @@ def job_execution_iterator(
             )
         else:
             event = DagsterEvent.job_success(job_context)
+        if asset_status_cache_updater:
+            asset_status_cache_updater.update_all()
         if not generator_closed:
             yield event
 
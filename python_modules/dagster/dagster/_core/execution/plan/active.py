@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -87,7 +91,17 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than rescanning _pending on each _update, track how many unresolved deps each
+        # pending step is waiting on. When a step resolves its dependents are notified, and those
+        # with no remaining deps are queued in _ready to be sorted into their buckets.
+        self._step_deps: Dict[str, Set[str]] = {}
+        self._remaining_dep_counts: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_order: Dict[str, int] = {}
+        self._ready: List[str] = []
+        self._counter = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -101,8 +115,9 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls, _executable being a heap
+        # ordered by sort key and then by the order in which steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -112,6 +127,15 @@ def __init__(
         # then are considered _in_flight when vended via get_steps_to_*
         self._in_flight: Set[str] = set()
 
+        # steps vended via get_steps_to_execute that are still in flight are counted against the
+        # tag concurrency limits
+        self._tag_concurrency_limits_counter: Optional[TagConcurrencyLimitsCounter] = (
+            TagConcurrencyLimitsCounter(self._tag_concurrency_limits, [])
+            if self._tag_concurrency_limits
+            else None
+        )
+        self._executing: Set[str] = set()
+
         # and finally their terminal state is tracked by these sets, via mark_*
         self._success: Set[str] = set()
         self._failed: Set[str] = set()
@@ -123,6 +147,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -176,7 +203,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in self._executable]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -198,16 +228,16 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -220,55 +250,82 @@ def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]
                     return True
         return False
 
+    def _is_resolved(self, step_key: str) -> bool:
+        return (
+            step_key in self._success
+            or step_key in self._skipped
+            or step_key in self._failed
+            or step_key in self._abandoned
+        )
+
+    def _add_pending(self, step_key: str, depends_on_steps: Set[str]) -> None:
+        self._pending[step_key] = depends_on_steps
+        self._step_deps[step_key] = depends_on_steps
+        self._pending_order[step_key] = next(self._counter)
+
+        remaining = 0
+        for dep_key in depends_on_steps:
+            if not self._is_resolved(dep_key):
+                self._dependents[dep_key].add(step_key)
+                remaining += 1
+
+        if remaining:
+            self._remaining_dep_counts[step_key] = remaining
+        else:
+            self._ready.append(step_key)
+
+    def _mark_resolved(self, step_key: str) -> None:
+        for dependent_key in self._dependents.pop(step_key, ()):
+            self._remaining_dep_counts[dependent_key] -= 1
+            if self._remaining_dep_counts[dependent_key] == 0:
+                del self._remaining_dep_counts[dependent_key]
+                self._ready.append(dependent_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        step = self.get_step_by_key(step_key)
+        heapq.heappush(self._executable, (self._sort_key_fn(step), next(self._counter), step_key))
+
     def _update(self) -> None:
-        """Moves steps from _pending to _executable / _pending_skip / _pending_retry
+        """Moves steps from _pending to _executable / _pending_skip / _pending_abandon
         as a function of what has been _completed.
-        """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
 
+        Only the steps whose last dependency resolved since the previous call are visited.
+        """
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
+        if self._ready:
+            # visit in the order steps entered _pending so that ties in sort key are broken the
+            # same way regardless of the order in which dependencies resolved
+            ready = sorted(self._ready, key=self._pending_order.__getitem__)
+            self._ready = []
+            for step_key in ready:
+                depends_on_steps = self._pending.pop(step_key)
+                del self._pending_order[step_key]
+                if self._should_skip_step(step_key):
+                    self._pending_skip.append(step_key)
+                elif any(
+                    dep_key in self._failed or dep_key in self._abandoned
+                    for dep_key in depends_on_steps
+                ):
+                    self._pending_abandon.append(step_key)
                 else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+                    self._push_executable(step_key)
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
-
-        ready_to_retry = []
-        tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
+        if self._waiting_to_retry:
+            ready_to_retry = []
+            tick_time = time.time()
+            for key, at_time in self._waiting_to_retry.items():
+                if tick_time >= at_time:
+                    ready_to_retry.append(key)
 
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+            for key in ready_to_retry:
+                self._push_executable(key)
+                del self._waiting_to_retry[key]
 
     def sleep_interval(self):
         now = time.time()
@@ -319,22 +376,12 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        run_scoped_concurrency_limits_counter = None
-        if self._tag_concurrency_limits:
-            in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
-            run_scoped_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                self._tag_concurrency_limits,
-                in_flight_steps,
-            )
-
         batch: List[ExecutionStep] = []
+        # steps passed over because of concurrency limits, to be returned to _executable
+        blocked: List[Tuple[float, int, str]] = []
+        unclaimed: List[ExecutionStep] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -344,12 +391,15 @@ def get_steps_to_execute(
             ):
                 break
 
-            if run_scoped_concurrency_limits_counter:
-                if run_scoped_concurrency_limits_counter.is_blocked(step):
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
+            if self._tag_concurrency_limits_counter:
+                if self._tag_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
-            if run_scoped_concurrency_limits_counter:
-                run_scoped_concurrency_limits_counter.update_counters_with_launched_item(step)
+                self._tag_concurrency_limits_counter.update_counters_with_launched_item(step)
 
             step_concurrency_key = step.tags.get(GLOBAL_CONCURRENCY_TAG)
             if step_concurrency_key and self._instance_concurrency_context:
@@ -361,13 +411,24 @@ def get_steps_to_execute(
                 if not self._instance_concurrency_context.claim(
                     step_concurrency_key, step.key, priority
                 ):
+                    blocked.append(entry)
+                    unclaimed.append(step)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
+        # steps that could not claim a slot hold their place against the tag concurrency limits
+        # for the rest of the batch only
+        if self._tag_concurrency_limits_counter:
+            for step in unclaimed:
+                self._tag_concurrency_limits_counter.update_counters_with_finished_item(step)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+            self._executing.add(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -376,13 +437,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -391,11 +451,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -447,20 +507,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -480,11 +544,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -497,6 +562,13 @@ def _mark_complete(self, step_key: str) -> None:
         )
         self._in_flight.remove(step_key)
 
+        if step_key in self._executing:
+            self._executing.remove(step_key)
+            if self._tag_concurrency_limits_counter:
+                self._tag_concurrency_limits_counter.update_counters_with_finished_item(
+                    self.get_step_by_key(step_key)
+                )
+
     def handle_event(self, dagster_event: DagsterEvent) -> None:
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
 
@@ -1,11 +1,14 @@
 import asyncio
 import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
     AsyncIterator,
     Iterator,
     List,
     Mapping,
+    Optional,
     Sequence,
     Set,
     TypeVar,
@@ -136,7 +139,48 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> OpOutputU
     return event
 
 
+# Event loop on which async compute functions are run instead of a per-step loop. Set by executors
+# that run the async compute of concurrent steps on a single loop owned by another thread.
+_shared_compute_event_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "_shared_compute_event_loop", default=None
+)
+
+
+@contextmanager
+def shared_compute_event_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Run async compute functions invoked within this context on the given (running) loop."""
+    token = _shared_compute_event_loop.set(check.inst_param(loop, "loop", asyncio.AbstractEventLoop))
+    try:
+        yield
+    finally:
+        _shared_compute_event_loop.reset(token)
+
+
+async def _anext(async_gen: AsyncIterator[T]) -> T:
+    return await async_gen.__anext__()
+
+
+def _gen_from_async_gen_on_loop(
+    async_gen: AsyncIterator[T], loop: asyncio.AbstractEventLoop
+) -> Iterator[T]:
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(_anext(async_gen), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(async_gen, "aclose", None)
+        if aclose:
+            asyncio.run_coroutine_threadsafe(aclose(), loop).result()
+
+
 def gen_from_async_gen(async_gen: AsyncIterator[T]) -> Iterator[T]:
+    shared_loop = _shared_compute_event_loop.get()
+    if shared_loop is not None:
+        yield from _gen_from_async_gen_on_loop(async_gen, shared_loop)
+        return
+
     # prime use for asyncio.Runner, but new in 3.11 and did not find appealing backport
     loop = asyncio.new_event_loop()
     try:
@@ -1,6 +1,10 @@
+import asyncio
+import itertools
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Iterator, Optional, Sequence, cast
+from queue import Empty, Queue
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -15,6 +19,7 @@
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.compute_logs import create_compute_log_file_key
 from dagster._core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster._core.execution.plan.compute import shared_compute_event_loop
 from dagster._core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import (
@@ -73,18 +78,7 @@ def inner_plan_execution_iterator(
                 )
                 step_event_list = []
 
-                missing_resources = [
-                    resource_key
-                    for resource_key in step_context.required_resource_keys
-                    if not hasattr(step_context.resources, resource_key)
-                ]
-                check.invariant(
-                    len(missing_resources) == 0,
-                    (
-                        "Expected step context for solid {solid_name} to have all required"
-                        " resources, but missing {missing_resources}."
-                    ).format(solid_name=step_context.op.name, missing_resources=missing_resources),
-                )
+                _check_step_resources(step_context)
 
                 with ExitStack() as step_stack:
                     if not isinstance(compute_log_manager, CapturedLogManager):
@@ -143,6 +137,181 @@ def inner_plan_execution_iterator(
                 yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
 
 
+# seconds to block waiting on events from step threads before re-checking for interrupts
+THREADED_EXECUTION_POLL_INTERVAL = 0.1
+
+
+def threaded_plan_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+    compute_event_loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Iterator[DagsterEvent]:
+    """Execute the steps of the plan on a bounded pool of threads in the current process.
+
+    Worker threads only run the event sequence of their step and hand each event back over a
+    queue. Everything that touches the ActiveExecution (scheduling, concurrency claims, retries,
+    hooks) happens on the calling thread as those events are drained. If a compute_event_loop is
+    provided, async compute functions are run on that loop instead of on a loop per step.
+
+    Since threads can not be interrupted, an interrupt stops new steps from being launched and
+    waits for the in-flight steps to finish.
+    """
+    check.inst_param(job_context, "job_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits")
+    check.opt_inst_param(compute_event_loop, "compute_event_loop", asyncio.AbstractEventLoop)
+
+    compute_log_manager = job_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+    step_events: "Queue[Tuple[int, Optional[DagsterEvent], Optional[BaseException]]]" = Queue()
+    # launch id -> (step context, events emitted by the step so far). Steps are tracked by launch
+    # rather than by key, since a step that is retried may be relaunched before the thread running
+    # the previous attempt has reported back that it is done.
+    in_flight: Dict[int, Tuple[StepExecutionContext, List[DagsterEvent]]] = {}
+    launch_ids = itertools.count()
+    stopping = False
+
+    with execution_plan.start(
+        retry_mode=job_context.retry_mode,
+        max_concurrent=max_concurrent,
+        tag_concurrency_limits=tag_concurrency_limits,
+        instance_concurrency_context=instance_concurrency_context,
+    ) as active_execution:
+        with ExitStack() as capture_stack:
+            # logs can only be captured for the process as a whole, since the steps share stdout
+            # and stderr with each other
+            if isinstance(compute_log_manager, CapturedLogManager):
+                file_key = create_compute_log_file_key()
+                log_key = compute_log_manager.build_log_key_for_run(job_context.run_id, file_key)
+                try:
+                    log_context = capture_stack.enter_context(
+                        compute_log_manager.capture_logs(log_key)
+                    )
+                    yield DagsterEvent.capture_logs(job_context, step_keys, log_key, log_context)
+                except Exception:
+                    yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
+
+            with ThreadPoolExecutor(
+                max_workers=max_concurrent, thread_name_prefix="dagster-step"
+            ) as thread_pool:
+                while in_flight or not (stopping or active_execution.is_complete):
+                    if not stopping and active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            job_context,
+                            "Received termination signal - waiting for in-flight steps to finish",
+                            EngineEventData.interrupted(
+                                [step_context.step.key for step_context, _ in in_flight.values()]
+                            ),
+                        )
+                        stopping = True
+                        active_execution.mark_interrupted()
+
+                    if not stopping:
+                        steps = active_execution.get_steps_to_execute()
+                        yield from active_execution.concurrency_event_iterator(job_context)
+
+                        for step in steps:
+                            step_context = cast(
+                                StepExecutionContext,
+                                job_context.for_step(step, active_execution.get_known_state()),
+                            )
+                            _check_step_resources(step_context)
+                            launch_id = next(launch_ids)
+                            in_flight[launch_id] = (step_context, [])
+                            thread_pool.submit(
+                                _execute_step_in_thread,
+                                launch_id,
+                                step_context,
+                                step_events,
+                                compute_event_loop,
+                            )
+
+                    if not in_flight:
+                        if not stopping:
+                            active_execution.sleep_til_ready()
+                        continue
+
+                    try:
+                        launch_id, step_event, error = step_events.get(
+                            timeout=THREADED_EXECUTION_POLL_INTERVAL
+                        )
+                    except Empty:
+                        continue
+
+                    # drain everything that is available before scheduling the next steps
+                    while True:
+                        step_context, step_event_list = in_flight[launch_id]
+                        if step_event:
+                            step_event_list.append(step_event)
+                            yield step_event
+                            active_execution.handle_event(step_event)
+                        else:
+                            del in_flight[launch_id]
+                            if error:
+                                raise error
+
+                            active_execution.verify_complete(job_context, step_context.step.key)
+
+                            # process skips from failures or uncovered inputs
+                            for event in active_execution.plan_events_iterator(job_context):
+                                step_event_list.append(event)
+                                yield event
+
+                            # pass a list of step events to hooks
+                            yield from _trigger_hook(step_context, step_event_list)
+
+                        try:
+                            launch_id, step_event, error = step_events.get_nowait()
+                        except Empty:
+                            break
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
+
+
+def _execute_step_in_thread(
+    launch_id: int,
+    step_context: StepExecutionContext,
+    step_events: "Queue[Tuple[int, Optional[DagsterEvent], Optional[BaseException]]]",
+    compute_event_loop: Optional[asyncio.AbstractEventLoop],
+) -> None:
+    error = None
+    try:
+        with ExitStack() as stack:
+            if compute_event_loop:
+                stack.enter_context(shared_compute_event_loop(compute_event_loop))
+            for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+                check.inst(step_event, DagsterEvent)
+                step_events.put((launch_id, step_event, None))
+    except BaseException as e:
+        # errors re-raised by the step (e.g. when raise_on_error is set) are surfaced to the
+        # calling thread once the step is marked as finished
+        error = e
+    finally:
+        step_events.put((launch_id, None, error))
+
+
+def _check_step_resources(step_context: StepExecutionContext) -> None:
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        (
+            "Expected step context for solid {solid_name} to have all required"
+            " resources, but missing {missing_resources}."
+        ).format(solid_name=step_context.op.name, missing_resources=missing_resources),
+    )
+
+
 def _handle_compute_log_setup_error(
     context: PlanExecutionContext, exc_info
 ) -> Iterator[DagsterEvent]:
@@ -7,12 +7,13 @@
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -73,23 +74,52 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
-        pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
-        try:
-            for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
-
-        except (
-            Exception,
-            KeyboardInterrupt,
-            DagsterExecutionInterruptedError,
-        ):
-            event_queue.put(
-                ChildProcessSystemErrorEvent(
-                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
+        _run_command(event_queue, command)
+
+
+def _run_command(event_queue: Queue, command: ChildProcessCommand):
+    pid = os.getpid()
+    event_queue.put(ChildProcessStartEvent(pid=pid))
+    try:
+        for step_event in command.execute():
+            event_queue.put(step_event)
+        event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+    except (
+        Exception,
+        KeyboardInterrupt,
+        DagsterExecutionInterruptedError,
+    ):
+        event_queue.put(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
             )
+        )
+
+
+def _execute_commands_in_worker_process(
+    task_queue: Queue,
+    event_queue: Queue,
+    term_event: Optional[Any],
+    max_tasks: Optional[int],
+):
+    """Runs the ChildProcessCommands received on task_queue one at a time, communicating with the
+    parent process across event_queue as _execute_command_in_child_process does. Exits when a None
+    sentinel is received, or after max_tasks commands.
+    """
+    with capture_interrupts():
+        if term_event is not None:
+            start_termination_thread(term_event)
+
+        num_tasks = 0
+        while max_tasks is None or num_tasks < max_tasks:
+            command = task_queue.get()
+            if command is None:
+                break
+
+            check.inst(command, ChildProcessCommand)
+            _run_command(event_queue, command)
+            num_tasks += 1
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -176,3 +206,144 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+class _ChildProcessWorker:
+    def __init__(self, process, task_queue: Queue, event_queue: Queue):
+        self.process = process
+        self.task_queue = task_queue
+        self.event_queue = event_queue
+        self.num_tasks = 0
+
+    def close(self, terminate: bool = False) -> None:
+        if terminate and self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of persistent worker processes that execute ChildProcessCommands.
+
+    Unlike execute_child_process_command, which starts a new process per command, commands are
+    dispatched to idle workers, so that modules imported and definitions loaded by one command are
+    reused by the following commands executed in the same worker. Each worker executes one
+    command at a time. Workers are started on demand, up to max_workers, and are replaced after
+    executing max_tasks_per_worker commands or crashing.
+
+    Commands are sent to the workers over a queue, so they must be picklable, and can not hold
+    synchronization primitives such as multiprocessing events. Instead, all workers watch the
+    pool's term_event, which interrupts the command executing in each worker when set.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_workers: int,
+        max_tasks_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        check.param_invariant(
+            self._max_tasks_per_worker is None or self._max_tasks_per_worker > 0,
+            "max_tasks_per_worker",
+            "must be a positive integer",
+        )
+        self.term_event = multiprocessing_ctx.Event()
+        self._idle_workers: List[_ChildProcessWorker] = []
+        self._num_busy_workers = 0
+        self._is_shutdown = False
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.shutdown()
+
+    def _start_worker(self) -> _ChildProcessWorker:
+        task_queue = self._multiprocessing_ctx.Queue()
+        event_queue = self._multiprocessing_ctx.Queue()
+        process = self._multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(task_queue, event_queue, self.term_event, self._max_tasks_per_worker),
+        )
+        process.start()
+        return _ChildProcessWorker(process, task_queue, event_queue)
+
+    def _acquire_worker(self) -> _ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.close()
+
+        check.invariant(
+            self._num_busy_workers < self._max_workers,
+            f"All {self._max_workers} workers of the pool are busy",
+        )
+        return self._start_worker()
+
+    def _release_worker(self, worker: _ChildProcessWorker, reusable: bool) -> None:
+        if not reusable:
+            worker.close(terminate=True)
+        elif (
+            self._max_tasks_per_worker is not None
+            and worker.num_tasks >= self._max_tasks_per_worker
+        ):
+            # the worker exits on its own after executing its last command
+            worker.close()
+        elif self._is_shutdown:
+            worker.task_queue.put(None)
+            worker.close()
+        else:
+            self._idle_workers.append(worker)
+
+    def execute_command(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent]]]:
+        """Execute a ChildProcessCommand in a worker of the pool.
+
+        Yields the same sequence of objects as execute_child_process_command, and likewise raises
+        ChildProcessCrashException if the worker dies before completing the command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(not self._is_shutdown, "ChildProcessWorkerPool has been shut down")
+
+        worker = self._acquire_worker()
+        self._num_busy_workers += 1
+        completed_properly = False
+        try:
+            worker.task_queue.put(command)
+            worker.num_tasks += 1
+
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(exit_code=worker.process.exitcode)
+        finally:
+            self._num_busy_workers -= 1
+            # a worker that did not complete its command (e.g. because it crashed, or because
+            # this iterator was closed early) is in an unknown state and is not reused
+            self._release_worker(worker, reusable=completed_properly)
+
+    def shutdown(self) -> None:
+        """Stop the idle workers. Workers executing a command are stopped once it completes."""
+        self._is_shutdown = True
+        for worker in self._idle_workers:
+            if worker.process.is_alive():
+                worker.task_queue.put(None)
+            worker.close()
+        self._idle_workers = []
@@ -38,6 +38,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -74,7 +75,9 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # commands executed in a worker pool are interrupted by the pool's termination event
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
 
             log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -112,6 +115,8 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -137,6 +142,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -198,6 +207,17 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_workers=limit,
+                        max_tasks_per_worker=self._max_tasks_per_worker,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
@@ -228,7 +248,9 @@ def execute(
 
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
+                        term_events[step.key] = (
+                            worker_pool.term_event if worker_pool else multiproc_ctx.Event()
+                        )
                         active_iters[step.key] = execute_step_out_of_process(
                             multiproc_ctx,
                             job,
@@ -239,6 +261,7 @@ def execute(
                             self.retries,
                             active_execution.get_known_state(),
                             execution_plan.repository_load_data,
+                            worker_pool=worker_pool,
                         )
 
                 # process active iterators
@@ -337,26 +360,37 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker_pool: Optional[ChildProcessWorkerPool] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # workers of the pool watch the pool's termination event instead
+        term_event=None if worker_pool else term_events[step.key],
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker_pool:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Dispatching "{step.key}" to a worker process.',
+            metadata={},
+        )
+        child_process_events = worker_pool.execute_command(command)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_events = execute_child_process_command(multiproc_ctx, command)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -0,0 +1,185 @@
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.execution.api import ExecuteRunWithPlanIterable
+from dagster._core.execution.context.system import PlanExecutionContext, PlanOrchestrationContext
+from dagster._core.execution.context_creation_job import PlanExecutionContextManager
+from dagster._core.execution.plan.execute_plan import threaded_plan_execution_iterator
+from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+from dagster._utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+
+def default_max_concurrent_threads() -> int:
+    # same default as concurrent.futures.ThreadPoolExecutor
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+# async steps spend most of their time waiting on the event loop, so many more of them can be
+# in flight at once
+DEFAULT_MAX_CONCURRENT_ASYNC_STEPS = 64
+
+
+def multithread_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    compute_event_loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Iterator[DagsterEvent]:
+    with InstanceConcurrencyContext(
+        job_context.instance, job_context.run_id
+    ) as instance_concurrency_context:
+        yield from threaded_plan_execution_iterator(
+            job_context,
+            execution_plan,
+            max_concurrent=max_concurrent,
+            tag_concurrency_limits=tag_concurrency_limits,
+            instance_concurrency_context=instance_concurrency_context,
+            compute_event_loop=compute_event_loop,
+        )
+
+
+def asyncio_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+) -> Iterator[DagsterEvent]:
+    with _event_loop_in_thread() as loop:
+        yield from multithread_execution_iterator(
+            job_context,
+            execution_plan,
+            max_concurrent=max_concurrent,
+            tag_concurrency_limits=tag_concurrency_limits,
+            compute_event_loop=loop,
+        )
+
+
+@contextmanager
+def _event_loop_in_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="dagster-event-loop", daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class MultithreadExecutor(Executor):
+    """Executes steps concurrently on a bounded pool of threads in the run process.
+
+    Steps share the resources initialized for the run, so those resources must be safe to use from
+    multiple threads.
+    """
+
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._max_concurrent = max_concurrent if max_concurrent else self._default_max_concurrent()
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
+
+    @property
+    def retries(self) -> RetryMode:
+        return self._retries
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def _default_max_concurrent(self) -> int:
+        return default_max_concurrent_threads()
+
+    def _execution_iterator(self):
+        return partial(
+            multithread_execution_iterator,
+            max_concurrent=self._max_concurrent,
+            tag_concurrency_limits=self._tag_concurrency_limits,
+        )
+
+    def _describe(self) -> str:
+        return f"in {self._max_concurrent} threads"
+
+    def execute(
+        self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+    ) -> Iterator[DagsterEvent]:
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            f"Executing steps {self._describe()} (pid: {os.getpid()})",
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=self._execution_iterator(),
+                    execution_context_manager=PlanExecutionContextManager(
+                        job=plan_context.job,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        dagster_run=plan_context.dagster_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps {description} (pid: {pid}) in {duration_ms}".format(
+                description=self._describe(),
+                pid=os.getpid(),
+                duration_ms=format_duration(timer_result.millis),
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+
+class AsyncioExecutor(MultithreadExecutor):
+    """Executes steps concurrently in the run process, running the compute functions of async ops
+    on a single event loop shared by all of the steps of the run.
+
+    The framework machinery of each step still runs in a worker thread, so synchronous ops do not
+    block the event loop.
+    """
+
+    def _default_max_concurrent(self) -> int:
+        return DEFAULT_MAX_CONCURRENT_ASYNC_STEPS
+
+    def _execution_iterator(self):
+        return partial(
+            asyncio_execution_iterator,
+            max_concurrent=self._max_concurrent,
+            tag_concurrency_limits=self._tag_concurrency_limits,
+        )
+
+    def _describe(self) -> str:
+        return f"on an event loop with up to {self._max_concurrent} steps in flight"
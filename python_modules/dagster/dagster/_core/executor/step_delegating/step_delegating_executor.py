@@ -1,7 +1,9 @@
 import os
 import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, cast
 
 import pendulum
 
@@ -14,7 +16,11 @@
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
-from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster._core.executor.step_delegating.step_handler.base import (
+    CheckStepHealthResult,
+    StepHandler,
+    StepHandlerContext,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -28,12 +34,22 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+# When notified of new events by a push based event log watch, the event log is still read
+# periodically in case a notification is missed
+DEFAULT_WATCHED_POLL_SECONDS = float(
+    os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_WATCHED_POLL_SECONDS", "10.0")
+)
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
     event log. But we wait until we later tail it from the event log database before yielding it,
     to avoid yielding the same event multiple times to callsites.
+
+    Where the event log storage is notified of new events as they are stored, the executor is woken
+    up as soon as new events are stored for the run instead of polling the event log every
+    `sleep_seconds`.
     """
 
     def __init__(
@@ -67,6 +83,7 @@ def __init__(
                 check_step_health_interval_seconds, "check_step_health_interval_seconds", default=20
             ),
         )
+        self._watched_poll_seconds = max(self._sleep_seconds, DEFAULT_WATCHED_POLL_SECONDS)
         self._should_verify_step = should_verify_step
         self._event_cursor: Optional[str] = None
 
@@ -88,6 +105,108 @@ def _pop_events(self, instance: DagsterInstance, run_id: str) -> Sequence[Dagste
         ]
         return dagster_events
 
+    @contextmanager
+    def _watch_for_new_events(
+        self, instance: DagsterInstance, run_id: str
+    ) -> Iterator[Optional[threading.Event]]:
+        """Yields an event that is set whenever new events are stored for the run, or None if the
+        event log storage can not watch the run as events are stored, in which case the event log
+        should be polled.
+        """
+        if not instance.event_log_storage.has_push_based_watch:
+            # a watch that polls the event log wouldn't notice new events any sooner than polling
+            # every `sleep_seconds`, and polls with a backoff of its own
+            yield None
+            return
+
+        new_events = threading.Event()
+
+        def _on_new_event(_event, _cursor) -> None:
+            new_events.set()
+
+        try:
+            instance.watch_event_logs(run_id, self._event_cursor, _on_new_event)
+        except Exception:
+            yield None
+            return
+
+        try:
+            yield new_events
+        finally:
+            instance.end_watch_event_logs(run_id, _on_new_event)
+
+    def _check_steps_health(
+        self,
+        plan_context: PlanOrchestrationContext,
+        steps: Sequence["ExecutionStep"],
+        active_execution: ActiveExecution,
+    ) -> None:
+        step_handler_contexts = [
+            self._get_step_handler_context(plan_context, [step], active_execution)
+            for step in steps
+        ]
+        try:
+            health_check_results = self._step_handler.check_steps_health(step_handler_contexts)
+            check.invariant(
+                len(health_check_results) == len(steps),
+                "Step handler returned a different number of health check results than steps",
+            )
+        except Exception:
+            # fall back to checking the steps one at a time, so that an error only fails the step
+            # that raised it
+            for step, step_handler_context in zip(steps, step_handler_contexts):
+                self._check_step_health(plan_context, step, step_handler_context)
+            return
+
+        for step, health_check_result in zip(steps, health_check_results):
+            if not health_check_result.is_healthy:
+                self._log_unhealthy_step(plan_context, step, health_check_result)
+
+    def _check_step_health(
+        self,
+        plan_context: PlanOrchestrationContext,
+        step: "ExecutionStep",
+        step_handler_context: StepHandlerContext,
+    ) -> None:
+        try:
+            health_check_result = self._step_handler.check_step_health(step_handler_context)
+            if not health_check_result.is_healthy:
+                self._log_unhealthy_step(plan_context, step, health_check_result)
+        except Exception:
+            serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+            # Log a step failure event if there was an error during the health
+            # check
+            DagsterEvent.step_failure_event(
+                step_context=plan_context.for_step(step),
+                step_failure_data=StepFailureData(
+                    error=serializable_error,
+                    user_failure_data=None,
+                ),
+            )
+
+    def _log_unhealthy_step(
+        self,
+        plan_context: PlanOrchestrationContext,
+        step: "ExecutionStep",
+        health_check_result: CheckStepHealthResult,
+    ) -> None:
+        DagsterEvent.step_failure_event(
+            step_context=plan_context.for_step(step),
+            step_failure_data=StepFailureData(
+                error=None,
+                user_failure_data=None,
+            ),
+            message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
+        )
+
+    def _should_pop_events(
+        self, new_events: Optional[threading.Event], last_pop_events_time: float
+    ) -> bool:
+        if new_events is None or new_events.is_set():
+            return True
+
+        return time.time() - last_pop_events_time >= self._watched_poll_seconds
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -119,7 +238,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         )
         with InstanceConcurrencyContext(
             plan_context.instance, plan_context.run_id
-        ) as instance_concurrency_context:
+        ) as instance_concurrency_context, self._watch_for_new_events(
+            plan_context.instance, plan_context.run_id
+        ) as new_events:
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -196,6 +317,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         running_steps[step.key] = step
 
                 last_check_step_health_time = pendulum.now("UTC")
+                last_pop_events_time = 0.0
 
                 # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
                 # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
@@ -233,32 +355,41 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                         return
 
-                    for dagster_event in self._pop_events(
-                        plan_context.instance,
-                        plan_context.run_id,
-                    ):
-                        yield dagster_event
-                        # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
-                        # and yields them.
-
-                        if dagster_event.is_step_skipped:
-                            assert isinstance(dagster_event.step_key, str)
-                            active_execution.verify_complete(plan_context, dagster_event.step_key)
-                        else:
-                            active_execution.handle_event(dagster_event)
-                            if (
-                                dagster_event.is_step_success
-                                or dagster_event.is_step_failure
-                                or dagster_event.is_resource_init_failure
-                                or dagster_event.is_step_up_for_retry
-                            ):
+                    if self._should_pop_events(new_events, last_pop_events_time):
+                        last_pop_events_time = time.time()
+                        if new_events:
+                            # clear before reading, so that any events stored while reading wake
+                            # the executor up again
+                            new_events.clear()
+
+                        for dagster_event in self._pop_events(
+                            plan_context.instance,
+                            plan_context.run_id,
+                        ):
+                            yield dagster_event
+                            # STEP_SKIPPED events are only emitted by ActiveExecution, which already
+                            # handles and yields them.
+
+                            if dagster_event.is_step_skipped:
                                 assert isinstance(dagster_event.step_key, str)
-                                del running_steps[dagster_event.step_key]
-
-                                if not dagster_event.is_step_up_for_retry:
-                                    active_execution.verify_complete(
-                                        plan_context, dagster_event.step_key
-                                    )
+                                active_execution.verify_complete(
+                                    plan_context, dagster_event.step_key
+                                )
+                            else:
+                                active_execution.handle_event(dagster_event)
+                                if (
+                                    dagster_event.is_step_success
+                                    or dagster_event.is_step_failure
+                                    or dagster_event.is_resource_init_failure
+                                    or dagster_event.is_step_up_for_retry
+                                ):
+                                    assert isinstance(dagster_event.step_key, str)
+                                    del running_steps[dagster_event.step_key]
+
+                                    if not dagster_event.is_step_up_for_retry:
+                                        active_execution.verify_complete(
+                                            plan_context, dagster_event.step_key
+                                        )
 
                     # process skips from failures or uncovered inputs
                     list(active_execution.plan_events_iterator(plan_context))
@@ -268,40 +399,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         curr_time - last_check_step_health_time
                     ).total_seconds() >= self._check_step_health_interval_seconds:
                         last_check_step_health_time = curr_time
-                        for step in running_steps.values():
-                            step_context = plan_context.for_step(step)
-
-                            try:
-                                health_check_result = self._step_handler.check_step_health(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                )
-                                if not health_check_result.is_healthy:
-                                    DagsterEvent.step_failure_event(
-                                        step_context=step_context,
-                                        step_failure_data=StepFailureData(
-                                            error=None,
-                                            user_failure_data=None,
-                                        ),
-                                        message=(
-                                            f"Step {step.key} failed health check:"
-                                            f" {health_check_result.unhealthy_reason}"
-                                        ),
-                                    )
-                            except Exception:
-                                serializable_error = serializable_error_info_from_exc_info(
-                                    sys.exc_info()
-                                )
-                                # Log a step failure event if there was an error during the health
-                                # check
-                                DagsterEvent.step_failure_event(
-                                    step_context=plan_context.for_step(step),
-                                    step_failure_data=StepFailureData(
-                                        error=serializable_error,
-                                        user_failure_data=None,
-                                    ),
-                                )
+                        if running_steps:
+                            self._check_steps_health(
+                                plan_context, list(running_steps.values()), active_execution
+                            )
 
                     if self._max_concurrent is not None:
                         max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -324,4 +425,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             )
                         )
 
-                    time.sleep(self._sleep_seconds)
+                    if new_events:
+                        new_events.wait(self._sleep_seconds)
+                    else:
+                        time.sleep(self._sleep_seconds)
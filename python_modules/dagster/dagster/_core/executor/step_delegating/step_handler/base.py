@@ -90,6 +90,16 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[Dags
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         pass
 
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        """Check the health of several running steps at once, returning a result for each context.
+
+        By default each step is checked with check_step_health. Step handlers that can look up the
+        state of many steps with a single request should override this.
+        """
+        return [self.check_step_health(context) for context in step_handler_contexts]
+
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
@@ -157,6 +157,7 @@
         EventLogRecord,
         EventRecordsFilter,
         EventRecordsResult,
+        LazyEventLogRecord,
     )
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
@@ -455,6 +456,24 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_buffer = None
+        if self.event_log_buffer_settings.get("enabled", False):
+            from .event_log_buffer import (
+                DEFAULT_FLUSH_INTERVAL_SECONDS,
+                DEFAULT_MAX_BUFFERED_EVENTS,
+                EventLogBuffer,
+            )
+
+            self._event_log_buffer = EventLogBuffer(
+                self._store_buffered_events,
+                max_buffered_events=self.event_log_buffer_settings.get(
+                    "max_buffered_events", DEFAULT_MAX_BUFFERED_EVENTS
+                ),
+                flush_interval_seconds=self.event_log_buffer_settings.get(
+                    "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+                ),
+            )
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
         if self.run_monitoring_enabled and self.run_monitoring_max_resume_run_attempts:
@@ -923,6 +942,36 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
     def auto_materialize_max_tick_retries(self) -> int:
         return self.get_settings("auto_materialize").get("max_tick_retries", 3)
 
+    @property
+    def auto_materialize_use_threads(self) -> bool:
+        return self.get_settings("auto_materialize").get("use_threads", False)
+
+    @property
+    def auto_materialize_num_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_workers")
+
+    @property
+    def auto_materialize_use_query_cache(self) -> bool:
+        return self.get_settings("auto_materialize").get("use_query_cache", False)
+
+    @property
+    def event_log_buffer_settings(self) -> Mapping[str, Any]:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def asset_status_cache_eager_updates_enabled(self) -> bool:
+        return self.get_settings("asset_status_cache").get("eager_updates", False)
+
+    @property
+    def asset_status_cache_reconcile_interval_seconds(self) -> int:
+        return self.get_settings("asset_status_cache").get("reconcile_interval_seconds", 30)
+
+    @property
+    def asset_status_cache_max_reconciled_assets(self) -> int:
+        return self.get_settings("asset_status_cache").get(
+            "max_reconciled_assets_per_iteration", 100
+        )
+
     # python logs
 
     @property
@@ -976,6 +1025,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_buffered_events()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1068,6 +1118,18 @@ def get_run_step_stats(
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_run_stats_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, DagsterRunStatsSnapshot]:
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    @traced
+    def get_run_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence["RunStepKeyStatsSnapshot"]]:
+        return self._event_storage.get_step_stats_for_runs(run_ids, step_keys)
+
     @traced
     def get_run_tags(
         self,
@@ -1083,6 +1145,31 @@ def get_run_tags(
     def get_run_tag_keys(self) -> Sequence[str]:
         return self._run_storage.get_run_tag_keys()
 
+    @traced
+    def get_run_tag_counts(
+        self,
+        tag_keys: Sequence[str],
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_counts(tag_keys, statuses=statuses)
+
+    @traced
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        return self._run_storage.get_queued_runs(cursor=cursor, limit=limit)
+
+    @traced
+    def get_sensor_runs_by_run_key(
+        self,
+        sensor_name: str,
+        repository_selector_id: str,
+        run_keys: Sequence[str],
+    ) -> Mapping[str, DagsterRun]:
+        return self._run_storage.get_sensor_runs_by_run_key(
+            sensor_name, repository_selector_id, run_keys
+        )
+
     @traced
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Sequence[DagsterRun]]]:
         return self._run_storage.get_run_group(run_id)
@@ -1820,6 +1907,19 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    @traced
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._event_storage.get_lazy_records_for_run(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2246,15 +2346,38 @@ def store_event(self, event: "EventLogEntry") -> None:
 
     def handle_new_event(self, event: "EventLogEntry") -> None:
         run_id = event.run_id
+        is_job_event = event.is_dagster_event and event.get_dagster_event().is_job_event
+
+        if self._event_log_buffer is not None:
+            if not is_job_event:
+                self._event_log_buffer.add(event)
+                return
+
+            # run lifecycle events are written through synchronously, after any buffered events
+            self._event_log_buffer.flush()
 
         self._event_storage.store_event(event)
 
-        if event.is_dagster_event and event.get_dagster_event().is_job_event:
+        if is_job_event:
             self._run_storage.handle_run_event(run_id, event.get_dagster_event())
 
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def flush_buffered_events(self) -> None:
+        """Write any events held in the event log buffer to event log storage. No-op unless
+        buffered event writes are enabled via the `event_log_buffer` instance setting.
+        """
+        if self._event_log_buffer is not None:
+            self._event_log_buffer.flush()
+
+    def _store_buffered_events(self, events: Sequence["EventLogEntry"]) -> None:
+        self._event_storage.store_events(events)
+
+        for event in events:
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -2681,6 +2804,16 @@ def all_instigator_state(
             repository_origin_id, repository_selector_id, instigator_type, instigator_statuses
         )
 
+    @traced
+    def get_updated_instigator_states(
+        self,
+        updated_after: float,
+        instigator_type: Optional["InstigatorType"] = None,
+    ) -> Sequence["InstigatorState"]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.get_updated_instigator_states(updated_after, instigator_type)
+
     @traced
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["InstigatorState"]:
         if not self._schedule_storage:
@@ -2789,6 +2922,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
         from dagster._core.run_coordinator import QueuedRunCoordinator
         from dagster._core.scheduler import DagsterDaemonScheduler
         from dagster._daemon.asset_daemon import AssetDaemon
+        from dagster._daemon.asset_status_cache import AssetStatusCacheDaemon
         from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
         from dagster._daemon.daemon import (
             BackfillDaemon,
@@ -2814,6 +2948,8 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(EventLogConsumerDaemon.daemon_type())
         if self.auto_materialize_enabled:
             daemons.append(AssetDaemon.daemon_type())
+        if self.asset_status_cache_eager_updates_enabled:
+            daemons.append(AssetStatusCacheDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
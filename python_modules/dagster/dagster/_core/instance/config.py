@@ -249,6 +249,36 @@ def get_tick_retention_settings(
         return default_retention_settings
 
 
+# How long a replica of the sensor or schedule daemon keeps its share of the instigators without
+# renewing its lease, and how long a replica that joins other live replicas waits before evaluating
+# instigators.
+DEFAULT_SHARD_LEASE_DURATION_SECONDS = 120
+
+
+def instigator_sharding_config(instigator_type: str) -> Field:
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            "lease_duration_seconds": Field(
+                int,
+                is_required=False,
+                default_value=DEFAULT_SHARD_LEASE_DURATION_SECONDS,
+                description=(
+                    f"How long a replica of the {instigator_type} daemon keeps its share of the"
+                    f" {instigator_type}s after it stops renewing its lease, before they are"
+                    " rebalanced onto the other replicas. A replica that joins other live replicas"
+                    f" waits this long before it starts evaluating {instigator_type}s."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            f"Divide the running {instigator_type}s between multiple replicas of the"
+            f" {instigator_type} daemon, each evaluating a consistent share of them."
+        ),
+    )
+
+
 def sensors_daemon_config() -> Field:
     return Field(
         {
@@ -269,6 +299,7 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "sharding": instigator_sharding_config("sensor"),
         },
         is_required=False,
     )
@@ -294,6 +325,70 @@ def schedules_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "sharding": instigator_sharding_config("schedule"),
+        },
+        is_required=False,
+    )
+
+
+def event_log_buffer_config_schema() -> Field:
+    return Field(
+        {
+            "enabled": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether to buffer non-run-lifecycle events in memory and write them to event"
+                    " log storage in batches. Run lifecycle events are always written immediately."
+                    " Buffered events may not be visible to readers until the buffer is flushed."
+                ),
+            ),
+            "max_buffered_events": Field(
+                int,
+                is_required=False,
+                description="Flush the buffer once it holds this many events.",
+            ),
+            "flush_interval_seconds": Field(
+                float,
+                is_required=False,
+                description=(
+                    "Flush the buffer when an event is received more than this many seconds after"
+                    " the last flush."
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
+def asset_status_cache_config_schema() -> Field:
+    return Field(
+        {
+            "eager_updates": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether runs should update the cached partition status of the assets they"
+                    " target as they execute, so that readers can use the cached status without"
+                    " catching it up with the event log. Requires the asset status cache daemon,"
+                    " which reconciles cached statuses that are left behind."
+                ),
+            ),
+            "reconcile_interval_seconds": Field(
+                int,
+                is_required=False,
+                description="How often the asset status cache daemon reconciles cached statuses.",
+            ),
+            "max_reconciled_assets_per_iteration": Field(
+                int,
+                is_required=False,
+                description=(
+                    "The maximum number of assets whose cached status is reconciled on each"
+                    " iteration of the asset status cache daemon."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -375,6 +470,26 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "For each auto-materialize tick that raises an error, how many times to retry that tick"
                     ),
                 ),
+                "use_threads": Field(Bool, is_required=False, default_value=False),
+                "num_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the assets of the same topological"
+                        " level in parallel within an auto-materialize tick"
+                    ),
+                ),
+                "use_query_cache": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to reuse the results of event log and run queries across"
+                        " auto-materialize ticks for the assets with no new events"
+                    ),
+                ),
             }
         ),
+        "event_log_buffer": event_log_buffer_config_schema(),
+        "asset_status_cache": asset_status_cache_config_schema(),
     }
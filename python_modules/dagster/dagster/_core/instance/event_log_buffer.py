@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+DEFAULT_MAX_BUFFERED_EVENTS = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Events that mark the end of a step attempt. Buffered events are flushed when one of these is
+# received, so that anything reading the event log for a finished step sees all of its events.
+STEP_BOUNDARY_EVENTS = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+class EventLogBuffer:
+    """Accumulates events in memory so that they can be written to event log storage in batches.
+
+    The buffer is flushed when it holds `max_buffered_events` events, when a step boundary event is
+    added, or when `flush` is called explicitly. A timer flushes events that have been buffered for
+    `flush_interval_seconds` without any of these happening, so no event waits longer than that to
+    be written. Flushing happens under the buffer lock, so batches are written in the order the
+    events were added.
+    """
+
+    def __init__(
+        self,
+        store_events_fn: Callable[[Sequence[EventLogEntry]], None],
+        max_buffered_events: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._store_events_fn = check.callable_param(store_events_fn, "store_events_fn")
+        self._max_buffered_events = check.int_param(max_buffered_events, "max_buffered_events")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._lock = threading.RLock()
+        self._events: List[EventLogEntry] = []
+        self._last_flush_time = time.time()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event: EventLogEntry) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+        with self._lock:
+            self._events.append(event)
+            if self._should_flush(event):
+                self.flush()
+            elif self._flush_timer is None:
+                self._start_flush_timer()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._cancel_flush_timer()
+            self._last_flush_time = time.time()
+            if not self._events:
+                return
+
+            events = self._events
+            self._events = []
+            self._store_events_fn(events)
+
+    def _start_flush_timer(self) -> None:
+        delay = max(0.0, self._last_flush_time + self._flush_interval_seconds - time.time())
+        self._flush_timer = threading.Timer(delay, self._flush_on_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logging.exception("Exception while flushing buffered events to the event log.")
+
+    def _should_flush(self, event: EventLogEntry) -> bool:
+        if len(self._events) >= self._max_buffered_events:
+            return True
+
+        if time.time() - self._last_flush_time >= self._flush_interval_seconds:
+            return True
+
+        return event.is_dagster_event and event.dagster_event_type in STEP_BOUNDARY_EVENTS
@@ -0,0 +1,49 @@
+"""add run queue priority column
+
+Revision ID: 9c4b2a1e7f3d
+Revises: ec80dd91891a
+Create Date: 2023-09-12 10:14:02.381174
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_column, has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "9c4b2a1e7f3d"
+down_revision = "ec80dd91891a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "priority"):
+        # existing runs get the default priority, and the run_queue_priority data migration fills
+        # in the priority of the unstarted runs that have a priority tag
+        op.add_column(
+            "runs",
+            db.Column("priority", db.Integer, nullable=False, server_default=db.text("0")),
+        )
+
+    if not has_index("runs", "idx_run_queue"):
+        op.create_index(
+            "idx_run_queue",
+            "runs",
+            ["status", "priority", "id"],
+            unique=False,
+            mysql_length={"status": 32},
+        )
+
+
+def downgrade():
+    if not has_table("runs"):
+        return
+
+    with op.batch_alter_table("runs") as batch_op:
+        if has_index("runs", "idx_run_queue"):
+            batch_op.drop_index("idx_run_queue")
+        if has_column("runs", "priority"):
+            batch_op.drop_column("priority")
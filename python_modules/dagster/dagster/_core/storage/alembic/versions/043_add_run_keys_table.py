@@ -0,0 +1,59 @@
+"""add run_keys table
+
+Revision ID: 3f1e6d2b8a4c
+Revises: 9c4b2a1e7f3d
+Create Date: 2023-09-14 16:42:18.527903
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "3f1e6d2b8a4c"
+down_revision = "9c4b2a1e7f3d"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "run_keys"
+INDEX_NAME = "idx_run_keys"
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column(
+                "run_id", db.String(255), db.ForeignKey("runs.run_id", ondelete="CASCADE")
+            ),
+            db.Column("sensor_name", db.Text),
+            db.Column("repository_selector_id", db.String(255)),
+            db.Column("run_key", db.Text),
+        )
+
+    if not has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            TABLE_NAME,
+            ["sensor_name", "run_key"],
+            unique=False,
+            mysql_length={"sensor_name": 64, "run_key": 64},
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, INDEX_NAME):
+            op.drop_index(INDEX_NAME, TABLE_NAME)
+
+        op.drop_table(TABLE_NAME)
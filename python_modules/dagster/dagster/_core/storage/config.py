@@ -65,4 +65,13 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "listen_notify_event_watcher": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Watch the event log for new events using Postgres LISTEN/NOTIFY on a single"
+                " shared connection, instead of polling each watched run."
+            ),
+        ),
     }
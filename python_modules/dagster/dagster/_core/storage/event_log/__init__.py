@@ -2,8 +2,13 @@
     AssetRecord as AssetRecord,
     EventLogRecord as EventLogRecord,
     EventLogStorage as EventLogStorage,
+    LazyEventLogRecord as LazyEventLogRecord,
 )
 from .in_memory import InMemoryEventLogStorage as InMemoryEventLogStorage
+from .notifying_event_watcher import (
+    EventLogNotifier as EventLogNotifier,
+    NotifyingEventWatcher as NotifyingEventWatcher,
+)
 from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
 from .schema import (
     AssetKeyTable as AssetKeyTable,
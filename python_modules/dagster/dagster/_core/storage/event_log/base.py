@@ -22,6 +22,7 @@
     EventLogRecord,
     EventRecordsFilter,
     EventRecordsResult,
+    LazyEventLogRecord,
     RunStatusChangeRecordsFilter,
 )
 from dagster._core.events import DagsterEventType
@@ -160,6 +161,26 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Get the event log records corresponding to a run, with the same arguments as
+        `get_records_for_run`. The event type, step key, asset key, partition and timestamp of
+        each record are available without deserializing its event log entry, which is only loaded
+        when accessed.
+        """
+        return [
+            LazyEventLogRecord.from_event_log_record(record)
+            for record in self.get_records_for_run(
+                run_id, cursor, of_type, limit, ascending=ascending
+            ).records
+        ]
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -178,6 +199,18 @@ def get_step_stats_for_run(
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        """Get a summary of the events that have ocurred in each of a set of runs, by run id."""
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        """Get the per-step stats of each of a set of runs, by run id, optionally only for the given
+        step keys.
+        """
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event: "EventLogEntry") -> None:
         """Store an event corresponding to a pipeline run.
@@ -186,6 +219,16 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, preserving their order. Storages that can write several
+        events in a single round trip should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -216,6 +259,13 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
         """Call this method to stop watching."""
 
+    @property
+    def has_push_based_watch(self) -> bool:
+        """Indicates that the watch callbacks are called as soon as new events are stored, rather
+        than when the event log is next polled.
+        """
+        return False
+
     @property
     @abstractmethod
     def is_persistent(self) -> bool:
@@ -248,6 +298,19 @@ def get_logs_for_all_runs_by_log_id(
         """Get event records across all runs. Only supported for non sharded sql storage."""
         raise NotImplementedError()
 
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event records for a set of runs with storage ids greater than
+        `after_storage_id`, in ascending storage id order. In run sharded storage, where storage
+        ids are only unique within a run, the records of each run are returned in turn, in the
+        order of `run_ids`.
+        """
+        raise NotImplementedError()
+
     def get_maximum_record_id(self) -> Optional[int]:
         """Get the current greatest record id in the event log. Only supported for non sharded sql storage."""
         raise NotImplementedError()
@@ -82,6 +82,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def _store_event_batch(self, events):
+        super(InMemoryEventLogStorage, self)._store_event_batch(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
@@ -98,6 +106,11 @@ def end_watch(self, run_id: str, handler: Callable):
         if handler in self._handlers[run_id]:
             self._handlers[run_id].remove(handler)
 
+    @property
+    def has_push_based_watch(self) -> bool:
+        # handlers are called as events are stored
+        return True
+
     @property
     def is_persistent(self) -> bool:
         return False
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Set
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+
+from .polling_event_watcher import MAX_POLL_PERIOD
+
+EventNotificationFn = Callable[[str, Optional[int]], None]
+
+
+class EventLogNotifier(ABC):
+    """Source of push notifications that new events have been stored for a run.
+
+    Implementations call the `on_notify` callback passed to `start` with the run id of each newly
+    stored event and, if known, its storage id. Notifications may be coalesced or dropped; the
+    watcher consuming them is responsible for fetching the new events from storage.
+    """
+
+    @abstractmethod
+    def start(self, on_notify: EventNotificationFn) -> None:
+        """Start delivering notifications to `on_notify`."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop delivering notifications and release any held resources."""
+
+
+class _WatchCallback:
+    def __init__(self, storage_id: Optional[int], callback: Callable[[EventLogEntry, str], None]):
+        self.storage_id = storage_id
+        self.callback = callback
+
+
+class NotifyingEventWatcher:
+    """Event log watcher that fetches new events for watched runs when notified by an
+    EventLogNotifier, instead of polling each run on a timer.
+
+    A single dispatcher thread serves all watched runs: notifications mark runs as pending, and
+    the dispatcher fetches the new records for each pending run once and fans them out to that
+    run's callbacks. In case notifications are lost, every watched run is also polled once every
+    `fallback_poll_interval` seconds, whether or not notifications are arriving for other runs.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _run_id_to_callbacks and _pending_run_ids
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        notifier: EventLogNotifier,
+        fallback_poll_interval: float = MAX_POLL_PERIOD,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._notifier = check.inst_param(notifier, "notifier", EventLogNotifier)
+        self._fallback_poll_interval = check.numeric_param(
+            fallback_poll_interval, "fallback_poll_interval"
+        )
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._run_id_to_callbacks: Dict[str, List[_WatchCallback]] = {}
+        self._pending_run_ids: Set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+        self._next_fallback_poll_time = 0.0
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._run_id_to_callbacks
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+
+        with self._wakeup:
+            check.invariant(not self._disposed, "Cannot watch runs on a closed event watcher")
+            if not self._thread:
+                self._notifier.start(self._on_notify)
+                self._thread = threading.Thread(
+                    target=self._dispatch_loop, name="event-watch-dispatcher", daemon=True
+                )
+                self._thread.start()
+
+            self._run_id_to_callbacks.setdefault(run_id, []).append(
+                _WatchCallback(storage_id, callback)
+            )
+            # pick up any events stored after the cursor before the next notification
+            self._pending_run_ids.add(run_id)
+            self._wakeup.notify()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id not in self._run_id_to_callbacks:
+                return
+
+            callbacks = [
+                watch_callback
+                for watch_callback in self._run_id_to_callbacks[run_id]
+                if watch_callback.callback != handler
+            ]
+            if callbacks:
+                self._run_id_to_callbacks[run_id] = callbacks
+            else:
+                del self._run_id_to_callbacks[run_id]
+                self._pending_run_ids.discard(run_id)
+
+    def _on_notify(self, run_id: str, _storage_id: Optional[int]) -> None:
+        with self._wakeup:
+            if run_id in self._run_id_to_callbacks:
+                self._pending_run_ids.add(run_id)
+                self._wakeup.notify()
+
+    def _dispatch_loop(self) -> None:
+        self._next_fallback_poll_time = time.time() + self._fallback_poll_interval
+        while True:
+            with self._wakeup:
+                wait_seconds = self._next_fallback_poll_time - time.time()
+                if not self._pending_run_ids and not self._disposed and wait_seconds > 0:
+                    self._wakeup.wait(wait_seconds)
+
+                if self._disposed:
+                    return
+
+                run_ids = self._pending_run_ids
+                self._pending_run_ids = set()
+                # poll every watched run on a fixed schedule, so that a run with a steady stream
+                # of notifications doesn't keep the others from being polled
+                if time.time() >= self._next_fallback_poll_time:
+                    run_ids |= set(self._run_id_to_callbacks.keys())
+                    self._next_fallback_poll_time = time.time() + self._fallback_poll_interval
+
+            for run_id in run_ids:
+                try:
+                    self._dispatch_run(run_id)
+                except Exception:
+                    logging.exception("Exception fetching new events for watched run %s.", run_id)
+
+    def _dispatch_run(self, run_id: str) -> None:
+        with self._lock:
+            callbacks = list(self._run_id_to_callbacks.get(run_id, []))
+
+        if not callbacks:
+            return
+
+        storage_ids = [watch_callback.storage_id for watch_callback in callbacks]
+        min_storage_id = None if None in storage_ids else min(storage_ids)  # type: ignore
+        cursor = (
+            EventLogCursor.from_storage_id(min_storage_id).to_string()
+            if min_storage_id is not None
+            else None
+        )
+
+        conn = self._event_log_storage.get_records_for_run(run_id, cursor=cursor)
+        for event_record in conn.records:
+            event_cursor = str(EventLogCursor.from_storage_id(event_record.storage_id))
+            for watch_callback in callbacks:
+                if (
+                    watch_callback.storage_id is not None
+                    and watch_callback.storage_id >= event_record.storage_id
+                ):
+                    continue
+
+                watch_callback.storage_id = event_record.storage_id
+                try:
+                    watch_callback.callback(event_record.event_log_entry, event_cursor)
+                except Exception:
+                    logging.exception("Exception in callback for event watch on run %s.", run_id)
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        with self._wakeup:
+            if self._disposed:
+                return
+            self._disposed = True
+            self._run_id_to_callbacks = {}
+            self._wakeup.notify()
+            thread = self._thread
+
+        if thread:
+            self._notifier.stop()
+            if thread is not threading.current_thread():
+                thread.join()
@@ -1,34 +1,24 @@
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, MutableMapping, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
 
-class CallbackAfterCursor(NamedTuple):
-    """Callback passed from Observer class in event polling.
-
-    cursor (str): Only process EventLogEntrys after the given cursor
-    callback (Callable[[EventLogEntry], None]): callback passed from Observer
-        to call on new EventLogEntrys, with a string cursor
-    """
-
-    cursor: Optional[str]
-    callback: Callable[[EventLogEntry, str], None]
-
-
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    A single thread (SqlPollingEventWatcherThread) polls for all watched run_ids. On storages that
+    are not run sharded, each poll is a single query for new events across every watched run,
+    whose results are dispatched to the callbacks of the corresponding run.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        ORDER: _dict_lock -> watcher_thread.callback_fn_list_lock
+        INVARIANTS: _dict_lock protects _watcher_thread
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -36,15 +26,17 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _watcher_thread
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = self._watcher_thread is not None and self._watcher_thread.has_run_id(
+                run_id
+            )
         return _has_run_id
 
     def watch_run(
@@ -54,22 +46,20 @@ def watch_run(
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+            if self._watcher_thread is None or self._watcher_thread.should_thread_exit.is_set():
+                self._watcher_thread = SqlPollingEventWatcherThread(self._event_log_storage)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
+                if self._watcher_thread.should_thread_exit.is_set():
+                    self._watcher_thread = None
 
     def __del__(self):
         self.close()
@@ -78,96 +68,164 @@ def close(self):
         if not self._disposed:
             self._disposed = True
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+                if self._watcher_thread is not None:
+                    if not self._watcher_thread.should_thread_exit.is_set():
+                        self._watcher_thread.should_thread_exit.set()
+                    self._watcher_thread.join()
+                self._watcher_thread = None
+
+
+class _RunWatchCallback:
+    def __init__(self, storage_id: Optional[int], callback: Callable[[EventLogEntry, str], None]):
+        # storage id of the last event dispatched to the callback
+        self.storage_id = storage_id
+        self.callback = callback
 
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches all watched run_ids for new Events by polling every
+    POLLING_CADENCE.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
+    Holds a list of callbacks per run_id (_run_id_to_callbacks) each passed in by an `Observer`.
+        Note that the callbacks have a storage id associated; this means that the callbacks should
+        be only executed on EventLogEntrys with an associated id > callback.storage_id
+    Tracks the storage id up to which each run_id has been fetched (_run_id_to_storage_id), so
+        that the watched runs can be polled together from the oldest of these storage ids.
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+        INVARIANTS: _callback_fn_list_lock protects _run_id_to_callbacks and _run_id_to_storage_id
 
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
+    def __init__(self, event_log_storage: EventLogStorage):
+        super(SqlPollingEventWatcherThread, self).__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
         self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+        self._run_id_to_callbacks: MutableMapping[str, List[_RunWatchCallback]] = {}
+        self._run_id_to_storage_id: Dict[str, int] = {}
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+    def has_run_id(self, run_id: str) -> bool:
+        with self._callback_fn_list_lock:
+            return run_id in self._run_id_to_callbacks
+
+    def add_callback(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
         """Observer has started watching this run.
             Add a callback to execute on new EventLogEntrys after the given cursor.
 
         Args:
+            run_id (str): the run to watch
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
         with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+            self._run_id_to_callbacks.setdefault(run_id, []).append(
+                _RunWatchCallback(storage_id, callback)
+            )
+            # rewind the run if the new callback needs events that have already been fetched
+            fetch_from = storage_id if storage_id is not None else -1
+            self._run_id_to_storage_id[run_id] = min(
+                self._run_id_to_storage_id.get(run_id, fetch_from), fetch_from
+            )
+
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also kill thread if no callbacks remaining (i.e. no Observers are watching any run_id)
 
         Args:
+            run_id (str): the run that was watched
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
         callback = check.callable_param(callback, "callback")
         with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
+            callbacks = [
+                watch_callback
+                for watch_callback in self._run_id_to_callbacks.get(run_id, [])
+                if watch_callback.callback != callback
             ]
-            if not self._callback_fn_list:
+            if callbacks:
+                self._run_id_to_callbacks[run_id] = callbacks
+            else:
+                self._run_id_to_callbacks.pop(run_id, None)
+                self._run_id_to_storage_id.pop(run_id, None)
+
+            if not self._run_id_to_callbacks:
                 self._should_thread_exit.set()
 
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
         Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+            1. executes a SELECT query to get new EventLogEntrys for all watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses the per-run storage ids as cursors in the DB to make sure that only new records are
+        retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
         while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+            with self._callback_fn_list_lock:
+                run_id_to_storage_id = dict(self._run_id_to_storage_id)
+
+            if not run_id_to_storage_id:
+                continue
+
+            if self._event_log_storage.is_run_sharded:
+                has_records = False
+                for run_id, storage_id in run_id_to_storage_id.items():
+                    conn = self._event_log_storage.get_records_for_run(
+                        run_id, cursor=EventLogCursor.from_storage_id(storage_id).to_string()
+                    )
+                    self._dispatch_records({run_id: storage_id}, conn.records)
+                    has_records = has_records or bool(conn.records)
+            else:
+                records = self._event_log_storage.get_records_for_runs(
+                    list(run_id_to_storage_id.keys()),
+                    after_storage_id=min(run_id_to_storage_id.values()),
+                )
+                self._dispatch_records(run_id_to_storage_id, records)
+                has_records = bool(records)
+
+            wait_time = INIT_POLL_PERIOD if has_records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+    def _dispatch_records(
+        self, run_id_to_storage_id: Dict[str, int], records: Sequence[EventLogRecord]
+    ) -> None:
+        if not records:
+            return
+
+        max_storage_id = records[-1].storage_id
+        with self._callback_fn_list_lock:
+            for event_record in records:
+                for watch_callback in self._run_id_to_callbacks.get(
+                    event_record.event_log_entry.run_id, []
+                ):
+                    if (
+                        watch_callback.storage_id is None
+                        or watch_callback.storage_id < event_record.storage_id
+                    ):
+                        watch_callback.storage_id = event_record.storage_id
+                        watch_callback.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+
+            # every polled run has now been fetched up to the newest record returned, unless a
+            # callback rewound it while the query was in flight
+            for run_id, polled_storage_id in run_id_to_storage_id.items():
+                if self._run_id_to_storage_id.get(run_id) == polled_storage_id:
+                    self._run_id_to_storage_id[run_id] = max(polled_storage_id, max_storage_id)
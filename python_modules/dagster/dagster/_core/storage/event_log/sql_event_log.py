@@ -94,6 +94,7 @@
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
+    LazyEventLogRecord,
 )
 from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
 from .schema import (
@@ -113,6 +114,21 @@
 MAX_CONCURRENCY_SLOTS = 1000
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+# the max number of event bodies of lazy records that are fetched in a single query
+LAZY_EVENT_BATCH_SIZE = 500
+
+# the types of the events that per-step stats are derived from
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START.value,
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_SKIPPED.value,
+    DagsterEventType.STEP_FAILURE.value,
+    DagsterEventType.STEP_RESTARTED.value,
+    DagsterEventType.ASSET_MATERIALIZATION.value,
+    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+    DagsterEventType.STEP_UP_FOR_RETRY.value,
+    *[marker_event.value for marker_event in MARKER_EVENTS],
+]
 
 
 def get_max_event_records_limit() -> int:
@@ -176,6 +192,13 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self.prepare_insert_event_values(event))
+
+    def prepare_insert_event_values(self, event: EventLogEntry) -> Dict[str, Any]:
+        """Helper method for preparing the column values of an event log row, shared between the
+        single-event insert statement and the multi-row inserts issued by `store_events`.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -189,8 +212,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        return dict(
             run_id=event.run_id,
             event=serialize_value(event),
             dagster_event_type=dagster_event_type,
@@ -448,6 +470,64 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events corresponding to one or more runs.
+
+        Contiguous events that do not need any secondary index writes are inserted with a single
+        multi-row statement per run, in one transaction. Events that do need index writes (asset
+        and asset check events) are stored individually, since those writes depend on the
+        generated storage id. The relative order of the events is preserved.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        batch: List[EventLogEntry] = []
+        for event in events:
+            if self.can_batch_insert_event(event):
+                batch.append(event)
+                continue
+
+            self._store_event_batch(batch)
+            batch = []
+            self.store_event(event)
+
+        self._store_event_batch(batch)
+
+    def can_batch_insert_event(self, event: EventLogEntry) -> bool:
+        """Whether the event can be written as part of a multi-row insert, i.e. whether storing it
+        only requires inserting its row into the event log table.
+        """
+        if not event.is_dagster_event:
+            return True
+
+        if event.dagster_event_type in ASSET_EVENTS and event.get_dagster_event().asset_key:
+            return False
+
+        return event.dagster_event_type not in ASSET_CHECK_EVENTS
+
+    def _store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        start = 0
+        while start < len(events):
+            run_id = events[start].run_id
+            end = start
+            while end < len(events) and events[end].run_id == run_id:
+                end += 1
+
+            self.store_event_rows(
+                run_id, [self.prepare_insert_event_values(event) for event in events[start:end]]
+            )
+            start = end
+
+    def store_event_rows(self, run_id: str, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Insert prepared event log rows for a single run in one statement."""
+        if not rows:
+            return
+
+        with self.run_connection(run_id) as conn:
+            conn.execute(SqlEventLogStorageTable.insert(), list(rows))
+
     def get_records_for_run(
         self,
         run_id,
@@ -465,6 +545,124 @@ def get_records_for_run(
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): the maximum number of events to fetch
         """
+        query = self._records_for_run_query(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            run_id,
+            cursor,
+            of_type,
+            limit,
+            ascending,
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        last_record_id = None
+        try:
+            records = []
+            for (
+                record_id,
+                json_str,
+            ) in results:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+                last_record_id = record_id
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        if last_record_id is not None:
+            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
+        elif cursor:
+            # record fetch returned no new logs, return the same cursor
+            next_cursor = cursor
+        else:
+            # rely on the fact that all storage ids will be positive integers
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(
+            records=records,
+            cursor=next_cursor,
+            has_more=bool(limit and len(results) == limit),
+        )
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        query = self._records_for_run_query(
+            [
+                SqlEventLogStorageTable.c.id,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.step_key,
+                SqlEventLogStorageTable.c.timestamp,
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+            ],
+            run_id,
+            cursor,
+            of_type,
+            limit,
+            ascending,
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        # the event bodies are not selected above, they're fetched for the whole batch of records
+        # the first time that the event log entry of any of them is accessed
+        batch = _LazyEventLogEntryBatch(self, run_id, [row[0] for row in results])
+        return [
+            LazyEventLogRecord(
+                storage_id=record_id,
+                run_id=run_id,
+                event_type=DagsterEventType(dagster_event_type) if dagster_event_type else None,
+                step_key=step_key,
+                timestamp=datetime_as_float(timestamp),
+                asset_key=AssetKey.from_db_string(asset_key),
+                partition_key=partition,
+                load_event_log_entry=batch.load,
+            )
+            for (
+                record_id,
+                dagster_event_type,
+                step_key,
+                timestamp,
+                asset_key,
+                partition,
+            ) in results
+        ]
+
+    def _get_serialized_events(self, run_id: str, storage_ids: Sequence[int]) -> Mapping[int, str]:
+        serialized_events = {}
+        with self.run_connection(run_id) as conn:
+            for start in range(0, len(storage_ids), LAZY_EVENT_BATCH_SIZE):
+                query = db_select(
+                    [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+                ).where(
+                    SqlEventLogStorageTable.c.id.in_(
+                        storage_ids[start : start + LAZY_EVENT_BATCH_SIZE]
+                    )
+                )
+                serialized_events.update(conn.execute(query).fetchall())
+        return serialized_events
+
+    def _records_for_run_query(
+        self,
+        columns: Sequence[db.ColumnElement],
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        limit: Optional[int],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
@@ -477,7 +675,7 @@ def get_records_for_run(
         )
 
         query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db_select(columns)
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(
                 SqlEventLogStorageTable.c.id.asc()
@@ -506,40 +704,7 @@ def get_records_for_run(
         if limit:
             query = query.limit(limit)
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
-
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
-
-        if last_record_id is not None:
-            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
-        elif cursor:
-            # record fetch returned no new logs, return the same cursor
-            next_cursor = cursor
-        else:
-            # rely on the fact that all storage ids will be positive integers
-            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
-
-        return EventLogConnection(
-            records=records,
-            cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
-        )
+        return query
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
@@ -573,30 +738,49 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
                 counts[dagster_event_type] = n_events_of_type
                 times[dagster_event_type] = last_event_timestamp
 
-            enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
-            launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(
-                    DagsterEventType.PIPELINE_FAILURE.value,
-                    times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
-                ),
+            return _build_run_stats_snapshot(run_id, counts, times)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        if not run_ids:
+            return {}
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label("n_events_of_type"),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+                )
             )
+            .group_by("run_id", "dagster_event_type")
+        )
 
-            return DagsterRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.ASSET_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
-                launch_time=datetime_as_float(launch_time) if launch_time else None,
-                start_time=datetime_as_float(start_time) if start_time else None,
-                end_time=datetime_as_float(end_time) if end_time else None,
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        counts_by_run_id: Dict[str, Dict[str, int]] = defaultdict(dict)
+        times_by_run_id: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for run_id, dagster_event_type, n_events_of_type, last_event_timestamp in results:
+            counts_by_run_id[run_id][dagster_event_type] = n_events_of_type
+            times_by_run_id[run_id][dagster_event_type] = last_event_timestamp
+
+        return {
+            run_id: _build_run_stats_snapshot(
+                run_id, counts_by_run_id[run_id], times_by_run_id[run_id]
             )
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            for run_id in run_ids
+        }
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
@@ -620,22 +804,7 @@ def get_step_stats_for_run(
             db_select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
-                )
-            )
+            .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
@@ -652,6 +821,42 @@ def get_step_stats_for_run(
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.opt_sequence_param(step_keys, "step_keys", of_type=str)
+
+        if not run_ids:
+            return {}
+
+        raw_event_query = (
+            db_select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+            .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.index_connection() as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        records_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for run_id, json_str in results:
+            try:
+                records_by_run_id[run_id].append(deserialize_value(json_str, EventLogEntry))
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return {
+            run_id: build_run_step_stats_from_events(run_id, records_by_run_id[run_id])
+            for run_id in run_ids
+        }
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -1195,6 +1400,56 @@ def get_logs_for_all_runs_by_log_id(
 
         return events
 
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_storage_id, "after_storage_id")
+        check.opt_int_param(limit, "limit")
+
+        if not run_ids:
+            return []
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.id > after_storage_id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return records
+
     def get_maximum_record_id(self) -> Optional[int]:
         with self.index_connection() as conn:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
@@ -2810,6 +3065,33 @@ def supports_asset_checks(self):
         return self.has_table(AssetCheckExecutionsTable.name)
 
 
+def _build_run_stats_snapshot(
+    run_id: str, counts: Mapping[str, int], times: Mapping[str, Any]
+) -> DagsterRunStatsSnapshot:
+    enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
+    launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
+    start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+    end_time = times.get(
+        DagsterEventType.PIPELINE_SUCCESS.value,
+        times.get(
+            DagsterEventType.PIPELINE_FAILURE.value,
+            times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
+        ),
+    )
+
+    return DagsterRunStatsSnapshot(
+        run_id=run_id,
+        steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+        steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+        materializations=counts.get(DagsterEventType.ASSET_MATERIALIZATION.value, 0),
+        expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+        enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
+        launch_time=datetime_as_float(launch_time) if launch_time else None,
+        start_time=datetime_as_float(start_time) if start_time else None,
+        end_time=datetime_as_float(end_time) if end_time else None,
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -2817,3 +3099,28 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+class _LazyEventLogEntryBatch:
+    """Loads the event log entries of a batch of lazy records from a run. The serialized events
+    of all of the records are fetched in one pass the first time that any of them is loaded, and
+    each is deserialized when its record is accessed.
+    """
+
+    def __init__(self, storage: SqlEventLogStorage, run_id: str, storage_ids: Sequence[int]):
+        self._storage = storage
+        self._run_id = run_id
+        self._storage_ids = storage_ids
+        self._serialized_events: Optional[Dict[int, str]] = None
+
+    def load(self, storage_id: int) -> EventLogEntry:
+        if self._serialized_events is None:
+            self._serialized_events = dict(
+                self._storage._get_serialized_events(  # noqa: SLF001
+                    self._run_id, self._storage_ids
+                )
+            )
+        try:
+            return deserialize_value(self._serialized_events.pop(storage_id), EventLogEntry)
+        except (KeyError, seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=self._run_id) from err
@@ -8,7 +8,17 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -32,7 +42,8 @@
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot
+from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot, DagsterRunStatus, RunsFilter
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.sql import (
     AlembicVersion,
@@ -273,6 +284,49 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_storage_id, "after_storage_id")
+        check.opt_int_param(limit, "limit")
+
+        # storage ids are only unique within a run shard, so each run's records are fetched from
+        # its own shard, in the order of the given run ids
+        cursor = EventLogCursor.from_storage_id(after_storage_id).to_string()
+        records: List[EventLogRecord] = []
+        for run_id in run_ids:
+            if limit and len(records) >= limit:
+                break
+
+            records.extend(
+                self.get_records_for_run(
+                    run_id, cursor=cursor, limit=limit - len(records) if limit else None
+                ).records
+            )
+
+        return records
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        # each run is stored in its own shard
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        # each run is stored in its own shard
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
+    def can_batch_insert_event(self, event: EventLogEntry) -> bool:
+        # run status change events are mirrored in the index shard, so they are stored individually
+        if event.is_dagster_event and event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            return False
+
+        return super().can_batch_insert_event(event)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -33,6 +33,7 @@
     EventLogStorage,
     EventRecordsFilter,
     EventRecordsResult,
+    LazyEventLogRecord,
 )
 from .runs.base import RunStorage
 from .schedules.base import ScheduleStorage
@@ -60,6 +61,7 @@
     from dagster._core.storage.dagster_run import (
         DagsterRun,
         DagsterRunStatsSnapshot,
+        DagsterRunStatus,
         JobBucket,
         RunPartitionData,
         RunRecord,
@@ -251,6 +253,28 @@ def get_run_tag_keys(self) -> Sequence[str]:
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         return self._storage.run_storage.add_run_tags(run_id, new_tags)
 
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.get_queued_runs(cursor=cursor, limit=limit)
+
+    def get_run_tag_counts(
+        self,
+        tag_keys: Sequence[str],
+        statuses: Optional[Sequence["DagsterRunStatus"]] = None,
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._storage.run_storage.get_run_tag_counts(tag_keys, statuses=statuses)
+
+    def get_sensor_runs_by_run_key(
+        self,
+        sensor_name: str,
+        repository_selector_id: str,
+        run_keys: Sequence[str],
+    ) -> Mapping[str, "DagsterRun"]:
+        return self._storage.run_storage.get_sensor_runs_by_run_key(
+            sensor_name, repository_selector_id, run_keys
+        )
+
     def has_run(self, run_id: str) -> bool:
         return self._storage.run_storage.has_run(run_id)
 
@@ -409,9 +433,38 @@ def get_step_stats_for_run(
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
         return self._storage.event_log_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, "DagsterRunStatsSnapshot"]:
+        return self._storage.event_log_storage.get_stats_for_runs(run_ids)
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, Sequence["RunStepKeyStatsSnapshot"]]:
+        return self._storage.event_log_storage.get_step_stats_for_runs(run_ids, step_keys)
+
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
+    def get_records_for_runs(
+        self,
+        run_ids: Sequence[str],
+        after_storage_id: int = -1,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        return self._storage.event_log_storage.get_records_for_runs(
+            run_ids, after_storage_id, limit
+        )
+
+    @property
+    def is_run_sharded(self) -> bool:
+        return self._storage.event_log_storage.is_run_sharded
+
+    @property
+    def has_push_based_watch(self) -> bool:
+        return self._storage.event_log_storage.has_push_based_watch
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -620,6 +673,18 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        return self._storage.event_log_storage.get_lazy_records_for_run(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def set_concurrency_slots(self, concurrency_key: str, num: int) -> None:
         return self._storage.event_log_storage.set_concurrency_slots(concurrency_key, num)
 
@@ -720,6 +785,15 @@ def all_instigator_state(
             repository_origin_id, repository_selector_id, instigator_type, instigator_statuses
         )
 
+    def get_updated_instigator_states(
+        self,
+        updated_after: float,
+        instigator_type: Optional["InstigatorType"] = None,
+    ) -> Sequence["InstigatorState"]:
+        return self._storage.schedule_storage.get_updated_instigator_states(
+            updated_after, instigator_type
+        )
+
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["InstigatorState"]:
         return self._storage.schedule_storage.get_instigator_state(origin_id, selector_id)
 
@@ -1,5 +1,17 @@
+import logging
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import pendulum
 
@@ -33,6 +45,7 @@
 from dagster._serdes.serdes import deserialize_value
 
 if TYPE_CHECKING:
+    from dagster._core.events import DagsterEvent
     from dagster._core.storage.event_log.base import AssetRecord
 
 
@@ -404,13 +417,63 @@ def get_and_update_asset_status_cache_value(
     asset_record = asset_record or next(
         iter(instance.get_asset_records(asset_keys=[asset_key])), None
     )
+    return _update_asset_status_cache_value(
+        instance,
+        asset_key,
+        partitions_def,
+        dynamic_partitions_loader if dynamic_partitions_loader else instance,
+        asset_record,
+        # when eager updates are enabled, the cached value is kept up to date as the events of
+        # runs are stored, so it only needs to be caught up with materializations stored elsewhere
+        # (e.g. reported outside of a run)
+        use_eager_cached_value=instance.asset_status_cache_eager_updates_enabled,
+    )
+
+
+def update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_asset_key: Mapping[AssetKey, Optional[PartitionsDefinition]],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+    """Catches the cached status of each of the given assets up with the events stored since the
+    cached value was last updated, fetching the asset records of all of the assets at once.
+    """
+    asset_keys = list(partitions_defs_by_asset_key.keys())
+    if not asset_keys:
+        return {}
+
+    asset_records_by_key = {
+        asset_record.asset_entry.asset_key: asset_record
+        for asset_record in instance.get_asset_records(asset_keys=asset_keys)
+    }
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    return {
+        asset_key: _update_asset_status_cache_value(
+            instance,
+            asset_key,
+            partitions_defs_by_asset_key[asset_key],
+            dynamic_partitions_store,
+            asset_records_by_key.get(asset_key),
+            use_eager_cached_value=False,
+        )
+        for asset_key in asset_keys
+    }
+
+
+def _update_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_store: DynamicPartitionsStore,
+    asset_record: Optional["AssetRecord"],
+    use_eager_cached_value: bool,
+) -> Optional[AssetStatusCacheValue]:
     if asset_record is None:
         stored_cache_value, latest_materialization_storage_id = None, None
     else:
         stored_cache_value = asset_record.asset_entry.cached_status
         latest_materialization_storage_id = asset_record.asset_entry.last_materialization_storage_id
 
-    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
     use_cached_value = (
         stored_cache_value
         and partitions_def
@@ -419,6 +482,14 @@ def get_and_update_asset_status_cache_value(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
+    if (
+        use_eager_cached_value
+        and use_cached_value
+        and stored_cache_value
+        and stored_cache_value.latest_storage_id >= (latest_materialization_storage_id or 0)
+    ):
+        return stored_cache_value
+
     updated_cache_value = _build_status_cache(
         instance=instance,
         asset_key=asset_key,
@@ -431,3 +502,127 @@ def get_and_update_asset_status_cache_value(
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
+
+
+class AssetStatusCacheUpdater:
+    """Keeps the cached status of the partitioned assets targeted by a run up to date while the
+    run executes, for instances with eager asset status cache updates enabled.
+
+    The in progress partitions are updated when the run starts, materialized partitions when the
+    step that materialized them finishes, and failed partitions when the run finishes. Failures to
+    update the cache are logged rather than raised, since the reconciler in the asset status cache
+    daemon catches up any value that is left behind.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        partitions_defs_by_asset_key: Mapping[AssetKey, PartitionsDefinition],
+    ):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._partitions_defs_by_asset_key = check.mapping_param(
+            partitions_defs_by_asset_key,
+            "partitions_defs_by_asset_key",
+            key_type=AssetKey,
+            value_type=PartitionsDefinition,
+        )
+        self._materialized_asset_keys: Set[AssetKey] = set()
+
+    @property
+    def asset_keys(self) -> AbstractSet[AssetKey]:
+        return set(self._partitions_defs_by_asset_key.keys())
+
+    def _update(self, asset_keys: Iterable[AssetKey]) -> None:
+        try:
+            # the cached status is caught up with the stored events, so events held in the event
+            # log buffer need to be written first
+            self._instance.flush_buffered_events()
+            update_asset_status_cache_values(
+                self._instance,
+                {
+                    asset_key: self._partitions_defs_by_asset_key[asset_key]
+                    for asset_key in asset_keys
+                },
+            )
+        except Exception:
+            logging.getLogger("dagster").warning(
+                "Failed to update the cached partition status of assets, it will be updated by the"
+                " asset status cache reconciler.",
+                exc_info=True,
+            )
+
+    def update_all(self) -> None:
+        self._materialized_asset_keys.clear()
+        self._update(self._partitions_defs_by_asset_key.keys())
+
+    def handle_event(self, event: "DagsterEvent") -> None:
+        if event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            if event.asset_key in self._partitions_defs_by_asset_key:
+                self._materialized_asset_keys.add(event.asset_key)
+        elif (event.is_step_success or event.is_step_failure) and self._materialized_asset_keys:
+            asset_keys = list(self._materialized_asset_keys)
+            self._materialized_asset_keys.clear()
+            self._update(asset_keys)
+
+
+class StaleAssetStatusCacheKeys(NamedTuple):
+    """The assets whose cached status may be behind the stored events.
+
+    Attributes:
+        out_of_date (Sequence[AssetKey]): The assets whose cached value is missing or known to be
+            out of date, in the order in which they should be caught up.
+        in_progress (Sequence[AssetKey]): The assets with partitions that were in progress when the
+            value was cached, ordered by asset key.
+    """
+
+    out_of_date: Sequence[AssetKey]
+    in_progress: Sequence[AssetKey]
+
+
+def get_stale_asset_status_cache_keys(
+    instance: DagsterInstance,
+    partitions_defs_by_asset_key: Mapping[AssetKey, PartitionsDefinition],
+    planned_storage_ids_by_asset_key: Mapping[AssetKey, int],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> StaleAssetStatusCacheKeys:
+    """Returns the assets whose cached status may be behind the stored events.
+
+    Args:
+        planned_storage_ids_by_asset_key (Mapping[AssetKey, int]): The storage id of the latest
+            planned materialization of assets, for materializations planned since the last time
+            the reconciler ran.
+    """
+    asset_keys = list(partitions_defs_by_asset_key.keys())
+    if not asset_keys:
+        return StaleAssetStatusCacheKeys(out_of_date=[], in_progress=[])
+
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    out_of_date: List[Tuple[int, AssetKey]] = []
+    in_progress: List[AssetKey] = []
+    for asset_record in instance.get_asset_records(asset_keys=asset_keys):
+        asset_entry = asset_record.asset_entry
+        cached_status = asset_entry.cached_status
+        partitions_def = partitions_defs_by_asset_key[asset_entry.asset_key]
+        if (
+            cached_status is None
+            or cached_status.partitions_def_id
+            != partitions_def.get_serializable_unique_identifier(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+        ):
+            out_of_date.append((0, asset_entry.asset_key))
+        elif (
+            max(
+                planned_storage_ids_by_asset_key.get(asset_entry.asset_key, 0),
+                asset_entry.last_materialization_storage_id or 0,
+            )
+            > cached_status.latest_storage_id
+        ):
+            out_of_date.append((cached_status.latest_storage_id, asset_entry.asset_key))
+        elif cached_status.earliest_in_progress_materialization_event_id is not None:
+            in_progress.append(asset_entry.asset_key)
+
+    return StaleAssetStatusCacheKeys(
+        out_of_date=[asset_key for _, asset_key in sorted(out_of_date, key=lambda entry: entry[0])],
+        in_progress=sorted(in_progress, key=lambda asset_key: asset_key.to_string()),
+    )
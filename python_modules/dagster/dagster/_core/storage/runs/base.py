@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Set, Tuple, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -9,6 +10,7 @@
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
 from dagster._core.storage.dagster_run import (
     DagsterRun,
+    DagsterRunStatus,
     JobBucket,
     RunPartitionData,
     RunRecord,
@@ -16,6 +18,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG, get_run_priority
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -191,6 +194,97 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
             new_tags (Dict[string, string])
         """
 
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        """Get the queued runs in the order they should be dequeued: by descending priority, and
+        then in the order they were submitted.
+
+        Storages that can read runs in this order from an index should override this method; by
+        default every queued run is loaded and sorted.
+
+        Args:
+            cursor (Optional[str]): The run id of the last run of the previous page.
+            limit (Optional[int]): The maximum number of runs to return.
+
+        Returns:
+            List[DagsterRun]
+        """
+        # sorted is stable, so fifo is maintained
+        queued_runs = sorted(
+            self.get_runs(RunsFilter(statuses=[DagsterRunStatus.QUEUED]), ascending=True),
+            key=lambda run: get_run_priority(run.tags),
+            reverse=True,
+        )
+        if cursor:
+            cursor_index = next(
+                (i for i, run in enumerate(queued_runs) if run.run_id == cursor), None
+            )
+            if cursor_index is None:
+                return []
+            queued_runs = queued_runs[cursor_index + 1 :]
+
+        return queued_runs[:limit] if limit else queued_runs
+
+    def get_run_tag_counts(
+        self,
+        tag_keys: Sequence[str],
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+    ) -> Mapping[Tuple[str, str], int]:
+        """Count the runs with each value of the given tag keys.
+
+        Args:
+            tag_keys (Sequence[str]): The tag keys to count runs for.
+            statuses (Optional[Sequence[DagsterRunStatus]]): Only count runs with these statuses.
+
+        Returns:
+            Dict[Tuple[str, str], int]: The number of runs for each (key, value) tag pair.
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run in self.get_runs(RunsFilter(statuses=statuses or [])):
+            for key in tag_keys:
+                if key in run.tags:
+                    counts[(key, run.tags[key])] += 1
+        return dict(counts)
+
+    def get_sensor_runs_by_run_key(
+        self,
+        sensor_name: str,
+        repository_selector_id: str,
+        run_keys: Sequence[str],
+    ) -> Mapping[str, DagsterRun]:
+        """Look up the runs that a sensor has already launched for a batch of run keys.
+
+        Runs launched from the sensor's repository match, as do runs with the sensor's name that
+        have no code origin. If several runs match a run key, the earliest one is returned.
+
+        Storages that index runs by sensor and run key should override this method; by default
+        the runs for each run key are fetched with a separate tag query.
+
+        Args:
+            sensor_name (str): The name of the sensor.
+            repository_selector_id (str): The selector id of the sensor's repository.
+            run_keys (Sequence[str]): The run keys to look up.
+
+        Returns:
+            Dict[str, DagsterRun]: The matching run for each run key that has one.
+        """
+        runs_by_run_key: Dict[str, DagsterRun] = {}
+        for run_key in run_keys:
+            # runs are returned most recent first
+            for run in reversed(self.get_runs(RunsFilter(tags={RUN_KEY_TAG: run_key}))):
+                if run.tags.get(SENSOR_NAME_TAG) != sensor_name:
+                    continue
+                # prevent the same named sensor across repos from affecting each other
+                if (
+                    run.external_job_origin is not None
+                    and run.external_job_origin.external_repository_origin.get_selector_id()
+                    != repository_selector_id
+                ):
+                    continue
+                runs_by_run_key.setdefault(run_key, run)
+        return runs_by_run_key
+
     @abstractmethod
     def has_run(self, run_id: str) -> bool:
         """Check if the storage contains a run.
@@ -14,8 +14,16 @@
 from ...execution.job_backfill import PartitionBackfill
 from ..dagster_run import DagsterRun, DagsterRunStatus, RunRecord
 from ..runs.base import RunStorage
-from ..runs.schema import BulkActionsTable, RunsTable, RunTagsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from ..runs.schema import BulkActionsTable, RunKeysTable, RunsTable, RunTagsTable
+from ..tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    PRIORITY_TAG,
+    REPOSITORY_LABEL_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
+    get_run_priority,
+)
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = (  # was run_start_end, but renamed to overwrite bad timestamps written
@@ -23,6 +31,8 @@
 )
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+RUN_QUEUE_PRIORITY = "run_queue_priority"
+RUN_KEYS = "run_keys"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -32,6 +42,8 @@
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    RUN_QUEUE_PRIORITY: lambda: migrate_run_queue_priority,
+    RUN_KEYS: lambda: migrate_run_keys,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
@@ -260,3 +272,126 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn: Optional[PrintFn] =
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_run_queue_priority(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    """Utility method that fills in the priority column of runs that have not started yet, so
+    that they are read in the right order from the run queue.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    # every other run already has the default priority, so only the unstarted runs with a
+    # priority tag need to be updated
+    base_query = (
+        db_select([RunsTable.c.id, RunTagsTable.c.value])
+        .select_from(RunsTable.join(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id))
+        .where(RunTagsTable.c.key == PRIORITY_TAG)
+        .where(RunsTable.c.status.in_([status.value for status in UNSTARTED_RUN_STATUSES]))
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                cursor = row[0]
+                conn.execute(
+                    RunsTable.update()
+                    .values(priority=get_run_priority({PRIORITY_TAG: cast(str, row[1])}))
+                    .where(RunsTable.c.id == cursor)
+                )
+
+
+def migrate_run_keys(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    """Utility method that indexes the run keys of existing sensor runs, so that sensors can look
+    up the runs they have already launched by run key.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    run_key_subquery = (
+        db_select([RunTagsTable.c.run_id.label("tags_run_id")])
+        .where(RunTagsTable.c.key == RUN_KEY_TAG)
+        .alias("tag_subquery")
+    )
+    indexed_subquery = db_select([RunKeysTable.c.run_id.label("keys_run_id")]).alias(
+        "keys_subquery"
+    )
+    base_query = (
+        db_select([RunsTable.c.run_body, RunsTable.c.id])
+        .select_from(
+            RunsTable.join(
+                run_key_subquery, RunsTable.c.run_id == run_key_subquery.c.tags_run_id
+            ).join(
+                indexed_subquery,
+                RunsTable.c.run_id == indexed_subquery.c.keys_run_id,
+                isouter=True,
+            )
+        )
+        .where(indexed_subquery.c.keys_run_id.is_(None))
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                run = deserialize_value(cast(str, row[0]), DagsterRun)
+                cursor = row[1]
+                write_run_key(conn, run)
+
+
+def write_run_key(conn: Connection, run: DagsterRun) -> None:
+    run_key = run.tags.get(RUN_KEY_TAG)
+    sensor_name = run.tags.get(SENSOR_NAME_TAG)
+    if not run_key or not sensor_name:
+        # not a sensor run, nothing to do
+        return
+
+    conn.execute(
+        RunKeysTable.insert().values(
+            run_id=run.run_id,
+            sensor_name=sensor_name,
+            repository_selector_id=(
+                run.external_job_origin.external_repository_origin.get_selector_id()
+                if run.external_job_origin
+                else None
+            ),
+            run_key=run_key,
+        )
+    )
@@ -44,6 +44,9 @@
     # columns in favor of DateTime / Timestamp columns.
     db.Column("start_time", db.Float),
     db.Column("end_time", db.Float),
+    # The priority of the run in the run queue, parsed from its priority tag, so that queued runs
+    # can be read in the order they should be dequeued
+    db.Column("priority", db.Integer, nullable=False, server_default=db.text("0")),
 )
 
 # Secondary Index migration table, used to track data migrations, both for event_logs and runs.
@@ -76,6 +79,24 @@
     db.Column("value", db.Text),
 )
 
+# Index of the run keys of the runs launched by each sensor, so that a sensor can look up the
+# runs it has already launched for a batch of run keys without joining runs against run_tags
+RunKeysTable = db.Table(
+    "run_keys",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", None, db.ForeignKey("runs.run_id", ondelete="CASCADE")),
+    db.Column("sensor_name", db.Text),
+    # null for runs that have no code origin
+    db.Column("repository_selector_id", db.String(255)),
+    db.Column("run_key", db.Text),
+)
+
 SnapshotsTable = db.Table(
     "snapshots",
     RunStorageSqlMetadata,
@@ -148,6 +169,12 @@
 )
 
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
+db.Index(
+    "idx_run_keys",
+    RunKeysTable.c.sensor_name,
+    RunKeysTable.c.run_key,
+    mysql_length={"sensor_name": 64, "run_key": 64},
+)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index(
     "idx_runs_by_job",
@@ -162,6 +189,13 @@
 db.Index("idx_bulk_actions_action_type", BulkActionsTable.c.action_type, mysql_length=32)
 db.Index("idx_bulk_actions_selector_id", BulkActionsTable.c.selector_id, mysql_length=64)
 db.Index("idx_run_status", RunsTable.c.status, mysql_length=32)
+db.Index(
+    "idx_run_queue",
+    RunsTable.c.status,
+    RunsTable.c.priority,
+    RunsTable.c.id,
+    mysql_length={"status": 32},
+)
 db.Index(
     "idx_run_range",
     RunsTable.c.status,
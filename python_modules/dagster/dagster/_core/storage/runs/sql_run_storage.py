@@ -11,6 +11,7 @@
     ContextManager,
     Dict,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -52,8 +53,12 @@
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
+    get_run_priority,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
@@ -77,14 +82,18 @@
 from .migration import (
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
+    RUN_KEYS,
     RUN_PARTITIONS,
+    RUN_QUEUE_PRIORITY,
     MigrationFn,
+    write_run_key,
 )
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    RunKeysTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
@@ -133,6 +142,16 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
         partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
         partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
 
+        kwargs = {}
+        if self.has_built_index(RUN_QUEUE_PRIORITY):
+            kwargs["priority"] = get_run_priority(dagster_run.tags)
+
+        write_run_keys = (
+            RUN_KEY_TAG in dagster_run.tags
+            and SENSOR_NAME_TAG in dagster_run.tags
+            and self.has_built_index(RUN_KEYS)
+        )
+
         runs_insert = RunsTable.insert().values(
             run_id=dagster_run.run_id,
             pipeline_name=dagster_run.job_name,
@@ -141,6 +160,7 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             snapshot_id=dagster_run.job_snapshot_id,
             partition=partition,
             partition_set=partition_set,
+            **kwargs,
         )
         with self.connect() as conn:
             try:
@@ -158,6 +178,9 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            if write_run_keys:
+                write_run_key(conn, dagster_run)
+
         return dagster_run
 
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
@@ -410,6 +433,122 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+
+        if not self.has_built_index(RUN_QUEUE_PRIORITY):
+            return super().get_queued_runs(cursor=cursor, limit=limit)
+
+        cursor_priority = None
+        cursor_id = None
+        if cursor:
+            cursor_row = self.fetchone(
+                db_select([RunsTable.c.priority, RunsTable.c.id]).where(
+                    RunsTable.c.run_id == cursor
+                )
+            )
+            if not cursor_row:
+                return []
+            cursor_priority, cursor_id = cursor_row["priority"], cursor_row["id"]
+
+        # Keyset pagination over (priority descending, id ascending). The two sort directions
+        # differ, so a single query could not read its rows in order from the (status, priority,
+        # id) index. Instead, each priority is read in id order with its own index range scan.
+        priorities_query = (
+            db_select([RunsTable.c.priority])
+            .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+            .distinct()
+            .order_by(db.desc(RunsTable.c.priority))
+        )
+        if cursor_priority is not None:
+            priorities_query = priorities_query.where(RunsTable.c.priority <= cursor_priority)
+
+        queued_runs: List[DagsterRun] = []
+        for priority_row in self.fetchall(priorities_query):
+            priority = priority_row["priority"]
+            query = (
+                db_select([RunsTable.c.run_body, RunsTable.c.status])
+                .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+                .where(RunsTable.c.priority == priority)
+                .order_by(db.asc(RunsTable.c.id))
+            )
+            if priority == cursor_priority:
+                query = query.where(RunsTable.c.id > cursor_id)
+            if limit:
+                query = query.limit(limit - len(queued_runs))
+
+            queued_runs.extend(self._rows_to_runs(self.fetchall(query)))
+            if limit and len(queued_runs) >= limit:
+                break
+
+        return queued_runs
+
+    def get_run_tag_counts(
+        self,
+        tag_keys: Sequence[str],
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+    ) -> Mapping[Tuple[str, str], int]:
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+        check.opt_sequence_param(statuses, "statuses", of_type=DagsterRunStatus)
+
+        if not tag_keys:
+            return {}
+
+        query = (
+            db_select(
+                [RunTagsTable.c.key, RunTagsTable.c.value, db.func.count().label("count")]
+            )
+            .select_from(RunTagsTable.join(RunsTable, RunTagsTable.c.run_id == RunsTable.c.run_id))
+            .where(RunTagsTable.c.key.in_(tag_keys))
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        if statuses:
+            query = query.where(RunsTable.c.status.in_([status.value for status in statuses]))
+
+        rows = self.fetchall(query)
+        return {(row["key"], row["value"]): row["count"] for row in rows}
+
+    def get_sensor_runs_by_run_key(
+        self,
+        sensor_name: str,
+        repository_selector_id: str,
+        run_keys: Sequence[str],
+    ) -> Mapping[str, DagsterRun]:
+        check.str_param(sensor_name, "sensor_name")
+        check.str_param(repository_selector_id, "repository_selector_id")
+        check.sequence_param(run_keys, "run_keys", of_type=str)
+
+        if not self.has_built_index(RUN_KEYS):
+            return super().get_sensor_runs_by_run_key(
+                sensor_name, repository_selector_id, run_keys
+            )
+
+        if not run_keys:
+            return {}
+
+        query = (
+            db_select([RunKeysTable.c.run_key, RunsTable.c.run_body, RunsTable.c.status])
+            .select_from(RunKeysTable.join(RunsTable, RunKeysTable.c.run_id == RunsTable.c.run_id))
+            .where(RunKeysTable.c.sensor_name == sensor_name)
+            .where(RunKeysTable.c.run_key.in_(run_keys))
+            .where(
+                db.or_(
+                    RunKeysTable.c.repository_selector_id == repository_selector_id,
+                    RunKeysTable.c.repository_selector_id.is_(None),
+                )
+            )
+            .order_by(db.asc(RunsTable.c.id))
+        )
+
+        runs_by_run_key: Dict[str, DagsterRun] = {}
+        for row in self.fetchall(query):
+            if row["run_key"] not in runs_by_run_key:
+                runs_by_run_key[row["run_key"]] = self._row_to_run(row)
+        return runs_by_run_key
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -453,6 +592,14 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         partition = all_tags.get(PARTITION_NAME_TAG)
         partition_set = all_tags.get(PARTITION_SET_TAG)
 
+        kwargs = {}
+        if PRIORITY_TAG in new_tags and self.has_built_index(RUN_QUEUE_PRIORITY):
+            kwargs["priority"] = get_run_priority(all_tags)
+
+        write_run_keys = (
+            RUN_KEY_TAG in new_tags or SENSOR_NAME_TAG in new_tags
+        ) and self.has_built_index(RUN_KEYS)
+
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()
@@ -462,6 +609,7 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
+                    **kwargs,
                 )
             )
 
@@ -484,6 +632,10 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     [dict(run_id=run_id, key=tag, value=new_tags[tag]) for tag in added_tags],
                 )
 
+            if write_run_keys:
+                conn.execute(RunKeysTable.delete().where(RunKeysTable.c.run_id == run_id))
+                write_run_key(conn, run.with_tags(all_tags))
+
     def get_run_group(self, run_id: str) -> Tuple[str, Sequence[DagsterRun]]:
         check.str_param(run_id, "run_id")
         dagster_run = self._get_run_by_id(run_id)
@@ -800,10 +952,14 @@ def get_daemon_heartbeats(self) -> Mapping[str, DaemonHeartbeat]:
 
     def wipe(self) -> None:
         """Clears the run storage."""
+        # the run keys table only exists once the run keys migration has run
+        has_run_keys = self.has_built_index(RUN_KEYS)
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())
             conn.execute(RunTagsTable.delete())
+            if has_run_keys:
+                conn.execute(RunKeysTable.delete())
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
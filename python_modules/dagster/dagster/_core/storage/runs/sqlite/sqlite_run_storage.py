@@ -26,7 +26,8 @@
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
 
-from ..schema import InstanceInfo, RunsTable, RunStorageSqlMetadata, RunTagsTable
+from ..migration import RUN_KEYS
+from ..schema import InstanceInfo, RunKeysTable, RunsTable, RunStorageSqlMetadata, RunTagsTable
 from ..sql_run_storage import SqlRunStorage
 
 if TYPE_CHECKING:
@@ -61,6 +62,7 @@ def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData]
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._index_migration_cache = {}
         super().__init__()
 
     @property
@@ -144,15 +146,34 @@ def _check_for_version_066_migration_and_perform(self) -> None:
                 self.add_run(run)
             os.unlink(path_to_old_db)
 
+    def has_built_index(self, migration_name: str) -> bool:
+        if migration_name not in self._index_migration_cache:
+            self._index_migration_cache[migration_name] = super(
+                SqliteRunStorage, self
+            ).has_built_index(migration_name)
+        return self._index_migration_cache[migration_name]
+
+    def mark_index_built(self, migration_name: str) -> None:
+        super(SqliteRunStorage, self).mark_index_built(migration_name)
+        if migration_name in self._index_migration_cache:
+            del self._index_migration_cache[migration_name]
+
     def delete_run(self, run_id: str) -> None:
         """Override the default sql delete run implementation until we can get full
         support on cascading deletes.
         """
         check.str_param(run_id, "run_id")
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
+        remove_run_keys = (
+            db.delete(RunKeysTable).where(RunKeysTable.c.run_id == run_id)
+            if self.has_built_index(RUN_KEYS)
+            else None
+        )
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(remove_tags)
+            if remove_run_keys is not None:
+                conn.execute(remove_run_keys)
             conn.execute(remove_run)
 
     def alembic_version(self) -> AlembicVersion:
@@ -43,6 +43,21 @@ def all_instigator_state(
             instigator_statuses (Optional[Set[InstigatorStatus]]): The InstigatorStatuses to scope results to
         """
 
+    def get_updated_instigator_states(
+        self,
+        updated_after: float,
+        instigator_type: Optional[InstigatorType] = None,
+    ) -> Sequence[InstigatorState]:
+        """Return the InstigationStates that were added or updated at or after the given timestamp.
+        Storages that do not track when states were updated return all states, so callers must
+        treat the result as a superset of the updated states.
+
+        Args:
+            updated_after (float): The timestamp to return updated states after
+            instigator_type (Optional[InstigatorType]): The InstigatorType to scope results to
+        """
+        return self.all_instigator_state(instigator_type=instigator_type)
+
     @abc.abstractmethod
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[InstigatorState]:
         """Return the instigator state for the given id.
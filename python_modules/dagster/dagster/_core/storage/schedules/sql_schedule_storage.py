@@ -114,6 +114,35 @@ def all_instigator_state(
         rows = self.execute(query)
         return self._deserialize_rows(rows, InstigatorState)
 
+    def get_updated_instigator_states(
+        self,
+        updated_after: float,
+        instigator_type: Optional[InstigatorType] = None,
+    ) -> Sequence[InstigatorState]:
+        check.float_param(updated_after, "updated_after")
+        check.opt_inst_param(instigator_type, "instigator_type", InstigatorType)
+
+        updated_after_datetime = utc_datetime_from_timestamp(updated_after)
+        if self.has_instigators_table() and self.has_built_index(SCHEDULE_JOBS_SELECTOR_ID):
+            query = (
+                db_select([InstigatorsTable.c.instigator_body])
+                .select_from(InstigatorsTable)
+                .where(InstigatorsTable.c.update_timestamp >= updated_after_datetime)
+            )
+            if instigator_type:
+                query = query.where(InstigatorsTable.c.instigator_type == instigator_type.value)
+        else:
+            query = (
+                db_select([JobTable.c.job_body])
+                .select_from(JobTable)
+                .where(JobTable.c.update_timestamp >= updated_after_datetime)
+            )
+            if instigator_type:
+                query = query.where(JobTable.c.job_type == instigator_type.value)
+
+        rows = self.execute(query)
+        return self._deserialize_rows(rows, InstigatorState)
+
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[InstigatorState]:
         check.str_param(origin_id, "origin_id")
         check.str_param(selector_id, "selector_id")
@@ -156,6 +185,7 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                     status=state.status.value,
                     instigator_type=state.instigator_type.value,
                     instigator_body=serialize_value(state),
+                    update_timestamp=pendulum.now("UTC"),
                 )
             )
         except db_exc.IntegrityError:
@@ -181,6 +211,7 @@ def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
                         status=state.status.value,
                         job_type=state.instigator_type.value,
                         job_body=serialize_value(state),
+                        update_timestamp=pendulum.now("UTC"),
                     )
                 )
             except db_exc.IntegrityError as exc:
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Mapping
 
 import dagster._check as check
 
@@ -104,6 +105,16 @@ def get_tag_type(tag):
         return TagType.USER_PROVIDED
 
 
+def get_run_priority(tags: Mapping[str, str]) -> int:
+    """The priority of a run in the run queue, from its priority tag. Runs without a valid
+    priority tag have priority 0.
+    """
+    try:
+        return int(tags.get(PRIORITY_TAG, "0"))
+    except ValueError:
+        return 0
+
+
 def check_reserved_tags(tags):
     check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
 
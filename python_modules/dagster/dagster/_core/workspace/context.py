@@ -5,8 +5,20 @@
 import warnings
 from abc import ABC, abstractmethod
 from contextlib import ExitStack
+from functools import cached_property
 from itertools import count
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Set, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Self
 
@@ -80,6 +92,13 @@ class BaseWorkspaceRequestContext(IWorkspace):
     into errors.
     """
 
+    @cached_property
+    def loaders(self) -> Dict[Type[Any], Any]:
+        """The loaders that batch and cache the storage queries made while serving the request,
+        keyed by their type.
+        """
+        return {}
+
     @property
     @abstractmethod
     def instance(self) -> DagsterInstance:
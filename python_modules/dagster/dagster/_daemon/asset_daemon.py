@@ -1,6 +1,7 @@
 import logging
 import sys
 from collections import defaultdict
+from contextlib import ExitStack
 from types import TracebackType
 from typing import Dict, Optional, Sequence, Tuple, Type
 
@@ -35,7 +36,7 @@
     AUTO_MATERIALIZE_TAG,
     AUTO_OBSERVE_TAG,
 )
-from dagster._core.utils import make_new_run_id
+from dagster._core.utils import InheritContextThreadPoolExecutor, make_new_run_id
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
@@ -189,7 +190,12 @@ def write(self) -> None:
 
 class AssetDaemon(IntervalDaemon):
     def __init__(self, interval_seconds: int):
+        from dagster._utils.caching_instance_queryer import InstanceQueryerCache
+
         super().__init__(interval_seconds=interval_seconds)
+        # query results that are reused across ticks, for the assets with no new events, if the
+        # `use_query_cache` auto_materialize setting is enabled
+        self._query_cache = InstanceQueryerCache()
 
     @classmethod
     def daemon_type(cls) -> str:
@@ -368,20 +374,35 @@ def _run_iteration_impl(
                 else:
                     evaluations_by_asset_key = {}
             else:
-                run_requests, new_cursor, evaluations = AssetDaemonContext(
-                    evaluation_id=evaluation_id,
-                    asset_graph=asset_graph,
-                    target_asset_keys=target_asset_keys,
-                    instance=instance,
-                    cursor=stored_cursor,
-                    materialize_run_tags={
-                        **instance.auto_materialize_run_tags,
-                    },
-                    observe_run_tags={AUTO_OBSERVE_TAG: "true"},
-                    auto_observe=True,
-                    respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
-                    logger=self._logger,
-                ).evaluate()
+                query_cache = None
+                if instance.auto_materialize_use_query_cache:
+                    query_cache = self._query_cache
+                    query_cache.refresh(instance)
+                with ExitStack() as stack:
+                    threadpool_executor = None
+                    if instance.auto_materialize_use_threads:
+                        threadpool_executor = stack.enter_context(
+                            InheritContextThreadPoolExecutor(
+                                max_workers=instance.auto_materialize_num_workers,
+                                thread_name_prefix="asset_daemon_worker",
+                            )
+                        )
+                    run_requests, new_cursor, evaluations = AssetDaemonContext(
+                        evaluation_id=evaluation_id,
+                        asset_graph=asset_graph,
+                        target_asset_keys=target_asset_keys,
+                        instance=instance,
+                        cursor=stored_cursor,
+                        materialize_run_tags={
+                            **instance.auto_materialize_run_tags,
+                        },
+                        observe_run_tags={AUTO_OBSERVE_TAG: "true"},
+                        auto_observe=True,
+                        respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
+                        logger=self._logger,
+                        query_cache=query_cache,
+                        threadpool_executor=threadpool_executor,
+                    ).evaluate()
 
                 check.invariant(new_cursor.evaluation_id == evaluation_id)
 
@@ -0,0 +1,155 @@
+import bisect
+from typing import AbstractSet, Dict, Mapping, Sequence
+
+from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.partition_status_cache import (
+    get_stale_asset_status_cache_keys,
+    is_cacheable_partition_type,
+    update_asset_status_cache_values,
+)
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+
+PLANNED_EVENTS_CURSOR_KEY = "ASSET_STATUS_CACHE_PLANNED_EVENTS_CURSOR"
+IN_PROGRESS_CURSOR_KEY = "ASSET_STATUS_CACHE_IN_PROGRESS_CURSOR"
+
+
+def _get_planned_storage_ids_since_cursor(
+    instance: DagsterInstance, limit: int
+) -> Mapping[AssetKey, int]:
+    """Returns the storage id of the latest materialization planned since the last call for each
+    asset, reading at most `limit` planned events. The remaining events are read by the following
+    calls.
+    """
+    storage = instance.daemon_cursor_storage
+    raw_cursor = storage.get_cursor_values({PLANNED_EVENTS_CURSOR_KEY}).get(
+        PLANNED_EVENTS_CURSOR_KEY
+    )
+    if raw_cursor is None:
+        # the first iteration reconciles every cached status, so there is no need to read the
+        # planned events stored before it
+        latest_records = instance.get_event_records(
+            EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED), limit=1
+        )
+        cursor = latest_records[0].storage_id if latest_records else 0
+        storage.set_cursor_values({PLANNED_EVENTS_CURSOR_KEY: str(cursor)})
+        return {}
+
+    records = instance.get_event_records(
+        EventRecordsFilter(
+            event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            after_cursor=int(raw_cursor),
+        ),
+        limit=limit,
+        ascending=True,
+    )
+    if records:
+        storage.set_cursor_values({PLANNED_EVENTS_CURSOR_KEY: str(records[-1].storage_id)})
+
+    planned_storage_ids_by_asset_key: Dict[AssetKey, int] = {}
+    for record in records:
+        asset_key = record.asset_key
+        if asset_key:
+            planned_storage_ids_by_asset_key[asset_key] = record.storage_id
+    return planned_storage_ids_by_asset_key
+
+
+def _get_in_progress_asset_keys_after_cursor(
+    instance: DagsterInstance, in_progress_asset_keys: Sequence[AssetKey], limit: int
+) -> Sequence[AssetKey]:
+    """Returns at most `limit` of the given assets with in progress partitions, which are ordered
+    by asset key, starting after the asset that was caught up last by the previous call and
+    wrapping around, so that assets with long-running runs don't take the same slots on every call.
+    """
+    if not in_progress_asset_keys or limit <= 0:
+        return []
+
+    storage = instance.daemon_cursor_storage
+    cursor = storage.get_cursor_values({IN_PROGRESS_CURSOR_KEY}).get(IN_PROGRESS_CURSOR_KEY)
+    start = (
+        bisect.bisect_right([asset_key.to_string() for asset_key in in_progress_asset_keys], cursor)
+        if cursor is not None
+        else 0
+    )
+    asset_keys = [*in_progress_asset_keys[start:], *in_progress_asset_keys[:start]][:limit]
+    storage.set_cursor_values({IN_PROGRESS_CURSOR_KEY: asset_keys[-1].to_string()})
+    return asset_keys
+
+
+def reconcile_asset_status_cache(
+    instance: DagsterInstance,
+    partitions_defs_by_asset_key: Mapping[AssetKey, PartitionsDefinition],
+    max_reconciled_assets: int,
+) -> AbstractSet[AssetKey]:
+    """Catches up the cached status of the assets whose cached value may have been left behind by
+    eager updates, e.g. because the run worker of a run that targeted them crashed, or because
+    their runs have not started yet. At most `max_reconciled_assets` assets are caught up, the
+    others are caught up by later calls, starting with the assets whose cached value is known to be
+    out of date, then rotating through the assets with in progress partitions. Returns the assets
+    that were caught up.
+    """
+    # assets with planned materializations that don't make the cut are caught up by the run worker
+    # once their run starts
+    planned_storage_ids_by_asset_key = _get_planned_storage_ids_since_cursor(
+        instance, limit=max_reconciled_assets * 10
+    )
+    stale_asset_keys = get_stale_asset_status_cache_keys(
+        instance, partitions_defs_by_asset_key, planned_storage_ids_by_asset_key
+    )
+    out_of_date_asset_keys = stale_asset_keys.out_of_date[:max_reconciled_assets]
+    reconciled_asset_keys = [
+        *out_of_date_asset_keys,
+        *_get_in_progress_asset_keys_after_cursor(
+            instance,
+            stale_asset_keys.in_progress,
+            limit=max_reconciled_assets - len(out_of_date_asset_keys),
+        ),
+    ]
+    update_asset_status_cache_values(
+        instance,
+        {
+            asset_key: partitions_defs_by_asset_key[asset_key]
+            for asset_key in reconciled_asset_keys
+        },
+    )
+    return set(reconciled_asset_keys)
+
+
+class AssetStatusCacheDaemon(IntervalDaemon):
+    """Reconciles the cached partition status of assets for instances with eager asset status cache
+    updates enabled.
+    """
+
+    @classmethod
+    def daemon_type(cls) -> str:
+        return "ASSET_STATUS_CACHE"
+
+    def run_iteration(self, workspace_process_context: IWorkspaceProcessContext) -> DaemonIterator:
+        instance = workspace_process_context.instance
+        if not instance.asset_status_cache_eager_updates_enabled:
+            yield
+            return
+
+        workspace = workspace_process_context.create_request_context()
+        asset_graph = ExternalAssetGraph.from_workspace(workspace)
+        partitions_defs_by_asset_key: Dict[AssetKey, PartitionsDefinition] = {}
+        for asset_key in asset_graph.materializable_asset_keys:
+            partitions_def = asset_graph.get_partitions_def(asset_key)
+            if partitions_def and is_cacheable_partition_type(partitions_def):
+                partitions_defs_by_asset_key[asset_key] = partitions_def
+
+        reconciled_asset_keys = reconcile_asset_status_cache(
+            instance,
+            partitions_defs_by_asset_key,
+            max_reconciled_assets=instance.asset_status_cache_max_reconciled_assets,
+        )
+        if reconciled_asset_keys:
+            self._logger.info(
+                f"Reconciled the cached status of {len(reconciled_asset_keys)} assets."
+            )
+        yield
@@ -1,6 +1,7 @@
 import os
 import sys
-from typing import Optional
+from functools import partial
+from typing import Optional, Sequence
 
 import click
 
@@ -18,6 +19,7 @@
     DEFAULT_DAEMON_HEARTBEAT_TOLERANCE_SECONDS,
     DagsterDaemonController as DagsterDaemonController,
     all_daemons_live,
+    create_daemons_from_instance,
     daemon_controller_from_instance,
     debug_daemon_heartbeats,
     get_daemon_statuses,
@@ -59,11 +61,21 @@ def _get_heartbeat_tolerance():
     required=False,
     hidden=True,
 )
+@click.option(
+    "--daemon-type",
+    "daemon_types",
+    multiple=True,
+    help=(
+        "Only run the daemons of the given type (e.g. SENSOR). Can be repeated. Used to run"
+        " additional replicas of the sensor or scheduler daemon when sharding is enabled."
+    ),
+)
 @workspace_target_argument
 def run_command(
     code_server_log_level: str,
     log_level: str,
     instance_ref: Optional[str],
+    daemon_types: Sequence[str],
     **kwargs: ClickArgValue,
 ) -> None:
     try:
@@ -71,21 +83,35 @@ def run_command(
             with get_instance_for_cli(
                 instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None
             ) as instance:
-                _daemon_run_command(instance, log_level, code_server_log_level, kwargs)
+                _daemon_run_command(
+                    instance, log_level, code_server_log_level, kwargs, daemon_types
+                )
     except KeyboardInterrupt:
         return  # Exit cleanly on interrupt
 
 
 @telemetry_wrapper(metadata={"DAEMON_SESSION_ID": get_telemetry_daemon_session_id()})
 def _daemon_run_command(
-    instance: DagsterInstance, log_level: str, code_server_log_level: str, kwargs: ClickArgMapping
+    instance: DagsterInstance,
+    log_level: str,
+    code_server_log_level: str,
+    kwargs: ClickArgMapping,
+    daemon_types: Sequence[str] = (),
 ) -> None:
+    unknown_daemon_types = set(daemon_types) - set(instance.get_required_daemon_types())
+    if unknown_daemon_types:
+        raise click.UsageError(
+            f"Daemon types {', '.join(sorted(unknown_daemon_types))} are not configured on this"
+            f" instance. Configured daemon types: {', '.join(instance.get_required_daemon_types())}"
+        )
+
     workspace_load_target = get_workspace_load_target(kwargs)
 
     with daemon_controller_from_instance(
         instance,
         workspace_load_target=workspace_load_target,
         heartbeat_tolerance_seconds=_get_heartbeat_tolerance(),
+        gen_daemons=partial(create_daemons_from_instance, daemon_types=daemon_types),
         log_level=log_level,
         code_server_log_level=code_server_log_level,
     ) as controller:
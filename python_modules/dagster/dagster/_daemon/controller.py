@@ -17,6 +17,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext, WorkspaceProcessContext
 from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._daemon.asset_daemon import AssetDaemon
+from dagster._daemon.asset_status_cache import AssetStatusCacheDaemon
 from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
 from dagster._daemon.daemon import (
     BackfillDaemon,
@@ -58,10 +59,13 @@ def _sorted_quoted(strings: Iterable[str]) -> str:
     return "[" + ", ".join([f"'{s}'" for s in sorted(list(strings))]) + "]"
 
 
-def create_daemons_from_instance(instance: DagsterInstance) -> Sequence[DagsterDaemon]:
+def create_daemons_from_instance(
+    instance: DagsterInstance, daemon_types: Optional[Sequence[str]] = None
+) -> Sequence[DagsterDaemon]:
     return [
         create_daemon_of_type(daemon_type, instance)
         for daemon_type in instance.get_required_daemon_types()
+        if not daemon_types or daemon_type in daemon_types
     ]
 
 
@@ -356,6 +360,10 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
                 else DEFAULT_DAEMON_INTERVAL_SECONDS
             )
         )
+    elif daemon_type == AssetStatusCacheDaemon.daemon_type():
+        return AssetStatusCacheDaemon(
+            interval_seconds=instance.asset_status_cache_reconcile_interval_seconds
+        )
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
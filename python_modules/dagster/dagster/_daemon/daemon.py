@@ -24,6 +24,7 @@
     execute_run_monitoring_iteration,
 )
 from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sharding import is_sharding_enabled
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -74,6 +75,10 @@ def daemon_type(cls) -> str:
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
+    def supports_replicas(self, instance: DagsterInstance) -> bool:
+        """Whether multiple processes may run this daemon at once against the same instance."""
+        return False
+
     def run_daemon_loop(
         self,
         workspace_process_context: TContext,
@@ -162,6 +167,7 @@ def _check_add_heartbeat(
             self._last_heartbeat_time
             and last_stored_heartbeat
             and last_stored_heartbeat.daemon_id != daemon_uuid
+            and not self.supports_replicas(instance)
         ):
             self._logger.error(
                 "Another %s daemon is still sending heartbeats. You likely have multiple "
@@ -241,6 +247,9 @@ class SchedulerDaemon(DagsterDaemon):
     def daemon_type(cls) -> str:
         return "SCHEDULER"
 
+    def supports_replicas(self, instance: DagsterInstance) -> bool:
+        return is_sharding_enabled(instance.get_scheduler_settings())
+
     def core_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -264,6 +273,9 @@ class SensorDaemon(DagsterDaemon):
     def daemon_type(cls) -> str:
         return "SENSOR"
 
+    def supports_replicas(self, instance: DagsterInstance) -> bool:
+        return is_sharding_enabled(instance.get_sensor_settings())
+
     def core_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
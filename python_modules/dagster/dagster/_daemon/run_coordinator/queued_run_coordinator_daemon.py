@@ -3,7 +3,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional
 
 from dagster import (
     DagsterEvent,
@@ -27,7 +27,6 @@
     DagsterRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
@@ -196,24 +195,22 @@ def _get_runs_to_dequeue(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        num_in_progress_runs = instance.get_runs_count(
+            RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        )
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+        max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: List[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -233,65 +230,46 @@ def _get_runs_to_dequeue(
             "Priority sorting and checking tag concurrency limits for queued runs."
             + locations_clause
         )
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
 
-            if not queued_runs:
-                has_more = False
-                return batch
-
-            cursor = queued_runs[-1].run_id
-
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
+        # seed the tag concurrency limits with per-tag counts of the in progress runs, rather than
+        # loading the runs themselves
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(tag_concurrency_limits, [])
+        if tag_concurrency_limits:
+            tag_concurrency_limits_counter.update_counters_with_tag_counts(
+                instance.get_run_tag_counts(
+                    tag_keys=list({limit["key"] for limit in tag_concurrency_limits}),
+                    statuses=IN_PROGRESS_RUN_STATUSES,
+                )
             )
 
-            batch += queued_runs
-            batch = self._priority_sort(batch)
+        # Page through the queued runs in the order they should be dequeued, stopping as soon as
+        # enough runs have been found to fill the available run slots.
+        cursor = None
+        batch: List[DagsterRun] = []
+        while True:
+            queued_runs = instance.get_queued_runs(cursor=cursor, limit=self._page_size)
+
+            for run in queued_runs:
+                if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                    return batch
 
-            to_remove = []
-            for run in batch:
                 if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+                    continue
+
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
 
                 location_name = (
                     run.external_job_origin.location_name if run.external_job_origin else None
                 )
                 if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-
-            for run in to_remove:
-                batch.remove(run)
+                    continue
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+                batch.append(run)
 
-        return batch
-
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
-
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+            if len(queued_runs) < self._page_size:
+                return batch
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+            cursor = queued_runs[-1].run_id
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -365,9 +343,9 @@ def _dequeue_run(
                             now + run_queue_config.user_code_failure_retry_delay
                         )
 
-                enqueue_event_records = instance.get_records_for_run(
+                enqueue_event_records = instance.get_lazy_records_for_run(
                     run_id=run.run_id, of_type=DagsterEventType.PIPELINE_ENQUEUED
-                ).records
+                )
 
                 check.invariant(len(enqueue_event_records), "Could not find enqueue event for run")
 
@@ -9,11 +9,12 @@
     TYPE_CHECKING,
     Dict,
     Iterator,
-    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -47,11 +48,16 @@
     TickData,
     TickStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.tags import RUN_KEY_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationEntry
+from dagster._daemon.sharding import (
+    InstigatorShardCoordinator,
+    create_instigator_shard_coordinator,
+)
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -231,6 +237,159 @@ def __exit__(
 VERBOSE_LOGS_INTERVAL = 60
 
 
+# Sensor states are read incrementally by update timestamp, reaching back a few seconds further
+# than the previous read to allow for clock skew between the processes writing states and for
+# storages that only keep timestamps to the second. Deleted states are not visible to incremental
+# reads, so all states are periodically read in full.
+SENSOR_STATE_UPDATE_MARGIN_SECONDS = 5
+FULL_SENSOR_STATE_READ_INTERVAL_SECONDS = 300
+
+
+def _get_location_version(location_entry: CodeLocationEntry) -> Tuple[float, Optional[str]]:
+    return (
+        location_entry.update_timestamp,
+        getattr(location_entry.code_location, "server_id", None),
+    )
+
+
+class SensorIndex:
+    """The sensors in the workspace and their instigator states, maintained across iterations of
+    the sensor daemon so that each iteration only does work for what changed since the previous one.
+
+    The sensors of a code location are only re-indexed when the location is reloaded, which changes
+    its load timestamp or server id, and only the sensor states that were updated since the previous
+    iteration are read from storage.
+    """
+
+    def __init__(self):
+        self._location_names: Sequence[str] = []
+        self._location_versions: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._location_sensors: Dict[str, Mapping[str, ExternalSensor]] = {}
+        self._sensors: Dict[str, ExternalSensor] = {}
+        self._sensor_states: Dict[str, InstigatorState] = {}
+        self._running_selector_ids: Set[str] = set()
+        self._running_sensors: Optional[Mapping[str, ExternalSensor]] = None
+        self._last_read_timestamp: Optional[float] = None
+        self._last_full_read_timestamp: Optional[float] = None
+        self._shard_assignment: Optional[Tuple[Tuple[str, ...], bool]] = None
+
+    @property
+    def sensor_states(self) -> Mapping[str, InstigatorState]:
+        return self._sensor_states
+
+    @property
+    def running_sensors(self) -> Mapping[str, ExternalSensor]:
+        """The running sensors by selector id, in workspace order."""
+        if self._running_sensors is None:
+            self._running_sensors = {
+                selector_id: sensor
+                for location_name in self._location_names
+                for selector_id, sensor in self._location_sensors[location_name].items()
+                if selector_id in self._running_selector_ids
+            }
+        return self._running_sensors
+
+    def add_sensor_state(self, sensor_state: InstigatorState) -> None:
+        self._sensor_states[sensor_state.selector_id] = sensor_state
+
+    def refresh(
+        self,
+        instance: DagsterInstance,
+        workspace_snapshot: Mapping[str, CodeLocationEntry],
+        shard_coordinator: Optional[InstigatorShardCoordinator] = None,
+    ) -> None:
+        changed_selector_ids = self._refresh_locations(workspace_snapshot)
+
+        now = pendulum.now("UTC").timestamp()
+        refresh_all = False
+        if (
+            self._last_read_timestamp is None
+            or self._last_full_read_timestamp is None
+            or now - self._last_full_read_timestamp >= FULL_SENSOR_STATE_READ_INTERVAL_SECONDS
+        ):
+            self._sensor_states = {
+                sensor_state.selector_id: sensor_state
+                for sensor_state in instance.all_instigator_state(
+                    instigator_type=InstigatorType.SENSOR
+                )
+            }
+            self._last_full_read_timestamp = now
+            refresh_all = True
+        else:
+            for sensor_state in instance.get_updated_instigator_states(
+                self._last_read_timestamp - SENSOR_STATE_UPDATE_MARGIN_SECONDS,
+                instigator_type=InstigatorType.SENSOR,
+            ):
+                self._sensor_states[sensor_state.selector_id] = sensor_state
+                changed_selector_ids.add(sensor_state.selector_id)
+        self._last_read_timestamp = now
+
+        shard_assignment = (
+            (shard_coordinator.live_replica_ids, shard_coordinator.is_active)
+            if shard_coordinator
+            else None
+        )
+        if shard_assignment != self._shard_assignment:
+            # the sensors have been reassigned between the replicas of the sensor daemon
+            self._shard_assignment = shard_assignment
+            refresh_all = True
+
+        if refresh_all:
+            changed_selector_ids = set(self._sensors.keys()) | self._running_selector_ids
+
+        for selector_id in changed_selector_ids:
+            sensor = self._sensors.get(selector_id)
+            if (
+                sensor
+                and (not shard_coordinator or shard_coordinator.owns(selector_id))
+                and sensor.get_current_instigator_state(
+                    self._sensor_states.get(selector_id)
+                ).is_running
+            ):
+                self._running_selector_ids.add(selector_id)
+            else:
+                self._running_selector_ids.discard(selector_id)
+
+        if changed_selector_ids:
+            self._running_sensors = None
+
+    def _refresh_locations(self, workspace_snapshot: Mapping[str, CodeLocationEntry]) -> Set[str]:
+        changed_selector_ids: Set[str] = set()
+
+        for location_name in list(self._location_versions.keys()):
+            if location_name not in workspace_snapshot:
+                del self._location_versions[location_name]
+                changed_selector_ids.update(self._location_sensors.pop(location_name).keys())
+
+        for location_name, location_entry in workspace_snapshot.items():
+            version = _get_location_version(location_entry)
+            if self._location_versions.get(location_name) == version:
+                continue
+
+            self._location_versions[location_name] = version
+            changed_selector_ids.update(self._location_sensors.get(location_name, {}).keys())
+            location_sensors = {}
+            if location_entry.code_location:
+                for repo in location_entry.code_location.get_repositories().values():
+                    for sensor in repo.get_external_sensors():
+                        location_sensors[sensor.selector_id] = sensor
+            self._location_sensors[location_name] = location_sensors
+            changed_selector_ids.update(location_sensors.keys())
+
+        if list(workspace_snapshot.keys()) != self._location_names:
+            self._location_names = list(workspace_snapshot.keys())
+            self._running_sensors = None
+
+        if changed_selector_ids:
+            self._sensors = {
+                selector_id: sensor
+                for location_sensors in self._location_sensors.values()
+                for selector_id, sensor in location_sensors.items()
+            }
+
+        return changed_selector_ids
+
+
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -264,6 +423,15 @@ def execute_sensor_iteration_loop(
                     )
                 )
 
+        shard_coordinator = create_instigator_shard_coordinator(
+            workspace_process_context.instance, "SENSOR", settings, logger
+        )
+        if shard_coordinator:
+            # the lease is also renewed between refreshes, so that it outlives long iterations
+            shard_coordinator.start()
+            stack.callback(shard_coordinator.release)
+
+        sensor_index = SensorIndex()
         last_verbose_time = None
         while True:
             start_time = pendulum.now("UTC").timestamp()
@@ -271,6 +439,9 @@ def execute_sensor_iteration_loop(
                 # provide a way of organically ending the loop to support test environment
                 break
 
+            if shard_coordinator:
+                shard_coordinator.refresh()
+
             # occasionally enable verbose logging (doing it always would be too much)
             verbose_logs_iteration = (
                 last_verbose_time is None or start_time - last_verbose_time > VERBOSE_LOGS_INTERVAL
@@ -283,6 +454,8 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                shard_coordinator=shard_coordinator,
+                sensor_index=sensor_index,
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
@@ -309,6 +482,8 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    shard_coordinator: Optional[InstigatorShardCoordinator] = None,
+    sensor_index: Optional[SensorIndex] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -322,35 +497,28 @@ def execute_sensor_iteration(
         .values()
     }
 
-    all_sensor_states = {
-        sensor_state.selector_id: sensor_state
-        for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
-    }
+    if not sensor_index:
+        sensor_index = SensorIndex()
+    sensor_index.refresh(instance, workspace_snapshot, shard_coordinator)
+    all_sensor_states = sensor_index.sensor_states
+    sensors = sensor_index.running_sensors
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
 
-    sensors: Dict[str, ExternalSensor] = {}
-    for location_entry in workspace_snapshot.values():
-        code_location = location_entry.code_location
-        if code_location:
-            for repo in code_location.get_repositories().values():
-                for sensor in repo.get_external_sensors():
-                    selector_id = sensor.selector_id
-                    if sensor.get_current_instigator_state(
-                        all_sensor_states.get(selector_id)
-                    ).is_running:
-                        sensors[selector_id] = sensor
-        elif location_entry.load_error and log_verbose_checks:
-            logger.warning(
-                f"Could not load location {location_entry.origin.location_name} to check for"
-                f" sensors due to the following error: {location_entry.load_error}"
-            )
-
     if log_verbose_checks:
+        for location_entry in workspace_snapshot.values():
+            if not location_entry.code_location and location_entry.load_error:
+                logger.warning(
+                    f"Could not load location {location_entry.origin.location_name} to check for"
+                    f" sensors due to the following error: {location_entry.load_error}"
+                )
+
         unloadable_sensor_states = {
             selector_id: sensor_state
             for selector_id, sensor_state in all_sensor_states.items()
-            if selector_id not in sensors and sensor_state.status == InstigatorStatus.RUNNING
+            if selector_id not in sensors
+            and sensor_state.status == InstigatorStatus.RUNNING
+            and (not shard_coordinator or shard_coordinator.owns(selector_id))
         }
 
         for sensor_state in unloadable_sensor_states.values():
@@ -404,6 +572,7 @@ def execute_sensor_iteration(
                 SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
             )
             instance.add_instigator_state(sensor_state)
+            sensor_index.add_sensor_state(sensor_state)
         elif _is_under_min_interval(sensor_state, external_sensor):
             continue
 
@@ -892,42 +1061,11 @@ def _fetch_existing_runs(
     if not run_keys:
         return {}
 
-    # fetch runs from the DB with only the run key tag
-    # note: while possible to filter more at DB level with tags - it is avoided here due to observed
-    # perf problems
-    runs_with_run_keys = []
-    for run_key in run_keys:
-        # do serial fetching, which has better perf than a single query with an IN clause, due to
-        # how the query planner does the runs/run_tags join
-        runs_with_run_keys.extend(
-            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
-        )
-
-    # filter down to runs with run_key that match the sensor name and its namespace (repository)
-    valid_runs: List[DagsterRun] = []
-    for run in runs_with_run_keys:
-        # if the run doesn't have a set origin, just match on sensor name
-        if (
-            run.external_job_origin is None
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
-        # otherwise prevent the same named sensor across repos from effecting each other
-        elif (
-            run.external_job_origin is not None
-            and run.external_job_origin.external_repository_origin.get_selector_id()
-            == external_sensor.get_external_origin().external_repository_origin.get_selector_id()
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
-
-    existing_runs = {}
-    for run in valid_runs:
-        tags = run.tags or {}
-        run_key = tags.get(RUN_KEY_TAG)
-        existing_runs[run_key] = run
-
-    return existing_runs
+    return instance.get_sensor_runs_by_run_key(
+        external_sensor.name,
+        external_sensor.get_external_origin().external_repository_origin.get_selector_id(),
+        run_keys,
+    )
 
 
 def _get_or_create_sensor_run(
@@ -0,0 +1,324 @@
+import bisect
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from typing import Any, List, Mapping, NamedTuple, Optional, Tuple
+
+import pendulum
+
+import dagster._check as check
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance.config import (
+    DEFAULT_SHARD_LEASE_DURATION_SECONDS as DEFAULT_SHARD_LEASE_DURATION_SECONDS,
+)
+
+INSTIGATOR_SHARD_KEY_PREFIX = "INSTIGATOR_SHARD"
+
+# How often, as a fraction of the lease duration, a replica renews its lease from its background
+# thread, so that the lease outlives daemon iterations that take longer than the lease duration.
+LEASE_RENEWAL_FRACTION = 0.25
+
+# Each replica registers in one of a fixed number of slots, so that every replica can read all of
+# the registrations with a single lookup, and no two replicas ever rewrite the same value.
+MAX_SHARD_REPLICAS = 32
+
+# Each replica is placed at several points on the hash ring, so that instigators are spread evenly
+# across the replicas, and the instigators of a replica that goes away are spread across all of the
+# remaining replicas rather than moving onto a single one.
+VIRTUAL_NODES_PER_REPLICA = 64
+
+
+def _hash(value: str) -> int:
+    # a stable hash, so that every replica places replicas and instigators at the same points
+    return int(hashlib.sha1(value.encode("utf-8")).hexdigest()[:16], 16)
+
+
+class ShardRegistration(NamedTuple):
+    replica_id: str
+    registered_at: float
+    lease_expires_at: float
+
+    def to_json(self) -> str:
+        return json.dumps(self._asdict())
+
+    @staticmethod
+    def from_json(value: str) -> "ShardRegistration":
+        return ShardRegistration(**json.loads(value))
+
+
+class InstigatorShardCoordinator:
+    """Divides the instigators evaluated by a sensor or schedule daemon among the replicas of that
+    daemon that are currently running.
+
+    Replicas coordinate through the daemon cursor storage of the instance. Each replica registers
+    in a slot of its own, which holds a lease that the replica renews every time it is refreshed,
+    and from a background thread once it is started. Every replica places the registered replicas
+    with unexpired leases on a consistent hash ring, and owns the instigators whose selector ids
+    hash to its segments of the ring.
+
+    A replica that joins while other replicas are live owns nothing until its registration is older
+    than one lease duration. Replicas refresh more often than that, so by then every other replica
+    has seen the registration and stopped evaluating the instigators that move to the new replica.
+    During that time those instigators are not evaluated, rather than being evaluated twice. A
+    replica that finds no other live replica once its registration is written starts owning
+    instigators immediately: any replica that registers later sees it, and waits.
+
+    When a replica stops, it gives up its lease and its instigators move to the other replicas on
+    their next refresh. A replica that dies without giving up its lease keeps its instigators until
+    the lease expires.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        daemon_type: str,
+        lease_duration_seconds: float = DEFAULT_SHARD_LEASE_DURATION_SECONDS,
+        replica_id: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._daemon_type = check.str_param(daemon_type, "daemon_type")
+        self._lease_duration_seconds = check.numeric_param(
+            lease_duration_seconds, "lease_duration_seconds"
+        )
+        self._replica_id = check.opt_str_param(replica_id, "replica_id") or str(uuid.uuid4())
+        self._slot_key: Optional[str] = None
+        # when this replica starts owning instigators, once the other replicas have seen it
+        self._active_at: Optional[float] = None
+        self._is_active = False
+        self._live_replica_ids: Tuple[str, ...] = ()
+        self._ring: List[Tuple[int, str]] = []
+        self._ring_points: List[int] = []
+        self._logger = logger or logging.getLogger("dagster.daemon")
+        self._warned_no_free_slot = False
+        # refreshes and lease renewals from the background thread read and rewrite the same slot
+        self._lock = threading.Lock()
+        self._renewal_thread: Optional[threading.Thread] = None
+        self._renewal_shutdown_event = threading.Event()
+
+    @property
+    def replica_id(self) -> str:
+        return self._replica_id
+
+    @property
+    def live_replica_ids(self) -> Tuple[str, ...]:
+        return self._live_replica_ids
+
+    @property
+    def is_active(self) -> bool:
+        """Whether this replica owns instigators, which it does not until the other replicas have
+        had time to see its registration.
+        """
+        return self._is_active
+
+    @property
+    def _slot_keys(self) -> List[str]:
+        return [
+            f"{INSTIGATOR_SHARD_KEY_PREFIX}_{self._daemon_type}_SLOT_{i}"
+            for i in range(MAX_SHARD_REPLICAS)
+        ]
+
+    @staticmethod
+    def _build_ring(replica_ids: Tuple[str, ...]) -> List[Tuple[int, str]]:
+        return sorted(
+            (_hash(f"{replica_id}:{i}"), replica_id)
+            for replica_id in replica_ids
+            for i in range(VIRTUAL_NODES_PER_REPLICA)
+        )
+
+    def _get_registrations(self) -> Mapping[str, ShardRegistration]:
+        values = self._instance.daemon_cursor_storage.get_cursor_values(set(self._slot_keys))
+        return {slot_key: ShardRegistration.from_json(value) for slot_key, value in values.items()}
+
+    def _register(self, now: float) -> Mapping[str, ShardRegistration]:
+        """Claim a slot that is free or whose lease has expired. Two replicas may claim the same slot
+        at once, so the claim is read back, and a replica whose claim was overwritten tries the next
+        free slot. A claim can also be overwritten after it was read back. Every refresh reads the
+        slot back before this replica starts owning instigators, so it finds out and registers
+        again instead.
+        """
+        storage = self._instance.daemon_cursor_storage
+        registrations = self._get_registrations()
+        for slot_key in self._slot_keys:
+            registration = registrations.get(slot_key)
+            if registration and registration.lease_expires_at > now:
+                continue
+
+            storage.set_cursor_values(
+                {
+                    slot_key: ShardRegistration(
+                        self._replica_id, now, now + self._lease_duration_seconds
+                    ).to_json()
+                }
+            )
+            registrations = self._get_registrations()
+            registration = registrations.get(slot_key)
+            if registration and registration.replica_id == self._replica_id:
+                self._slot_key = slot_key
+                self._warned_no_free_slot = False
+                has_other_live_replicas = any(
+                    registration.replica_id != self._replica_id
+                    and registration.lease_expires_at > now
+                    for registration in registrations.values()
+                )
+                self._active_at = (
+                    now + self._lease_duration_seconds if has_other_live_replicas else now
+                )
+                return registrations
+
+        if not self._warned_no_free_slot:
+            self._warned_no_free_slot = True
+            self._logger.warning(
+                f"All {MAX_SHARD_REPLICAS} shard slots of the {self._daemon_type} daemon are held"
+                " by other live replicas, so this replica will not evaluate any instigators until a"
+                " slot is freed."
+            )
+        return registrations
+
+    def refresh(self) -> None:
+        """Renew the lease of this replica, and pick up the replicas that have joined or left since
+        the last refresh.
+        """
+        with self._lock:
+            now = pendulum.now("UTC").timestamp()
+            registrations = self._get_registrations()
+            if not self._renew(registrations, now):
+                # this replica has not registered yet, its lease expired and the other replicas
+                # may have taken over its instigators, or another replica claimed its slot at the
+                # same time, so it registers again
+                self._slot_key = None
+                self._active_at = None
+                registrations = self._register(now)
+            self._update_ring(registrations, now)
+
+    def _renew(self, registrations: Mapping[str, ShardRegistration], now: float) -> bool:
+        """Renew the lease of this replica, returning False if it no longer holds its slot."""
+        registration = registrations.get(self._slot_key) if self._slot_key else None
+        if not (
+            registration
+            and registration.replica_id == self._replica_id
+            and registration.lease_expires_at > now
+        ):
+            return False
+
+        renewed = ShardRegistration(
+            self._replica_id, registration.registered_at, now + self._lease_duration_seconds
+        )
+        self._instance.daemon_cursor_storage.set_cursor_values(
+            {check.not_none(self._slot_key): renewed.to_json()}
+        )
+        return True
+
+    def renew_lease(self) -> None:
+        """Renew the lease of this replica without picking up replicas that have joined or left, so
+        that the lease can be renewed while an iteration evaluates instigators. If this replica
+        lost its slot, it stops owning instigators until it is refreshed.
+        """
+        with self._lock:
+            if not self._slot_key:
+                return
+            if not self._renew(self._get_registrations(), pendulum.now("UTC").timestamp()):
+                self._is_active = False
+
+    def start(self) -> None:
+        """Start renewing the lease of this replica from a background thread, until it is
+        released.
+        """
+        if self._renewal_thread:
+            return
+
+        self._renewal_shutdown_event.clear()
+        self._renewal_thread = threading.Thread(
+            target=self._renew_lease_loop,
+            name=f"{self._daemon_type.lower()}_shard_lease_renewal",
+            daemon=True,
+        )
+        self._renewal_thread.start()
+
+    def _renew_lease_loop(self) -> None:
+        interval = self._lease_duration_seconds * LEASE_RENEWAL_FRACTION
+        while not self._renewal_shutdown_event.wait(interval):
+            try:
+                self.renew_lease()
+            except Exception:
+                self._logger.exception(
+                    f"Failed to renew the shard lease of the {self._daemon_type} daemon"
+                )
+
+    def _update_ring(self, registrations: Mapping[str, ShardRegistration], now: float) -> None:
+        live_replica_ids = tuple(
+            sorted(
+                {
+                    registration.replica_id
+                    for registration in registrations.values()
+                    if registration.lease_expires_at > now
+                }
+            )
+        )
+        self._is_active = self._active_at is not None and now >= self._active_at
+
+        if live_replica_ids != self._live_replica_ids:
+            self._live_replica_ids = live_replica_ids
+            self._ring = self._build_ring(live_replica_ids)
+            self._ring_points = [point for point, _ in self._ring]
+
+    def release(self) -> None:
+        """Stop renewing the lease of this replica and give it up, so that its instigators move to
+        the other replicas without waiting for the lease to expire.
+        """
+        if self._renewal_thread:
+            self._renewal_shutdown_event.set()
+            self._renewal_thread.join()
+            self._renewal_thread = None
+
+        with self._lock:
+            self._is_active = False
+            if not self._slot_key:
+                return
+
+            registration = self._get_registrations().get(self._slot_key)
+            if registration and registration.replica_id == self._replica_id:
+                self._instance.daemon_cursor_storage.set_cursor_values(
+                    {self._slot_key: registration._replace(lease_expires_at=0).to_json()}
+                )
+            self._slot_key = None
+            self._active_at = None
+
+    def owns(self, selector_id: str) -> bool:
+        """Whether this replica should evaluate the instigator with the given selector id."""
+        if not self._is_active:
+            return False
+
+        if len(self._live_replica_ids) == 1:
+            return True
+
+        index = bisect.bisect_left(self._ring_points, _hash(selector_id)) % len(self._ring)
+        return self._ring[index][1] == self._replica_id
+
+
+def is_sharding_enabled(settings: Mapping[str, Any]) -> bool:
+    return bool((settings.get("sharding") or {}).get("enabled"))
+
+
+def create_instigator_shard_coordinator(
+    instance: DagsterInstance,
+    daemon_type: str,
+    settings: Mapping[str, Any],
+    logger: Optional[logging.Logger] = None,
+) -> Optional[InstigatorShardCoordinator]:
+    """Create a shard coordinator for a sensor or schedule daemon from its instance settings, or
+    return None if sharding is not enabled.
+    """
+    if not is_sharding_enabled(settings):
+        return None
+
+    return InstigatorShardCoordinator(
+        instance,
+        daemon_type,
+        lease_duration_seconds=settings["sharding"].get(
+            "lease_duration_seconds", DEFAULT_SHARD_LEASE_DURATION_SECONDS
+        ),
+        logger=logger,
+    )
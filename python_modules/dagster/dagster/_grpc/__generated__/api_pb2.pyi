@@ -417,17 +417,22 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
 
     SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
     DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    COMPACT_SERIALIZATION_FIELD_NUMBER: builtins.int
     serialized_repository_python_origin: builtins.str
     defer_snapshots: builtins.bool
+    compact_serialization: builtins.bool
     def __init__(
         self,
         *,
         serialized_repository_python_origin: builtins.str = ...,
         defer_snapshots: builtins.bool = ...,
+        compact_serialization: builtins.bool = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
+            "compact_serialization",
+            b"compact_serialization",
             "defer_snapshots",
             b"defer_snapshots",
             "serialized_repository_python_origin",
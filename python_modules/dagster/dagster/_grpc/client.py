@@ -323,6 +323,7 @@ def external_repository(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
         defer_snapshots: bool = False,
+        compact_serialization: bool = False,
     ) -> str:
         check.inst_param(
             external_repository_origin,
@@ -336,6 +337,7 @@ def external_repository(
             # rename this param name
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            compact_serialization=compact_serialization,
         )
 
         return res.serialized_external_repository_data
@@ -362,6 +364,7 @@ def streaming_external_repository(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
         defer_snapshots: bool = False,
+        compact_serialization: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
     ) -> Iterator[dict]:
         for res in self._streaming_query(
@@ -370,6 +373,7 @@ def streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            compact_serialization=compact_serialization,
             timeout=timeout,
         ):
             yield {
@@ -51,7 +51,7 @@
 from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.workspace.autodiscovery import LoadableTarget
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import SerdesFormat, deserialize_value, serialize_value
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
 from dagster._utils import (
     find_free_port,
@@ -644,7 +644,14 @@ def _get_serialized_external_repository_data(
                 external_repository_data_from_def(
                     self._get_repo_for_origin(repository_origin),
                     defer_snapshots=request.defer_snapshots,
-                )
+                ),
+                # only clients that can read the compact format ask for it, older clients leave
+                # the flag unset and get JSON
+                serdes_format=(
+                    SerdesFormat.COMPACT_JSON
+                    if request.compact_serialization
+                    else SerdesFormat.JSON
+                ),
             )
         except Exception:
             return serialize_value(
@@ -37,6 +37,10 @@
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.sharding import (
+    InstigatorShardCoordinator,
+    create_instigator_shard_coordinator,
+)
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._seven.compat.pendulum import to_timezone
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
@@ -158,11 +162,22 @@ def execute_scheduler_iteration_loop(
                     )
                 )
 
+        shard_coordinator = create_instigator_shard_coordinator(
+            workspace_process_context.instance, "SCHEDULER", settings, logger
+        )
+        if shard_coordinator:
+            # the lease is also renewed between refreshes, so that it outlives long iterations
+            shard_coordinator.start()
+            stack.callback(shard_coordinator.release)
+
         last_verbose_time = None
         while True:
             start_time = pendulum.now("UTC").timestamp()
             end_datetime_utc = pendulum.now("UTC")
 
+            if shard_coordinator:
+                shard_coordinator.refresh()
+
             # occasionally enable verbose logging (doing it always would be too much)
             verbose_logs_iteration = (
                 last_verbose_time is None or start_time - last_verbose_time > VERBOSE_LOGS_INTERVAL
@@ -178,6 +193,7 @@ def execute_scheduler_iteration_loop(
                 max_catchup_runs=max_catchup_runs,
                 max_tick_retries=max_tick_retries,
                 log_verbose_checks=verbose_logs_iteration,
+                shard_coordinator=shard_coordinator,
             )
             yield
             end_time = pendulum.now("UTC").timestamp()
@@ -206,6 +222,7 @@ def launch_scheduled_runs(
     max_tick_retries: int = 0,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     log_verbose_checks: bool = True,
+    shard_coordinator: Optional[InstigatorShardCoordinator] = None,
 ) -> "DaemonIterator":
     instance = workspace_process_context.instance
 
@@ -222,6 +239,7 @@ def launch_scheduled_runs(
     all_schedule_states = {
         schedule_state.selector_id: schedule_state
         for schedule_state in instance.all_instigator_state(instigator_type=InstigatorType.SCHEDULE)
+        if not shard_coordinator or shard_coordinator.owns(schedule_state.selector_id)
     }
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SCHEDULE)
@@ -235,6 +253,9 @@ def launch_scheduled_runs(
             for repo in code_location.get_repositories().values():
                 for schedule in repo.get_external_schedules():
                     selector_id = schedule.selector_id
+                    if shard_coordinator and not shard_coordinator.owns(selector_id):
+                        # evaluated by another replica of the scheduler daemon
+                        continue
                     if schedule.get_current_instigator_state(
                         all_schedule_states.get(selector_id)
                     ).is_running:
@@ -471,6 +471,10 @@ def __init__(
         self.old_fields = old_fields or {}
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
+        # Per-class packing/unpacking plans, compiled on first use. See `_compile_field_packers`
+        # and `_compile_field_unpacker`.
+        self._field_packers: Optional[Sequence[_FieldPacker]] = None
+        self._field_unpackers: Dict[str, Optional[_FieldUnpacker]] = {}
 
     def unpack(
         self,
@@ -481,14 +485,18 @@ def unpack(
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
+            field_unpackers = self._field_unpackers
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                if key in field_unpackers:
+                    field_unpacker = field_unpackers[key]
+                else:
+                    field_unpacker = self._compile_field_unpacker(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if field_unpacker is not None:
+                    loaded_name, custom = field_unpacker
                     # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
                     if custom:
                         unpacked[loaded_name] = custom.unpack(
                             value,
@@ -542,22 +550,26 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
-        for key, inner_value in self.before_pack(value)._asdict().items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+        field_packers = self._field_packers
+        if field_packers is None:
+            field_packers = self._compile_field_packers()
+        # fields are read positionally, which avoids building an intermediate `_asdict()` dict
+        for (path_suffix, storage_key, custom, skip_when_empty), inner_value in zip(
+            field_packers, self.before_pack(value)
+        ):
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
                     whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
+                    descent_path=descent_path + path_suffix,
                 )
+            elif type(inner_value) in _SCALAR_TYPES or inner_value is None:
+                packed[storage_key] = inner_value
             else:
                 packed[storage_key] = _pack_value(
-                    inner_value,
-                    whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
+                    inner_value, whitelist_map, descent_path + path_suffix
                 )
         for key, default in self.old_fields.items():
             packed[key] = default
@@ -578,10 +590,42 @@ def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSeri
     def constructor_param_names(self) -> Sequence[str]:
         return list(signature(self.klass.__new__).parameters.keys())
 
+    def _compile_field_packers(self) -> Sequence["_FieldPacker"]:
+        # Resolves the storage name, field serializer and skip behavior of each field once per
+        # class, instead of once per field of every packed value.
+        self._field_packers = [
+            (
+                f".{field_name}",
+                self.storage_field_names.get(field_name, field_name),
+                self.field_serializers.get(field_name),
+                field_name in self.skip_when_empty_fields,
+            )
+            for field_name in self.klass._fields
+        ]
+        return self._field_packers
+
+    def _compile_field_unpacker(self, storage_key: str) -> Optional["_FieldUnpacker"]:
+        # Resolves the constructor argument and field serializer of a stored key once per class.
+        # Keys that are not accepted by the constructor resolve to None.
+        loaded_name = self.loaded_field_names.get(storage_key, storage_key)
+        field_unpacker = (
+            (loaded_name, self.field_serializers.get(loaded_name))
+            if loaded_name in self.constructor_param_names
+            else None
+        )
+        self._field_unpackers[storage_key] = field_unpacker
+        return field_unpacker
+
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
 
+# (descent path suffix, storage name, field serializer, skip when empty)
+_FieldPacker: TypeAlias = Tuple[str, str, Optional["FieldSerializer"], bool]
+# (constructor argument name, field serializer)
+_FieldUnpacker: TypeAlias = Tuple[str, Optional["FieldSerializer"]]
+
+
 class FieldSerializer(Serializer):
     _instance = None
 
@@ -634,19 +678,83 @@ def pack(
 ###################################################################################################
 
 
+class SerdesFormat(Enum):
+    """String formats produced by `serialize_value`. `deserialize_value` reads every format,
+    detecting it from the serialized string, so readers can be upgraded before writers switch.
+
+    JSON: The packed value as JSON, where each serialized namedtuple is an object with a
+        `__class__` key and one key per field. This is the default.
+    COMPACT_JSON: A table of the distinct namedtuple layouts (class name and field names) in the
+        value, followed by the value itself, where each namedtuple is a list of its field values
+        that refers to its layout by index. Values containing many instances of the same classes
+        (e.g. repository snapshots, execution plans, partition status caches) are much smaller and
+        faster to parse than in the JSON format.
+    """
+
+    JSON = "JSON"
+    COMPACT_JSON = "COMPACT_JSON"
+
+
+# JSON documents never start with `~`, so this prefix is enough to tell the formats apart
+COMPACT_JSON_PREFIX: Final[str] = "~1~"
+_COMPACT_TUPLE_KEY: Final[str] = "!"
+_COMPACT_LITERAL_DICT_LAYOUT: Final[int] = -1
+
+
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    serdes_format: SerdesFormat = SerdesFormat.JSON,
     **json_kwargs: Any,
 ) -> str:
     """Serialize an object to a JSON string.
 
-    Objects are first converted to a JSON-serializable form with `pack_value`.
+    Objects are first converted to a JSON-serializable form with `pack_value`. With
+    `SerdesFormat.COMPACT_JSON`, the packed value is further compacted with `_compact_value`.
     """
     packed_value = pack_value(val, whitelist_map=whitelist_map)
+    if serdes_format == SerdesFormat.COMPACT_JSON:
+        layout_ids: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        body = _compact_value(packed_value, layout_ids)
+        layouts = [[klass_name, list(field_names)] for klass_name, field_names in layout_ids]
+        # separators passed by the caller take precedence over the compact ones
+        return COMPACT_JSON_PREFIX + seven.json.dumps(
+            [layouts, body], **{"separators": (",", ":"), **json_kwargs}
+        )
+
     return seven.json.dumps(packed_value, **json_kwargs)
 
 
+def _compact_value(
+    val: JsonSerializableValue, layout_ids: Dict[Tuple[str, Tuple[str, ...]], int]
+) -> JsonSerializableValue:
+    """Replace each packed namedtuple `{"__class__": <class>, <field>: <value>, ...}` with
+    `{"!": [<layout id>, <value>, ...]}`, registering its layout in `layout_ids`. Plain dicts that
+    happen to contain a `!` key are wrapped as `{"!": [-1, <dict>]}`.
+    """
+    tval = type(val)
+    if tval is list:
+        return [_compact_value(item, layout_ids) for item in cast(list, val)]
+    if tval is dict:
+        val = cast(dict, val)
+        if "__class__" in val:
+            field_names = tuple(key for key in val.keys() if key != "__class__")
+            layout_id = layout_ids.setdefault((val["__class__"], field_names), len(layout_ids))
+            return {
+                _COMPACT_TUPLE_KEY: [
+                    layout_id,
+                    *(_compact_value(val[field_name], layout_ids) for field_name in field_names),
+                ]
+            }
+
+        compacted = {key: _compact_value(value, layout_ids) for key, value in val.items()}
+        if _COMPACT_TUPLE_KEY in val:
+            return {_COMPACT_TUPLE_KEY: [_COMPACT_LITERAL_DICT_LAYOUT, compacted]}
+        return compacted
+
+    return val
+
+
 @overload
 def pack_value(
     val: T_Scalar,
@@ -693,6 +801,9 @@ def pack_value(
     return _pack_value(val, whitelist_map=whitelist_map, descent_path=descent_path)
 
 
+_SCALAR_TYPES: Final[AbstractSet[type]] = frozenset((int, float, str, bool))
+
+
 def _pack_value(
     val: PackableValue,
     whitelist_map: WhitelistMap,
@@ -700,7 +811,7 @@ def _pack_value(
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
     tval = type(val)
-    if tval in (int, float, str, bool) or val is None:
+    if tval in _SCALAR_TYPES or val is None:
         return cast(JsonSerializableValue, val)
     if tval is list:
         return [
@@ -725,13 +836,12 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 "Can only serialize whitelisted namedtuples, received"
                 f" {val}.\nDescent path: {descent_path}",
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -827,15 +937,22 @@ def deserialize_value(
     - Unpack the complex of lists, dicts, and scalars resulting from JSON parsing into a complex of richer
       Python objects (e.g. dagster-specific `NamedTuple` objects).
     - Optionally, check that the resulting object is of the expected type.
+
+    Strings in any `SerdesFormat` are accepted.
     """
     check.str_param(val, "val")
 
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings():
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
-            val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
-        )
+        if val.startswith(COMPACT_JSON_PREFIX):
+            layouts, body = seven.json.loads(val[len(COMPACT_JSON_PREFIX) :])
+            unpacked_value = _unpack_compact_value(body, layouts, whitelist_map, context)
+        else:
+            unpacked_value = seven.json.loads(
+                val,
+                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
+            )
         unpacked_value = context.finalize_unpack(unpacked_value)
         if as_type and not (
             is_named_tuple_instance(unpacked_value)
@@ -858,7 +975,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -867,7 +985,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -901,6 +1018,37 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
     return val
 
 
+def _unpack_compact_value(
+    val: JsonSerializableValue,
+    layouts: Sequence[Tuple[str, Sequence[str]]],
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+) -> UnpackedValue:
+    if isinstance(val, list):
+        return [_unpack_compact_value(item, layouts, whitelist_map, context) for item in val]
+
+    if isinstance(val, dict):
+        if _COMPACT_TUPLE_KEY in val:
+            layout_id, *values = cast(list, val[_COMPACT_TUPLE_KEY])
+            if layout_id == _COMPACT_LITERAL_DICT_LAYOUT:
+                val = cast(dict, values[0])
+            else:
+                klass_name, field_names = layouts[layout_id]
+                unpacked_vals = {
+                    field_name: _unpack_compact_value(value, layouts, whitelist_map, context)
+                    for field_name, value in zip(field_names, values)
+                }
+                unpacked_vals["__class__"] = klass_name
+                return _unpack_object(unpacked_vals, whitelist_map, context)
+
+        unpacked_vals = {
+            k: _unpack_compact_value(v, layouts, whitelist_map, context) for k, v in val.items()
+        }
+        return _unpack_object(unpacked_vals, whitelist_map, context)
+
+    return val
+
+
 @overload
 def unpack_value(
     val: JsonSerializableValue,
@@ -1,15 +1,19 @@
 import logging
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
+    Hashable,
     Iterable,
     Mapping,
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -50,14 +54,210 @@
     from dagster._core.storage.event_log import EventLogRecord
     from dagster._core.storage.event_log.base import AssetRecord
 
+# the events that change the results of the queries for an asset that are cached across evaluations
+INVALIDATING_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_OBSERVATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+]
+DEFAULT_QUERYER_CACHE_MAX_ENTRIES = 100000
+DEFAULT_QUERYER_CACHE_MAX_TAILED_RECORDS = 10000
+
+
+class InstanceQueryerCache:
+    """Caches the results of the queries made by a CachingInstanceQueryer across evaluations, e.g.
+    across the ticks of the asset daemon, so that each evaluation only queries the instance for
+    the assets with events stored since the previous evaluation.
+
+    Results are held in a size-capped LRU cache. Before each evaluation, the cache is refreshed by
+    tailing the event log for the materialization, observation and planned materialization events
+    stored since the previous refresh, and the results for the assets of those events are
+    invalidated. Asset wipes don't store events, so the refresh also fetches the records of the
+    assets with cached results, and invalidates the results for the assets whose latest
+    materialization changed since their records were cached. Results that can't change, such as
+    the records of finished runs, are only evicted by the size cap.
+
+    The cache can be shared by queryers used from several threads, e.g. by the worker threads of a
+    tick that evaluates assets concurrently.
+
+    Args:
+        max_entries (int): The maximum number of cached results.
+        max_tailed_records (int): The maximum number of event records of each type read when the
+            cache is refreshed. If more events were stored since the previous refresh, the whole
+            cache is cleared instead.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_QUERYER_CACHE_MAX_ENTRIES,
+        max_tailed_records: int = DEFAULT_QUERYER_CACHE_MAX_TAILED_RECORDS,
+    ):
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._max_tailed_records = check.int_param(max_tailed_records, "max_tailed_records")
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._entry_keys_by_asset_key: Dict[AssetKey, Set[Hashable]] = defaultdict(set)
+        self._entry_asset_keys: Dict[Hashable, AssetKey] = {}
+        self._storage_id_cursor: Optional[int] = None
+        # the latest materialization storage id of each asset when its results were cached, or
+        # None for assets without a record
+        self._last_materialization_storage_ids: Dict[AssetKey, Optional[int]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns whether a result is cached for the given key, and the result if it is. Unlike
+        checking for the key before getting it, this can't race with an eviction.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def set(self, key: Hashable, value: Any, asset_key: Optional[AssetKey] = None) -> None:
+        """Caches a result. If an asset key is given, the result is invalidated when new events
+        are stored for the asset.
+        """
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = value
+            if asset_key is not None:
+                self._entry_keys_by_asset_key[asset_key].add(key)
+                self._entry_asset_keys[key] = asset_key
+
+            while len(self._entries) > self._max_entries:
+                oldest_key = next(iter(self._entries))
+                self._discard(oldest_key)
+
+    def _discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        asset_key = self._entry_asset_keys.pop(key, None)
+        if asset_key is not None:
+            self._entry_keys_by_asset_key[asset_key].discard(key)
+            if not self._entry_keys_by_asset_key[asset_key]:
+                del self._entry_keys_by_asset_key[asset_key]
+
+    def track_asset_record(
+        self, asset_key: AssetKey, asset_record: Optional["AssetRecord"]
+    ) -> None:
+        """Records the latest materialization of an asset as of when its results are cached, so
+        that the results can be invalidated if it changes without an event being stored.
+        """
+        with self._lock:
+            self._last_materialization_storage_ids.setdefault(
+                asset_key,
+                asset_record.asset_entry.last_materialization_storage_id if asset_record else None,
+            )
+
+    def invalidate(self, asset_key: AssetKey) -> None:
+        with self._lock:
+            self._last_materialization_storage_ids.pop(asset_key, None)
+            for key in list(self._entry_keys_by_asset_key.get(asset_key, [])):
+                self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._entry_keys_by_asset_key.clear()
+            self._entry_asset_keys.clear()
+            self._last_materialization_storage_ids.clear()
+
+    def refresh(self, instance: DagsterInstance) -> AbstractSet[AssetKey]:
+        """Invalidates the results for the assets with events stored since the previous refresh, or
+        wiped since the previous refresh, and returns those assets.
+        """
+        from dagster._core.event_api import EventRecordsFilter
+
+        latest_storage_id = instance.event_log_storage.get_maximum_record_id() or 0
+        cursor = self._storage_id_cursor
+        self._storage_id_cursor = latest_storage_id
+        if cursor is None:
+            # nothing could have been cached against an earlier state of the event log
+            self.clear()
+            return set()
+
+        updated_asset_keys = self._get_wiped_asset_keys(instance)
+        if latest_storage_id <= cursor:
+            for asset_key in updated_asset_keys:
+                self.invalidate(asset_key)
+            return updated_asset_keys
+
+        for event_type in INVALIDATING_EVENT_TYPES:
+            records = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=event_type,
+                    after_cursor=cursor,
+                    before_cursor=latest_storage_id + 1,
+                ),
+                limit=self._max_tailed_records + 1,
+                ascending=True,
+            )
+            if len(records) > self._max_tailed_records:
+                self.clear()
+                return set()
+            updated_asset_keys.update(
+                record.asset_key for record in records if record.asset_key is not None
+            )
+
+        for asset_key in updated_asset_keys:
+            self.invalidate(asset_key)
+        return updated_asset_keys
+
+    def _get_wiped_asset_keys(self, instance: DagsterInstance) -> Set[AssetKey]:
+        """Fetches the records of the assets with cached results in a single batch, and returns the
+        assets whose latest materialization no longer matches the one seen when their results were
+        cached, e.g. because they were wiped.
+        """
+        with self._lock:
+            cached_asset_keys = list(self._entry_keys_by_asset_key.keys())
+            # forget the records of assets whose results were all evicted by the size cap
+            for asset_key in set(self._last_materialization_storage_ids) - set(cached_asset_keys):
+                del self._last_materialization_storage_ids[asset_key]
+            expected_storage_ids = dict(self._last_materialization_storage_ids)
+        if not cached_asset_keys:
+            return set()
+
+        storage_ids: Dict[AssetKey, Optional[int]] = {
+            asset_key: None for asset_key in cached_asset_keys
+        }
+        for asset_record in instance.get_asset_records(cached_asset_keys):
+            asset_entry = asset_record.asset_entry
+            storage_ids[asset_entry.asset_key] = asset_entry.last_materialization_storage_id
+
+        # results cached without a known record can't be checked, so they're invalidated too
+        return {
+            asset_key
+            for asset_key, storage_id in storage_ids.items()
+            if asset_key not in expected_storage_ids
+            or expected_storage_ids[asset_key] != storage_id
+        }
+
 
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
     instance which will attempt to limit redundant expensive calls. Intended for use within the
     scope of a single "request" (e.g. GQL request, sensor tick).
 
+    Its methods may be called concurrently from several threads, in which case a result that is
+    not yet cached may be queried more than once.
+
     Args:
         instance (DagsterInstance): The instance to query.
+        query_cache (Optional[InstanceQueryerCache]): A cache of query results that outlives this
+            queryer, e.g. one shared across the ticks of the asset daemon. Must have been refreshed
+            before the queryer is created.
     """
 
     def __init__(
@@ -66,15 +266,15 @@ def __init__(
         asset_graph: AssetGraph,
         evaluation_time: Optional[datetime] = None,
         logger: Optional[logging.Logger] = None,
+        query_cache: Optional[InstanceQueryerCache] = None,
     ):
         self._instance = instance
         self._asset_graph = asset_graph
         self._logger = logger or logging.getLogger("dagster")
+        self._query_cache = check.opt_inst_param(query_cache, "query_cache", InstanceQueryerCache)
 
         self._asset_record_cache: Dict[AssetKey, Optional[AssetRecord]] = {}
-        self._asset_partitions_cache: Dict[Optional[int], Dict[AssetKey, Set[str]]] = defaultdict(
-            dict
-        )
+        self._asset_partitions_cache: Dict[Tuple[Optional[int], AssetKey], AbstractSet[str]] = {}
         self._asset_partition_versions_updated_after_cursor_cache: Dict[
             AssetKeyPartitionKey, int
         ] = {}
@@ -103,18 +303,47 @@ def evaluation_time(self) -> datetime:
     # QUERY BATCHING
     ####################
 
+    def _get_cached_query_result(self, key: Tuple) -> Tuple[bool, Any]:
+        if self._query_cache is None:
+            return False, None
+        return self._query_cache.lookup(key)
+
+    def _cache_query_result(
+        self, key: Tuple, value: Any, asset_key: Optional[AssetKey] = None
+    ) -> None:
+        if self._query_cache is not None:
+            self._query_cache.set(key, value, asset_key=asset_key)
+
+    def _cache_asset_record(self, asset_key: AssetKey, asset_record: Optional["AssetRecord"]):
+        self._asset_record_cache[asset_key] = asset_record
+        if self._query_cache is not None:
+            self._query_cache.track_asset_record(asset_key, asset_record)
+        cached_status = asset_record.asset_entry.cached_status if asset_record else None
+        # the status cache value of an asset with in progress partitions changes when their runs
+        # finish, which doesn't store any events for the asset, so its record can't be kept
+        if cached_status and cached_status.earliest_in_progress_materialization_event_id:
+            return
+        self._cache_query_result(("asset_record", asset_key), asset_record, asset_key=asset_key)
+
     def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
         """For performance, batches together queries for selected assets."""
-        keys_to_fetch = set(asset_keys) - set(self._asset_record_cache.keys())
+        asset_keys = set(asset_keys)
+        keys_to_fetch = set()
+        for key in asset_keys - set(self._asset_record_cache.keys()):
+            is_cached, asset_record = self._get_cached_query_result(("asset_record", key))
+            if is_cached:
+                self._asset_record_cache[key] = asset_record
+            else:
+                keys_to_fetch.add(key)
         if len(keys_to_fetch) == 0:
             return
         # get all asset records for selected assets that aren't already cached
         asset_records = self.instance.get_asset_records(list(keys_to_fetch))
         for asset_record in asset_records:
-            self._asset_record_cache[asset_record.asset_entry.asset_key] = asset_record
-        for key in asset_keys:
+            self._cache_asset_record(asset_record.asset_entry.asset_key, asset_record)
+        for key in keys_to_fetch:
             if key not in self._asset_record_cache:
-                self._asset_record_cache[key] = None
+                self._cache_asset_record(key, None)
 
     ####################
     # ASSET STATUS CACHE
@@ -138,6 +367,15 @@ def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> Partitions
             dynamic_partitions_loader=self,
             asset_record=asset_record,
         )
+        if asset_record is not None and cache_value != asset_record.asset_entry.cached_status:
+            # keep the cached record in line with the updated status cache value, so that later
+            # evaluations don't need to catch the stored value up again
+            self._cache_asset_record(
+                asset_key,
+                asset_record._replace(
+                    asset_entry=asset_record.asset_entry._replace(cached_status=cache_value)
+                ),
+            )
         if cache_value is None:
             return partitions_def.empty_subset()
 
@@ -154,9 +392,7 @@ def has_cached_asset_record(self, asset_key: AssetKey) -> bool:
 
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
         if asset_key not in self._asset_record_cache:
-            self._asset_record_cache[asset_key] = next(
-                iter(self.instance.get_asset_records([asset_key])), None
-            )
+            self.prefetch_asset_records([asset_key])
         return self._asset_record_cache[asset_key]
 
     def _event_type_for_key(self, asset_key: AssetKey) -> DagsterEventType:
@@ -186,9 +422,15 @@ def _get_latest_materialization_or_observation_record(
                 return None
             return asset_record.asset_entry.last_materialization_record
 
+        event_type = self._event_type_for_key(asset_partition.asset_key)
+        cache_key = ("latest_record", event_type, asset_partition, before_cursor)
+        is_cached, record = self._get_cached_query_result(cache_key)
+        if is_cached:
+            return record
+
         records = self.instance.get_event_records(
             EventRecordsFilter(
-                event_type=self._event_type_for_key(asset_partition.asset_key),
+                event_type=event_type,
                 asset_key=asset_partition.asset_key,
                 asset_partitions=(
                     [asset_partition.partition_key] if asset_partition.partition_key else None
@@ -198,7 +440,11 @@ def _get_latest_materialization_or_observation_record(
             ascending=False,
             limit=1,
         )
-        return next(iter(records), None)
+        record = next(iter(records), None)
+        # results before a cursor don't change as new events are stored, but they're still keyed
+        # by the asset so that they're invalidated if the asset is wiped
+        self._cache_query_result(cache_key, record, asset_key=asset_partition.asset_key)
+        return record
 
     @cached_method
     def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
@@ -210,6 +456,13 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
         Note that for partitioned assets, an asset partition with a None partition key will be
         present in the mapping, representing the latest storage id for the asset as a whole.
         """
+        is_partitioned = self.asset_graph.is_partitioned(asset_key)
+        event_type = self._event_type_for_key(asset_key)
+        cache_key = ("latest_storage_ids", event_type, is_partitioned, asset_key)
+        is_cached, cached_storage_ids = self._get_cached_query_result(cache_key)
+        if is_cached:
+            return cached_storage_ids
+
         asset_partition = AssetKeyPartitionKey(asset_key)
         latest_record = self._get_latest_materialization_or_observation_record(
             asset_partition=asset_partition
@@ -217,15 +470,16 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
         latest_storage_ids = {
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
-        if self.asset_graph.is_partitioned(asset_key):
+        if is_partitioned:
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
                     for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
+                        asset_key, event_type=event_type
                     ).items()
                 }
             )
+        self._cache_query_result(cache_key, latest_storage_ids, asset_key=asset_key)
         return latest_storage_ids
 
     def get_latest_materialization_or_observation_storage_id(
@@ -344,7 +598,20 @@ def next_version_record(
 
     @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        cache_key = ("run_record", run_id)
+        is_cached, run_record = self._get_cached_query_result(cache_key)
+        if is_cached:
+            return run_record
+
+        run_record = self.instance.get_run_record_by_id(run_id)
+        # only the records of finished runs are kept across evaluations, since they don't change
+        if run_record is not None and run_record.dagster_run.is_finished:
+            self._cache_query_result(cache_key, run_record)
+        return run_record
+
+    def _is_run_finished(self, run_id: str) -> bool:
+        run = self._get_run_by_id(run_id)
+        return run is not None and run.is_finished
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -370,10 +637,21 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
+        cache_key = ("planned_materializations", run_id)
+        is_cached, planned_asset_keys = self._get_cached_query_result(cache_key)
+        if is_cached:
+            return planned_asset_keys
+
+        materializations_planned = self.instance.get_lazy_records_for_run(
             run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
+        )
+        # results shared across evaluations are immutable, so no caller can change another's
+        planned_asset_keys = frozenset(
+            cast(AssetKey, record.asset_key) for record in materializations_planned
+        )
+        if self._is_run_finished(run_id):
+            self._cache_query_result(cache_key, planned_asset_keys)
+        return planned_asset_keys
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
         """Returns the set of asset keys that are planned to be materialized by the run.
@@ -414,11 +692,21 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
+        cache_key = ("current_materializations", run_id)
+        is_cached, materialized_asset_keys = self._get_cached_query_result(cache_key)
+        if is_cached:
+            return materialized_asset_keys
+
+        materializations = self.instance.get_lazy_records_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations)
+        )
+        materialized_asset_keys = frozenset(
+            cast(AssetKey, record.asset_key) for record in materializations
+        )
+        if self._is_run_finished(run_id):
+            self._cache_query_result(cache_key, materialized_asset_keys)
+        return materialized_asset_keys
 
     ####################
     # BACKFILLS
@@ -459,7 +747,7 @@ def get_active_backfill_target_asset_graph_subset(self) -> AssetGraphSubset:
 
     def get_materialized_partitions(
         self, asset_key: AssetKey, before_cursor: Optional[int] = None
-    ) -> Set[str]:
+    ) -> AbstractSet[str]:
         """Returns a list of the partitions that have been materialized for the given asset key.
 
         Args:
@@ -467,17 +755,20 @@ def get_materialized_partitions(
             before_cursor (Optional[int]): The cursor before which to look for materialized
                 partitions. If not provided, will look at all materializations.
         """
-        if (
-            before_cursor not in self._asset_partitions_cache
-            or asset_key not in self._asset_partitions_cache[before_cursor]
-        ):
-            self._asset_partitions_cache[before_cursor][
-                asset_key
-            ] = self.instance.get_materialized_partitions(
-                asset_key=asset_key, before_cursor=before_cursor
-            )
+        materialized_partitions = self._asset_partitions_cache.get((before_cursor, asset_key))
+        if materialized_partitions is None:
+            cache_key = ("materialized_partitions", asset_key, before_cursor)
+            is_cached, materialized_partitions = self._get_cached_query_result(cache_key)
+            if not is_cached:
+                materialized_partitions = frozenset(
+                    self.instance.get_materialized_partitions(
+                        asset_key=asset_key, before_cursor=before_cursor
+                    )
+                )
+                self._cache_query_result(cache_key, materialized_partitions, asset_key=asset_key)
+            self._asset_partitions_cache[(before_cursor, asset_key)] = materialized_partitions
 
-        return self._asset_partitions_cache[before_cursor][asset_key]
+        return materialized_partitions
 
     ####################
     # DYNAMIC PARTITIONS
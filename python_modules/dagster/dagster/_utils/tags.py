@@ -85,3 +85,33 @@ def update_counters_with_launched_item(
 
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
+
+    def update_counters_with_tag_counts(self, tag_counts: Mapping[Tuple[str, str], int]) -> None:
+        """Add the given number of in progress items carrying each (key, value) tag to the
+        counters, as an alternative to adding each of the items themselves.
+        """
+        for (key, value), count in tag_counts.items():
+            if key in self._key_limits:
+                self._key_counts[key] += count
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] += count
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] += count
+
+    def update_counters_with_finished_item(
+        self, item: Union["DagsterRun", "ExecutionStep"]
+    ) -> None:
+        """Remove an item that is no longer in progress from the counters."""
+        for key, value in item.tags.items():
+            if key in self._key_limits:
+                self._key_counts[key] -= 1
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] -= 1
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] -= 1
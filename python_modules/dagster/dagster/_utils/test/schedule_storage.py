@@ -459,6 +459,31 @@ def test_update_state_not_found(self, storage):
         with pytest.raises(Exception):
             storage.update_instigator_state(state)
 
+    def test_get_updated_instigator_states(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        state_2 = self.build_sensor("my_sensor_2")
+        storage.add_instigator_state(state)
+        storage.add_instigator_state(state_2)
+
+        states = storage.get_updated_instigator_states(time.time() - 60)
+        assert {s.instigator_name for s in states} == {"my_sensor", "my_sensor_2"}
+
+        # some storages only keep update timestamps to the second
+        time.sleep(2)
+        updated_after = time.time() - 1
+        storage.update_instigator_state(state_2.with_status(InstigatorStatus.STOPPED))
+
+        states = storage.get_updated_instigator_states(updated_after)
+        assert len(states) == 1
+        assert states[0].instigator_name == "my_sensor_2"
+        assert states[0].status == InstigatorStatus.STOPPED
+
+        assert not storage.get_updated_instigator_states(
+            updated_after, instigator_type=InstigatorType.SCHEDULE
+        )
+
     def test_delete_instigator_state(self, storage):
         assert storage
 
@@ -18,7 +18,7 @@
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import COMPACT_JSON_PREFIX, deserialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -41,6 +41,23 @@ def test_streaming_external_repositories_api_grpc(instance):
         }
 
 
+def test_external_repository_compact_serialization(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+
+        ser_repo_data = code_location.client.external_repository(repo_origin)
+        compact_ser_repo_data = code_location.client.external_repository(
+            repo_origin, compact_serialization=True
+        )
+
+        assert not ser_repo_data.startswith(COMPACT_JSON_PREFIX)
+        assert compact_ser_repo_data.startswith(COMPACT_JSON_PREFIX)
+        assert len(compact_ser_repo_data) < len(ser_repo_data)
+        assert deserialize_value(
+            compact_ser_repo_data, ExternalRepositoryData
+        ) == deserialize_value(ser_repo_data, ExternalRepositoryData)
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -1,14 +1,22 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
 import pendulum
 import pytest
 from dagster import (
+    DagsterInstance,
     DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     TimeWindowPartitionsDefinition,
@@ -57,6 +65,103 @@ def test_static_partitions_subset_current_version_serialization():
     assert deserialized.get_partition_keys() == {"baz", "foo"}
 
 
+def test_bitmap_partitions_subset_operations():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d", "e", "f"])
+    subset = partitions_def.empty_subset().with_partition_keys(["a", "b", "c", "e", "removed"])
+    other = partitions_def.empty_subset().with_partition_keys(["c", "d", "e"])
+
+    assert len(subset) == 5
+    assert "a" in subset and "removed" in subset and "d" not in subset
+    assert (subset | other).get_partition_keys() == {"a", "b", "c", "d", "e", "removed"}
+    assert (subset & other).get_partition_keys() == {"c", "e"}
+    assert (subset - other).get_partition_keys() == {"a", "b", "removed"}
+    assert set(subset.get_partition_keys_not_in_subset(partitions_def)) == {"d", "f"}
+    assert subset.get_partition_key_ranges(partitions_def) == [
+        PartitionKeyRange("a", "c"),
+        PartitionKeyRange("e", "e"),
+    ]
+
+    all_subset = AllPartitionsSubset(partitions_def, Mock(), pendulum.now("UTC"))
+    assert (subset | all_subset).get_partition_keys() == {"a", "b", "c", "d", "e", "f", "removed"}
+    assert (subset & all_subset).get_partition_keys() == {"a", "b", "c", "e"}
+    assert (subset - all_subset).get_partition_keys() == {"removed"}
+
+    # interoperates with subsets of partition keys
+    default_subset = DefaultPartitionsSubset({"c", "d", "e"})
+    assert default_subset == other and other == default_subset
+    assert (subset & default_subset).get_partition_keys() == {"c", "e"}
+
+
+def test_bitmap_partitions_subset_serialization():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    subset = partitions_def.empty_subset().with_partition_keys(["a", "b", "d", "removed"])
+    serialized = subset.serialize()
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    # subsets are stored as partition keys in the format of DefaultPartitionsSubset, which
+    # versions that predate the bitmap can read
+    assert serialized == DefaultPartitionsSubset({"a", "b", "d", "removed"}).serialize()
+    assert json.loads(serialized) == {"version": 1, "subset": ["a", "b", "d", "removed"]}
+
+    # the subset stays valid when the partition keys are appended, inserted or reordered
+    for changed_partitions_def in [
+        StaticPartitionsDefinition(["a", "b", "c", "d", "e"]),
+        StaticPartitionsDefinition(["a", "inserted", "b", "c", "d"]),
+        StaticPartitionsDefinition(["d", "c", "b", "a"]),
+    ]:
+        assert changed_partitions_def.can_deserialize_subset(
+            serialized, None, StaticPartitionsDefinition.__name__
+        )
+        deserialized = changed_partitions_def.deserialize_subset(serialized)
+        assert deserialized.get_partition_keys() == {"a", "b", "d", "removed"}
+        assert set(deserialized.get_partition_keys_not_in_subset(changed_partitions_def)) == set(
+            changed_partitions_def.get_partition_keys()
+        ) - {"a", "b", "d"}
+
+    # subsets serialized with serdes are stored as partition keys, which don't depend on the
+    # partitions definition
+    assert serialize_value(subset) == serialize_value(
+        DefaultPartitionsSubset({"a", "b", "d", "removed"})
+    )
+    assert deserialize_value(serialize_value(subset)) == subset
+
+
+def test_dynamic_partitions_subset_serialization():
+    # the indexes of dynamic partition keys shift as partitions are added and deleted, so subsets
+    # of dynamic partitions are stored as partition keys rather than as a bitmap over indexes
+    instance = DagsterInstance.ephemeral()
+    instance.add_dynamic_partitions("fruits", ["apple", "banana", "cherry"])
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+
+    subset = partitions_def.empty_subset().with_partition_keys(["banana", "cherry"])
+    assert not isinstance(subset, BitmapPartitionsSubset)
+    serialized = subset.serialize()
+    serialized_unique_id = partitions_def.get_serializable_unique_identifier(instance)
+
+    # deleting a partition shifts the index of every later partition key
+    instance.delete_dynamic_partition("fruits", "apple")
+    instance.add_dynamic_partitions("fruits", ["apple", "date"])
+    assert partitions_def.get_partition_keys(dynamic_partitions_store=instance) == [
+        "banana",
+        "cherry",
+        "apple",
+        "date",
+    ]
+    assert partitions_def.get_serializable_unique_identifier(instance) != serialized_unique_id
+
+    assert partitions_def.can_deserialize_subset(
+        serialized, serialized_unique_id, DynamicPartitionsDefinition.__name__
+    )
+    deserialized = partitions_def.deserialize_subset(serialized)
+    assert set(deserialized.get_partition_keys()) == {"banana", "cherry"}
+    assert set(
+        deserialized.get_partition_keys_not_in_subset(
+            partitions_def, dynamic_partitions_store=instance
+        )
+    ) == {"apple", "date"}
+    assert deserialize_value(serialize_value(subset)) == subset
+
+
 def test_time_window_subset_cannot_deserialize_invalid_version():
     daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
     serialized_subset = (
@@ -86,7 +191,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -776,3 +777,61 @@ def test_report_runless_asset_event():
             limit=1,
         )
         assert len(records) == 1
+
+
+def test_buffered_event_log_writes():
+    @op
+    def noisy_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def noisy_job():
+        noisy_op()
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_buffered_events": 1000}}
+    ) as instance:
+        with patch.object(
+            instance.event_log_storage,
+            "store_events",
+            wraps=instance.event_log_storage.store_events,
+        ) as store_events_mock:
+            result = noisy_job.execute_in_process(instance=instance)
+            assert result.success
+
+        # the step's events are flushed together at the step boundary
+        assert store_events_mock.call_count >= 1
+        assert max(len(call.args[0]) for call in store_events_mock.call_args_list) > 10
+
+        logs = instance.all_logs(result.run_id)
+        assert len([log for log in logs if log.user_message.startswith("message ")]) == 10
+        assert logs[-1].dagster_event.event_type == DagsterEventType.RUN_SUCCESS
+        assert instance.get_run_by_id(result.run_id).is_success
+
+
+def test_buffered_event_log_explicit_flush():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "flush_interval_seconds": 3600.0}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.report_engine_event("buffered", run)
+        assert instance.all_logs(run.run_id) == []
+
+        instance.flush_buffered_events()
+        assert len(instance.all_logs(run.run_id)) == 1
+
+
+def test_buffered_event_log_flush_interval():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "flush_interval_seconds": 0.5}}
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.report_engine_event("buffered", run)
+        assert instance.all_logs(run.run_id) == []
+
+        # no further events arrive, so the timer flushes the buffered event
+        start_time = time.time()
+        while not instance.all_logs(run.run_id):
+            assert time.time() - start_time < 10, "Buffered event was never flushed"
+            time.sleep(0.1)
@@ -0,0 +1,163 @@
+import dagster._check as check
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.test_utils import instance_for_test
+from dagster._utils import Counter, traced_counter
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer, InstanceQueryerCache
+
+partitions_def = StaticPartitionsDefinition(["x", "y", "z"])
+
+
+@asset
+def unpartitioned():
+    pass
+
+
+@asset(partitions_def=partitions_def)
+def partitioned():
+    pass
+
+
+ASSET_GRAPH = AssetGraph.from_assets([unpartitioned, partitioned])
+
+
+def _query(instance, query_cache):
+    instance_queryer = CachingInstanceQueryer(instance, ASSET_GRAPH, query_cache=query_cache)
+    instance_queryer.prefetch_asset_records([unpartitioned.key, partitioned.key])
+    return (
+        instance_queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(unpartitioned.key)
+        ),
+        instance_queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(partitioned.key, "x")
+        ),
+        instance_queryer.get_materialized_partitions(partitioned.key),
+    )
+
+
+def test_results_reused_across_evaluations():
+    with instance_for_test() as instance:
+        materialize([unpartitioned], instance=instance)
+        materialize([partitioned], instance=instance, partition_key="x")
+
+        query_cache = InstanceQueryerCache()
+        assert query_cache.refresh(instance) == set()
+        unpartitioned_storage_id, partitioned_storage_id, materialized_partitions = _query(
+            instance, query_cache
+        )
+        assert unpartitioned_storage_id and partitioned_storage_id
+        assert materialized_partitions == {"x"}
+
+        # no new events, so the next evaluation doesn't query the instance
+        assert query_cache.refresh(instance) == set()
+        traced_counter.set(Counter())
+        assert _query(instance, query_cache) == (
+            unpartitioned_storage_id,
+            partitioned_storage_id,
+            {"x"},
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_asset_records", 0) == 0
+        assert counts.get("DagsterInstance.get_materialized_partitions", 0) == 0
+        assert counts.get("DagsterInstance.get_latest_storage_id_by_partition", 0) == 0
+
+        # only the results for the asset with new events are queried again
+        materialize([partitioned], instance=instance, partition_key="y")
+        assert query_cache.refresh(instance) == {partitioned.key}
+        traced_counter.set(Counter())
+        assert _query(instance, query_cache) == (
+            unpartitioned_storage_id,
+            partitioned_storage_id,
+            {"x", "y"},
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_asset_records") == 1
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 1
+
+
+def test_cache_bounds():
+    query_cache = InstanceQueryerCache(max_entries=2)
+    query_cache.set("a", 1, asset_key=AssetKey("a"))
+    query_cache.set("b", 2)
+    assert query_cache.get("a") == 1
+    query_cache.set("c", 3)
+    # the least recently used entry is evicted
+    assert len(query_cache) == 2
+    assert "a" in query_cache and "b" not in query_cache and "c" in query_cache
+    query_cache.invalidate(AssetKey("a"))
+    assert "a" not in query_cache
+
+    with instance_for_test() as instance:
+        query_cache = InstanceQueryerCache(max_tailed_records=1)
+        query_cache.refresh(instance)
+        query_cache.set("c", 3)
+        for partition_key in ["x", "y"]:
+            instance.report_runless_asset_event(
+                AssetMaterialization(partitioned.key, partition=partition_key)
+            )
+
+        # more events than are tailed were stored, so the whole cache is cleared
+        assert query_cache.refresh(instance) == set()
+        assert len(query_cache) == 0
+
+
+def test_wiped_asset_results_invalidated():
+    with instance_for_test() as instance:
+        materialize([unpartitioned], instance=instance)
+        materialize([partitioned], instance=instance, partition_key="x")
+
+        query_cache = InstanceQueryerCache()
+        query_cache.refresh(instance)
+        unpartitioned_storage_id, _, materialized_partitions = _query(instance, query_cache)
+        assert materialized_partitions == {"x"}
+        # results shared across evaluations can't be changed by the callers
+        assert isinstance(materialized_partitions, frozenset)
+
+        # wiping doesn't store any events, but the results for the wiped asset are invalidated
+        instance.wipe_assets([partitioned.key])
+        assert query_cache.refresh(instance) == {partitioned.key}
+        assert _query(instance, query_cache) == (unpartitioned_storage_id, None, set())
+
+        # once checked against the new record, the results are reused again
+        assert query_cache.refresh(instance) == set()
+        traced_counter.set(Counter())
+        assert _query(instance, query_cache) == (unpartitioned_storage_id, None, set())
+        assert traced_counter.get().counts().get("DagsterInstance.get_asset_records", 0) == 0
+
+
+def test_wiped_asset_results_before_cursor_invalidated():
+    with instance_for_test() as instance:
+        materialize([partitioned], instance=instance, partition_key="x")
+        before_cursor = check.not_none(instance.event_log_storage.get_maximum_record_id()) + 1
+
+        def _query_before_cursor():
+            instance_queryer = CachingInstanceQueryer(
+                instance, ASSET_GRAPH, query_cache=query_cache
+            )
+            instance_queryer.prefetch_asset_records([partitioned.key])
+            return (
+                instance_queryer.get_latest_materialization_or_observation_record(
+                    AssetKeyPartitionKey(partitioned.key, "x"), before_cursor=before_cursor
+                ),
+                instance_queryer.get_materialized_partitions(
+                    partitioned.key, before_cursor=before_cursor
+                ),
+            )
+
+        query_cache = InstanceQueryerCache()
+        query_cache.refresh(instance)
+        record, materialized_partitions = _query_before_cursor()
+        assert record is not None
+        assert materialized_partitions == {"x"}
+
+        # results before a cursor are also invalidated when the asset is wiped
+        instance.wipe_assets([partitioned.key])
+        assert query_cache.refresh(instance) == {partitioned.key}
+        assert _query_before_cursor() == (None, set())
@@ -67,7 +67,15 @@
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorIndex,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
+from dagster._daemon.sharding import (
+    DEFAULT_SHARD_LEASE_DURATION_SECONDS,
+    InstigatorShardCoordinator,
+)
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 from .conftest import create_workspace_load_target
@@ -3221,3 +3229,125 @@ def test_stale_request_context(instance, workspace_context, external_repo):
             TickStatus.SUCCESS,
             [run.run_id],
         )
+
+
+def test_sharded_sensors(instance, workspace_context, external_repo, executor):
+    sensor_names = ["simple_sensor", "custom_interval_sensor", "skip_cursor_sensor"]
+    external_sensors = [external_repo.get_external_sensor(name) for name in sensor_names]
+    for external_sensor in external_sensors:
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+    coordinators = [
+        InstigatorShardCoordinator(instance, "SENSOR", replica_id=f"replica_{i}")
+        for i in range(2)
+    ]
+    # refresh the replicas, renewing their leases, until they are past the join grace period
+    refresh_time = pendulum.now("UTC")
+    for _ in range(3):
+        with pendulum.test(refresh_time):
+            for coordinator in coordinators:
+                coordinator.refresh()
+        refresh_time = refresh_time.add(seconds=DEFAULT_SHARD_LEASE_DURATION_SECONDS / 2)
+    assert all(coordinator.is_active for coordinator in coordinators)
+
+    logger = get_default_daemon_logger("SensorDaemon")
+    for coordinator in coordinators:
+        owned_origin_ids = {
+            external_sensor.get_external_origin_id()
+            for external_sensor in external_sensors
+            if coordinator.owns(external_sensor.selector_id)
+        }
+        previously_ticked_origin_ids = {
+            external_sensor.get_external_origin_id()
+            for external_sensor in external_sensors
+            if instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+        }
+        futures = {}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=executor,
+                sensor_tick_futures=futures,
+                shard_coordinator=coordinator,
+            )
+        )
+        wait_for_futures(futures, timeout=FUTURES_TIMEOUT)
+
+        ticked_origin_ids = {
+            external_sensor.get_external_origin_id()
+            for external_sensor in external_sensors
+            if instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+        }
+        assert ticked_origin_ids == previously_ticked_origin_ids | owned_origin_ids
+        assert not previously_ticked_origin_ids & owned_origin_ids
+
+    # between them, the replicas evaluated every sensor exactly once
+    for external_sensor in external_sensors:
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 1
+
+
+def test_sensor_index_reused_across_iterations(instance, workspace_context, external_repo, executor):
+    external_sensor = external_repo.get_external_sensor("skip_cursor_sensor")
+    instance.start_sensor(external_sensor)
+
+    logger = get_default_daemon_logger("SensorDaemon")
+    sensor_index = SensorIndex()
+
+    def _evaluate():
+        futures = {}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=executor,
+                sensor_tick_futures=futures,
+                sensor_index=sensor_index,
+            )
+        )
+        wait_for_futures(futures, timeout=FUTURES_TIMEOUT)
+
+    def _get_ticks():
+        return instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+
+    freeze_datetime = pendulum.now("UTC")
+    with pendulum.test(freeze_datetime):
+        _evaluate()
+        assert external_sensor.selector_id in sensor_index.running_sensors
+        assert len(_get_ticks()) == 1
+
+    # unchanged code locations are not re-indexed, and only updated sensor states are read
+    freeze_datetime = freeze_datetime.add(seconds=35)
+    with pendulum.test(freeze_datetime), mock.patch.object(
+        ExternalRepository, "get_external_sensors"
+    ) as get_external_sensors, mock.patch.object(
+        DagsterInstance, "all_instigator_state"
+    ) as all_instigator_state:
+        _evaluate()
+        assert not get_external_sensors.called
+        assert not all_instigator_state.called
+        assert len(_get_ticks()) == 2
+
+    freeze_datetime = freeze_datetime.add(seconds=35)
+    with pendulum.test(freeze_datetime):
+        instance.stop_sensor(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id, external_sensor
+        )
+        _evaluate()
+        assert external_sensor.selector_id not in sensor_index.running_sensors
+        assert len(_get_ticks()) == 2
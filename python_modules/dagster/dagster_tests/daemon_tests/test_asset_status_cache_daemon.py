@@ -0,0 +1,112 @@
+import time
+
+from dagster import (
+    AssetKey,
+    DagsterEventType,
+    EventLogEntry,
+    StaticPartitionsDefinition,
+)
+from dagster._core.events import AssetMaterializationPlannedData, DagsterEvent
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._daemon.asset_status_cache import AssetStatusCacheDaemon, reconcile_asset_status_cache
+
+PARTITIONS_DEF = StaticPartitionsDefinition(["a", "b", "c"])
+ASSET_KEYS = [AssetKey(f"asset{i}") for i in range(3)]
+
+
+def _store_planned_event(instance, run_id, asset_key, partition):
+    instance.event_log_storage.store_event(
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id=run_id,
+            timestamp=time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                "nonce",
+                event_specific_data=AssetMaterializationPlannedData(asset_key, partition),
+            ),
+        )
+    )
+
+
+def _get_cached_statuses(instance):
+    return {
+        asset_record.asset_entry.asset_key: asset_record.asset_entry.cached_status
+        for asset_record in instance.get_asset_records(ASSET_KEYS)
+    }
+
+
+def test_reconcile_asset_status_cache():
+    partitions_defs_by_asset_key = {asset_key: PARTITIONS_DEF for asset_key in ASSET_KEYS}
+    with instance_for_test(overrides={"asset_status_cache": {"eager_updates": True}}) as instance:
+        assert AssetStatusCacheDaemon.daemon_type() in instance.get_required_daemon_types()
+
+        # nothing to reconcile
+        assert not reconcile_asset_status_cache(instance, partitions_defs_by_asset_key, 2)
+
+        # runs that were never started don't update the cached status, so the reconciler does
+        runs = [create_run_for_test(instance) for _ in ASSET_KEYS]
+        for run, asset_key in zip(runs, ASSET_KEYS):
+            _store_planned_event(instance, run.run_id, asset_key, "a")
+
+        # the reconciler is bounded, and picks up the remaining assets on its next iteration before
+        # checking on the assets with in progress partitions again
+        reconciled_asset_keys = reconcile_asset_status_cache(
+            instance, partitions_defs_by_asset_key, 2
+        )
+        assert len(reconciled_asset_keys) == 2
+        (remaining_asset_key,) = set(ASSET_KEYS) - reconciled_asset_keys
+        reconciled_asset_keys = reconcile_asset_status_cache(
+            instance, partitions_defs_by_asset_key, 1
+        )
+        assert reconciled_asset_keys == {remaining_asset_key}
+        for cached_status in _get_cached_statuses(instance).values():
+            assert cached_status.deserialize_in_progress_partition_subsets(
+                PARTITIONS_DEF
+            ).get_partition_keys() == {"a"}
+
+        # the run of the first asset fails without its run worker updating the cached status
+        instance.report_run_failed(runs[0])
+        reconcile_asset_status_cache(instance, partitions_defs_by_asset_key, 10)
+        cached_statuses = _get_cached_statuses(instance)
+        assert cached_statuses[ASSET_KEYS[0]].deserialize_failed_partition_subsets(
+            PARTITIONS_DEF
+        ).get_partition_keys() == {"a"}
+        assert not cached_statuses[ASSET_KEYS[0]].deserialize_in_progress_partition_subsets(
+            PARTITIONS_DEF
+        ).get_partition_keys()
+        assert cached_statuses[ASSET_KEYS[1]].deserialize_in_progress_partition_subsets(
+            PARTITIONS_DEF
+        ).get_partition_keys() == {"a"}
+
+    with instance_for_test() as instance:
+        assert AssetStatusCacheDaemon.daemon_type() not in instance.get_required_daemon_types()
+
+
+def test_reconcile_asset_status_cache_rotates_in_progress_assets():
+    asset_keys = [AssetKey(f"in_progress_asset{i}") for i in range(5)]
+    partitions_defs_by_asset_key = {asset_key: PARTITIONS_DEF for asset_key in asset_keys}
+    with instance_for_test(overrides={"asset_status_cache": {"eager_updates": True}}) as instance:
+        for asset_key in asset_keys:
+            run = create_run_for_test(instance)
+            _store_planned_event(instance, run.run_id, asset_key, "a")
+
+        # catch up every cached status, which leaves more assets with in progress partitions than
+        # the reconciler catches up on each call
+        assert reconcile_asset_status_cache(instance, partitions_defs_by_asset_key, 10) == set(
+            asset_keys
+        )
+
+        # the runs keep running, so the assets stay in progress. Each call picks up where the
+        # previous one left off, rather than catching up the same assets on every call
+        reconciled_asset_keys = [
+            reconcile_asset_status_cache(instance, partitions_defs_by_asset_key, 2)
+            for _ in range(3)
+        ]
+        assert reconciled_asset_keys == [
+            {asset_keys[0], asset_keys[1]},
+            {asset_keys[2], asset_keys[3]},
+            {asset_keys[4], asset_keys[0]},
+        ]
@@ -246,6 +246,27 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
 
         assert self.get_run_ids(instance.run_launcher.queue()) == ["bad-pri-run"]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [dict(max_concurrent_runs=2)],
+    )
+    def test_priority_across_pages(self, instance, workspace_context, job_handle, daemon):
+        for i in range(5):
+            self.create_queued_run(instance, job_handle, run_id=f"default-pri-run-{i}")
+        self.create_queued_run(
+            instance,
+            job_handle,
+            run_id="hi-pri-run",
+            tags={PRIORITY_TAG: "3"},
+        )
+
+        list(daemon.run_iteration(workspace_context))
+
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            "hi-pri-run",
+            "default-pri-run-0",
+        ]
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
@@ -0,0 +1,301 @@
+import time
+from unittest import mock
+
+import pendulum
+from dagster._core.test_utils import instance_for_test
+from dagster._daemon.daemon import SchedulerDaemon, SensorDaemon
+from dagster._daemon.sharding import (
+    DEFAULT_SHARD_LEASE_DURATION_SECONDS,
+    MAX_SHARD_REPLICAS,
+    InstigatorShardCoordinator,
+    ShardRegistration,
+    create_instigator_shard_coordinator,
+)
+
+SELECTOR_IDS = [f"selector_{i}" for i in range(200)]
+
+
+def _owned(coordinator):
+    return {selector_id for selector_id in SELECTOR_IDS if coordinator.owns(selector_id)}
+
+
+def _refresh_at(coordinators, refresh_time):
+    with pendulum.test(refresh_time):
+        for coordinator in coordinators:
+            coordinator.refresh()
+
+
+def _start(coordinators, start_time):
+    """Refreshes the coordinators, renewing their leases, until they are past the join grace
+    period.
+    """
+    for _ in range(3):
+        _refresh_at(coordinators, start_time)
+        start_time = start_time.add(seconds=DEFAULT_SHARD_LEASE_DURATION_SECONDS / 2)
+    return start_time
+
+
+def _registrations(instance, daemon_type):
+    slot_keys = {f"INSTIGATOR_SHARD_{daemon_type}_SLOT_{i}" for i in range(MAX_SHARD_REPLICAS)}
+    return {
+        slot_key: ShardRegistration.from_json(value)
+        for slot_key, value in instance.daemon_cursor_storage.get_cursor_values(slot_keys).items()
+    }
+
+
+def test_single_replica_owns_everything():
+    with instance_for_test() as instance:
+        coordinator = InstigatorShardCoordinator(instance, "SENSOR")
+        start_time = pendulum.now("UTC")
+
+        # without other live replicas, a new replica owns everything right away
+        _refresh_at([coordinator], start_time)
+        assert coordinator.live_replica_ids == (coordinator.replica_id,)
+        assert coordinator.is_active
+        assert _owned(coordinator) == set(SELECTOR_IDS)
+
+        # a replica that joins it waits for the grace period
+        joining = InstigatorShardCoordinator(instance, "SENSOR")
+        _refresh_at([joining], start_time.add(seconds=1))
+        assert not joining.is_active
+        assert _owned(joining) == set()
+
+
+def test_replicas_partition_instigators():
+    with instance_for_test() as instance:
+        coordinators = [
+            InstigatorShardCoordinator(instance, "SENSOR", replica_id=f"replica_{i}")
+            for i in range(3)
+        ]
+        _start(coordinators, pendulum.now("UTC"))
+
+        for coordinator in coordinators:
+            assert coordinator.live_replica_ids == ("replica_0", "replica_1", "replica_2")
+
+        owned = [_owned(coordinator) for coordinator in coordinators]
+        assert set.union(*owned) == set(SELECTOR_IDS)
+        assert sum(len(selector_ids) for selector_ids in owned) == len(SELECTOR_IDS)
+        assert all(selector_ids for selector_ids in owned)
+
+        # replicas of other daemons are tracked separately
+        scheduler_coordinator = InstigatorShardCoordinator(instance, "SCHEDULER")
+        _start([scheduler_coordinator], pendulum.now("UTC"))
+        assert _owned(scheduler_coordinator) == set(SELECTOR_IDS)
+
+
+def test_no_overlap_during_join():
+    with instance_for_test() as instance:
+        existing = [
+            InstigatorShardCoordinator(instance, "SENSOR", replica_id=f"existing_{i}")
+            for i in range(2)
+        ]
+        current_time = _start(existing, pendulum.now("UTC"))
+
+        joining = [
+            InstigatorShardCoordinator(instance, "SENSOR", replica_id=f"joining_{i}")
+            for i in range(2)
+        ]
+        all_coordinators = existing + joining
+
+        def assert_no_overlap():
+            owned = [_owned(coordinator) for coordinator in all_coordinators]
+            assert sum(len(selector_ids) for selector_ids in owned) == len(
+                set().union(*owned)
+            ), "an instigator is owned by more than one replica"
+
+        # the replicas join concurrently, and every replica refreshes at its own pace, with each
+        # refresh happening well within a lease duration of the previous one. Overlap is checked
+        # after every single refresh.
+        refresh_offsets = {"existing_0": 7, "existing_1": 31, "joining_0": 13, "joining_1": 23}
+        refresh_intervals = {"existing_0": 40, "existing_1": 90, "joining_0": 50, "joining_1": 70}
+        next_refresh = {
+            replica_id: current_time.add(seconds=offset)
+            for replica_id, offset in refresh_offsets.items()
+        }
+        end_time = current_time.add(seconds=4 * DEFAULT_SHARD_LEASE_DURATION_SECONDS)
+        while True:
+            coordinator = min(all_coordinators, key=lambda c: next_refresh[c.replica_id])
+            refresh_time = next_refresh[coordinator.replica_id]
+            if refresh_time > end_time:
+                break
+            _refresh_at([coordinator], refresh_time)
+            assert_no_overlap()
+            next_refresh[coordinator.replica_id] = refresh_time.add(
+                seconds=refresh_intervals[coordinator.replica_id]
+            )
+
+        # once the grace period is over, every instigator is owned by exactly one replica
+        assert all(coordinator.is_active for coordinator in all_coordinators)
+        owned = [_owned(coordinator) for coordinator in all_coordinators]
+        assert set.union(*owned) == set(SELECTOR_IDS)
+        assert sum(len(selector_ids) for selector_ids in owned) == len(SELECTOR_IDS)
+        assert all(selector_ids for selector_ids in owned)
+
+
+def test_overwritten_registration():
+    with instance_for_test() as instance:
+        first = InstigatorShardCoordinator(instance, "SENSOR", replica_id="first")
+        second = InstigatorShardCoordinator(instance, "SENSOR", replica_id="second")
+        current_time = _start([first, second], pendulum.now("UTC"))
+        assert first.is_active
+        assert {
+            registration.replica_id for registration in _registrations(instance, "SENSOR").values()
+        } == {"first", "second"}
+
+        # another replica claims the slot of the first replica at the same time, which the first
+        # replica finds out on its next refresh. It registers again, and owns nothing until its
+        # new registration is past the grace period
+        slot_key, registration = next(
+            (slot_key, registration)
+            for slot_key, registration in _registrations(instance, "SENSOR").items()
+            if registration.replica_id == "first"
+        )
+        instance.daemon_cursor_storage.set_cursor_values(
+            {slot_key: registration._replace(replica_id="third").to_json()}
+        )
+        _refresh_at([first], current_time)
+        assert not first.is_active
+        assert _owned(first) == set()
+        assert first.live_replica_ids == ("first", "second", "third")
+        assert len(_registrations(instance, "SENSOR")) == 3
+
+
+def test_rebalance_on_release():
+    with instance_for_test() as instance:
+        first = InstigatorShardCoordinator(instance, "SENSOR", replica_id="first")
+        second = InstigatorShardCoordinator(instance, "SENSOR", replica_id="second")
+        current_time = _start([first, second], pendulum.now("UTC"))
+
+        owned_by_first = _owned(first)
+        assert owned_by_first != set(SELECTOR_IDS)
+
+        second.release()
+        assert _owned(second) == set()
+        current_time = current_time.add(seconds=1)
+        _refresh_at([first], current_time)
+        assert first.live_replica_ids == ("first",)
+        assert _owned(first) == set(SELECTOR_IDS)
+
+        # only the instigators of the released replica moved
+        current_time = _start([second, first], current_time.add(seconds=1))
+        assert _owned(first) == owned_by_first
+
+
+def test_rebalance_on_expired_lease():
+    with instance_for_test() as instance:
+        first = InstigatorShardCoordinator(instance, "SENSOR", replica_id="first")
+        dead = InstigatorShardCoordinator(instance, "SENSOR", replica_id="dead")
+        current_time = _start([first, dead], pendulum.now("UTC"))
+        assert first.live_replica_ids == ("dead", "first")
+
+        # the dead replica stops renewing its lease, which then expires
+        current_time = current_time.add(seconds=DEFAULT_SHARD_LEASE_DURATION_SECONDS / 2)
+        _refresh_at([first], current_time)
+        assert first.live_replica_ids == ("dead", "first")
+
+        current_time = current_time.add(seconds=DEFAULT_SHARD_LEASE_DURATION_SECONDS / 2)
+        _refresh_at([first], current_time)
+        assert first.live_replica_ids == ("first",)
+        assert _owned(first) == set(SELECTOR_IDS)
+
+
+def test_lease_renewed_during_long_iteration():
+    with instance_for_test() as instance:
+        first = InstigatorShardCoordinator(instance, "SENSOR", replica_id="first")
+        second = InstigatorShardCoordinator(instance, "SENSOR", replica_id="second")
+        current_time = _start([first, second], pendulum.now("UTC"))
+
+        def _registered_at():
+            return [
+                registration.registered_at
+                for registration in _registrations(instance, "SENSOR").values()
+                if registration.replica_id == "first"
+            ]
+
+        registered_at = _registered_at()
+
+        # an iteration of the first replica takes three lease durations, during which its lease is
+        # renewed without refreshing it
+        for _ in range(6):
+            with pendulum.test(current_time):
+                first.renew_lease()
+                second.refresh()
+            assert first.is_active
+            assert second.live_replica_ids == ("first", "second")
+            current_time = current_time.add(seconds=DEFAULT_SHARD_LEASE_DURATION_SECONDS / 2)
+
+        # the first replica kept its registration, so it doesn't wait for another grace period
+        _refresh_at([first], current_time)
+        assert first.is_active
+        assert _registered_at() == registered_at
+
+
+def test_lease_renewal_thread():
+    with instance_for_test() as instance:
+        coordinator = InstigatorShardCoordinator(
+            instance, "SENSOR", lease_duration_seconds=1, replica_id="first"
+        )
+        coordinator.refresh()
+        assert coordinator.is_active
+        (registration,) = _registrations(instance, "SENSOR").values()
+
+        coordinator.start()
+        try:
+            # without the background renewal, the lease would have expired by now
+            time.sleep(2)
+            coordinator.refresh()
+            assert coordinator.is_active
+            (renewed,) = _registrations(instance, "SENSOR").values()
+            assert renewed.registered_at == registration.registered_at
+            assert renewed.lease_expires_at > registration.lease_expires_at
+        finally:
+            coordinator.release()
+
+        (released,) = _registrations(instance, "SENSOR").values()
+        assert released.lease_expires_at == 0
+
+
+def test_no_free_slot():
+    with instance_for_test() as instance:
+        now = pendulum.now("UTC").timestamp()
+        instance.daemon_cursor_storage.set_cursor_values(
+            {
+                f"INSTIGATOR_SHARD_SENSOR_SLOT_{i}": ShardRegistration(
+                    f"other_{i}", now, now + DEFAULT_SHARD_LEASE_DURATION_SECONDS
+                ).to_json()
+                for i in range(MAX_SHARD_REPLICAS)
+            }
+        )
+
+        logger = mock.MagicMock()
+        coordinator = InstigatorShardCoordinator(instance, "SENSOR", logger=logger)
+        coordinator.refresh()
+        coordinator.refresh()
+        assert not coordinator.is_active
+        assert _owned(coordinator) == set()
+        # the replica warns once, rather than on every refresh
+        assert logger.warning.call_count == 1
+        assert "shard slots" in logger.warning.call_args[0][0]
+
+
+def test_sharding_settings():
+    with instance_for_test() as instance:
+        assert not create_instigator_shard_coordinator(
+            instance, "SENSOR", instance.get_sensor_settings()
+        )
+        assert not SensorDaemon().supports_replicas(instance)
+
+    with instance_for_test(
+        overrides={
+            "sensors": {"sharding": {"enabled": True, "lease_duration_seconds": 30}},
+            "schedules": {"sharding": {"enabled": True}},
+        }
+    ) as instance:
+        assert create_instigator_shard_coordinator(
+            instance, "SENSOR", instance.get_sensor_settings()
+        )
+        assert create_instigator_shard_coordinator(
+            instance, "SCHEDULER", instance.get_scheduler_settings()
+        )
+        assert SensorDaemon().supports_replicas(instance)
+        assert SchedulerDaemon().supports_replicas(instance)
@@ -5,6 +5,7 @@
 import os
 import sys
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -30,10 +31,12 @@
     DagsterRunStatus,
     Definitions,
     MultiPartitionKey,
+    PartitionsDefinition,
     RunRequest,
     RunsFilter,
     asset,
     materialize,
+    multi_asset,
 )
 from dagster._core.definitions.asset_daemon_context import (
     AssetDaemonContext,
@@ -163,6 +166,14 @@ class AssetSpecWithPartitionsDef(
     ...
 
 
+class MultiAssetSpec(NamedTuple):
+    """Describes a multi-asset with the given specs, which is not subsettable unless specified."""
+
+    specs: Sequence[AssetSpec]
+    partitions_def: Optional[PartitionsDefinition] = None
+    can_subset: bool = False
+
+
 class AssetDaemonScenarioState(NamedTuple):
     """Specifies the state of a given AssetDaemonScenario. This state can be modified by changing
     the set of asset definitions it contains, executing runs, updating the time, evaluating ticks, etc.
@@ -175,9 +186,11 @@ class AssetDaemonScenarioState(NamedTuple):
         asset_specs (Sequence[AssetSpec]): The specs describing all assets that are part of this
             scenario.
         current_time (datetime): The current time of the scenario.
+        threadpool_executor (Optional[ThreadPoolExecutor]): If provided, the assets of each
+            topological level are evaluated concurrently on this executor in fast mode.
     """
 
-    asset_specs: Sequence[Union[AssetSpec, AssetSpecWithPartitionsDef]]
+    asset_specs: Sequence[Union[AssetSpec, AssetSpecWithPartitionsDef, MultiAssetSpec]]
     current_time: datetime.datetime = pendulum.now()
     run_requests: Sequence[RunRequest] = []
     serialized_cursor: str = AssetDaemonCursor.empty().serialize()
@@ -186,6 +199,7 @@ class AssetDaemonScenarioState(NamedTuple):
     # this is set by the scenario runner
     scenario_instance: Optional[DagsterInstance] = None
     is_daemon: bool = False
+    threadpool_executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def instance(self) -> DagsterInstance:
@@ -212,12 +226,28 @@ def compute_fn(context: AssetExecutionContext) -> None:
             "partitions_def",
         }
         for spec in self.asset_specs:
-            assets.append(
-                asset(
-                    compute_fn=compute_fn,
-                    **{k: v for k, v in spec._asdict().items() if k in params},
+            if isinstance(spec, MultiAssetSpec):
+
+                @multi_asset(
+                    name=f"multi_asset_{spec.specs[0].key.to_python_identifier()}",
+                    **spec._asdict(),
+                )
+                def _multi_asset(context: AssetExecutionContext):
+                    fail_keys = {
+                        AssetKey.from_coercible(s)
+                        for s in json.loads(context.run.tags.get(FAIL_TAG) or "[]")
+                    }
+                    if fail_keys & context.selected_asset_keys:
+                        raise Exception("Asset failed")
+
+                assets.append(_multi_asset)
+            else:
+                assets.append(
+                    asset(
+                        compute_fn=compute_fn,
+                        **{k: v for k, v in spec._asdict().items() if k in params},
+                    )
                 )
-            )
         return assets
 
     @property
@@ -232,9 +262,24 @@ def with_asset_properties(
         self, keys: Optional[Iterable[CoercibleToAssetKey]] = None, **kwargs
     ) -> "AssetDaemonScenarioState":
         """Convenience method to update the properties of one or more assets in the scenario state."""
+        target_keys = {AssetKey.from_coercible(key) for key in keys} if keys is not None else None
         new_asset_specs = []
         for spec in self.asset_specs:
-            if keys is None or spec.key in {AssetKey.from_coercible(key) for key in keys}:
+            if isinstance(spec, MultiAssetSpec):
+                spec_kwargs = {k: v for k, v in kwargs.items() if k != "partitions_def"}
+                new_specs = [
+                    inner_spec._replace(**spec_kwargs)
+                    if target_keys is None or inner_spec.key in target_keys
+                    else inner_spec
+                    for inner_spec in spec.specs
+                ]
+                if "partitions_def" in kwargs and (
+                    target_keys is None
+                    or any(inner_spec.key in target_keys for inner_spec in spec.specs)
+                ):
+                    spec = spec._replace(partitions_def=kwargs["partitions_def"])
+                new_asset_specs.append(spec._replace(specs=new_specs))
+            elif target_keys is None or spec.key in target_keys:
                 if "partitions_def" in kwargs:
                     # partitions_def is not a field on AssetSpec, so we need to do this hack
                     new_asset_specs.append(
@@ -329,6 +374,7 @@ def _evaluate_tick_fast(
             auto_observe=True,
             respect_materialization_data_versions=False,
             logger=self.logger,
+            threadpool_executor=self.threadpool_executor,
         ).evaluate()
 
         # make sure these run requests are available on the instance
@@ -1,6 +1,14 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Sequence, Tuple
+
+import dagster._check as check
 import pytest
+from dagster import AssetKey, AssetSpec, AutoMaterializePolicy, DagsterInstance
+from dagster._core.utils import InheritContextThreadPoolExecutor
 
-from .asset_daemon_scenario import AssetDaemonScenario
+from .asset_daemon_scenario import AssetDaemonScenario, AssetDaemonScenarioState, MultiAssetSpec
+from .base_scenario import run_request
 from .updated_scenarios.basic_scenarios import basic_scenarios
 from .updated_scenarios.cron_scenarios import cron_scenarios
 from .updated_scenarios.freshness_policy_scenarios import freshness_policy_scenarios
@@ -21,3 +29,86 @@
 @pytest.mark.parametrize("scenario", all_scenarios, ids=[scenario.id for scenario in all_scenarios])
 def test_scenario_fast(scenario: AssetDaemonScenario) -> None:
     scenario.evaluate_fast()
+
+
+def _large_graph_state(num_levels: int, width: int) -> AssetDaemonScenarioState:
+    """Builds a graph of eager and lazy assets, in which every pair of assets out of four in each
+    level is a non-subsettable multi-asset.
+    """
+    asset_specs = []
+    for level in range(num_levels):
+        for i in range(0, width, 2):
+            specs = [
+                AssetSpec(
+                    f"asset_{level}_{j}",
+                    deps=[f"asset_{level - 1}_{k}" for k in {j, (j + 1) % width}] if level else [],
+                    auto_materialize_policy=(
+                        AutoMaterializePolicy.lazy()
+                        if i % 3 == 2
+                        else AutoMaterializePolicy.eager()
+                    ),
+                )
+                for j in [i, i + 1]
+            ]
+            if i % 4 == 0:
+                asset_specs.append(MultiAssetSpec(specs=specs))
+            else:
+                asset_specs.extend(specs)
+    return AssetDaemonScenarioState(asset_specs=asset_specs)
+
+
+def _evaluate_large_graph(
+    state: AssetDaemonScenarioState, threadpool_executor: Optional[ThreadPoolExecutor]
+) -> Sequence[Tuple[Sequence[Tuple[Sequence[AssetKey], Optional[str]]], str, Sequence[Any]]]:
+    """Evaluates two ticks of the large graph on a fresh instance, after materializing part of it,
+    and returns the run requests, cursor and evaluations of each tick.
+    """
+    evaluation_time = state.current_time
+    state = state._replace(
+        scenario_instance=DagsterInstance.ephemeral(), threadpool_executor=threadpool_executor
+    ).with_runs(
+        run_request([f"asset_0_{i}" for i in range(8)]),
+        run_request([f"asset_1_{i}" for i in range(4)]),
+    )
+
+    results = []
+    for tick in range(2):
+        if tick:
+            # execute the requested runs, and update some roots so that the tick has work to do
+            state = state.with_not_started_runs().with_runs(
+                run_request(["asset_0_2", "asset_0_3"]), run_request(["asset_0_8", "asset_0_9"])
+            )
+        # runs take different amounts of real time, so both evaluations are pinned to the same time
+        evaluation_time += datetime.timedelta(minutes=5)
+        state = state._replace(current_time=evaluation_time).evaluate_tick()
+        results.append(
+            (
+                sorted(
+                    (sorted(check.not_none(run_request.asset_selection)), run_request.partition_key)
+                    for run_request in state.run_requests
+                ),
+                state.serialized_cursor,
+                sorted(state.evaluations, key=lambda evaluation: evaluation.asset_key),
+            )
+        )
+    return results
+
+
+def test_large_graph_threaded_evaluation() -> None:
+    """Checks that evaluating the assets of each topological level concurrently requests the same
+    runs and produces the same cursors and evaluations as evaluating them serially. Timings on
+    larger graphs are measured by dagster_test.benchmarks.asset_daemon.
+    """
+    state = _large_graph_state(num_levels=3, width=12)
+
+    serial_results = _evaluate_large_graph(state, None)
+    with InheritContextThreadPoolExecutor(
+        max_workers=4, thread_name_prefix="asset_daemon_worker"
+    ) as threadpool_executor:
+        threaded_results = _evaluate_large_graph(state, threadpool_executor)
+
+    # both ticks request runs, including runs of multi-assets
+    (first_run_requests, _, _), (second_run_requests, _, _) = serial_results
+    assert first_run_requests and second_run_requests
+    assert any(len(asset_keys) > 1 for asset_keys, _ in first_run_requests)
+    assert threaded_results == serial_results
@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest import mock
 
 import pendulum
 import pytest
@@ -21,7 +22,11 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import BitmapPartitionsSubset, DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
@@ -321,6 +326,123 @@ def test_multipartitions_subset_addition(initial, added):
     ) == set(expected_keys_not_in_updated_subset)
 
 
+def test_multipartitions_subset_rows():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-01-05"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    subset = multipartitions_def.empty_subset().with_partition_keys(
+        ["2015-01-01|a", "2015-01-01|b", "2015-01-02|a"]
+    )
+    other = multipartitions_def.empty_subset().with_partition_key_product(
+        {"date": ["2015-01-01", "2015-01-03"], "static": ["a", "c"]}
+    )
+
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert set(subset.secondary_subsets_by_primary_key.keys()) == {"2015-01-01", "2015-01-02"}
+    assert len(subset) == 3
+    assert "2015-01-01|b" in subset and "2015-01-02|b" not in subset
+    assert subset.get_dimension_partition_keys("date") == {"2015-01-01", "2015-01-02"}
+    assert subset.get_dimension_partition_keys("static") == {"a", "b"}
+
+    assert (subset | other).get_partition_keys() == {
+        "2015-01-01|a",
+        "2015-01-01|b",
+        "2015-01-01|c",
+        "2015-01-02|a",
+        "2015-01-03|a",
+        "2015-01-03|c",
+    }
+    assert (subset & other).get_partition_keys() == {"2015-01-01|a"}
+    assert (subset - other).get_partition_keys() == {"2015-01-01|b", "2015-01-02|a"}
+    assert len(set(subset.get_partition_keys_not_in_subset(multipartitions_def))) == 9
+
+    # interoperates with subsets of partition keys
+    assert subset == DefaultPartitionsSubset({"2015-01-01|a", "2015-01-01|b", "2015-01-02|a"})
+    assert (subset - DefaultPartitionsSubset({"2015-01-01|a"})).get_partition_keys() == {
+        "2015-01-01|b",
+        "2015-01-02|a",
+    }
+
+    serialized = subset.serialize()
+    assert multipartitions_def.can_deserialize_subset(serialized, None, None)
+    assert multipartitions_def.deserialize_subset(serialized) == subset
+
+    legacy_serialized = DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    assert multipartitions_def.deserialize_subset(legacy_serialized) == subset
+
+
+def test_multipartitions_subset_groups_identical_rows():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-01-05"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    # every row gets its own secondary subset object, but they are equal for the first three rows
+    subset = multipartitions_def.empty_subset().with_partition_keys(
+        [
+            "2015-01-01|a",
+            "2015-01-01|b",
+            "2015-01-02|a",
+            "2015-01-02|b",
+            "2015-01-03|a",
+            "2015-01-03|b",
+            "2015-01-04|c",
+        ]
+    )
+    assert isinstance(subset, MultiPartitionsSubset)
+
+    with mock.patch.object(
+        BitmapPartitionsSubset,
+        "get_partition_keys",
+        autospec=True,
+        side_effect=BitmapPartitionsSubset.get_partition_keys,
+    ) as get_partition_keys_mock:
+        products = subset.get_partition_key_products()
+        # the keys of each distinct secondary subset are materialized once, rather than once per row
+        assert get_partition_keys_mock.call_count == 2
+
+    assert sorted(products, key=lambda product: sorted(product["date"])) == [
+        {"date": {"2015-01-01", "2015-01-02", "2015-01-03"}, "static": {"a", "b"}},
+        {"date": {"2015-01-04"}, "static": {"c"}},
+    ]
+
+
+def test_multipartitions_subset_serialization_by_partition_keys():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-01-05"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    subset = multipartitions_def.empty_subset().with_partition_keys(
+        ["2015-01-01|a", "2015-01-01|b", "2015-01-02|c"]
+    )
+    serialized = subset.serialize()
+
+    # subsets are stored as multi-partition keys in the format of DefaultPartitionsSubset, which
+    # versions that predate storing subsets by primary partition key can read
+    assert serialized == DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    assert multipartitions_def.deserialize_subset(serialized) == subset
+
+    # the subset stays valid when the partition keys of the static dimension change
+    changed_multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-01-05"),
+            "static": StaticPartitionsDefinition(["c", "inserted", "b", "a"]),
+        }
+    )
+    assert changed_multipartitions_def.can_deserialize_subset(
+        serialized, None, MultiPartitionsDefinition.__name__
+    )
+    assert changed_multipartitions_def.deserialize_subset(
+        serialized
+    ).get_partition_keys() == {"2015-01-01|a", "2015-01-01|b", "2015-01-02|c"}
+
+
 def test_asset_partition_key_is_multipartition_key():
     class MyIOManager(IOManager):
         def handle_output(self, context, obj):
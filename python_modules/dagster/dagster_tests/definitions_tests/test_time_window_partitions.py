@@ -26,6 +26,7 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
 )
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
@@ -1217,6 +1218,68 @@ def my_partitioned_config_2(_start, _end):
     )
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2020-10-30-00:00", timezone="US/Central"),
+        HourlyPartitionsDefinition(
+            start_date="2020-10-30-00:00", timezone="Europe/London", minute_offset=15, end_offset=2
+        ),
+        DailyPartitionsDefinition(
+            start_date="2020-03-01", timezone="US/Central", hour_offset=2, minute_offset=30
+        ),
+        DailyPartitionsDefinition(start_date="2020-03-01", end_date="2020-12-15", end_offset=-2),
+        WeeklyPartitionsDefinition(start_date="2020-01-01", timezone="US/Pacific", day_offset=1),
+        MonthlyPartitionsDefinition(
+            start_date="2019-01-01", timezone="America/Sao_Paulo", day_offset=5, end_offset=1
+        ),
+        # partitions whose boundaries can't be computed from their index
+        MonthlyPartitionsDefinition(start_date="2019-01-01", day_offset=31),
+    ],
+)
+def test_partition_keys_match_iterated_time_windows(partitions_def: TimeWindowPartitionsDefinition):
+    for current_time in [
+        create_pendulum_time(2020, 11, 1, 6, 30, tz="UTC"),
+        create_pendulum_time(2020, 11, 8, 7, 0, tz="UTC"),
+        create_pendulum_time(2021, 3, 14, 8, 45, tz="UTC"),
+        create_pendulum_time(2021, 11, 7, 7, 59, tz="UTC"),
+    ]:
+        current_timestamp = current_time.timestamp()
+        expected_keys = []
+        num_past_current_time = 0
+        for window in partitions_def._iterate_time_windows(partitions_def.start):  # noqa: SLF001
+            if partitions_def.end and window.end.timestamp() > partitions_def.end.timestamp():
+                break
+            if window.end.timestamp() > current_timestamp:
+                if num_past_current_time >= partitions_def.end_offset:
+                    break
+                num_past_current_time += 1
+            expected_keys.append(
+                dst_safe_strftime(
+                    window.start,
+                    partitions_def.timezone,
+                    partitions_def.fmt,
+                    partitions_def.cron_schedule,
+                )
+            )
+        if partitions_def.end_offset < 0:
+            expected_keys = expected_keys[: partitions_def.end_offset]
+
+        assert partitions_def.get_partition_keys(current_time) == expected_keys
+        assert max(0, partitions_def.get_num_partitions(current_time)) == len(expected_keys)
+        assert (
+            partitions_def.get_partition_keys_between_indexes(
+                len(expected_keys) - 5, len(expected_keys), current_time
+            )
+            == expected_keys[-5:]
+        )
+        if expected_keys:
+            assert partitions_def.get_last_partition_key(current_time) == expected_keys[-1]
+            assert partitions_def.has_partition_key(expected_keys[-1], current_time)
+        else:
+            assert partitions_def.get_last_partition_key(current_time) is None
+
+
 def test_get_first_partition_window():
     assert DailyPartitionsDefinition(
         start_date="2023-01-01"
@@ -10,6 +10,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -44,6 +45,11 @@ def execute(self):
         segfault()
 
 
+class PidCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -105,3 +111,55 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def _pool_results(pool, command):
+    return [
+        event
+        for event in pool.execute_command(command)
+        if event is not None and not isinstance(event, ChildProcessEvent)
+    ]
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        first_pids = _pool_results(pool, PidCommand())
+        second_pids = _pool_results(pool, PidCommand())
+        assert first_pids == second_pids
+        assert first_pids[0] != os.getpid()
+        assert _pool_results(pool, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1, max_tasks_per_worker=2) as pool:
+        pids = [_pool_results(pool, PidCommand())[0] for _ in range(4)]
+        assert pids[0] == pids[1]
+        assert pids[1] != pids[2]
+        assert pids[2] == pids[3]
+
+
+def test_worker_pool_uncaught_exception():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        pid = _pool_results(pool, PidCommand())[0]
+        results = [
+            event
+            for event in pool.execute_command(ThrowAnErrorCommand())
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        # the worker survives errors raised by the command
+        assert _pool_results(pool, PidCommand()) == [pid]
+
+
+def test_worker_pool_crashy_process():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        pid = _pool_results(pool, PidCommand())[0]
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(pool.execute_command(CrashyCommand()))
+        assert exc.value.exit_code == 1
+
+        # crashed workers are replaced
+        new_pids = _pool_results(pool, PidCommand())
+        assert new_pids and new_pids != [pid]
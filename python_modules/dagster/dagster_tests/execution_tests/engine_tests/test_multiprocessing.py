@@ -76,6 +76,60 @@ def test_explicit_spawn():
             assert result.output_for_node("adder") == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {"max_concurrent": 1, "worker_pool": {"enabled": True}}
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"]
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            # all four steps were executed by the single worker of the pool
+            assert len(worker_pids) == 1
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"enabled": True, "max_tasks_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"]
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(worker_pids) == 2
+
+
 @pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
 def test_forkserver_execution():
     with instance_for_test() as instance:
@@ -443,6 +497,23 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={
+                "execution": {"config": {"multiprocess": {"worker_pool": {"enabled": True}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @op
 def segfault_op(context):
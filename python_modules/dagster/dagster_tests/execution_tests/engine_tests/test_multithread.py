@@ -0,0 +1,265 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from dagster import (
+    DagsterEventType,
+    In,
+    Out,
+    RetryPolicy,
+    asyncio_executor,
+    job,
+    multithread_executor,
+    op,
+)
+from dagster._core.definitions.job_base import InMemoryJob
+from dagster._core.execution.api import execute_run
+from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
+
+EXECUTORS = [multithread_executor, asyncio_executor]
+
+# op name -> value recorded by the op, since outputs are not loadable from the results of
+# execute_run
+RECORDED = {}
+
+
+@pytest.fixture(autouse=True)
+def clear_recorded():
+    RECORDED.clear()
+    yield
+    RECORDED.clear()
+
+
+def _execute(job_def, instance, run_config=None, raise_on_error=False):
+    # execute_in_process always runs with the in-process executor
+    dagster_run = instance.create_run_for_job(job_def, run_config=run_config)
+    return execute_run(InMemoryJob(job_def), dagster_run, instance, raise_on_error=raise_on_error)
+
+
+def _intervals_overlap(op_names):
+    intervals = sorted(RECORDED[name] for name in op_names)
+    return any(start < prev_end for (_, prev_end), (start, _) in zip(intervals, intervals[1:]))
+
+
+def _sleep_config(op_names, sleep):
+    return {"ops": {name: {"config": {"sleep": sleep}} for name in op_names}}
+
+
+@op(config_schema={"sleep": float}, tags={"database": "tiny"})
+def sleep_op(context):
+    start = time.time()
+    time.sleep(context.op_config["sleep"])
+    RECORDED[context.op.name] = (start, time.time())
+
+
+@op(config_schema={"sleep": float})
+async def async_sleep_op(context):
+    start = time.time()
+    await asyncio.sleep(context.op_config["sleep"])
+    RECORDED[context.op.name] = (start, time.time())
+
+
+@op(tags={GLOBAL_CONCURRENCY_TAG: "foo"})
+def concurrency_op(context):
+    start = time.time()
+    time.sleep(0.2)
+    RECORDED[context.op.name] = (start, time.time())
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_diamond(instance, executor_def):
+    @op
+    def emit():
+        return 1
+
+    @op(ins={"num": In(int)}, out=Out(int))
+    def add_one(num):
+        return num + 1
+
+    @op
+    def add(context, left, right):
+        RECORDED[context.op.name] = left + right
+
+    @job(executor_def=executor_def)
+    def diamond_job():
+        num = emit()
+        add(add_one.alias("left")(num), add_one.alias("right")(num))
+
+    result = _execute(diamond_job, instance)
+    assert result.success
+    assert RECORDED["add"] == 4
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_steps_run_concurrently(instance, executor_def):
+    op_names = [f"sleep_{i}" for i in range(4)]
+
+    @job(executor_def=executor_def)
+    def sleepy_job():
+        for name in op_names:
+            sleep_op.alias(name)()
+
+    result = _execute(
+        sleepy_job,
+        instance,
+        run_config={**_sleep_config(op_names, 0.5), "execution": {"config": {"max_concurrent": 4}}},
+    )
+    assert result.success
+    assert _intervals_overlap(op_names)
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_max_concurrent(instance, executor_def):
+    op_names = [f"sleep_{i}" for i in range(3)]
+
+    @job(executor_def=executor_def)
+    def sleepy_job():
+        for name in op_names:
+            sleep_op.alias(name)()
+
+    result = _execute(
+        sleepy_job,
+        instance,
+        run_config={**_sleep_config(op_names, 0.1), "execution": {"config": {"max_concurrent": 1}}},
+    )
+    assert result.success
+    assert not _intervals_overlap(op_names)
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_tag_concurrency_limits(instance, executor_def):
+    op_names = [f"sleep_{i}" for i in range(3)]
+
+    @job(executor_def=executor_def)
+    def sleepy_job():
+        for name in op_names:
+            sleep_op.alias(name)()
+
+    result = _execute(
+        sleepy_job,
+        instance,
+        run_config={
+            **_sleep_config(op_names, 0.1),
+            "execution": {
+                "config": {
+                    "max_concurrent": 4,
+                    "tag_concurrency_limits": [
+                        {"key": "database", "value": "tiny", "limit": 1},
+                    ],
+                }
+            },
+        },
+    )
+    assert result.success
+    assert not _intervals_overlap(op_names)
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_op_concurrency_slots(instance, executor_def):
+    instance.event_log_storage.set_concurrency_slots("foo", 1)
+    op_names = [f"concurrency_{i}" for i in range(3)]
+
+    @job(executor_def=executor_def)
+    def concurrency_job():
+        for name in op_names:
+            concurrency_op.alias(name)()
+
+    result = _execute(
+        concurrency_job, instance, run_config={"execution": {"config": {"max_concurrent": 4}}}
+    )
+    assert result.success
+    assert not _intervals_overlap(op_names)
+    assert instance.event_log_storage.get_concurrency_info("foo").active_slot_count == 0
+
+
+def test_async_ops_share_event_loop(instance):
+    op_names = [f"async_sleep_{i}" for i in range(8)]
+    loops = set()
+
+    @op
+    async def record_loop():
+        loops.add(id(asyncio.get_running_loop()))
+
+    @job(executor_def=asyncio_executor)
+    def async_job():
+        for name in op_names:
+            async_sleep_op.alias(name)()
+        record_loop.alias("record_1")()
+        record_loop.alias("record_2")()
+
+    start = time.time()
+    result = _execute(async_job, instance, run_config=_sleep_config(op_names, 0.5))
+    assert result.success
+    assert time.time() - start < 4
+    assert _intervals_overlap(op_names)
+    assert len(loops) == 1
+
+
+def test_sync_ops_in_asyncio_executor_run_off_the_event_loop(instance):
+    threads = set()
+
+    @op
+    def sync_op():
+        threads.add(threading.current_thread().name)
+
+    @job(executor_def=asyncio_executor)
+    def sync_job():
+        sync_op()
+
+    assert _execute(sync_job, instance).success
+    assert threads and all(name.startswith("dagster-step") for name in threads)
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_failure(instance, executor_def):
+    @op
+    def fail():
+        raise Exception("womp")
+
+    @op
+    def downstream(_x):
+        pass
+
+    @op
+    def independent(context):
+        RECORDED[context.op.name] = True
+
+    @job(executor_def=executor_def)
+    def failing_job():
+        downstream(fail())
+        independent()
+
+    result = _execute(failing_job, instance)
+    assert not result.success
+    assert RECORDED["independent"]
+    started = {event.step_key for event in result.all_events if event.is_step_start}
+    assert started == {"fail", "independent"}
+
+    with pytest.raises(Exception, match="womp"):
+        _execute(failing_job, instance, raise_on_error=True)
+
+
+@pytest.mark.parametrize("executor_def", EXECUTORS)
+def test_retries(instance, executor_def):
+    attempts = []
+
+    @op(retry_policy=RetryPolicy(max_retries=2))
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise Exception("try again")
+
+    @job(executor_def=executor_def)
+    def flaky_job():
+        flaky()
+
+    result = _execute(flaky_job, instance)
+    assert result.success
+    assert len(attempts) == 3
+    retries = [
+        event
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_UP_FOR_RETRY
+    ]
+    assert len(retries) == 2
@@ -1,5 +1,6 @@
 import subprocess
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -294,6 +295,94 @@ def test_tag_concurrency_limits():
                     active_step = None
 
 
+class BatchHealthCheckStepHandler(TestStepHandler):
+    health_check_batch_sizes = []
+
+    def check_steps_health(self, step_handler_contexts):
+        BatchHealthCheckStepHandler.health_check_batch_sizes.append(len(step_handler_contexts))
+        return super().check_steps_health(step_handler_contexts)
+
+
+@executor(
+    name="test_step_delegating_executor_batch_health_check",
+    requirements=multiple_process_executor_requirements(),
+    config_schema=Permissive(),
+)
+def test_step_delegating_executor_batch_health_check(exc_init):
+    return StepDelegatingExecutor(
+        BatchHealthCheckStepHandler(),
+        retries=RetryMode.DISABLED,
+        check_step_health_interval_seconds=0,
+    )
+
+
+@job(executor_def=test_step_delegating_executor_batch_health_check)
+def three_op_batch_health_check_job():
+    for i in range(3):
+        slow_op.alias(f"slow_op_{i}")()
+
+
+def test_batch_health_check():
+    TestStepHandler.reset()
+    BatchHealthCheckStepHandler.health_check_batch_sizes = []
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(three_op_batch_health_check_job),
+            instance=instance,
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # running steps are checked together, each one through check_step_health by default
+    assert max(BatchHealthCheckStepHandler.health_check_batch_sizes) > 1
+    assert TestStepHandler.check_step_health_count == sum(
+        BatchHealthCheckStepHandler.health_check_batch_sizes
+    )
+
+
+def test_watch_for_new_events():
+    step_delegating_executor = StepDelegatingExecutor(TestStepHandler(), retries=RetryMode.DISABLED)
+    with DagsterInstance.ephemeral() as instance:
+        with step_delegating_executor._watch_for_new_events(  # noqa: SLF001
+            instance, "foo_run"
+        ) as new_events:
+            assert new_events is not None
+            assert not new_events.is_set()
+            instance.report_engine_event("new event", job_name="foo_job", run_id="foo_run")
+            assert new_events.is_set()
+
+        # the watch ends with the executor
+        new_events.clear()
+        instance.report_engine_event("another event", job_name="foo_job", run_id="foo_run")
+        assert not new_events.is_set()
+
+    # storages that can not watch runs fall back to polling the event log
+    instance = mock.MagicMock()
+    instance.watch_event_logs.side_effect = NotImplementedError()
+    with step_delegating_executor._watch_for_new_events(  # noqa: SLF001
+        instance, "foo_run"
+    ) as new_events:
+        assert new_events is None
+
+
+def test_polling_watch_polls_event_log():
+    step_delegating_executor = StepDelegatingExecutor(
+        TestStepHandler(), retries=RetryMode.DISABLED, sleep_seconds=0.1
+    )
+    with instance_for_test() as instance:
+        # the sqlite event log storage watches runs by polling the event log
+        assert not instance.event_log_storage.has_push_based_watch
+        with mock.patch.object(instance, "watch_event_logs") as watch_event_logs:
+            with step_delegating_executor._watch_for_new_events(  # noqa: SLF001
+                instance, "foo_run"
+            ) as new_events:
+                assert new_events is None
+            assert not watch_event_logs.called
+
+    # so the event log is read every `sleep_seconds`, rather than at the watched poll interval
+    assert step_delegating_executor._should_pop_events(None, time.time())  # noqa: SLF001
+
+
 @executor(
     name="test_step_delegating_executor_verify_step",
     requirements=multiple_process_executor_requirements(),
@@ -0,0 +1,18 @@
+from dagster._core.execution.api import create_execution_plan
+from dagster_test.benchmarks.active_execution import build_fan_out_job, build_layered_job, drive
+
+
+def test_layered_plan_completes():
+    plan = create_execution_plan(build_layered_job(300))
+    assert drive(plan) == 300
+
+
+def test_layered_plan_completes_serially():
+    plan = create_execution_plan(build_layered_job(30, width=10))
+    assert drive(plan, max_concurrent=1) == 30
+
+
+def test_dynamic_fan_out_plan_completes():
+    plan = create_execution_plan(build_fan_out_job(300))
+    # emit, the mapped steps and collect
+    assert drive(plan, fan_out=300) == 302
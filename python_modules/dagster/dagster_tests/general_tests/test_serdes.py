@@ -11,6 +11,7 @@
     EnumSerializer,
     FieldSerializer,
     NamedTupleSerializer,
+    SerdesFormat,
     SerializableNonScalarKeyMapping,
     SetToSequenceFieldSerializer,
     UnpackContext,
@@ -776,3 +777,101 @@ def __new__(cls, keyed_by_non_scalar):
         )
         == named_tuple
     )
+
+
+def test_compact_json_format():
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+        BLUE = "BLUE"
+
+    @_whitelist_for_serdes(test_env)
+    class Leaf(NamedTuple):
+        color: Color
+        tags: AbstractSet[str]
+
+    @_whitelist_for_serdes(test_env)
+    class Node(NamedTuple):
+        name: str
+        leaves: Sequence[Leaf]
+        metadata: Mapping[str, Any]
+
+    node = Node(
+        name="root",
+        leaves=[Leaf(Color.RED, {"a", "b"}), Leaf(Color.BLUE, set()), Leaf(Color.RED, {"c"})],
+        # plain dicts that collide with the compact format's reserved key are preserved
+        metadata={"!": [0, 1], "nested": {"!": "bang", "leaf": Leaf(Color.BLUE, {"d"})}},
+    )
+
+    json_str = serialize_value(node, whitelist_map=test_env)
+    compact_str = serialize_value(
+        node, whitelist_map=test_env, serdes_format=SerdesFormat.COMPACT_JSON
+    )
+    assert compact_str.startswith("~1~")
+    assert len(compact_str) < len(json_str)
+    assert deserialize_value(compact_str, Node, whitelist_map=test_env) == node
+    assert deserialize_value(json_str, Node, whitelist_map=test_env) == node
+
+    # class names and field names are written once, regardless of the number of instances
+    assert compact_str.count("Leaf") == 1
+    assert compact_str.count("color") == 1
+
+    # non-namedtuple values round trip as well
+    for value in [1, "foo", None, [1, {"!": 2}], {"a": Color.RED}, {"x", "y"}]:
+        assert (
+            deserialize_value(
+                serialize_value(
+                    value, whitelist_map=test_env, serdes_format=SerdesFormat.COMPACT_JSON
+                ),
+                whitelist_map=test_env,
+            )
+            == value
+        )
+
+    # json kwargs passed by the caller are applied to the compact format, including separators
+    spaced_str = serialize_value(
+        node,
+        whitelist_map=test_env,
+        serdes_format=SerdesFormat.COMPACT_JSON,
+        separators=(", ", ": "),
+        sort_keys=True,
+    )
+    assert len(spaced_str) > len(compact_str)
+    assert deserialize_value(spaced_str, Node, whitelist_map=test_env) == node
+
+
+def test_named_tuple_compiled_field_plans() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_field_names={"color": "colour"},
+        skip_when_empty_fields={"tags"},
+        field_serializers={"shapes": SetToSequenceFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        color: str
+        shapes: AbstractSet[str]
+        tags: Optional[Mapping[str, str]] = None
+
+    vals = [Foo("red", {"circle"}, None), Foo("blue", set(), {"a": "b"})]
+    expected = [
+        '{"__class__": "Foo", "colour": "red", "shapes": ["circle"]}',
+        '{"__class__": "Foo", "colour": "blue", "shapes": [], "tags": {"a": "b"}}',
+    ]
+
+    # the plans compiled for the first value of the class are reused for the following ones, in
+    # both directions
+    for _ in range(2):
+        serialized = [serialize_value(val, whitelist_map=test_env) for val in vals]
+        assert serialized == expected
+        assert [deserialize_value(s, whitelist_map=test_env) for s in serialized] == vals
+
+    # keys unknown to the loaded class are ignored, also once the plan for them is compiled
+    for _ in range(2):
+        assert deserialize_value(
+            '{"__class__": "Foo", "colour": "red", "shapes": [], "size": 3}',
+            whitelist_map=test_env,
+        ) == Foo("red", set(), None)
@@ -0,0 +1,200 @@
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import (
+    EventLogNotifier,
+    NotifyingEventWatcher,
+    SqliteEventLogStorage,
+)
+from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.notifying_event_watcher import EventNotificationFn
+
+from .test_polling_event_watcher import RUN_ID, create_event
+
+
+class InProcessEventLogNotifier(EventLogNotifier):
+    """Notifier for events written through the same process, e.g. by a storage that calls
+    `notify` after each write. Events written by other processes are only picked up by the
+    watcher's fallback poll.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._on_notify: Optional[EventNotificationFn] = None
+
+    def start(self, on_notify: EventNotificationFn) -> None:
+        with self._lock:
+            self._on_notify = check.callable_param(on_notify, "on_notify")
+
+    def stop(self) -> None:
+        with self._lock:
+            self._on_notify = None
+
+    def notify(self, run_id: str, storage_id: Optional[int] = None) -> None:
+        with self._lock:
+            on_notify = self._on_notify
+
+        if on_notify:
+            on_notify(run_id, storage_id)
+
+
+class SqliteNotifyingEventLogStorage(SqliteEventLogStorage):
+    """SQLite-backed event log storage that watches runs with a NotifyingEventWatcher, notified
+    in-process on every write.
+    """
+
+    def __init__(self, *args, fallback_poll_interval: float = 60.0, **kwargs):
+        super(SqliteNotifyingEventLogStorage, self).__init__(*args, **kwargs)
+        self._notifier = InProcessEventLogNotifier()
+        self._watcher = NotifyingEventWatcher(
+            self, self._notifier, fallback_poll_interval=fallback_poll_interval
+        )
+        self._disposed = False
+
+    def store_event(self, event: EventLogEntry):
+        super(SqliteNotifyingEventLogStorage, self).store_event(event)
+        self._notifier.notify(event.run_id)
+
+    def watch(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+        check.callable_param(callback, "callback")
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def __del__(self):
+        self.dispose()
+
+    def dispose(self):
+        if not self._disposed:
+            self._disposed = True
+            self._watcher.close()
+
+
+@contextmanager
+def create_sqlite_notifying_event_logstorage(**kwargs):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteNotifyingEventLogStorage(tmpdir_path, **kwargs)
+        yield storage
+        storage.dispose()
+
+
+def _wait_for(condition, attempts=20):
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_notifying_watcher_callbacks():
+    with create_sqlite_notifying_event_logstorage() as storage:
+        watched_1 = []
+        watched_2 = []
+
+        def watch_one(event, _cursor):
+            watched_1.append(event)
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        storage.store_event(create_event(1))
+        storage.watch(RUN_ID, str(EventLogCursor.from_storage_id(1)), watch_one)
+
+        storage.store_event(create_event(2))
+        storage.store_event(create_event(3))
+
+        storage.watch(RUN_ID, str(EventLogCursor.from_storage_id(3)), watch_two)
+        storage.store_event(create_event(4))
+
+        _wait_for(lambda: len(watched_1) >= 3 and len(watched_2) >= 1)
+        assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
+        assert [int(evt.message) for evt in watched_2] == [4]
+
+        storage.end_watch(RUN_ID, watch_one)
+        storage.store_event(create_event(5))
+
+        _wait_for(lambda: len(watched_2) >= 2)
+        storage.end_watch(RUN_ID, watch_two)
+
+        assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
+        assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+    # calling end_watch after dispose does not error
+    storage.end_watch(RUN_ID, watch_two)
+
+
+def test_notifying_watcher_shares_dispatcher_across_runs():
+    with create_sqlite_notifying_event_logstorage() as storage:
+        watched = {"foo": [], "bar": []}
+
+        def _callback_for(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _callback_for(run_id) for run_id in watched}
+        for run_id, callback in callbacks.items():
+            storage.watch(run_id, None, callback)
+
+        storage.store_event(create_event(1, run_id="foo"))
+        storage.store_event(create_event(2, run_id="bar"))
+        storage.store_event(create_event(3, run_id="foo"))
+
+        _wait_for(lambda: len(watched["foo"]) >= 2 and len(watched["bar"]) >= 1)
+        assert [int(evt.message) for evt in watched["foo"]] == [1, 3]
+        assert [int(evt.message) for evt in watched["bar"]] == [2]
+
+        for run_id, callback in callbacks.items():
+            storage.end_watch(run_id, callback)
+            assert not storage._watcher.has_run_id(run_id)  # noqa: SLF001
+
+
+def test_notifying_watcher_fallback_poll():
+    with create_sqlite_notifying_event_logstorage(fallback_poll_interval=0.2) as storage:
+        watched = []
+
+        def watch_one(event, _cursor):
+            watched.append(event)
+
+        storage.watch(RUN_ID, None, watch_one)
+
+        # write without notifying, as another process would
+        SqliteEventLogStorage.store_event(storage, create_event(1))
+
+        _wait_for(lambda: len(watched) >= 1)
+        assert [int(evt.message) for evt in watched] == [1]
+        storage.end_watch(RUN_ID, watch_one)
+
+
+def test_notifying_watcher_fallback_poll_with_busy_run():
+    with create_sqlite_notifying_event_logstorage(fallback_poll_interval=0.2) as storage:
+        watched = {"foo": [], "bar": []}
+
+        def _callback_for(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _callback_for(run_id) for run_id in watched}
+        for run_id, callback in callbacks.items():
+            storage.watch(run_id, None, callback)
+
+        # write without notifying, as another process would
+        SqliteEventLogStorage.store_event(storage, create_event(1, run_id="bar"))
+
+        # notifications keep arriving for another run, which doesn't delay the fallback poll
+        for i in range(20):
+            storage.store_event(create_event(i, run_id="foo"))
+            if watched["bar"]:
+                break
+            time.sleep(0.05)
+
+        _wait_for(lambda: len(watched["bar"]) >= 1, attempts=5)
+        assert [int(evt.message) for evt in watched["bar"]] == [1]
+
+        for run_id, callback in callbacks.items():
+            storage.end_watch(run_id, callback)
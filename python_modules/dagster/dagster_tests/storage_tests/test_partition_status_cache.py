@@ -27,6 +27,7 @@
     AssetStatusCacheValue,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    update_asset_status_cache_values,
 )
 from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._core.utils import make_new_run_id
@@ -443,6 +444,84 @@ def asset1(context):
         ).get_partition_keys() == {"good2"}
 
 
+def test_eager_updates():
+    partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1(context):
+        if context.partition_key.startswith("fail"):
+            raise Exception()
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+    def _get_stored_cache_value(instance):
+        return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+    with instance_for_test(overrides={"asset_status_cache": {"eager_updates": True}}) as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="good1")
+        asset_job.execute_in_process(instance=instance, partition_key="fail1", raise_on_error=False)
+
+        # the runs updated the cached value as they executed
+        stored_cache_value = _get_stored_cache_value(instance)
+        assert stored_cache_value.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1"}
+        assert stored_cache_value.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1"}
+        assert not stored_cache_value.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys()
+
+        # readers use the stored value without catching it up with the event log
+        traced_counter.set(Counter())
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+            == stored_cache_value
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions", 0) == 0
+
+        # materializations stored outside of a run are caught up by readers
+        instance.report_runless_asset_event(AssetMaterialization(asset_key, partition="good2"))
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, partitions_def
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1", "good2"}
+
+        # planned materializations are caught up by the writer or the reconciler
+        run = create_run_for_test(instance)
+        instance.event_log_storage.store_event(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run.run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                    "nonce",
+                    event_specific_data=AssetMaterializationPlannedData(asset_key, "fail2"),
+                ),
+            )
+        )
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+            == cached_status
+        )
+        cached_status = update_asset_status_cache_values(instance, {asset_key: partitions_def})[
+            asset_key
+        ]
+        assert cached_status.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail2"}
+        assert _get_stored_cache_value(instance) == cached_status
+
+
 def test_failure_cache_added():
     partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
 
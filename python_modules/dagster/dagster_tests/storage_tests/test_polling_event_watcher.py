@@ -1,12 +1,16 @@
 import tempfile
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Mapping, Union
+from typing import Any, Callable, Mapping, Optional, Union
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -53,6 +57,28 @@ def dispose(self):
             self._watcher.close()
 
 
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Non-run-sharded SQLite event log storage that uses SqlPollingEventWatcher, so that all
+    watched runs are polled with a single query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher = SqlPollingEventWatcher(self)
+        self._disposed = False
+
+    def watch(self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry], None]):
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id: str, handler: Callable[[EventLogEntry], None]):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self):
+        if not self._disposed:
+            self._disposed = True
+            self._watcher.close()
+
+
 RUN_ID = "foo"
 
 
@@ -138,3 +164,36 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_multiplexed_polling_across_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        watched = {"foo": [], "bar": []}
+        callbacks = {
+            "foo": lambda event, _cursor: watched["foo"].append(event),
+            "bar": lambda event, _cursor: watched["bar"].append(event),
+        }
+
+        storage.store_event(create_event(1, run_id="foo"))
+        storage.watch("foo", str(EventLogCursor.from_storage_id(1)), callbacks["foo"])
+        storage.watch("bar", None, callbacks["bar"])
+
+        storage.store_event(create_event(2, run_id="bar"))
+        storage.store_event(create_event(3, run_id="foo"))
+        storage.store_event(create_event(4, run_id="baz"))
+        storage.store_event(create_event(5, run_id="bar"))
+
+        attempts = 20
+        while (len(watched["foo"]) < 1 or len(watched["bar"]) < 2) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched["foo"]] == [3]
+        assert [int(evt.message) for evt in watched["bar"]] == [2, 5]
+
+        storage.end_watch("foo", callbacks["foo"])
+        assert not storage._watcher.has_run_id("foo")  # noqa: SLF001
+        assert storage._watcher.has_run_id("bar")  # noqa: SLF001
+        storage.end_watch("bar", callbacks["bar"])
+        storage.dispose()
@@ -684,6 +684,42 @@ def test_event_log_step_stats(self, test_run_id, storage):
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_event_log_stats_for_runs(self, storage):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for run_id in run_ids[:2]:
+            for record in _stats_records(run_id=run_id):
+                storage.store_event(record)
+
+        # runs without events have empty stats
+        stats_by_run_id = storage.get_stats_for_runs(run_ids)
+        assert set(stats_by_run_id.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+        assert stats_by_run_id[run_ids[0]].steps_succeeded == 2
+        assert stats_by_run_id[run_ids[2]].steps_succeeded == 0
+
+        step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids)
+        assert set(step_stats_by_run_id.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(run_id)
+        assert len(step_stats_by_run_id[run_ids[0]]) == 4
+        assert step_stats_by_run_id[run_ids[2]] == []
+
+        # only the stats of the given steps are fetched
+        step_key = step_stats_by_run_id[run_ids[0]][0].step_key
+        filtered_step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids, [step_key])
+        assert set(filtered_step_stats_by_run_id.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert filtered_step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(
+                run_id, [step_key]
+            )
+        assert [
+            step_stats.step_key for step_stats in filtered_step_stats_by_run_id[run_ids[0]]
+        ] == [step_key]
+
+        assert storage.get_stats_for_runs([]) == {}
+        assert storage.get_step_stats_for_runs([]) == {}
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -724,6 +760,158 @@ def test_basic_event_store(self, test_run_id, storage):
             _event_types(events)
         )
 
+    def test_store_events_batch(self, test_run_id, storage):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @op
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _ops():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+            storage.store_events(events)
+
+            out_events = storage.get_logs_for_run(test_run_id)
+            assert _event_types(out_events) == _event_types(events)
+
+            assert asset_key in set(storage.all_asset_keys())
+            result = storage.fetch_materializations(asset_key, limit=100)
+            assert len(result.records) == 1
+            assert result.records[0].event_log_entry.dagster_event.asset_key == asset_key
+
+    def test_get_records_for_runs(self, storage):
+        if storage.is_run_sharded:
+            pytest.skip("storage ids are not comparable across runs in run sharded storage")
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for i in range(6):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_ids[i % 3]))
+
+        records = storage.get_records_for_runs(run_ids[:2])
+        assert [record.event_log_entry.user_message for record in records] == ["0", "1", "3", "4"]
+
+        records = storage.get_records_for_runs(
+            run_ids[:2], after_storage_id=records[1].storage_id, limit=1
+        )
+        assert [record.event_log_entry.user_message for record in records] == ["3"]
+
+        assert storage.get_records_for_runs([]) == []
+
+    def test_get_records_for_runs_run_sharded(self, storage):
+        if not storage.is_run_sharded:
+            pytest.skip("storage ids are comparable across runs in non run sharded storage")
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for i in range(6):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_ids[i % 3]))
+
+        # storage ids are only unique within a run, so the records are returned run by run
+        records = storage.get_records_for_runs(run_ids[:2])
+        assert [record.event_log_entry.user_message for record in records] == ["0", "3", "1", "4"]
+
+        records = storage.get_records_for_runs(run_ids[:2], after_storage_id=records[0].storage_id)
+        assert [record.event_log_entry.user_message for record in records] == ["3", "4"]
+
+        records = storage.get_records_for_runs(run_ids[:2], limit=3)
+        assert [record.event_log_entry.user_message for record in records] == ["0", "3", "1"]
+
+        assert storage.get_records_for_runs([]) == []
+
+    def test_get_lazy_records_for_run(self, storage, test_run_id):
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(
+                two_asset_ops, instance=created_instance, run_id=test_run_id
+            )
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_records_for_run(test_run_id).records
+            lazy_records = storage.get_lazy_records_for_run(test_run_id)
+            assert [record.storage_id for record in lazy_records] == [
+                record.storage_id for record in records
+            ]
+            for record, lazy_record in zip(records, lazy_records):
+                entry = record.event_log_entry
+                assert lazy_record.run_id == test_run_id
+                assert lazy_record.event_type == entry.dagster_event_type
+                assert lazy_record.step_key == entry.step_key
+                assert lazy_record.timestamp == pytest.approx(entry.timestamp, abs=1e-3)
+                assert lazy_record.asset_key == record.asset_key
+                assert lazy_record.partition_key == record.partition_key
+
+            materializations = storage.get_lazy_records_for_run(
+                test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION, ascending=False
+            )
+            assert [record.asset_key for record in materializations] == [
+                AssetKey(["path", "to", "asset_3"]),
+                AssetKey("asset_2"),
+                AssetKey("asset_1"),
+            ]
+            # the indexed fields do not load the event log entry, which is loaded on access
+            assert not any(record.is_loaded for record in materializations)
+            assert materializations[0].asset_materialization
+            assert materializations[0].is_loaded
+            assert not materializations[1].is_loaded
+            assert [record.event_log_entry.dagster_event_type for record in materializations] == [
+                DagsterEventType.ASSET_MATERIALIZATION
+            ] * 3
+            assert all(record.is_loaded for record in materializations)
+
+            cursor = str(EventLogCursor.from_storage_id(lazy_records[1].storage_id))
+            paged = storage.get_lazy_records_for_run(test_run_id, cursor=cursor, limit=2)
+            assert [record.storage_id for record in paged] == [
+                record.storage_id for record in lazy_records[2:4]
+            ]
+
+    def test_get_lazy_records_for_run_unindexed_asset_key(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(
+                two_asset_ops, instance=created_instance, run_id=test_run_id
+            )
+            for event in events:
+                storage.store_event(event)
+
+            # rows written before the asset key column was populated have no asset key
+            with storage.run_connection(run_id=test_run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.update()
+                    .where(SqlEventLogStorageTable.c.run_id == test_run_id)
+                    .values(asset_key=None, partition=None)
+                )
+
+            materializations = storage.get_lazy_records_for_run(
+                test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+            )
+            assert [record.asset_key for record in materializations] == [
+                AssetKey("asset_1"),
+                AssetKey("asset_2"),
+                AssetKey(["path", "to", "asset_3"]),
+            ]
+
+            # events without an asset key are not loaded to look for one
+            step_events = storage.get_lazy_records_for_run(
+                test_run_id, of_type=DagsterEventType.STEP_SUCCESS
+            )
+            assert step_events
+            assert all(record.asset_key is None for record in step_events)
+            assert not any(record.is_loaded for record in step_events)
+
     def test_basic_get_logs_for_run(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -32,14 +32,21 @@
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.migration import (
+    REQUIRED_DATA_MIGRATIONS,
+    migrate_run_queue_priority,
+)
+from dagster._core.storage.runs.schema import RunsTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
@@ -858,6 +865,184 @@ def test_fetch_by_status_cursored(self, storage):
         assert len(cursor_four_limit_one) == 1
         assert cursor_four_limit_one[0].run_id == two
 
+    def test_get_queued_runs(self, storage):
+        assert storage
+        priorities = {
+            "default": None,
+            "high": "3",
+            "low": "-1",
+            "malformed": "foobar",
+            "high_2": "3",
+            "default_2": None,
+        }
+        run_ids = {name: make_new_run_id() for name in priorities}
+        for name, priority in priorities.items():
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_ids[name],
+                    job_name="some_pipeline",
+                    status=DagsterRunStatus.QUEUED,
+                    tags={PRIORITY_TAG: priority} if priority else None,
+                    external_job_origin=self.fake_job_origin("some_pipeline"),
+                )
+            )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name="some_pipeline",
+                status=DagsterRunStatus.STARTED,
+                tags={PRIORITY_TAG: "10"},
+            )
+        )
+
+        expected_order = [
+            run_ids[name]
+            for name in ["high", "high_2", "default", "malformed", "default_2", "low"]
+        ]
+        assert [run.run_id for run in storage.get_queued_runs()] == expected_order
+
+        paged_run_ids = []
+        cursor = None
+        while True:
+            page = storage.get_queued_runs(cursor=cursor, limit=4)
+            paged_run_ids.extend(run.run_id for run in page)
+            if len(page) < 4:
+                break
+            cursor = page[-1].run_id
+        assert paged_run_ids == expected_order
+
+        # raising the priority of a queued run moves it up the queue
+        storage.add_run_tags(run_ids["low"], {PRIORITY_TAG: "5"})
+        assert storage.get_queued_runs(limit=1)[0].run_id == run_ids["low"]
+
+    def test_get_queued_runs_after_priority_migration(self, storage):
+        assert storage
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("priority column is specific to sql run storages")
+
+        priorities = {"high": "3", "default": None, "migrated": "2", "low": "-1", "default_2": None}
+        run_ids = {name: make_new_run_id() for name in priorities}
+        for name, priority in priorities.items():
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_ids[name],
+                    job_name="some_pipeline",
+                    status=DagsterRunStatus.QUEUED,
+                    tags={PRIORITY_TAG: priority} if priority else None,
+                    external_job_origin=self.fake_job_origin("some_pipeline"),
+                )
+            )
+
+        # runs stored before the priority column was added get the default priority, until the
+        # data migration fills in the priority of their tags
+        with storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()
+                .where(RunsTable.c.run_id.in_([run_ids["migrated"], run_ids["low"]]))
+                .values(priority=0)
+            )
+        migrate_run_queue_priority(storage)
+
+        expected_order = [run_ids[name] for name in ["high", "migrated", "default", "default_2", "low"]]
+        assert [run.run_id for run in storage.get_queued_runs()] == expected_order
+
+        # including pages whose cursor is a migrated run
+        for limit in [1, 2, 3]:
+            paged_run_ids = []
+            cursor = None
+            while True:
+                page = storage.get_queued_runs(cursor=cursor, limit=limit)
+                paged_run_ids.extend(run.run_id for run in page)
+                if len(page) < limit:
+                    break
+                cursor = page[-1].run_id
+            assert paged_run_ids == expected_order
+
+    def test_get_run_tag_counts(self, storage):
+        assert storage
+        for tags, status in [
+            ({"database": "tiny", "other": "a"}, DagsterRunStatus.STARTED),
+            ({"database": "tiny"}, DagsterRunStatus.STARTING),
+            ({"database": "large"}, DagsterRunStatus.STARTED),
+            ({"database": "tiny"}, DagsterRunStatus.SUCCESS),
+            ({"other": "b"}, DagsterRunStatus.QUEUED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    job_name="some_pipeline",
+                    tags=tags,
+                    status=status,
+                    external_job_origin=self.fake_job_origin("some_pipeline"),
+                )
+            )
+
+        assert storage.get_run_tag_counts(["database"]) == {
+            ("database", "tiny"): 3,
+            ("database", "large"): 1,
+        }
+        assert storage.get_run_tag_counts(
+            ["database", "other"],
+            statuses=[DagsterRunStatus.STARTED, DagsterRunStatus.STARTING],
+        ) == {
+            ("database", "tiny"): 2,
+            ("database", "large"): 1,
+            ("other", "a"): 1,
+        }
+        assert storage.get_run_tag_counts([]) == {}
+
+    def test_get_sensor_runs_by_run_key(self, storage):
+        assert storage
+        repo_selector_id = self.fake_repo_target().get_selector_id()
+
+        def _add_sensor_run(run_key, sensor_name="my_sensor", repo_name=None, has_origin=True):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="some_pipeline",
+                    tags={RUN_KEY_TAG: run_key, SENSOR_NAME_TAG: sensor_name},
+                    external_job_origin=(
+                        self.fake_job_origin("some_pipeline", repo_name) if has_origin else None
+                    ),
+                )
+            )
+            return run_id
+
+        first = _add_sensor_run("a")
+        _add_sensor_run("a")
+        no_origin = _add_sensor_run("b", has_origin=False)
+        _add_sensor_run("c", sensor_name="other_sensor")
+        _add_sensor_run("d", repo_name="other_repo")
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(), job_name="some_pipeline", tags={RUN_KEY_TAG: "e"}
+            )
+        )
+
+        runs_by_run_key = storage.get_sensor_runs_by_run_key(
+            "my_sensor", repo_selector_id, ["a", "b", "c", "d", "e", "f"]
+        )
+        assert {run_key: run.run_id for run_key, run in runs_by_run_key.items()} == {
+            "a": first,
+            "b": no_origin,
+        }
+        assert storage.get_sensor_runs_by_run_key("my_sensor", repo_selector_id, []) == {}
+
+        # run keys added after the run is created are also found
+        tagged = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=tagged, job_name="some_pipeline"))
+        storage.add_run_tags(tagged, {RUN_KEY_TAG: "g", SENSOR_NAME_TAG: "my_sensor"})
+        assert (
+            storage.get_sensor_runs_by_run_key("my_sensor", repo_selector_id, ["g"])["g"].run_id
+            == tagged
+        )
+
+        storage.delete_run(first)
+        assert storage.get_sensor_runs_by_run_key("my_sensor", repo_selector_id, ["a"])[
+            "a"
+        ].run_id != first
+
     def test_delete(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete runs")
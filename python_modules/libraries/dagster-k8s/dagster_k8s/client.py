@@ -2,7 +2,7 @@
 import sys
 import time
 from enum import Enum
-from typing import Any, Callable, List, Optional, TypeVar
+from typing import Any, Callable, List, Mapping, Optional, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
@@ -426,6 +426,22 @@ def _get_job_status():
 
         return k8s_api_retry(_get_job_status, max_retries=3, timeout=wait_time_between_attempts)
 
+    def get_job_statuses(
+        self,
+        namespace: str,
+        label_selector: str,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ) -> Mapping[str, V1JobStatus]:
+        """Get the statuses of all the jobs in a namespace matching a label selector, by job name."""
+
+        def _get_job_statuses():
+            jobs = self.batch_api.list_namespaced_job(
+                namespace=namespace, label_selector=label_selector
+            )
+            return {job.metadata.name: job.status for job in jobs.items}
+
+        return k8s_api_retry(_get_job_statuses, max_retries=3, timeout=wait_time_between_attempts)
+
     def delete_job(
         self,
         job_name,
@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional, cast
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, cast
 
 import kubernetes.config
 from dagster import (
@@ -23,6 +23,7 @@
     StepHandlerContext,
 )
 from dagster._utils.merger import merge_dicts
+from kubernetes.client.models import V1JobStatus
 
 from dagster_k8s.launcher import K8sRunLauncher
 
@@ -307,8 +308,6 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[Dags
         self._api_client.create_namespaced_job_with_retries(body=job, namespace=namespace)
 
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
-        step_key = self._get_step_key(step_handler_context)
-
         job_name = self._get_k8s_step_job_name(step_handler_context)
 
         container_context = self._get_container_context(step_handler_context)
@@ -317,7 +316,41 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
             namespace=container_context.namespace,
             job_name=job_name,
         )
+        return self._health_from_job_status(step_handler_context, job_name, status)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        # list the jobs for the run in each namespace once, rather than reading each step's job
+        job_statuses_by_namespace: Dict[str, Mapping[str, V1JobStatus]] = {}
+        results = []
+        for step_handler_context in step_handler_contexts:
+            namespace = self._get_container_context(step_handler_context).namespace
+            if namespace not in job_statuses_by_namespace:
+                job_statuses_by_namespace[namespace] = self._api_client.get_job_statuses(
+                    namespace=namespace,
+                    label_selector=(
+                        f"dagster/run-id={step_handler_context.execute_step_args.run_id}"
+                    ),
+                )
+
+            job_name = self._get_k8s_step_job_name(step_handler_context)
+            status = job_statuses_by_namespace[namespace].get(job_name)
+            if status is None:
+                # not found by its labels, e.g. if they were overridden - read the job directly
+                results.append(self.check_step_health(step_handler_context))
+            else:
+                results.append(
+                    self._health_from_job_status(step_handler_context, job_name, status)
+                )
+
+        return results
+
+    def _health_from_job_status(
+        self, step_handler_context: StepHandlerContext, job_name: str, status: V1JobStatus
+    ) -> CheckStepHealthResult:
         if status.failed:
+            step_key = self._get_step_key(step_handler_context)
             return CheckStepHealthResult.unhealthy(
                 reason=f"Discovered failed Kubernetes job {job_name} for step {step_key}.",
             )
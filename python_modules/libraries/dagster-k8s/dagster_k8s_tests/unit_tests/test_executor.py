@@ -549,6 +549,50 @@ def test_step_handler_user_defined_config(kubeconfig_file, k8s_instance):
         assert env_vars["FOO_TEST"] == "bar"
 
 
+def test_step_handler_check_steps_health(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    run = create_run_for_test(
+        k8s_instance,
+        job_name="bar",
+        job_code_origin=reconstructable(bar).get_python_origin(),
+    )
+    step_handler_context = _step_handler_context(
+        job_def=reconstructable(bar),
+        dagster_run=run,
+        instance=k8s_instance,
+        executor=_get_executor(
+            k8s_instance,
+            reconstructable(bar),
+        ),
+    )
+    job_name = handler._get_k8s_step_job_name(step_handler_context)  # noqa: SLF001
+
+    failed_job = mock.MagicMock()
+    failed_job.metadata.name = job_name
+    failed_job.status.failed = 1
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = mock.MagicMock(
+        items=[failed_job]
+    )
+
+    results = handler.check_steps_health([step_handler_context, step_handler_context])
+    assert [result.is_healthy for result in results] == [False, False]
+    assert job_name in results[0].unhealthy_reason
+
+    # the jobs of all the steps are listed with a single request
+    mock_k8s_client_batch_api.list_namespaced_job.assert_called_once_with(
+        namespace="foo", label_selector=f"dagster/run-id={run.run_id}"
+    )
+    mock_k8s_client_batch_api.read_namespaced_job_status.assert_not_called()
+
+
 def test_step_handler_image_override(kubeconfig_file, k8s_instance):
     mock_k8s_client_batch_api = mock.MagicMock()
     handler = K8sStepHandler(
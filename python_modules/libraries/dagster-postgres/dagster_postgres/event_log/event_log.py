@@ -1,4 +1,4 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from typing import Any, ContextManager, Mapping, Optional, Sequence, Union
 
 import dagster._check as check
 import sqlalchemy as db
@@ -19,6 +19,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.notifying_event_watcher import NotifyingEventWatcher
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
@@ -39,6 +40,7 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventLogNotifier
 
 CHANNEL_NAME = "run_events"
 
@@ -77,12 +79,16 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        listen_notify_event_watcher: bool = False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self.listen_notify_event_watcher = check.bool_param(
+            listen_notify_event_watcher, "listen_notify_event_watcher"
+        )
 
         self._disposed = False
 
@@ -91,7 +97,14 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        if self.listen_notify_event_watcher:
+            self._event_watcher: Union[NotifyingEventWatcher, SqlPollingEventWatcher] = (
+                NotifyingEventWatcher(
+                    self, PostgresEventLogNotifier(self.postgres_url, CHANNEL_NAME)
+                )
+            )
+        else:
+            self._event_watcher = SqlPollingEventWatcher(self)
 
         self._secondary_index_cache = {}
 
@@ -149,11 +162,14 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            listen_notify_event_watcher=config_value.get("listen_notify_event_watcher", False),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        listen_notify_event_watcher: bool = False,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
@@ -163,7 +179,11 @@ def create_clean_storage(
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string,
+            should_autocreate_tables,
+            listen_notify_event_watcher=listen_notify_event_watcher,
+        )
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a run.
@@ -182,7 +202,8 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # LISTEN/NOTIFY is only used by the opt-in `listen_notify_event_watcher` - preserved
+            # unconditionally to support version skew
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -206,6 +227,27 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_rows(self, run_id: str, rows: Sequence[Mapping[str, Any]]) -> None:
+        if not rows:
+            return
+
+        with self._connect() as conn:
+            result = conn.execute(
+                SqlEventLogStorageTable.insert()
+                .values(list(rows))
+                .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+            )
+            inserted = result.fetchall()
+            result.close()
+
+            # LISTEN/NOTIFY is only used by the opt-in `listen_notify_event_watcher` - preserved
+            # unconditionally to support version skew
+            for row_run_id, event_id in inserted:
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": row_run_id + "_" + str(event_id)},
+                )
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -325,6 +367,10 @@ def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
         self._event_watcher.unwatch_run(run_id, handler)
 
+    @property
+    def has_push_based_watch(self) -> bool:
+        return self.listen_notify_event_watcher
+
     def __del__(self) -> None:
         # Keep the inherent limitations of __del__ in Python in mind!
         self.dispose()
@@ -0,0 +1,85 @@
+import logging
+import re
+import select
+import threading
+from typing import Optional
+
+import dagster._check as check
+import psycopg2
+import psycopg2.extensions
+from dagster._core.storage.event_log.notifying_event_watcher import (
+    EventLogNotifier,
+    EventNotificationFn,
+)
+
+POLL_TIMEOUT = 1.0  # seconds to block on the listening connection before checking for shutdown
+RECONNECT_DELAY = 5.0  # seconds
+
+
+def _libpq_url(postgres_url: str) -> str:
+    # libpq does not understand SQLAlchemy driver suffixes such as `postgresql+psycopg2://`
+    return re.sub(r"^postgres(ql)?\+\w+://", "postgresql://", postgres_url)
+
+
+class PostgresEventLogNotifier(EventLogNotifier):
+    """Notifier that LISTENs on the channel PostgresEventLogStorage NOTIFYs with
+    `<run_id>_<storage_id>` on every event write.
+
+    A single background thread holds one dedicated connection, independently of the number of
+    watched runs. If the connection drops, it reconnects after RECONNECT_DELAY seconds; events
+    written in the meantime are picked up by the watcher's fallback poll.
+    """
+
+    def __init__(self, postgres_url: str, channel: str):
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+        self._shutdown_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, on_notify: EventNotificationFn) -> None:
+        check.callable_param(on_notify, "on_notify")
+        check.invariant(self._thread is None, "PostgresEventLogNotifier already started")
+        self._thread = threading.Thread(
+            target=self._listen,
+            args=(on_notify,),
+            name="postgres-event-log-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._shutdown_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _listen(self, on_notify: EventNotificationFn) -> None:
+        while not self._shutdown_event.is_set():
+            try:
+                self._listen_on_connection(on_notify)
+            except Exception:
+                logging.exception(
+                    "Error listening for event log notifications, reconnecting in %s seconds.",
+                    RECONNECT_DELAY,
+                )
+                self._shutdown_event.wait(RECONNECT_DELAY)
+
+    def _listen_on_connection(self, on_notify: EventNotificationFn) -> None:
+        conn = psycopg2.connect(_libpq_url(self._postgres_url))
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self._channel};")
+
+            while not self._shutdown_event.is_set():
+                if select.select([conn], [], [], POLL_TIMEOUT) == ([], [], []):
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    notification = conn.notifies.pop(0)
+                    run_id, _, storage_id = notification.payload.rpartition("_")
+                    if not run_id:
+                        continue
+                    on_notify(run_id, int(storage_id) if storage_id.isdigit() else None)
+        finally:
+            conn.close()
@@ -109,3 +109,18 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+
+class TestPostgresListenNotifyEventLogStorage(TestPostgresEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, conn_string):
+        storage = PostgresEventLogStorage.create_clean_storage(
+            conn_string, listen_notify_event_watcher=True
+        )
+        assert storage
+        try:
+            yield storage
+        finally:
+            storage.dispose()